@@ -10,8 +10,8 @@ FastAPI dependency injection functions for:
 - Authentication (future)
 
 @.architecture
-Incoming: app.py (startup_event), api/v1/endpoints/*.py --- {set_runtime_engine/set_mcp_manager/set_database_connection calls, Depends() injections from endpoints}
-Processing: get_settings(), get_runtime_engine(), get_mcp_manager(), get_database(), setup_request_context(), cleanup_request_context(), get_pagination_params() --- {5 jobs: cleanup, context_setup, dependency_injection, resource_management, validation}
+Incoming: app.py (startup_event), api/v1/endpoints/*.py --- {set_runtime_engine/set_mcp_manager/set_database_connection/set_startup_orchestrator calls, Depends() injections from endpoints}
+Processing: get_settings(), get_runtime_engine(), get_mcp_manager(), get_startup_orchestrator(), get_database(), setup_request_context(), cleanup_request_context(), get_pagination_params() --- {5 jobs: cleanup, context_setup, dependency_injection, resource_management, validation}
 Outgoing: api/v1/endpoints/*.py, app.py --- {Settings instance, RuntimeEngine instance, MCPServerManager instance, DatabaseConnection instance, request context dict, PaginationParams}
 """
 
@@ -22,8 +22,10 @@ import uuid
 
 from config.settings import Settings, get_settings as load_settings
 from core.runtime.engine import RuntimeEngine
+from core.runtime.startup import StartupOrchestrator
 from core.mcp.manager import MCPServerManager
 from data.database.connection import DatabaseConnection
+from data.database.write_behind import WriteBehindBuffer
 from monitoring import get_logger, set_request_context, clear_request_context
 
 logger = get_logger(__name__)
@@ -130,6 +132,29 @@ def require_mcp_manager() -> MCPServerManager:
     return manager
 
 
+# =============================================================================
+# Startup Dependencies
+# =============================================================================
+
+_startup_orchestrator: Optional[StartupOrchestrator] = None
+
+
+def set_startup_orchestrator(orchestrator: StartupOrchestrator) -> None:
+    """Set the application startup orchestrator (after startup has run)."""
+    global _startup_orchestrator
+    _startup_orchestrator = orchestrator
+
+
+def get_startup_orchestrator() -> Optional[StartupOrchestrator]:
+    """
+    Get the application startup orchestrator.
+    
+    Returns:
+        Optional[StartupOrchestrator]: The orchestrator, or None before startup completes
+    """
+    return _startup_orchestrator
+
+
 # =============================================================================
 # Database Dependencies
 # =============================================================================
@@ -143,6 +168,37 @@ def set_database_connection(connection: DatabaseConnection) -> None:
     _database_connection = connection
 
 
+_trail_state_buffer: Optional[WriteBehindBuffer] = None
+
+
+def get_trail_state_buffer() -> Optional[WriteBehindBuffer]:
+    """
+    Get the shared write-behind buffer for trail state autosaves.
+    
+    Created lazily on first use; None when debouncing is disabled
+    (database.trail_write_interval <= 0) or the database is not initialized.
+    """
+    global _trail_state_buffer
+    if _trail_state_buffer is None and _database_connection is not None:
+        interval = get_settings().database.trail_write_interval
+        if interval > 0:
+            from data.database.repositories.storage import StorageRepository
+
+            async def flush(chat_id: str, data) -> None:
+                await StorageRepository(_database_connection).upsert_trail_state(chat_id, data)
+
+            _trail_state_buffer = WriteBehindBuffer(flush=flush, interval=interval)
+    return _trail_state_buffer
+
+
+async def close_trail_state_buffer() -> None:
+    """Flush pending trail state writes (call before closing the database)."""
+    global _trail_state_buffer
+    if _trail_state_buffer is not None:
+        await _trail_state_buffer.close()
+        _trail_state_buffer = None
+
+
 async def get_database() -> AsyncGenerator[DatabaseConnection, None]:
     """
     Get database connection (async generator for dependency injection).
@@ -7,7 +7,9 @@ Provides middleware components for request/response processing including:
 - Error handling
 - CORS (via FastAPI)
 
-All middleware is production-ready and configurable.
+All middleware is production-ready and configurable. The middlewares are
+pure ASGI (no BaseHTTPMiddleware), so they add no per-request tasks or
+memory streams and never buffer streaming responses.
 """
 
 from .security import (
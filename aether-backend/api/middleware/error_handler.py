@@ -5,17 +5,21 @@ Provides centralized error handling with sanitized error responses and logging.
 
 @.architecture
 Incoming: app.py (middleware registration), Exception objects from endpoints --- {FastAPI Request objects, Python exceptions}
-Processing: dispatch(), _handle_error(), _classify_error(), _build_error_response(), _log_error() --- {5 jobs: exception_catching, error_classification, response_formatting, sanitization, logging}
+Processing: __call__(), _handle_error(), _classify_error(), _build_error_response(), _log_error() --- {5 jobs: exception_catching, error_classification, response_formatting, sanitization, logging}
 Outgoing: monitoring/logging.py, Frontend (HTTP) --- {structured error logs, JSONResponse with standardized error format: code/message/type}
+
+Implemented as a pure ASGI middleware that only observes whether the
+response has started; bodies (including StreamingResponse) are passed
+through without buffering. An error raised after the response started
+cannot be turned into an error response, so it is logged and re-raised.
 """
 
 import logging
 import traceback
-from typing import Callable, Optional, Dict, Any
-from fastapi import Request, Response
+from typing import Optional, Dict, Any
+from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +72,7 @@ class ErrorHandlerConfig:
         }
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
+class ErrorHandlerMiddleware:
     """
     Middleware for global error handling.
     
@@ -92,28 +96,65 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             config: Error handler configuration
         """
-        super().__init__(app)
+        self.app = app
         self.config = config or ErrorHandlerConfig()
         logger.info("Error handler middleware initialized")
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with error handling.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response (or error response if exception caught)
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_tracking)
             
         except Exception as e:
+            if response_started:
+                # Headers are already on the wire; nothing to replace them with
+                error = self._unwrap_error(e)
+                if self.config.log_errors:
+                    self._log_error(Request(scope), error, 500)
+                if error is e:
+                    raise
+                raise error
+            
             # Handle error
-            return await self._handle_error(request, e)
+            response = await self._handle_error(Request(scope), e)
+            await response(scope, receive, send)
+    
+    @staticmethod
+    def _unwrap_error(error: Exception) -> Exception:
+        """
+        Unwrap an exception group holding a single error.
+        
+        StreamingResponse runs its body in an anyio task group, so an error
+        raised mid-stream arrives as ExceptionGroup([error]).
+        
+        Args:
+            error: Exception that was raised
+            
+        Returns:
+            The single wrapped exception, or error itself
+        """
+        while isinstance(error, ExceptionGroup) and len(error.exceptions) == 1:
+            error = error.exceptions[0]
+        return error
     
     async def _handle_error(self, request: Request, error: Exception) -> JSONResponse:
         """
@@ -5,20 +5,24 @@ FastAPI middleware for rate limiting API requests per client.
 
 @.architecture
 Incoming: app.py (middleware registration), security/rate_limit.py --- {FastAPI Request objects, rate limit configuration}
-Processing: dispatch(), _get_client_id(), _get_tier_for_path(), _add_rate_limit_headers() --- {4 jobs: request_identification, tier_classification, limit_checking, header_injection}
+Processing: __call__(), _get_client_id(), _get_tier_for_path(), _rate_limit_headers() --- {4 jobs: request_identification, tier_classification, limit_checking, header_injection}
 Outgoing: Frontend (HTTP), security/rate_limit.py --- {HTTP Response with X-RateLimit-* headers, HTTP 429 on limit exceeded, rate limit check requests}
+
+Implemented as a pure ASGI middleware: allowed requests are forwarded as-is
+and only the http.response.start message is touched, so streaming bodies
+are never buffered.
 """
 
 import logging
-from typing import Callable, Optional
-from fastapi import Request, Response, HTTPException
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from typing import List, Tuple
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
 
-class RateLimiterMiddleware(BaseHTTPMiddleware):
+class RateLimiterMiddleware:
     """
     Middleware to apply rate limiting to API endpoints.
     
@@ -41,7 +45,7 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             enabled: Whether rate limiting is enabled
         """
-        super().__init__(app)
+        self.app = app
         self.enabled = enabled
         
         if enabled:
@@ -53,29 +57,28 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
             self._limiter = None
             logger.info("Rate limiter middleware disabled")
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request with rate limiting.
         
+        Requests over the limit get a 429 without reaching the application;
+        allowed responses carry X-RateLimit-* headers.
+        
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response (with rate limit headers)
-            
-        Raises:
-            HTTPException: 429 if rate limit exceeded
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        if not self.enabled or self._limiter is None:
+        if scope["type"] != "http" or not self.enabled or self._limiter is None:
             # Rate limiting disabled, pass through
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
         
         # Get client identifier (IP address)
-        client_id = self._get_client_id(request)
+        client_id = self._get_client_id(scope)
         
         # Determine tier based on endpoint
-        tier = self._get_tier_for_path(request.url.path)
+        tier = self._get_tier_for_path(scope["path"])
         
         # Import rate limit exception
         from security.rate_limit import RateLimitExceeded
@@ -87,18 +90,10 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
             # Get limit info for headers
             limit_info = await self._limiter.get_limit_info(client_id, tier)
             
-            # Process request
-            response = await call_next(request)
-            
-            # Add rate limit headers
-            self._add_rate_limit_headers(response, limit_info)
-            
-            return response
-            
         except RateLimitExceeded as e:
             # Rate limit exceeded - return 429
             logger.warning(
-                f"Rate limit exceeded for {client_id} on {request.url.path} "
+                f"Rate limit exceeded for {client_id} on {scope['path']} "
                 f"(tier: {tier})"
             )
             
@@ -111,42 +106,54 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
                 status_code=429,
                 media_type="text/plain"
             )
-            
-            # Add rate limit headers
-            self._add_rate_limit_headers(response, limit_info)
+            response.raw_headers.extend(self._rate_limit_headers(limit_info))
             response.headers["Retry-After"] = str(int(e.retry_after))
             
-            return response
+            await response(scope, receive, send)
+            return
         
         except Exception as e:
             # Unexpected error in rate limiting - log and continue
             logger.error(f"Error in rate limiter: {e}", exc_info=True)
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
+        
+        extra_headers = self._rate_limit_headers(limit_info)
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
     
-    def _get_client_id(self, request: Request) -> str:
+    def _get_client_id(self, scope: Scope) -> str:
         """
         Extract client identifier from request.
         
         Args:
-            request: HTTP request
+            scope: ASGI connection scope
             
         Returns:
             Client identifier (IP address)
         """
+        headers = Headers(scope=scope)
+        
         # Try X-Forwarded-For header first (for proxies)
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = headers.get("x-forwarded-for")
         if forwarded_for:
             # Take first IP in chain
             return forwarded_for.split(",")[0].strip()
         
         # Try X-Real-IP header
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip.strip()
         
         # Fall back to direct client IP
-        if request.client:
-            return request.client.host
+        client = scope.get("client")
+        if client:
+            return client[0]
         
         # Default if no client info available
         return "unknown"
@@ -173,21 +180,22 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         else:
             return "api_default"
     
-    def _add_rate_limit_headers(
-        self,
-        response: Response,
-        limit_info: dict
-    ) -> None:
+    @staticmethod
+    def _rate_limit_headers(limit_info: dict) -> List[Tuple[bytes, bytes]]:
         """
-        Add rate limit information to response headers.
+        Build rate limit response headers.
         
         Args:
-            response: HTTP response
             limit_info: Rate limit info from limiter
+            
+        Returns:
+            ASGI (name, value) byte pairs
         """
-        response.headers["X-RateLimit-Limit"] = str(limit_info['limit'])
-        response.headers["X-RateLimit-Remaining"] = str(limit_info['remaining'])
-        response.headers["X-RateLimit-Reset"] = str(limit_info['reset'])
+        return [
+            (b"x-ratelimit-limit", str(limit_info['limit']).encode("latin-1")),
+            (b"x-ratelimit-remaining", str(limit_info['remaining']).encode("latin-1")),
+            (b"x-ratelimit-reset", str(limit_info['reset']).encode("latin-1")),
+        ]
 
 
 def create_rate_limiter_middleware(
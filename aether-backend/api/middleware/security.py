@@ -5,15 +5,17 @@ Adds security headers to all HTTP responses to protect against common web vulner
 
 @.architecture
 Incoming: app.py (middleware registration), HTTP requests --- {FastAPI Request objects, HTTP responses from endpoints}
-Processing: dispatch(), _add_headers(), build_csp_header(), build_hsts_header() --- {2 jobs: header_injection, response_interception}
+Processing: __call__(), build_raw_headers(), build_csp_header(), build_hsts_header() --- {3 jobs: header_injection, header_precomputation, response_interception}
 Outgoing: Frontend (HTTP) --- {HTTP Response with security headers: CSP, X-Frame-Options, X-XSS-Protection, HSTS, Referrer-Policy, Permissions-Policy}
+
+Implemented as a pure ASGI middleware: the header list is encoded once at
+startup and appended to the http.response.start message, so response
+bodies (including StreamingResponse) pass through untouched.
 """
 
 import logging
-from typing import Callable, Dict, Optional
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from typing import Dict, List, Optional, Tuple
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -127,9 +129,48 @@ class SecurityHeadersConfig:
         if self.hsts_preload:
             parts.append("preload")
         return "; ".join(parts)
+    
+    def build_raw_headers(self) -> List[Tuple[bytes, bytes]]:
+        """
+        Build the enabled headers as ASGI (name, value) byte pairs.
+        
+        Returns:
+            Lowercase header names with latin-1 encoded values
+        """
+        headers = []
+        
+        # Content Security Policy
+        if self.enable_csp:
+            headers.append(("content-security-policy", self.build_csp_header()))
+        
+        # X-Frame-Options
+        if self.x_frame_options:
+            headers.append(("x-frame-options", self.x_frame_options))
+        
+        # X-XSS-Protection (legacy, but still useful for older browsers)
+        if self.x_xss_protection:
+            headers.append(("x-xss-protection", self.x_xss_protection))
+        
+        # X-Content-Type-Options
+        if self.x_content_type_options:
+            headers.append(("x-content-type-options", self.x_content_type_options))
+        
+        # Referrer-Policy
+        if self.referrer_policy:
+            headers.append(("referrer-policy", self.referrer_policy))
+        
+        # Permissions-Policy
+        if self.permissions_policy:
+            headers.append(("permissions-policy", self.permissions_policy))
+        
+        # HSTS (only if enabled and HTTPS)
+        if self.enable_hsts:
+            headers.append(("strict-transport-security", self.build_hsts_header()))
+        
+        return [(name.encode("latin-1"), value.encode("latin-1")) for name, value in headers]
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
     
@@ -153,61 +194,37 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
             app: ASGI application
             config: Security headers configuration
         """
-        super().__init__(app)
+        self.app = app
         self.config = config or SecurityHeadersConfig()
+        self._raw_headers = self.config.build_raw_headers()
+        self._header_names = frozenset(name for name, _ in self._raw_headers)
         logger.info("Security headers middleware initialized")
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Process request and add security headers to response.
+        Process request and add security headers to the response start.
         
         Args:
-            request: Incoming request
-            call_next: Next middleware/handler
-            
-        Returns:
-            Response with security headers added
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Process request
-        response = await call_next(request)
-        
-        # Add security headers
-        self._add_headers(response)
-        
-        return response
-    
-    def _add_headers(self, response: Response) -> None:
-        """Add security headers to response."""
-        
-        # Content Security Policy
-        if self.config.enable_csp:
-            csp_header = self.config.build_csp_header()
-            response.headers["Content-Security-Policy"] = csp_header
-        
-        # X-Frame-Options
-        if self.config.x_frame_options:
-            response.headers["X-Frame-Options"] = self.config.x_frame_options
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # X-XSS-Protection (legacy, but still useful for older browsers)
-        if self.config.x_xss_protection:
-            response.headers["X-XSS-Protection"] = self.config.x_xss_protection
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Security headers replace any value set by the endpoint
+                headers = [
+                    header for header in message.get("headers", ())
+                    if header[0].lower() not in self._header_names
+                ]
+                headers.extend(self._raw_headers)
+                message["headers"] = headers
+            await send(message)
         
-        # X-Content-Type-Options
-        if self.config.x_content_type_options:
-            response.headers["X-Content-Type-Options"] = self.config.x_content_type_options
-        
-        # Referrer-Policy
-        if self.config.referrer_policy:
-            response.headers["Referrer-Policy"] = self.config.referrer_policy
-        
-        # Permissions-Policy
-        if self.config.permissions_policy:
-            response.headers["Permissions-Policy"] = self.config.permissions_policy
-        
-        # HSTS (only if enabled and HTTPS)
-        if self.config.enable_hsts:
-            hsts_header = self.config.build_hsts_header()
-            response.headers["Strict-Transport-Security"] = hsts_header
+        await self.app(scope, receive, send_with_headers)
 
 
 def create_security_headers_middleware(
@@ -6,11 +6,16 @@ Provides comprehensive metadata and health status for all integrated backends.
 
 @.architecture
 Incoming: api/v1/router.py, Frontend (HTTP GET), config/integrations_registry.yaml --- {HTTP requests to /v1/backends/*, YAML registry data}
-Processing: list_backends(), get_backend_details(), check_backend_health(), get_registry_info(), check_all_backends_health() --- {4 jobs: backend_discovery, health_aggregation, metadata_extraction, registry_loading}
+Processing: list_backends(), get_backend_details(), check_backend_health(), get_registry_info(), check_all_backends_health(), _probe_backend() --- {5 jobs: backend_discovery, concurrent_health_checks, health_aggregation, metadata_extraction, registry_loading}
 Outgoing: core/integrations/libraries/*, Frontend (HTTP) --- {backend integration health checks, BackendInfo, JSONResponse with registry metadata and health status}
+
+The registry YAML is parsed once and re-read only when the file changes.
+Bulk health checks probe every backend concurrently with a per-backend
+timeout; blocking integration calls run in worker threads.
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from typing import Dict, Any, List, Optional, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 import yaml
@@ -29,6 +34,12 @@ from core.integrations.libraries.xlwings import excel as xlwings_excel
 logger = get_logger(__name__)
 router = APIRouter(tags=["backends"], prefix="/backends")
 
+REGISTRY_PATH = Path(__file__).parent.parent.parent.parent / "config" / "integrations_registry.yaml"
+BACKEND_HEALTH_TIMEOUT = 5.0  # Seconds per backend in bulk checks
+
+# (mtime_ns, parsed registry)
+_registry_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
 
 # =============================================================================
 # Schemas
@@ -60,16 +71,27 @@ class BackendHealthRequest(BaseModel):
 # =============================================================================
 
 def _load_integrations_registry() -> Dict[str, Any]:
-    """Load integrations_registry.yaml."""
+    """
+    Load integrations_registry.yaml.
+    
+    The parsed registry is cached and reloaded only when the file's
+    modification time changes. Callers must not mutate the result.
+    """
+    global _registry_cache
     try:
-        registry_path = Path(__file__).parent.parent.parent.parent / "config" / "integrations_registry.yaml"
-        
-        if not registry_path.exists():
-            logger.error(f"Registry not found: {registry_path}")
+        try:
+            mtime = REGISTRY_PATH.stat().st_mtime_ns
+        except FileNotFoundError:
+            logger.error(f"Registry not found: {REGISTRY_PATH}")
             return {"integrations": {}}
         
-        with open(registry_path, 'r') as f:
-            return yaml.safe_load(f) or {"integrations": {}}
+        if _registry_cache is not None and _registry_cache[0] == mtime:
+            return _registry_cache[1]
+        
+        with open(REGISTRY_PATH, 'r') as f:
+            registry = yaml.safe_load(f) or {"integrations": {}}
+        _registry_cache = (mtime, registry)
+        return registry
     except Exception as e:
         logger.error(f"Failed to load registry: {e}")
         return {"integrations": {}}
@@ -342,45 +364,9 @@ async def check_backend_health(
 ) -> Dict[str, Any]:
     """Check health of a specific backend."""
     try:
-        health_status = {}
-        
-        if backend_name == "ocr":
-            backends = ocr_registry.OCRBackendRegistry.list_available_backends()
-            health_status = {
-                "healthy": any(b.get("available") for b in backends.values()),
-                "backends": backends
-            }
-        
-        elif backend_name == "tts":
-            tts = realtime_tts.get_tts_integration()
-            health_status = await tts.check_health()
-        
-        elif backend_name == "notebook":
-            result = notebook_runtime.nb_list_sys_path()
-            health_status = {
-                "healthy": True,
-                "sys_path_count": result.get("count", 0)
-            }
-        
-        elif backend_name == "omni":
-            workflows = omni_tools.omni_workflows()
-            health_status = {
-                "healthy": True,
-                "workflows": len(workflows)
-            }
-        
-        elif backend_name == "xlwings":
-            health_status = xlwings_excel.xlwings_health()
-        
-        else:
-            health_status = {
-                "healthy": False,
-                "message": f"Health check not implemented for {backend_name}"
-            }
-        
         return {
             "backend": backend_name,
-            **health_status
+            **await _probe_backend(backend_name)
         }
         
     except Exception as e:
@@ -392,6 +378,47 @@ async def check_backend_health(
         }
 
 
+async def _probe_backend(backend_name: str) -> Dict[str, Any]:
+    """
+    Run the health probe for one backend.
+    
+    Synchronous integration calls (model registry scans, xlwings HTTP) run
+    in a worker thread so concurrent probes do not block the event loop.
+    """
+    if backend_name == "ocr":
+        backends = await asyncio.to_thread(ocr_registry.OCRBackendRegistry.list_available_backends)
+        return {
+            "healthy": any(b.get("available") for b in backends.values()),
+            "backends": backends
+        }
+    
+    elif backend_name == "tts":
+        tts = realtime_tts.get_tts_integration()
+        return await tts.check_health()
+    
+    elif backend_name == "notebook":
+        result = await asyncio.to_thread(notebook_runtime.nb_list_sys_path)
+        return {
+            "healthy": True,
+            "sys_path_count": result.get("count", 0)
+        }
+    
+    elif backend_name == "omni":
+        workflows = omni_tools.omni_workflows()
+        return {
+            "healthy": True,
+            "workflows": len(workflows)
+        }
+    
+    elif backend_name == "xlwings":
+        return await asyncio.to_thread(xlwings_excel.xlwings_health)
+    
+    return {
+        "healthy": False,
+        "message": f"Health check not implemented for {backend_name}"
+    }
+
+
 # =============================================================================
 # Registry Info
 # =============================================================================
@@ -437,22 +464,13 @@ async def get_registry_info(
 async def check_all_backends_health(
     _context: dict = Depends(setup_request_context)
 ) -> Dict[str, Any]:
-    """Check health of all backends."""
+    """Check health of all backends concurrently."""
     try:
         registry = _load_integrations_registry()
-        integrations = registry.get("integrations", {})
+        names = list(registry.get("integrations", {}).keys())
         
-        health_results = {}
-        
-        for name in integrations.keys():
-            try:
-                health_results[name] = await check_backend_health(name, _context)
-            except Exception as e:
-                health_results[name] = {
-                    "backend": name,
-                    "healthy": False,
-                    "error": "Health check failed"
-                }
+        results = await asyncio.gather(*(_check_with_timeout(name) for name in names))
+        health_results = dict(zip(names, results))
         
         # Count healthy backends
         healthy_count = sum(1 for h in health_results.values() if h.get("healthy", False))
@@ -471,3 +489,25 @@ async def check_all_backends_health(
             detail="Bulk health check failed"
         )
 
+
+async def _check_with_timeout(name: str) -> Dict[str, Any]:
+    """Probe one backend, bounded by BACKEND_HEALTH_TIMEOUT."""
+    try:
+        return {
+            "backend": name,
+            **await asyncio.wait_for(_probe_backend(name), BACKEND_HEALTH_TIMEOUT)
+        }
+    except asyncio.TimeoutError:
+        logger.warning(f"Health check for {name} timed out after {BACKEND_HEALTH_TIMEOUT}s")
+        return {
+            "backend": name,
+            "healthy": False,
+            "error": "Health check timed out"
+        }
+    except Exception as e:
+        logger.error(f"Health check failed for {name}: {e}")
+        return {
+            "backend": name,
+            "healthy": False,
+            "error": "Health check failed"
+        }
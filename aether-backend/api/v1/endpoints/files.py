@@ -4,9 +4,9 @@ File Processing Endpoints
 Endpoints for file upload and document processing.
 
 @.architecture
-Incoming: api/v1/router.py, Frontend (HTTP POST/GET) --- {multipart/form-data file uploads, HTTP requests to /v1/files/upload, /v1/files/process, /v1/files}
-Processing: upload_file(), process_file(), list_files() --- {10 jobs: dependency_injection, error_handling, file_validation, http_communication, metadata_extraction, path_validation, recording, sanitization, size_validation, storage_management}
-Outgoing: data/storage/local.py, Frontend (HTTP) --- {file storage operations, FileUploadResponse, JSONResponse with file metadata}
+Incoming: api/v1/router.py, Frontend (HTTP POST/GET) --- {multipart/form-data file uploads, HTTP requests to /v1/files/upload, /v1/files/process, /v1/files/chat, /v1/files}
+Processing: upload_file(), process_file(), chat_with_file(), list_files() --- {10 jobs: dependency_injection, error_handling, file_validation, http_communication, metadata_extraction, path_validation, recording, sanitization, size_validation, storage_management}
+Outgoing: data/storage/local.py, core/runtime/engine.py, Frontend (HTTP) --- {file storage operations, streamed file chat requests, FileUploadResponse, JSONResponse with file metadata}
 """
 
 import time
@@ -17,13 +17,15 @@ from typing import Dict, Any, Optional, List
 from fastapi import APIRouter, Depends, File, Form, UploadFile, HTTPException, status, Query
 from fastapi.responses import JSONResponse
 
-from api.dependencies import get_settings, setup_request_context
+from api.dependencies import get_settings, get_runtime_engine, setup_request_context
 from api.v1.schemas.files import (
     FileUploadResponse,
     FileChatRequest,
     FileChatResponse
 )
 from config.settings import Settings
+from core.runtime.document import InterpreterUnavailableError, UploadTooLargeError
+from core.runtime.engine import RuntimeEngine
 from monitoring import get_logger, counter
 from security.sanitization import sanitize_filename, validate_file_upload, PathTraversalError, ValidationError
 
@@ -213,7 +215,89 @@ async def process_file(
 
 
 # =============================================================================
-# File Chat (JSON Request)
+# File Chat (Streaming Upload)
+# =============================================================================
+
+@router.post(
+    "/files/chat",
+    summary="Chat with file",
+    description="Upload a file and analyze it with Docling and the LLM"
+)
+async def chat_with_file(
+    file: UploadFile = File(...),
+    prompt: str = Form(default="", max_length=5000),
+    request_id: Optional[str] = Form(default=None),
+    settings: Settings = Depends(get_settings),
+    runtime: RuntimeEngine = Depends(get_runtime_engine),
+    _context: dict = Depends(setup_request_context)
+) -> JSONResponse:
+    """
+    Upload a file and run file chat on it.
+    
+    The upload is never read into memory as a whole: it is spooled to disk
+    in chunks and streamed to Docling, with progress reported to the UI.
+    """
+    if not file.filename:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No filename provided"
+        )
+    
+    try:
+        safe_filename = sanitize_filename(file.filename)
+    except (ValidationError, PathTraversalError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File validation failed: {str(e)}"
+        )
+    
+    file_ext = Path(safe_filename).suffix.lower()
+    if file_ext not in settings.storage.allowed_extensions:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"File type {file_ext} not allowed"
+        )
+    
+    max_bytes = settings.storage.max_upload_size_mb * 1024 * 1024
+    if file.size is not None and file.size > max_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Max size: {settings.storage.max_upload_size_mb}MB"
+        )
+    
+    try:
+        result = await runtime.handle_file_chat_multipart(
+            file_data={
+                "name": safe_filename,
+                "file_object": file,
+                "max_bytes": max_bytes,
+            },
+            prompt=prompt,
+            request_id=request_id,
+        )
+    except UploadTooLargeError:
+        file_operations.inc(operation='chat', status='error')
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File too large. Max size: {settings.storage.max_upload_size_mb}MB"
+        )
+    except InterpreterUnavailableError as e:
+        file_operations.inc(operation='chat', status='error')
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
+    
+    if result.get("status") == "ok":
+        file_operations.inc(operation='chat', status='success')
+        return JSONResponse(result)
+    
+    file_operations.inc(operation='chat', status='error')
+    return JSONResponse(result, status_code=status.HTTP_502_BAD_GATEWAY)
+
+
+# =============================================================================
+# File Listing
 # =============================================================================
 
 @router.get(
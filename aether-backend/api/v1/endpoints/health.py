@@ -4,20 +4,26 @@ Health Check Endpoints
 Comprehensive health checks integrating with monitoring layer.
 
 @.architecture
-Incoming: api/v1/router.py, Frontend (HTTP GET), Load Balancers --- {HTTP requests to /v1/health, /v1/health/detailed, /v1/health/ready, /v1/health/live, /api/status}
-Processing: health_check(), detailed_health_check(), readiness_probe(), liveness_probe(), check_component_health() --- {7 jobs: component_checking, data_validation, dependency_injection, error_handling, health_monitoring, http_communication, resource_monitoring}
+Incoming: api/v1/router.py, Frontend (HTTP GET), Load Balancers --- {HTTP requests to /v1/health, /v1/health/detailed, /v1/health/ready, /v1/health/live, /metrics, /api/status}
+Processing: health_check(), detailed_health_check(), readiness_probe(), liveness_probe(), check_component_health(), startup_report(), prometheus_metrics() --- {9 jobs: component_checking, data_validation, dependency_injection, error_handling, health_monitoring, http_communication, metrics_export, resource_monitoring, startup_reporting}
 Outgoing: monitoring/health.py, api/dependencies.py, Frontend (HTTP) --- {health check results, HealthCheckResponse, SimpleHealthResponse, ComponentHealth schemas}
+
+Probes never run checks inline: detailed checks share a TTL-cached report,
+readiness reads the last report without waiting, and resource figures come
+from the background system metrics sampler.
 """
 
 import time
 import platform
 import sys
-import psutil
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import PlainTextResponse
 
 from api.dependencies import (
     get_runtime_engine,
+    get_settings,
+    get_startup_orchestrator,
     get_mcp_manager,
     get_database,
     setup_request_context
@@ -30,7 +36,8 @@ from api.v1.schemas.health import (
     SystemHealth
 )
 from api.v1.schemas.common import HealthStatus
-from monitoring import get_health_checker, get_logger
+from config.settings import Settings
+from monitoring import get_health_checker, get_logger, get_registry
 from core.runtime.engine import RuntimeEngine
 from core.mcp.manager import MCPServerManager
 from data.database.connection import DatabaseConnection
@@ -76,6 +83,7 @@ async def health_check() -> SimpleHealthResponse:
     description="Comprehensive health check of all system components"
 )
 async def detailed_health_check(
+    fresh: bool = Query(False, description="Run checks now instead of reusing a recent report"),
     _context: dict = Depends(setup_request_context)
 ) -> HealthCheckResponse:
     """
@@ -88,7 +96,8 @@ async def detailed_health_check(
     - MCP servers
     - Integrations
     
-    Returns detailed status for each component.
+    Returns detailed status for each component. Reports younger than the
+    checker's cache_ttl are reused unless fresh=true.
     """
     start_time = time.time()
     
@@ -113,8 +122,8 @@ async def detailed_health_check(
                 ]
             )
         
-        # Run comprehensive health check
-        health_data = await checker.check_all()
+        # Run (or reuse) comprehensive health check
+        health_data = await checker.get_snapshot(max_age=0 if fresh else None)
         
         # Convert to response model
         components = [
@@ -254,6 +263,9 @@ async def readiness_probe(response: Response) -> dict:
     
     Returns 200 if application is ready to serve traffic.
     Returns 503 if not ready.
+    
+    Reads the last cached health report (refreshed in the background when
+    stale) and never waits on component checks.
     """
     try:
         # Check critical components
@@ -273,6 +285,15 @@ async def readiness_probe(response: Response) -> dict:
             response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
             return {"ready": False, "reason": f"Runtime engine error: {str(e)}"}
         
+        snapshot = checker.peek_snapshot()
+        if snapshot is not None and snapshot["status"] == HealthStatus.UNHEALTHY.value:
+            unhealthy = [
+                c["component"] for c in snapshot["components"]
+                if c["status"] == HealthStatus.UNHEALTHY.value
+            ]
+            response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            return {"ready": False, "reason": f"Unhealthy components: {', '.join(unhealthy)}"}
+        
         return {"ready": True}
         
     except Exception as e:
@@ -299,6 +320,45 @@ async def liveness_probe() -> dict:
     }
 
 
+@router.get(
+    "/health/startup",
+    summary="Startup report",
+    description="Per-component startup status and timings"
+)
+async def startup_report(response: Response) -> dict:
+    """
+    Startup report.
+    
+    Returns each startup component's status, duration and error, including
+    the deferred background warm-up. Returns 503 until startup has finished.
+    """
+    startup = get_startup_orchestrator()
+    if startup is None:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"complete": False}
+    return {"complete": True, **startup.get_report()}
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    summary="Prometheus metrics",
+    description="All registered metrics in Prometheus text format"
+)
+async def prometheus_metrics(settings: Settings = Depends(get_settings)) -> PlainTextResponse:
+    """
+    Prometheus scrape endpoint.
+    
+    Returns 404 when metrics are disabled in monitoring settings.
+    """
+    if not settings.monitoring.metrics_enabled:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Metrics disabled")
+    return PlainTextResponse(
+        get_registry().export_prometheus(),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
 # =============================================================================
 # Detailed Status (Legacy Compatibility)
 # =============================================================================
@@ -319,14 +379,13 @@ async def status_check(
     Maintained for backward compatibility with old frontend.
     """
     try:
-        # Get system info
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
+        # Latest background sample (no psutil calls on the request path)
+        sample = get_health_checker().sampler.snapshot()
         
         system = SystemHealth(
-            cpu_percent=psutil.cpu_percent(interval=None) or 0,
-            memory_percent=memory.percent,
-            disk_percent=disk.percent,
+            cpu_percent=sample["cpu_percent"] or 0,
+            memory_percent=sample["memory_percent"],
+            disk_percent=sample["disk_percent"],
             platform=platform.system(),
             python_version=sys.version,
             uptime_seconds=time.time() - START_TIME
@@ -335,14 +394,14 @@ async def status_check(
         resources = {
             "cpu_percent": system.cpu_percent,
             "memory": {
-                "total_gb": memory.total / (1024**3),
-                "available_gb": memory.available / (1024**3),
-                "percent_used": memory.percent
+                "total_gb": sample["memory_total"] / (1024**3),
+                "available_gb": sample["memory_available"] / (1024**3),
+                "percent_used": sample["memory_percent"]
             },
             "disk": {
-                "total_gb": disk.total / (1024**3),
-                "free_gb": disk.free / (1024**3),
-                "percent_used": disk.percent
+                "total_gb": sample["disk_total"] / (1024**3),
+                "free_gb": sample["disk_free"] / (1024**3),
+                "percent_used": sample["disk_percent"]
             }
         }
         
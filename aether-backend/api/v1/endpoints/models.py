@@ -5,23 +5,31 @@ Endpoints for LLM model discovery and capabilities.
 
 @.architecture
 Incoming: api/v1/router.py, Frontend (HTTP GET), External LLM APIs --- {HTTP requests to /v1/models, /v1/models/active, /v1/models/capabilities, HTTP responses from LLM providers}
-Processing: list_models(), get_active_model(), model_capabilities() --- {7 jobs: capability_detection, data_validation, dependency_injection, error_handling, http_communication, model_discovery, provider_communication}
-Outgoing: External LLM APIs (HTTP GET), Frontend (HTTP) --- {HTTP GET to {api_base}/models, ModelsListResponse, ModelCapabilitiesResponse}
+Processing: list_models(), _fetch_model_names(), get_active_model(), model_capabilities() --- {8 jobs: capability_detection, data_validation, dependency_injection, error_handling, http_communication, model_discovery, provider_communication, response_caching}
+Outgoing: External LLM APIs (HTTP GET), data/cache/tiered.py, Frontend (HTTP) --- {HTTP GET to {api_base}/models, cached model name lists, ModelsListResponse, ModelCapabilitiesResponse}
 """
 
 import httpx
-from typing import Optional
+from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 
 from api.dependencies import get_settings, setup_request_context
 from api.v1.schemas.models import ModelsListResponse, ModelCapabilitiesResponse
 from config.settings import Settings
+from data.cache.tiered import cached, get_cache
 from monitoring import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter(tags=["models"])
 
+# Provider model lists change rarely; shared across workers via the tiered cache
+MODELS_CACHE_TTL = 60
+
+
+def _models_cache_key(base: str) -> str:
+    return f"models:{base}"
+
 
 # =============================================================================
 # List Models
@@ -35,6 +43,7 @@ router = APIRouter(tags=["models"])
 )
 async def list_models(
     base: Optional[str] = Query(None, description="Override API base URL"),
+    refresh: bool = Query(False, description="Bypass the model list cache"),
     settings: Settings = Depends(get_settings),
     _context: dict = Depends(setup_request_context)
 ) -> ModelsListResponse:
@@ -43,6 +52,7 @@ async def list_models(
     
     Args:
         base: Optional API base URL override
+        refresh: Refetch from the provider instead of using the cache
         
     Returns:
         ModelsListResponse: List of available model names
@@ -60,37 +70,11 @@ async def list_models(
     url = f"{effective_base}/models"
     
     try:
-        # Fast connect but allow slow model hosts
-        async with httpx.AsyncClient(timeout=httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=10.0)) as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Normalize to list of names
-            names = []
-            
-            # OpenAI-compatible format
-            if isinstance(data, dict) and isinstance(data.get("data"), list):
-                for item in data["data"]:
-                    name = item.get("id") or item.get("name")
-                    if name:
-                        names.append(name)
-            # Simple list format
-            elif isinstance(data, list):
-                for item in data:
-                    if isinstance(item, dict):
-                        name = item.get("id") or item.get("name")
-                        if name:
-                            names.append(name)
-                    elif isinstance(item, str):
-                        names.append(item)
-            
-            logger.info(f"Listed {len(names)} models from {effective_base}")
-            
-            return ModelsListResponse(
-                models=names if names else (data if isinstance(data, list) else []),
-                count=len(names) if names else (len(data) if isinstance(data, list) else 0)
-            )
+        if refresh:
+            await get_cache().invalidate(_models_cache_key(effective_base))
+        models = await _fetch_model_names(effective_base)
+        
+        return ModelsListResponse(models=models, count=len(models))
             
     except httpx.TimeoutException:
         logger.error(f"Timeout connecting to {url}")
@@ -112,6 +96,49 @@ async def list_models(
         )
 
 
+@cached(_models_cache_key, ttl=MODELS_CACHE_TTL)
+async def _fetch_model_names(effective_base: str) -> List[Any]:
+    """
+    Fetch and normalize the provider's model list (read-through cached).
+    
+    Args:
+        effective_base: Provider API base URL
+        
+    Returns:
+        List of model names (or the raw list if names cannot be extracted)
+    """
+    url = f"{effective_base}/models"
+    
+    # Fast connect but allow slow model hosts
+    async with httpx.AsyncClient(timeout=httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=10.0)) as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        data = response.json()
+    
+    # Normalize to list of names
+    names = []
+    
+    # OpenAI-compatible format
+    if isinstance(data, dict) and isinstance(data.get("data"), list):
+        for item in data["data"]:
+            name = item.get("id") or item.get("name")
+            if name:
+                names.append(name)
+    # Simple list format
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict):
+                name = item.get("id") or item.get("name")
+                if name:
+                    names.append(name)
+            elif isinstance(item, str):
+                names.append(item)
+    
+    logger.info(f"Listed {len(names)} models from {effective_base}")
+    
+    return names if names else (data if isinstance(data, list) else [])
+
+
 # =============================================================================
 # Get Active Model
 # =============================================================================
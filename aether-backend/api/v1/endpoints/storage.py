@@ -6,26 +6,36 @@ Uses ChatRepository and StorageRepository for all database operations with prope
 
 @.architecture
 Incoming: api/v1/router.py, Frontend (HTTP GET/POST/PUT/DELETE) --- {HTTP requests to /v1/api/storage/*, /v1/api/trails/*, ChatCreate, MessageCreate, ArtifactCreate, TrailState JSON payloads}
-Processing: list_chats(), create_chat(), get_chat(), update_chat(), delete_chat(), get_messages(), create_message(), get_artifacts(), create_artifact(), update_artifact_message_id(), save_trail_state(), load_trail_state(), delete_trail_state(), save_traceability_data(), load_traceability_data(), get_storage_stats(), health_check() --- {15 jobs: artifact_crud, chat_crud, data_validation, dependency_injection, error_handling, health_checking, http_communication, json_persistence, message_crud, query_execution, serialization, statistics_collection, traceability_persistence, trail_state_persistence, transaction_management}
-Outgoing: data/database/repositories/chat.py, data/database/repositories/storage.py, Frontend (HTTP) --- {ChatRepository, StorageRepository method calls, ChatResponse, MessageResponse, ArtifactResponse, TrailStateResponse, TraceabilityResponse schemas}
+Processing: list_chats(), list_chats_page(), create_chat(), get_chat(), update_chat(), delete_chat(), get_messages(), create_message(), create_messages_batch(), get_artifacts(), create_artifact(), create_artifacts_batch(), update_artifact_message_id(), save_trail_state(), load_trail_state(), delete_trail_state(), save_traceability_data(), load_traceability_data(), get_storage_stats(), health_check() --- {16 jobs: artifact_crud, bulk_ingestion, chat_crud, data_validation, dependency_injection, error_handling, health_checking, http_communication, json_persistence, message_crud, query_execution, serialization, statistics_collection, traceability_persistence, trail_state_persistence, transaction_management}
+Outgoing: data/database/repositories/chat.py, data/database/repositories/storage.py, Frontend (HTTP) --- {ChatRepository, StorageRepository method calls, ChatResponse, ChatPageResponse, BatchCreateResponse, MessageResponse, ArtifactResponse, TrailStateResponse, TraceabilityResponse schemas}
 """
 
-from typing import List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status
+import base64
+import json
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from uuid import UUID
 
-from api.dependencies import setup_request_context, get_database
+import psycopg
+
+from api.dependencies import setup_request_context, get_database, get_trail_state_buffer
 from api.v1.schemas.chat import (
     ChatCreate,
     ChatUpdate,
     ChatResponse,
+    ChatPageResponse,
     MessageCreate,
     MessageResponse,
     ArtifactCreate,
     ArtifactResponse,
+    ArtifactBatchCreate,
+    MessageBatchCreate,
+    BatchCreateResponse,
     ArtifactUpdateMessageIdRequest,
     ArtifactUpdateMessageIdResponse
 )
+from data.cache.tiered import get_cache
 from data.database.connection import DatabaseConnection
 from data.database.repositories.chat import ChatRepository
 from data.database.repositories.storage import StorageRepository
@@ -43,14 +53,14 @@ async def get_chat_repository(
     db: DatabaseConnection = Depends(get_database)
 ) -> ChatRepository:
     """Get chat repository instance."""
-    return ChatRepository(db)
+    return ChatRepository(db, cache=get_cache())
 
 
 async def get_storage_repository(
     db: DatabaseConnection = Depends(get_database)
 ) -> StorageRepository:
-    """Get storage repository instance."""
-    return StorageRepository(db)
+    """Get storage repository instance (shares the trail write-behind buffer)."""
+    return StorageRepository(db, trail_writer=get_trail_state_buffer())
 
 
 # =============================================================================
@@ -92,16 +102,59 @@ async def list_chats(
         logger.info(f"Retrieved {len(chats)} chats (skip={skip}, limit={limit})")
         
         # Convert to response models
-        return [
-            ChatResponse(
-                id=str(chat.id),
-                title=chat.title,
-                created_at=chat.created_at,
-                updated_at=chat.updated_at,
-                message_count=getattr(chat, 'message_count', 0)
+        return [_chat_response(chat) for chat in chats]
+        
+    except Exception as e:
+        logger.error(f"Failed to list chats: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to retrieve chats"
+        )
+
+
+@router.get("/chats/page", response_model=ChatPageResponse, summary="List chats (cursor pagination)")
+async def list_chats_page(
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum chats to return"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    _context: dict = Depends(setup_request_context),
+    repo: ChatRepository = Depends(get_chat_repository)
+) -> ChatPageResponse:
+    """
+    List chats ordered by most recently updated, using keyset pagination.
+    
+    Pages are addressed by an opaque (updated_at, id) cursor, so fetching a
+    page costs the same regardless of its depth.
+    
+    Args:
+        limit: Maximum number of chats to return
+        cursor: Cursor returned as next_cursor by the previous page
+        
+    Returns:
+        Page of chats with next_cursor when more chats exist
+    """
+    after = None
+    if cursor:
+        try:
+            after = _decode_chat_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
             )
-            for chat in chats
-        ]
+    
+    try:
+        chats, has_more = await repo.list_chats_page(limit=limit, after=after)
+        logger.info(f"Retrieved {len(chats)} chats (cursor={'yes' if cursor else 'no'}, limit={limit})")
+        
+        next_cursor = None
+        if has_more and chats:
+            next_cursor = _encode_chat_cursor(chats[-1].updated_at, chats[-1].id)
+        
+        return ChatPageResponse(
+            chats=[_chat_response(chat) for chat in chats],
+            next_cursor=next_cursor,
+            has_more=has_more
+        )
         
     except Exception as e:
         logger.error(f"Failed to list chats: {e}", exc_info=True)
@@ -111,6 +164,39 @@ async def list_chats(
         )
 
 
+def _chat_response(chat: Any) -> ChatResponse:
+    """Build a ChatResponse from a chat row with list counters."""
+    return ChatResponse(
+        id=str(chat.id),
+        title=chat.title,
+        created_at=chat.created_at,
+        updated_at=chat.updated_at,
+        message_count=getattr(chat, 'message_count', 0) or 0,
+        last_message_at=getattr(chat, 'last_message_at', None)
+    )
+
+
+def _encode_chat_cursor(updated_at: datetime, chat_id: UUID) -> str:
+    """Encode an (updated_at, id) keyset position as an opaque cursor."""
+    raw = json.dumps([updated_at.isoformat(), str(chat_id)]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_chat_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    Decode a cursor produced by _encode_chat_cursor().
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_at, chat_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(updated_at), UUID(chat_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid chat cursor: {e}") from e
+
+
 @router.post("/chats", response_model=ChatResponse, status_code=status.HTTP_201_CREATED, summary="Create chat")
 async def create_chat(
     chat: ChatCreate,
@@ -173,16 +259,8 @@ async def get_chat(
                 detail=f"Chat {chat_id} not found"
             )
         
-        # Get message count
-        stats = await repo.get_chat_statistics(chat_id)
-        
-        return ChatResponse(
-            id=str(chat.id),
-            title=chat.title,
-            created_at=chat.created_at,
-            updated_at=chat.updated_at,
-            message_count=stats.get('message_count', 0)
-        )
+        # Message count is stored on the chat row
+        return _chat_response(chat)
         
     except HTTPException:
         raise
@@ -397,6 +475,69 @@ async def create_message(
         )
 
 
+@router.post("/chats/{chat_id}/messages:batch", response_model=BatchCreateResponse, status_code=status.HTTP_201_CREATED, summary="Create messages in bulk")
+async def create_messages_batch(
+    chat_id: UUID,
+    batch: MessageBatchCreate,
+    _context: dict = Depends(setup_request_context),
+    repo: ChatRepository = Depends(get_chat_repository)
+) -> BatchCreateResponse:
+    """
+    Insert many messages into a chat in a single transaction.
+    
+    Used for importing or syncing conversations; the whole batch is
+    committed or rejected together.
+    
+    Args:
+        chat_id: Chat UUID
+        batch: Messages in conversation order
+        
+    Returns:
+        Inserted count and message IDs in input order
+        
+    Raises:
+        404: If chat not found
+        400: If the batch violates a database constraint
+    """
+    try:
+        ids = await repo.create_messages_bulk(
+            chat_id=chat_id,
+            messages=[
+                {
+                    "role": message.role,
+                    "content": message.content,
+                    "timestamp": message.timestamp,
+                    "llm_model": message.llm_model,
+                    "llm_provider": message.llm_provider,
+                    "tokens_used": message.tokens_used,
+                    "correlation_id": message.parent_message_id,
+                }
+                for message in batch.messages
+            ]
+        )
+        
+        logger.info(f"Bulk created {len(ids)} messages in chat {chat_id}")
+        return BatchCreateResponse(chat_id=chat_id, inserted=len(ids), ids=ids)
+        
+    except ValueError:
+        # Chat not found
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat not found"
+        )
+    except psycopg.errors.IntegrityError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch rejected: {e.diag.message_primary or 'constraint violation'}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to bulk create messages in chat {chat_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create messages"
+        )
+
+
 # =============================================================================
 # Artifact Endpoints
 # =============================================================================
@@ -536,6 +677,73 @@ async def create_artifact(
         )
 
 
+@router.post("/chats/{chat_id}/artifacts:batch", response_model=BatchCreateResponse, status_code=status.HTTP_201_CREATED, summary="Create artifacts in bulk")
+async def create_artifacts_batch(
+    chat_id: UUID,
+    batch: ArtifactBatchCreate,
+    _context: dict = Depends(setup_request_context),
+    repo: ChatRepository = Depends(get_chat_repository)
+) -> BatchCreateResponse:
+    """
+    Insert many artifacts into a chat in a single transaction.
+    
+    Args:
+        chat_id: Chat UUID
+        batch: Artifacts to create
+        
+    Returns:
+        Inserted count and artifact IDs in input order
+        
+    Raises:
+        404: If chat not found
+        400: If a message_id is malformed or the batch violates a constraint
+    """
+    artifacts = []
+    for artifact in batch.artifacts:
+        message_uuid = None
+        if artifact.message_id:
+            try:
+                message_uuid = UUID(artifact.message_id)
+            except (ValueError, TypeError) as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Invalid message_id format: {str(e)}"
+                )
+        artifacts.append({
+            "type": artifact.type,
+            "content": artifact.content,
+            "filename": artifact.filename,
+            "language": artifact.language,
+            "message_id": message_uuid,
+            "artifact_id": artifact.artifact_id,
+            "metadata": artifact.metadata,
+        })
+    
+    try:
+        ids = await repo.create_artifacts_bulk(chat_id=chat_id, artifacts=artifacts)
+        
+        logger.info(f"Bulk created {len(ids)} artifacts in chat {chat_id}")
+        return BatchCreateResponse(chat_id=chat_id, inserted=len(ids), ids=ids)
+        
+    except ValueError:
+        # Chat not found
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat not found"
+        )
+    except psycopg.errors.IntegrityError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch rejected: {e.diag.message_primary or 'constraint violation'}"
+        )
+    except Exception as e:
+        logger.error(f"Failed to bulk create artifacts in chat {chat_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create artifacts"
+        )
+
+
 @router.put("/artifacts/update-message-id", response_model=ArtifactUpdateMessageIdResponse, summary="Update artifact message ID")
 async def update_artifact_message_id(
     update_request: ArtifactUpdateMessageIdRequest,
@@ -833,11 +1041,8 @@ async def get_storage_stats(
         all_chats = await chat_repo.list_chats(limit=10000, offset=0)
         chat_count = len(all_chats)
         
-        # Get message count - sum from all chats
-        message_count = 0
-        for chat in all_chats:
-            chat_stats = await chat_repo.get_chat_statistics(chat.id)
-            message_count += chat_stats.get('message_count', 0)
+        # Get message count - sum of per-chat counters
+        message_count = sum(getattr(chat, 'message_count', 0) or 0 for chat in all_chats)
         
         return {
             "total_chats": chat_count,
@@ -38,6 +38,7 @@ from .chat import (
     ChatCreate,
     ChatUpdate,
     ChatResponse,
+    ChatPageResponse,
     MessageCreate,
     MessageResponse,
     ArtifactCreate,
@@ -86,6 +87,7 @@ __all__ = [
     "ChatCreate",
     "ChatUpdate",
     "ChatResponse",
+    "ChatPageResponse",
     "MessageCreate",
     "MessageResponse",
     "ArtifactCreate",
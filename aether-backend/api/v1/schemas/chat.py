@@ -6,7 +6,7 @@ Pydantic models for chat and messaging endpoints.
 @.architecture
 Incoming: api/v1/endpoints/chat.py, api/v1/endpoints/storage.py --- {JSON request payloads, database records}
 Processing: Pydantic validation and serialization --- {2 jobs: data_validation, serialization}
-Outgoing: api/v1/endpoints/chat.py, api/v1/endpoints/storage.py --- {ChatCreate, ChatUpdate, ChatResponse, MessageCreate, MessageResponse, ArtifactCreate validated models}
+Outgoing: api/v1/endpoints/chat.py, api/v1/endpoints/storage.py --- {ChatCreate, ChatUpdate, ChatResponse, ChatPageResponse, MessageCreate, MessageResponse, ArtifactCreate, MessageBatchCreate, ArtifactBatchCreate, BatchCreateResponse validated models}
 """
 
 from typing import List, Optional, Dict, Any
@@ -51,6 +51,7 @@ class ChatResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     message_count: int = 0
+    last_message_at: Optional[datetime] = None
     archived: bool = False
     metadata: Optional[Dict[str, Any]] = None
     
@@ -63,12 +64,29 @@ class ChatResponse(BaseModel):
                 "created_at": "2024-11-04T12:00:00Z",
                 "updated_at": "2024-11-04T12:30:00Z",
                 "message_count": 15,
+                "last_message_at": "2024-11-04T12:30:00Z",
                 "archived": False,
                 "metadata": {"tags": ["code", "python"]}
             }
         }
 
 
+class ChatPageResponse(BaseModel):
+    """Keyset-paginated chat list page."""
+    chats: List[ChatResponse]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "chats": [],
+                "next_cursor": "WyIyMDI0LTExLTA0VDEyOjMwOjAwKzAwOjAwIiwgIjU1MGU4NDAwIl0",
+                "has_more": True
+            }
+        }
+
+
 # =============================================================================
 # Message Models
 # =============================================================================
@@ -227,6 +245,58 @@ class ArtifactUpdateMessageIdResponse(BaseModel):
         }
 
 
+# =============================================================================
+# Bulk Ingestion Models
+# =============================================================================
+
+# Upper bound on rows per batch request
+MAX_BATCH_SIZE = 5000
+
+
+class MessageImport(MessageCreate):
+    """Message in a bulk import; keeps its original timestamp when given."""
+    timestamp: Optional[datetime] = None
+
+
+class MessageBatchCreate(BaseModel):
+    """Request to insert many messages into a chat."""
+    messages: List[MessageImport] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "messages": [
+                    {"role": "user", "content": "Hello", "timestamp": "2024-11-04T12:00:00Z"},
+                    {"role": "assistant", "content": "Hi! How can I help?"}
+                ]
+            }
+        }
+
+
+class ArtifactBatchCreate(BaseModel):
+    """Request to insert many artifacts into a chat."""
+    artifacts: List[ArtifactCreate] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class BatchCreateResponse(BaseModel):
+    """Result of a bulk insert."""
+    chat_id: UUID
+    inserted: int
+    ids: List[UUID]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "chat_id": "550e8400-e29b-41d4-a716-446655440000",
+                "inserted": 2,
+                "ids": [
+                    "650e8400-e29b-41d4-a716-446655440001",
+                    "650e8400-e29b-41d4-a716-446655440002"
+                ]
+            }
+        }
+
+
 # =============================================================================
 # Streaming Models
 # =============================================================================
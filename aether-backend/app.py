@@ -9,7 +9,7 @@ Creates and configures the FastAPI application with:
 
 @.architecture
 Incoming: main.py, config/settings.py, api/v1/router.py, ws/hub.py, api/middleware/*.py --- {Settings object, APIRouter instances, middleware constructors}
-Processing: create_app(), startup_event(), shutdown_event(), websocket_endpoint() --- {11 jobs: application_creation, cleanup, connection_management, dependency_injection, health_monitoring, initialization, lifecycle_management, message_routing, middleware_registration, routing_registration, tool_catalog_generation}
+Processing: create_app(), startup_event(), shutdown_event(), websocket_endpoint() --- {12 jobs: application_creation, cleanup, connection_management, dependency_injection, health_monitoring, initialization, lifecycle_management, message_routing, middleware_registration, routing_registration, startup_orchestration, tool_catalog_generation}
 Outgoing: main.py, Frontend (HTTP/WebSocket) --- {FastAPI application instance, HTTP responses, WebSocket messages}
 """
 
@@ -30,12 +30,15 @@ from api.middleware import (
 from api.dependencies import (
     set_runtime_engine,
     set_mcp_manager,
-    set_database_connection
+    set_database_connection,
+    set_startup_orchestrator
 )
+from core.runtime.startup import StartupOrchestrator, record_time_to_first_request
 from monitoring import (
     configure_from_preset,
     get_logger,
     initialize_health_checks,
+    configure_tracer,
     get_tracer
 )
 
@@ -65,6 +68,15 @@ def create_app() -> FastAPI:
     
     logger.info(f"Creating Aether Backend application (environment: {settings.environment})")
     
+    # Bounded, sampled span recording with optional OTLP-JSON export
+    configure_tracer(
+        capacity=settings.monitoring.trace_buffer_size,
+        sample_ratio=settings.monitoring.trace_sample_ratio,
+        tail_latency_ms=settings.monitoring.trace_tail_latency_ms,
+        export_path=settings.monitoring.trace_export_path,
+        enabled=settings.monitoring.tracing_enabled,
+    )
+    
     # Create FastAPI app
     app = FastAPI(
         title=settings.app_name,
@@ -218,129 +230,123 @@ def create_app() -> FastAPI:
         """
         Application startup.
         
-        Initializes:
-        - Runtime engine
-        - WebSocket hub
-        - MCP manager
+        Components start concurrently in dependency order:
+        - Runtime engine -> WebSocket hub
+        - Tiered cache (optional Redis) -> MCP manager
         - Database connections
-        - Backend API tool registration with OI
-        - Health checks
-        - Monitoring
-        """
-        nonlocal ws_hub
+        - Health checks and monitoring (after runtime and database)
+        
+        Deferred to a background warm-up once requests are being served:
+        - Backend API tool registration with OI (backend_tools_registry.yaml)
+        - OCR backend and TTS engine instances (otherwise created on first use)
         
+        A failed component is logged and its dependents are skipped; the
+        rest of the application still starts (endpoints return 503).
+        """
         logger.info("=== Application Startup ===")
+        startup = StartupOrchestrator("app")
         
-        try:
-            # Initialize runtime engine
-            logger.info("Initializing runtime engine...")
+        async def start_runtime():
             from core.runtime.engine import RuntimeEngine
             runtime = RuntimeEngine(settings=settings)
             await runtime.start()
             set_runtime_engine(runtime)
-            logger.info("✅ Runtime engine initialized")
+        
+        async def start_websocket_hub():
+            nonlocal ws_hub
+            from api.dependencies import get_runtime_engine
+            ws_hub = WebSocketHub(get_runtime_engine())
+        
+        async def start_cache():
+            # Redis shared tier is optional; failure leaves the in-process default
+            from data.cache import RedisCache, TieredCache, set_cache
+            redis_cache = None
+            if settings.cache.redis_url:
+                redis_cache = RedisCache(settings.cache.redis_url, namespace=settings.cache.namespace)
+                if not await redis_cache.connect():
+                    logger.warning("Redis unavailable - cache is in-process only")
+            set_cache(TieredCache(
+                redis=redis_cache,
+                max_entries=settings.cache.local_max_entries,
+                local_ttl=settings.cache.local_ttl,
+                default_ttl=settings.cache.default_ttl,
+                name="api",
+            ))
+        
+        async def start_mcp():
+            from core.mcp.manager import MCPServerManager
+            from core.mcp.database import MCPDatabase
             
-            # Initialize WebSocket hub
-            logger.info("Initializing WebSocket hub...")
-            ws_hub = WebSocketHub(runtime)
-            logger.info("✅ WebSocket hub initialized")
+            mcp_db = MCPDatabase(settings.database.url)
+            await mcp_db.initialize()
             
-        except Exception as e:
-            logger.error(f"Failed to initialize runtime engine: {e}", exc_info=True)
-            # Continue without runtime - endpoints will return 503
-        
-        try:
-            # Initialize MCP manager (if enabled)
-            if settings.integrations.mcp_enabled:
-                logger.info("Initializing MCP manager...")
-                from core.mcp.manager import MCPServerManager
-                from core.mcp.database import MCPDatabase
-                
-                mcp_db = MCPDatabase(settings.database.url)
-                await mcp_db.initialize()
-                
-                mcp_manager = MCPServerManager(mcp_db)
-                await mcp_manager.start()
-                set_mcp_manager(mcp_manager)
-                logger.info("✅ MCP manager initialized")
-            else:
-                logger.info("MCP disabled in settings")
-                
-        except Exception as e:
-            logger.error(f"Failed to initialize MCP manager: {e}", exc_info=True)
-            # Continue without MCP - endpoints will return 503
+            mcp_manager = MCPServerManager(mcp_db)
+            await mcp_manager.start()
+            set_mcp_manager(mcp_manager)
         
-        try:
-            # Initialize database connection
-            logger.info("Initializing database...")
+        async def start_database():
             from data.database.connection import DatabaseConnection
             db = DatabaseConnection(settings.database.url)
             await db.connect()
             set_database_connection(db)
-            logger.info("✅ Database initialized")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize database: {e}", exc_info=True)
-            # Continue without database - storage endpoints will not work
         
-        try:
-            # Initialize health checks and register components
-            logger.info("Initializing health checks...")
+        async def start_health_checks():
+            from api.dependencies import get_runtime_engine, _database_connection
             
-            # Register runtime engine if available
+            runtime = None
             try:
-                from api.dependencies import get_runtime_engine
-                from monitoring import get_health_checker
-                
                 runtime = get_runtime_engine()
-                health_checker = get_health_checker()
-                
-                if runtime and health_checker:
-                    health_checker.register_checker("runtime", runtime)
-                    logger.debug("✅ Runtime registered with health checker")
             except Exception as e:
                 logger.debug(f"Runtime health registration skipped: {e}")
             
-            # Register database if available  
-            try:
-                from api.dependencies import get_database
-                from monitoring import get_health_checker
-                
-                db = get_database()
-                health_checker = get_health_checker()
-                
-                if db and health_checker:
-                    health_checker.register_checker("database", db)
-                    logger.debug("✅ Database registered with health checker")
-            except Exception as e:
-                logger.debug(f"Database health registration skipped: {e}")
-            
-            logger.info("✅ Health checks initialized")
-            
-        except Exception as e:
-            logger.warning(f"Health check initialization failed: {e}")
+            health_checker = initialize_health_checks(
+                runtime=runtime,
+                database=_database_connection,
+                check_timeout=settings.monitoring.health_check_timeout,
+                cache_ttl=settings.monitoring.health_cache_ttl,
+                sample_interval=settings.monitoring.system_sample_interval,
+            )
+            # Background CPU/memory/disk sampling keeps probes off psutil
+            await health_checker.start()
         
-        # =============================================================================
-        # Generate Backend Tools Registry YAML for OI
-        # =============================================================================
-        try:
-            logger.info("Generating backend_tools_registry.yaml for OI...")
+        async def generate_tools_yaml():
+            # Route introspection and YAML writing are blocking
             from core.integrations.framework import generate_backend_tools_yaml
-            
-            success = generate_backend_tools_yaml(
-                fastapi_app=app,
-                settings=settings
+            success = await asyncio.to_thread(
+                generate_backend_tools_yaml, fastapi_app=app, settings=settings
             )
-            
-            if success:
-                logger.info("✅ backend_tools_registry.yaml generated successfully")
-                logger.info(f"   Location: {settings.config_dir / 'backend_tools_registry.yaml'}")
-                logger.info("   OI will load this on next initialization")
-            else:
-                logger.warning("⚠️  Failed to generate backend_tools_registry.yaml")
-                
-        except Exception as e:
-            logger.warning(f"Backend tools YAML generation failed (non-critical): {e}", exc_info=True)
+            if not success:
+                raise RuntimeError("Failed to generate backend_tools_registry.yaml")
+            logger.info(f"backend_tools_registry.yaml written to {settings.config_dir}")
+        
+        async def warm_ocr():
+            from core.integrations.libraries.ocr.registry import OCRBackendRegistry
+            # Creates the default backend; model weights still load on first use
+            await asyncio.to_thread(OCRBackendRegistry.get_backend)
+        
+        async def warm_tts():
+            from core.integrations.libraries.tts.realtime_tts import get_tts_integration
+            await asyncio.to_thread(get_tts_integration)
+        
+        startup.add("runtime", start_runtime)
+        startup.add("websocket_hub", start_websocket_hub, depends_on=["runtime"])
+        startup.add("cache", start_cache)
+        if settings.integrations.mcp_enabled:
+            startup.add("mcp", start_mcp, after=["cache"])
+        else:
+            logger.info("MCP disabled in settings")
+        startup.add("database", start_database)
+        startup.add("health_checks", start_health_checks, after=["runtime", "database"])
+        
+        startup.add("tools_yaml", generate_tools_yaml, deferred=True)
+        if settings.integrations.warmup_enabled:
+            startup.add("ocr_warmup", warm_ocr, deferred=True)
+            startup.add("tts_warmup", warm_tts, deferred=True)
+        
+        await startup.run()
+        set_startup_orchestrator(startup)
+        record_time_to_first_request()
+        startup.start_deferred()
         
         logger.info("=== Startup Complete ===")
     
@@ -350,12 +356,32 @@ def create_app() -> FastAPI:
         Application shutdown.
         
         Cleanup:
+        - Cancel unfinished startup warm-up
+        - Stop health metrics sampler
         - Stop runtime engine
         - Stop MCP manager
+        - Flush pending trail state writes
         - Close database connections
+        - Flush exported trace spans
+        - Close shared HTTP client pools
         """
         logger.info("=== Application Shutdown ===")
         
+        try:
+            # Cancel an unfinished background warm-up
+            from api.dependencies import get_startup_orchestrator
+            startup = get_startup_orchestrator()
+            if startup:
+                await startup.stop()
+        except Exception as e:
+            logger.error(f"Error stopping startup warm-up: {e}")
+        
+        try:
+            from monitoring import get_health_checker
+            await get_health_checker().stop()
+        except Exception as e:
+            logger.error(f"Error stopping health checker: {e}")
+        
         try:
             # Stop runtime engine
             from api.dependencies import get_runtime_engine
@@ -376,6 +402,13 @@ def create_app() -> FastAPI:
         except Exception as e:
             logger.error(f"Error stopping MCP manager: {e}")
         
+        try:
+            # Flush debounced trail state writes while the database is still open
+            from api.dependencies import close_trail_state_buffer
+            await close_trail_state_buffer()
+        except Exception as e:
+            logger.error(f"Error flushing trail state writes: {e}")
+        
         try:
             # Close database connection directly
             from api.dependencies import _database_connection
@@ -385,6 +418,29 @@ def create_app() -> FastAPI:
         except Exception as e:
             logger.error(f"Error closing database: {e}")
         
+        try:
+            # Disconnect the shared cache tier
+            from data.cache import get_cache
+            cache = get_cache()
+            if cache.redis is not None:
+                await cache.redis.disconnect()
+        except Exception as e:
+            logger.error(f"Error closing cache: {e}")
+        
+        try:
+            # Write spans still queued for export
+            await asyncio.to_thread(get_tracer().shutdown)
+        except Exception as e:
+            logger.error(f"Error flushing trace export: {e}")
+        
+        try:
+            # Close pooled keep-alive connections to integration services
+            from utils.http import close_http_client, close_sync_http_clients
+            await close_http_client()
+            close_sync_http_clients()
+        except Exception as e:
+            logger.error(f"Error closing HTTP clients: {e}")
+        
         logger.info("=== Shutdown Complete ===")
     
     return app
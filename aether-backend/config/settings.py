@@ -59,6 +59,11 @@ class InterpreterSettings(BaseModel):
     disable_telemetry: bool = True
     computer: ComputerAPISettings = Field(default_factory=ComputerAPISettings)
     
+    # Interpreter pool (concurrent agentic sessions per process)
+    pool_size: int = 1
+    pool_max_requests: int = 200  # Recycle instance after N requests (0 = never)
+    pool_acquire_timeout: float = 300.0
+    
     class Config:
         env_prefix = "INTERPRETER_"
 
@@ -98,6 +103,7 @@ class DatabaseSettings(BaseModel):
     max_overflow: int = 20
     pool_timeout: int = 30
     echo_sql: bool = False
+    trail_write_interval: float = 1.0  # Seconds to debounce trail autosaves (0 = write immediately)
     
     class Config:
         env_prefix = "DATABASE_"
@@ -110,6 +116,13 @@ class MonitoringSettings(BaseModel):
     metrics_enabled: bool = True
     tracing_enabled: bool = True
     health_check_interval: int = 30
+    health_check_timeout: float = 5.0  # Seconds per component check
+    health_cache_ttl: float = 2.0  # Seconds a full health report is reused by probes
+    system_sample_interval: float = 5.0  # Seconds between background CPU/memory/disk samples
+    trace_buffer_size: int = 10000  # Finished spans kept in memory (oldest evicted)
+    trace_sample_ratio: float = 1.0  # Fraction of traces recorded (head sampling)
+    trace_tail_latency_ms: Optional[float] = None  # Also keep unsampled traces at least this slow
+    trace_export_path: Optional[str] = None  # OTLP-JSON lines file (None = no export)
     
     class Config:
         env_prefix = "MONITORING_"
@@ -120,6 +133,8 @@ class IntegrationSettings(BaseModel):
     # Service integrations
     perplexica_url: str = "http://localhost:3000"
     perplexica_enabled: bool = True
+    perplexica_model_cache_ttl: float = 300.0  # Seconds to reuse discovered models (0 = rediscover per search)
+    perplexica_answer_cache_ttl: float = 0.0  # Seconds to reuse answers per normalised query (0 = disabled)
     
     searxng_url: str = "http://127.0.0.1:4000"
     searxng_enabled: bool = True
@@ -138,6 +153,10 @@ class IntegrationSettings(BaseModel):
     mcp_auto_start: bool = True
     mcp_health_check_interval: int = 30
     
+    # Create OCR/TTS instances in a background warm-up after startup
+    # (False = create on first use)
+    warmup_enabled: bool = True
+    
     class Config:
         env_prefix = "INTEGRATION_"
 
@@ -170,6 +189,18 @@ class StorageSettings(BaseModel):
         env_prefix = "STORAGE_"
 
 
+class CacheSettings(BaseModel):
+    """Tiered read-through cache settings."""
+    redis_url: Optional[str] = None  # Shared tier across workers (None = in-process only)
+    namespace: str = "aether"
+    local_max_entries: int = 1024
+    local_ttl: float = 5.0  # Bounds cross-worker staleness after invalidation
+    default_ttl: int = 60
+    
+    class Config:
+        env_prefix = "CACHE_"
+
+
 class Settings(BaseModel):
     """
     Main application settings.
@@ -200,6 +231,7 @@ class Settings(BaseModel):
     integrations: IntegrationSettings = Field(default_factory=IntegrationSettings)
     memory: MemorySettings = Field(default_factory=MemorySettings)
     storage: StorageSettings = Field(default_factory=StorageSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
     
     @property
     def base_url(self) -> str:
@@ -277,6 +309,8 @@ def get_settings() -> Settings:
         interpreter_settings = {
             "offline": oi_config.get("offline", True),
             "disable_telemetry": oi_config.get("disable_telemetry", True),
+            "pool_size": oi_config.get("pool_size", 1),
+            "pool_max_requests": oi_config.get("pool_max_requests", 200),
         }
     
     # Build settings dict
@@ -306,9 +340,15 @@ def get_settings() -> Settings:
     if db_url := os.getenv("DATABASE_URL"):
         settings_dict["database"] = {"url": db_url}
     
+    if pool_size := os.getenv("INTERPRETER_POOL_SIZE"):
+        settings_dict.setdefault("interpreter", {})["pool_size"] = int(pool_size)
+    
     if log_level := os.getenv("MONITORING_LOG_LEVEL"):
         settings_dict.setdefault("monitoring", {})["log_level"] = log_level
     
+    if redis_url := os.getenv("CACHE_REDIS_URL"):
+        settings_dict.setdefault("cache", {})["redis_url"] = redis_url
+    
     # Create Settings instance (Pydantic will handle env vars via Config)
     return Settings(**settings_dict)
 
@@ -17,13 +17,14 @@ Features:
 Production-ready with:
 - Proper error handling
 - Timeout management
+- Shared keep-alive connection pool across operations
 - Clear error messages
 - API compatibility
 
 @.architecture
 Incoming: api/v1/endpoints/xlwings_api.py, services/xlwings --- {Dict workbook config, str workbook_id, List[List] data, Dict chart config}
 Processing: excel_workbook_create(), excel_sheet_create(), excel_data_write(), excel_data_read(), excel_chart_create() --- {5 jobs: chart_creation, data_manipulation, excel_automation, formatting, workbook_management}
-Outgoing: api/v1/endpoints/xlwings_api.py, XLWings server --- {Dict[str, Any] workbook info, str workbook_id, List[List] read data, HTTP requests to xlwings server}
+Outgoing: api/v1/endpoints/xlwings_api.py, XLWings server (via utils/http.py shared client) --- {Dict[str, Any] workbook info, str workbook_id, List[List] read data, HTTP requests to xlwings server}
 """
 
 import json
@@ -32,6 +33,8 @@ from typing import Any, Dict, List, Optional, Union
 
 import httpx
 
+from utils.http import get_sync_http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,20 +70,20 @@ def _xlwings_api_call(
     url = f"{xlwings_url}{endpoint}"
     
     try:
-        with httpx.Client(timeout=timeout) as client:
-            if method == "GET":
-                response = client.get(url)
-            elif method == "POST":
-                if data:
-                    response = client.post(url, json=data)
-                else:
-                    response = client.post(url)
+        client = get_sync_http_client("xlwings")
+        if method == "GET":
+            response = client.get(url, timeout=timeout)
+        elif method == "POST":
+            if data:
+                response = client.post(url, json=data, timeout=timeout)
             else:
-                return {"error": f"Unsupported HTTP method: {method}"}
-            
-            response.raise_for_status()
-            return response.json()
-            
+                response = client.post(url, timeout=timeout)
+        else:
+            return {"error": f"Unsupported HTTP method: {method}"}
+        
+        response.raise_for_status()
+        return response.json()
+        
     except httpx.TimeoutException:
         error_msg = f"XLWings API timeout after {timeout}s"
         logger.error(error_msg)
@@ -7,17 +7,32 @@ with security isolation and audit logging.
 
 @.architecture
 Incoming: Open Interpreter computer, core/mcp/manager.py --- {MCPServerManager, str server_name, str tool_name, Dict tool_args}
-Processing: list_servers(), list_tools(), execute(), health(), _log_execution() --- {5 jobs: audit_logging, mcp_orchestration, security_isolation, tool_discovery, tool_execution}
+Processing: list_servers(), list_tools(), execute(), health(), alist_servers(), alist_tools(), aexecute(), ahealth(), _run(), _get_server_id() --- {7 jobs: audit_logging, loop_dispatch, mcp_orchestration, security_isolation, server_resolution, tool_discovery, tool_execution}
 Outgoing: Open Interpreter computer.mcp namespace, core/mcp/manager.py --- {List[Dict] servers/tools, Any tool_execution_result, Dict health status}
+
+Threading model:
+MCP sessions and the database pool belong to the application event loop.
+The bridge binds to that loop at install time; synchronous calls from
+agent worker threads are submitted to it with run_coroutine_threadsafe
+(one hop per call), and async callers await the a* methods directly.
+A synchronous call made on the loop thread itself is refused instead of
+deadlocking.
 """
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 from uuid import UUID
 
 logger = logging.getLogger(__name__)
 
+# Timeouts for synchronous calls (seconds)
+LIST_TIMEOUT = 10.0
+TOOLS_TIMEOUT = 30.0
+EXECUTE_TIMEOUT = 300.0
+HEALTH_TIMEOUT = 30.0
+HISTORY_TIMEOUT = 10.0
+
 
 class MCPBridge:
     """
@@ -49,8 +64,15 @@ class MCPBridge:
         self._manager = manager
         self._bridge_marker = "mcp_bridge"
         
+        # Event loop owning the manager's sessions (bound in install())
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
         # Cache for server name to UUID mapping
         self._server_cache: Dict[str, UUID] = {}
+        # In-flight lookups, so concurrent misses share one query
+        self._server_lookups: Dict[str, asyncio.Future] = {}
+        # Registered computer.mcp_<server>_<tool> name -> (server name, server UUID, tool name)
+        self._tool_index: Dict[str, Tuple[str, UUID, str]] = {}
 
     def install(self) -> bool:
         """
@@ -60,6 +82,8 @@ class MCPBridge:
             True if installation successful
         """
         try:
+            self.bind_loop()
+            
             # Create a proper MCP class instance for tool discovery
             mcp_class = MCPToolsClass(self)
             
@@ -75,6 +99,20 @@ class MCPBridge:
             logger.error(f"Failed to install MCP bridge: {e}")
             return False
     
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Bind the bridge to the event loop running the MCP manager.
+        
+        Args:
+            loop: Event loop (defaults to the running loop, if any)
+        """
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+        self._loop = loop
+    
     async def _register_dynamic_tools_async(self):
         """
         Dynamically register all MCP tools as individual functions in computer API
@@ -90,6 +128,8 @@ class MCPBridge:
                 logger.warning("Cannot import ToolMetadata - tools won't be indexed in semantic search")
                 has_tool_metadata = False
             
+            self.bind_loop()
+            
             # Get servers directly from manager (async)
             servers = await self._manager.list_servers()
             total_tools = 0
@@ -103,6 +143,7 @@ class MCPBridge:
                 server_name = server["name"]
                 server_id = server["id"] if isinstance(server["id"], UUID) else UUID(str(server["id"]))
                 server_desc = server.get("description", "")
+                self._server_cache[server_name] = server_id
                 
                 # Get tools directly from manager (async)
                 tools = await self._manager.get_server_tools(server_id, refresh=False)
@@ -113,11 +154,11 @@ class MCPBridge:
                     tool_desc = tool_func.get("description", "")
                     tool_params = tool_func.get("parameters", {})
                     
-                    # Create wrapper function for this tool
+                    # Create wrapper function for this tool (server already resolved)
                     def make_tool_executor(srv_name, tl_name, tl_desc, tl_params):
                         def executor(**kwargs):
                             """Dynamically generated MCP tool executor"""
-                            return self.execute(srv_name, tl_name, **kwargs)
+                            return self.execute_registered(f"mcp_{srv_name}_{tl_name}", **kwargs)
                         
                         executor.__name__ = f"mcp_{srv_name}_{tl_name}"
                         executor.__doc__ = f"{tl_desc}\n\nServer: {srv_name}\nTool: {tl_name}\nParameters: {tl_params}"
@@ -132,6 +173,7 @@ class MCPBridge:
                     )
                     
                     setattr(self._computer, tool_name, tool_executor)
+                    self._tool_index[tool_name] = (server_name, server_id, tool_func["name"])
                     total_tools += 1
                     logger.debug(f"Registered MCP tool: {tool_name}")
                     
@@ -203,6 +245,8 @@ class MCPBridge:
         """
         Get server UUID from name with caching
         
+        Concurrent misses for the same name share a single database query.
+        
         Args:
             server_name: Server name
             
@@ -212,42 +256,106 @@ class MCPBridge:
         Raises:
             ValueError: If server not found
         """
-        # Check cache first
-        if server_name in self._server_cache:
-            return self._server_cache[server_name]
+        while True:
+            # Check cache first
+            server_id = self._server_cache.get(server_name)
+            if server_id is not None:
+                return server_id
+            
+            pending = self._server_lookups.get(server_name)
+            if pending is None:
+                break
+            server_id = await asyncio.shield(pending)
+            if server_id is not None:
+                return server_id
+            # The looking-up caller was cancelled (e.g. a timed-out sync
+            # call) - take the lookup over
         
-        # Fetch from manager
-        server = await self._manager.db.get_server_by_name(server_name)
+        future = asyncio.get_running_loop().create_future()
+        self._server_lookups[server_name] = future
+        try:
+            # Fetch from manager
+            server = await self._manager.db.get_server_by_name(server_name)
+            if not server:
+                raise ValueError(f"MCP server '{server_name}' not found")
+            
+            server_id = server["id"] if isinstance(server["id"], UUID) else UUID(str(server["id"]))
+            self._server_cache[server_name] = server_id
+            future.set_result(server_id)
+            return server_id
+        except asyncio.CancelledError:
+            # Only this caller is cancelled; waiters retry
+            future.set_result(None)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else is waiting
+            raise
+        finally:
+            self._server_lookups.pop(server_name, None)
+
+    def invalidate_server(self, server_name: Optional[str] = None) -> None:
+        """
+        Drop cached server name lookups.
         
-        if not server:
-            raise ValueError(f"MCP server '{server_name}' not found")
+        Args:
+            server_name: Server to forget (None = all servers)
+        """
+        if server_name is None:
+            self._server_cache.clear()
+        else:
+            self._server_cache.pop(server_name, None)
+
+    def _run(self, coro: Awaitable[Any], timeout: float) -> Any:
+        """
+        Run a coroutine on the bridge's event loop from synchronous code.
         
-        server_id = UUID(server["id"])
-        self._server_cache[server_name] = server_id
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait for the result
+            
+        Returns:
+            Coroutine result
+            
+        Raises:
+            RuntimeError: If not bound to a loop, or called on the loop thread
+            TimeoutError: If the result is not ready in time (the call is cancelled)
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            coro.close()
+            raise RuntimeError("MCP bridge is not bound to a running event loop")
         
-        return server_id
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            # Blocking here would stop the loop that has to produce the result
+            coro.close()
+            raise RuntimeError(
+                "Synchronous MCP bridge call on the event loop thread; "
+                "await the async variant (alist_servers/alist_tools/aexecute/ahealth) instead"
+            )
+        
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"MCP bridge call timed out after {timeout}s") from None
 
-    # ==================== Public API ====================
+    # ==================== Async API ====================
 
-    def list_servers(self) -> List[Dict[str, Any]]:
+    async def alist_servers(self) -> List[Dict[str, Any]]:
         """
-        List all available MCP servers
+        List all available MCP servers (async)
         
         Returns:
             List of server information dicts
         """
         try:
-            # Run async operation in event loop
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # If called from async context, use run_until_complete
-                future = asyncio.run_coroutine_threadsafe(
-                    self._manager.list_servers(),
-                    loop
-                )
-                servers = future.result(timeout=10)
-            else:
-                servers = loop.run_until_complete(self._manager.list_servers())
+            servers = await self._manager.list_servers()
             
             # Simplify output for agent
             return [
@@ -267,6 +375,142 @@ class MCPBridge:
             logger.error(f"Failed to list servers: {e}")
             return []
 
+    async def alist_tools(self, server_name: str, refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        List tools available from an MCP server (async)
+        
+        Args:
+            server_name: Name of the server
+            refresh: Force refresh from server
+            
+        Returns:
+            List of tool schemas
+        """
+        try:
+            server_id = await self._get_server_id(server_name)
+            return await self._manager.get_server_tools(server_id, refresh=refresh)
+            
+        except Exception as e:
+            logger.error(f"Failed to list tools for {server_name}: {e}")
+            return []
+
+    async def aexecute(
+        self,
+        server_name: str,
+        tool_name: str,
+        **arguments
+    ) -> Dict[str, Any]:
+        """
+        Execute a tool on an MCP server (async)
+        
+        Args:
+            server_name: Name of the server
+            tool_name: Name of the tool
+            **arguments: Tool arguments as keyword args
+            
+        Returns:
+            Execution result
+        """
+        try:
+            server_id = await self._get_server_id(server_name)
+        except Exception as e:
+            logger.error(f"Failed to execute {tool_name} on {server_name}: {e}")
+            return self._execution_error(e)
+        return await self._execute_resolved(server_name, server_id, tool_name, arguments)
+
+    async def ahealth(self, server_name: str) -> Dict[str, Any]:
+        """
+        Check health of an MCP server (async)
+        
+        Args:
+            server_name: Name of the server
+            
+        Returns:
+            Health status
+        """
+        try:
+            server_id = await self._get_server_id(server_name)
+            return await self._manager.check_server_health(server_id)
+            
+        except Exception as e:
+            logger.error(f"Failed to check health for {server_name}: {e}")
+            return {
+                "healthy": False,
+                "status": "error",
+                "error": str(e)
+            }
+
+    async def aget_execution_history(
+        self,
+        server_name: Optional[str] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Get execution history (async)
+        
+        Args:
+            server_name: Filter by server (optional)
+            limit: Maximum number of results
+            
+        Returns:
+            List of execution records
+        """
+        try:
+            server_id = await self._get_server_id(server_name) if server_name else None
+            return await self._manager.get_execution_history(server_id, limit)
+            
+        except Exception as e:
+            logger.error(f"Failed to get execution history: {e}")
+            return []
+
+    async def _execute_resolved(
+        self,
+        server_name: str,
+        server_id: UUID,
+        tool_name: str,
+        arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Execute a tool on an already-resolved server."""
+        execution_context = {
+            "source": "open_interpreter",
+            "interpreter_id": id(self._interpreter),
+        }
+        try:
+            return await self._manager.execute_tool(
+                server_id=server_id,
+                tool_name=tool_name,
+                arguments=arguments,
+                execution_context=execution_context,
+            )
+        except Exception as e:
+            # Server may have been removed or re-registered under a new ID
+            self.invalidate_server(server_name)
+            logger.error(f"Failed to execute {tool_name} on {server_name}: {e}")
+            return self._execution_error(e)
+
+    @staticmethod
+    def _execution_error(error: Exception) -> Dict[str, Any]:
+        return {
+            "success": False,
+            "error": str(error),
+            "duration_ms": 0,
+        }
+
+    # ==================== Public API ====================
+
+    def list_servers(self) -> List[Dict[str, Any]]:
+        """
+        List all available MCP servers
+        
+        Returns:
+            List of server information dicts
+        """
+        try:
+            return self._run(self.alist_servers(), LIST_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Failed to list servers: {e}")
+            return []
+
     def list_tools(self, server_name: str, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         List tools available from an MCP server
@@ -279,34 +523,7 @@ class MCPBridge:
             List of tool schemas
         """
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Get server ID
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._get_server_id(server_name),
-                    loop
-                )
-                server_id = future.result(timeout=5)
-            else:
-                server_id = loop.run_until_complete(
-                    self._get_server_id(server_name)
-                )
-            
-            # Get tools
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._manager.get_server_tools(server_id, refresh=refresh),
-                    loop
-                )
-                tools = future.result(timeout=30)
-            else:
-                tools = loop.run_until_complete(
-                    self._manager.get_server_tools(server_id, refresh=refresh)
-                )
-            
-            return tools
-            
+            return self._run(self.alist_tools(server_name, refresh), TOOLS_TIMEOUT)
         except Exception as e:
             logger.error(f"Failed to list tools for {server_name}: {e}")
             return []
@@ -337,56 +554,36 @@ class MCPBridge:
             )
         """
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Get server ID
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._get_server_id(server_name),
-                    loop
-                )
-                server_id = future.result(timeout=5)
-            else:
-                server_id = loop.run_until_complete(
-                    self._get_server_id(server_name)
-                )
-            
-            # Execute tool
-            execution_context = {
-                "source": "open_interpreter",
-                "interpreter_id": id(self._interpreter),
-            }
-            
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._manager.execute_tool(
-                        server_id=server_id,
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        execution_context=execution_context,
-                    ),
-                    loop
-                )
-                result = future.result(timeout=300)  # 5 min timeout
-            else:
-                result = loop.run_until_complete(
-                    self._manager.execute_tool(
-                        server_id=server_id,
-                        tool_name=tool_name,
-                        arguments=arguments,
-                        execution_context=execution_context,
-                    )
-                )
-            
-            return result
+            return self._run(self.aexecute(server_name, tool_name, **arguments), EXECUTE_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Failed to execute {tool_name} on {server_name}: {e}")
+            return self._execution_error(e)
+
+    def execute_registered(self, registered_name: str, **arguments) -> Dict[str, Any]:
+        """
+        Execute a tool by its registered computer API name
+        
+        Uses the server resolved at registration, skipping the name lookup.
+        
+        Args:
+            registered_name: Name such as "mcp_weather_get_forecast"
+            **arguments: Tool arguments as keyword args
             
+        Returns:
+            Execution result
+        """
+        entry = self._tool_index.get(registered_name)
+        if entry is None:
+            return self._execution_error(ValueError(f"Unknown MCP tool '{registered_name}'"))
+        server_name, server_id, tool_name = entry
+        try:
+            return self._run(
+                self._execute_resolved(server_name, server_id, tool_name, arguments),
+                EXECUTE_TIMEOUT
+            )
         except Exception as e:
             logger.error(f"Failed to execute {tool_name} on {server_name}: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "duration_ms": 0,
-            }
+            return self._execution_error(e)
 
     def health(self, server_name: str) -> Dict[str, Any]:
         """
@@ -399,34 +596,7 @@ class MCPBridge:
             Health status
         """
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Get server ID
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._get_server_id(server_name),
-                    loop
-                )
-                server_id = future.result(timeout=5)
-            else:
-                server_id = loop.run_until_complete(
-                    self._get_server_id(server_name)
-                )
-            
-            # Check health
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._manager.check_server_health(server_id),
-                    loop
-                )
-                health = future.result(timeout=30)
-            else:
-                health = loop.run_until_complete(
-                    self._manager.check_server_health(server_id)
-                )
-            
-            return health
-            
+            return self._run(self.ahealth(server_name), HEALTH_TIMEOUT)
         except Exception as e:
             logger.error(f"Failed to check health for {server_name}: {e}")
             return {
@@ -451,36 +621,7 @@ class MCPBridge:
             List of execution records
         """
         try:
-            loop = asyncio.get_event_loop()
-            
-            # Get server ID if specified
-            server_id = None
-            if server_name:
-                if loop.is_running():
-                    future = asyncio.run_coroutine_threadsafe(
-                        self._get_server_id(server_name),
-                        loop
-                    )
-                    server_id = future.result(timeout=5)
-                else:
-                    server_id = loop.run_until_complete(
-                        self._get_server_id(server_name)
-                    )
-            
-            # Get history
-            if loop.is_running():
-                future = asyncio.run_coroutine_threadsafe(
-                    self._manager.get_execution_history(server_id, limit),
-                    loop
-                )
-                history = future.result(timeout=10)
-            else:
-                history = loop.run_until_complete(
-                    self._manager.get_execution_history(server_id, limit)
-                )
-            
-            return history
-            
+            return self._run(self.aget_execution_history(server_name, limit), HISTORY_TIMEOUT)
         except Exception as e:
             logger.error(f"Failed to get execution history: {e}")
             return []
@@ -534,7 +675,7 @@ class MCPToolsClass:
                     def make_tool_method(srv_name, tl_name, tl_desc):
                         async def tool_method(**kwargs):
                             """MCP tool method"""
-                            return await self._bridge.execute(srv_name, tl_name, **kwargs)
+                            return await self._bridge.aexecute(srv_name, tl_name, **kwargs)
                         
                         tool_method.__name__ = f"{srv_name}_{tl_name}"
                         tool_method.__doc__ = f"{tl_desc}\n\nMCP Server: {srv_name}\nTool: {tl_name}"
@@ -566,5 +707,5 @@ class MCPToolsClass:
     
     async def execute(self, server_name: str, tool_name: str, **kwargs):
         """Execute a tool"""
-        return await self._bridge.execute(server_name, tool_name, **kwargs)
+        return await self._bridge.aexecute(server_name, tool_name, **kwargs)
 
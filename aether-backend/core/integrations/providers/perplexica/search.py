@@ -18,20 +18,115 @@ Production-ready with:
 Note: All URL parameters default to None and are loaded from settings.
 Override by passing explicit URLs for testing/custom deployments.
 
+Requests go through a shared keep-alive client (utils.http), model discovery
+is cached for integrations.perplexica_model_cache_ttl seconds, and answers
+can be cached per normalised query by setting
+integrations.perplexica_answer_cache_ttl above zero.
+
 @.architecture
 Incoming: api/v1/endpoints/backends.py, services/Perplexica --- {str query, str focus_mode, str chat_model, Dict search config}
-Processing: perplexica_search(), perplexica_search_stream(), _match_model_to_lm_studio(), health_check() --- {4 jobs: health_checking, http_communication, model_matching, web_search}
-Outgoing: api/v1/endpoints/backends.py --- {Dict[str, Any] search results with answer/sources/images, AsyncIterator streaming response}
+Processing: perplexica_search(), perplexica_search_async(), find_best_model_match(), _discover_models(), _normalize_query(), clear_search_caches() --- {6 jobs: answer_caching, http_communication, model_discovery_caching, model_matching, query_normalization, web_search}
+Outgoing: api/v1/endpoints/backends.py, utils/http.py (shared sync/async clients) --- {Dict[str, Any] search results with answer/sources/images}
 """
 
+import asyncio
 import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 import httpx
 
+from utils.http import get_http_client, get_sync_http_client
+
 logger = logging.getLogger(__name__)
 
+POOL_NAME = "perplexica"
+DEFAULT_MODEL_CACHE_TTL = 300.0
+
+
+# ============================================================================
+# CACHES
+# ============================================================================
+
+class _TTLCache:
+    """Thread-safe bounded LRU with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_model_cache = _TTLCache(max_entries=16)
+_answer_cache = _TTLCache(max_entries=256)
+# One lock per (base_url, lm_studio_url): a slow endpoint only holds up
+# discoveries of the same endpoint
+_discovery_locks: Dict[Tuple[str, str], threading.Lock] = {}
+_discovery_locks_guard = threading.Lock()
+
+
+def clear_search_caches() -> None:
+    """Drop cached model matches and answers."""
+    _model_cache.clear()
+    _answer_cache.clear()
+
+
+def _get_discovery_lock(key: Tuple[str, str]) -> threading.Lock:
+    """Lock serializing model discovery for one endpoint pair."""
+    with _discovery_locks_guard:
+        lock = _discovery_locks.get(key)
+        if lock is None:
+            lock = _discovery_locks[key] = threading.Lock()
+        return lock
+
+
+def _get_cache_ttls() -> Tuple[float, float]:
+    """Get (model discovery TTL, answer TTL) from settings or use defaults."""
+    try:
+        from config.settings import get_settings
+        integrations = get_settings().integrations
+        return integrations.perplexica_model_cache_ttl, integrations.perplexica_answer_cache_ttl
+    except Exception:
+        return DEFAULT_MODEL_CACHE_TTL, 0.0
+
+
+def _normalize_query(query: str) -> str:
+    """Normalise a query for answer caching (case, whitespace, trailing punctuation)."""
+    return " ".join(query.casefold().split()).rstrip("?!. ")
+
+
+# ============================================================================
+# MODEL DISCOVERY
+# ============================================================================
 
 def _get_perplexica_url() -> str:
     """Get Perplexica URL from settings or use default."""
@@ -67,17 +162,16 @@ def get_perplexica_available_models(base_url: Optional[str] = None) -> tuple[Dic
     endpoint = f"{base_url}/api/models"
     
     try:
-        with httpx.Client(timeout=15.0) as client:
-            response = client.get(endpoint)
-            if response.status_code == 200:
-                result = response.json()
-                chat_models = result.get("chatModelProviders", {})
-                embedding_models = result.get("embeddingModelProviders", {})
-                logger.debug(f"Retrieved Perplexica models: {len(chat_models)} chat, {len(embedding_models)} embedding")
-                return chat_models, embedding_models
-            else:
-                logger.warning(f"Perplexica models endpoint returned {response.status_code}")
-                return {}, {}
+        response = get_sync_http_client(POOL_NAME).get(endpoint, timeout=15.0)
+        if response.status_code == 200:
+            result = response.json()
+            chat_models = result.get("chatModelProviders", {})
+            embedding_models = result.get("embeddingModelProviders", {})
+            logger.debug(f"Retrieved Perplexica models: {len(chat_models)} chat, {len(embedding_models)} embedding")
+            return chat_models, embedding_models
+        else:
+            logger.warning(f"Perplexica models endpoint returned {response.status_code}")
+            return {}, {}
     except httpx.RequestError as e:
         logger.warning(f"Failed to retrieve Perplexica models: {e}")
         return {}, {}
@@ -103,16 +197,15 @@ def get_lm_studio_models(lm_studio_url: Optional[str] = None) -> List[str]:
     
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(lm_studio_url)
-            if response.status_code == 200:
-                models_data = response.json().get("data", [])
-                model_names = [m.get("id", "") for m in models_data if m.get("id")]
-                logger.debug(f"Retrieved {len(model_names)} models from LM Studio")
-                return model_names
-            else:
-                logger.warning(f"LM Studio API returned {response.status_code}")
-                return []
+        response = get_sync_http_client(POOL_NAME).get(lm_studio_url, timeout=10.0)
+        if response.status_code == 200:
+            models_data = response.json().get("data", [])
+            model_names = [m.get("id", "") for m in models_data if m.get("id")]
+            logger.debug(f"Retrieved {len(model_names)} models from LM Studio")
+            return model_names
+        else:
+            logger.warning(f"LM Studio API returned {response.status_code}")
+            return []
     except httpx.RequestError as e:
         logger.warning(f"Failed to connect to LM Studio: {e}")
         return []
@@ -123,14 +216,20 @@ def get_lm_studio_models(lm_studio_url: Optional[str] = None) -> List[str]:
 
 def find_best_model_match(
     base_url: Optional[str] = None,
-    lm_studio_url: Optional[str] = None
+    lm_studio_url: Optional[str] = None,
+    refresh: bool = False
 ) -> tuple[Optional[Dict], Optional[Dict]]:
     """
     Find best matching chat and embedding models between Perplexica and LM Studio.
     
+    Complete matches are cached per (base_url, lm_studio_url) for the
+    configured model cache TTL; concurrent misses for the same endpoints
+    share one discovery.
+    
     Args:
         base_url: Perplexica service URL (None = load from settings)
         lm_studio_url: LM Studio API endpoint (None = load from settings)
+        refresh: Skip the cache and rediscover
         
     Returns:
         Tuple of (chat_model_config, embedding_model_config) or (None, None) if no match
@@ -140,7 +239,30 @@ def find_best_model_match(
     if lm_studio_url is None:
         lm_studio_url = _get_lm_studio_url()
     
+    key = (base_url, lm_studio_url)
+    if not refresh:
+        cached = _model_cache.get(key)
+        if cached is not None:
+            return cached
+    
+    with _get_discovery_lock(key):
+        if not refresh:
+            cached = _model_cache.get(key)
+            if cached is not None:
+                return cached
+        
+        match = _discover_models(base_url, lm_studio_url)
+        model_ttl, _ = _get_cache_ttls()
+        if match[0] and match[1] and model_ttl > 0:
+            _model_cache.set(key, match, model_ttl)
+        return match
+
 
+def _discover_models(
+    base_url: str,
+    lm_studio_url: str
+) -> tuple[Optional[Dict], Optional[Dict]]:
+    """Query Perplexica and LM Studio and pick chat/embedding models."""
     try:
         # Get available models from both services
         perplexica_chat, perplexica_embedding = get_perplexica_available_models(base_url)
@@ -195,6 +317,84 @@ def find_best_model_match(
         return None, None
 
 
+# ============================================================================
+# SEARCH
+# ============================================================================
+
+def _answer_key(query: str, focus: str, mode: str, base_url: str) -> Tuple[str, str, str, str]:
+    return (_normalize_query(query), focus, mode, base_url)
+
+
+def _cached_answer(key: Tuple[str, str, str, str], query: str) -> Optional[Dict[str, Any]]:
+    """Return a cached answer for this query, if answer caching is enabled."""
+    cached = _answer_cache.get(key)
+    if cached is None:
+        return None
+    logger.debug(f"Perplexica answer cache hit: {key[0]}")
+    return {**cached, "query": query, "cached": True}
+
+
+def _search_payload(query: str, focus: str, mode: str, chat_model: Dict, embedding_model: Dict) -> Dict[str, Any]:
+    return {
+        "query": query,
+        "focusMode": focus,
+        "optimizationMode": mode,
+        "chatModel": chat_model,
+        "embeddingModel": embedding_model,
+        "history": [],
+        "systemInstructions": "",
+        "stream": False
+    }
+
+
+def _search_result(
+    response: httpx.Response,
+    key: Tuple[str, str, str, str],
+    query: str,
+    focus: str,
+    chat_model: Dict,
+    lm_studio_url: str
+) -> Dict[str, Any]:
+    """Turn a Perplexica /api/search response into a result dict and cache it."""
+    if response.status_code != 200:
+        # The matched model may have been unloaded; rediscover next time
+        _model_cache.pop((key[3], lm_studio_url))
+        error_msg = f"Search failed: HTTP {response.status_code}"
+        logger.error(f"{error_msg}: {response.text}")
+        return {"error": error_msg, "query": query}
+    
+    result = response.json()
+    message = result.get("message", "")
+    sources = result.get("sources", [])
+    
+    logger.info(f"Perplexica {focus} search completed: {len(sources)} sources found")
+    
+    search_result = {
+        "query": query,
+        "focus_mode": focus,
+        "answer": message,
+        "sources": sources,
+        "source_count": len(sources),
+        "timestamp": datetime.now().isoformat(),
+        "model_used": f"{chat_model['provider']}/{chat_model['name']}"
+    }
+    _, answer_ttl = _get_cache_ttls()
+    if answer_ttl > 0 and message:
+        _answer_cache.set(key, search_result, answer_ttl)
+    return search_result
+
+
+def _search_error(e: Exception, query: str, base_url: str, timeout: float) -> Dict[str, Any]:
+    if isinstance(e, httpx.TimeoutException):
+        error_msg = f"Search timed out after {timeout}s"
+    elif isinstance(e, httpx.ConnectError):
+        error_msg = f"Cannot connect to Perplexica at {base_url}. Ensure service is running."
+    else:
+        error_msg = f"Search error: {str(e)}"
+    logger.error(error_msg)
+    return {"error": error_msg, "query": query}
+
+
 def perplexica_search(
     query: str,
     focus: str = "webSearch",
@@ -225,69 +425,87 @@ def perplexica_search(
             - sources: List of source URLs and titles
             - source_count: Number of sources
             - timestamp: ISO timestamp
+            - cached: True when served from the answer cache
             - error: Error message (if failed)
     """
     if base_url is None:
         base_url = _get_perplexica_url()
     
-    endpoint = f"{base_url}/api/search"
+    key = _answer_key(query, focus, mode, base_url)
+    cached = _cached_answer(key, query)
+    if cached is not None:
+        return cached
     
     # Try to find best model match dynamically
-    chat_model, embedding_model = find_best_model_match(base_url)
+    lm_studio_url = _get_lm_studio_url()
+    chat_model, embedding_model = find_best_model_match(base_url, lm_studio_url)
     
     if not chat_model or not embedding_model:
         error_msg = "No suitable models available. Ensure LM Studio is running with models loaded."
         logger.error(error_msg)
         return {"error": error_msg, "query": query}
     
-    payload = {
-        "query": query,
-        "focusMode": focus,
-        "optimizationMode": mode,
-        "chatModel": chat_model,
-        "embeddingModel": embedding_model,
-        "history": [],
-        "systemInstructions": "",
-        "stream": False
-    }
+    payload = _search_payload(query, focus, mode, chat_model, embedding_model)
     
     try:
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(endpoint, json=payload)
-            
-            if response.status_code == 200:
-                result = response.json()
-                message = result.get("message", "")
-                sources = result.get("sources", [])
-                
-                logger.info(f"Perplexica {focus} search completed: {len(sources)} sources found")
-                
-                return {
-                    "query": query,
-                    "focus_mode": focus,
-                    "answer": message,
-                    "sources": sources,
-                    "source_count": len(sources),
-                    "timestamp": datetime.now().isoformat(),
-                    "model_used": f"{chat_model['provider']}/{chat_model['name']}"
-                }
-            else:
-                error_msg = f"Search failed: HTTP {response.status_code}"
-                logger.error(f"{error_msg}: {response.text}")
-                return {"error": error_msg, "query": query}
-                
-    except httpx.TimeoutException:
-        error_msg = f"Search timed out after {timeout}s"
-        logger.error(error_msg)
-        return {"error": error_msg, "query": query}
-    except httpx.ConnectError:
-        error_msg = f"Cannot connect to Perplexica at {base_url}. Ensure service is running."
-        logger.error(error_msg)
-        return {"error": error_msg, "query": query}
+        response = get_sync_http_client(POOL_NAME).post(
+            f"{base_url}/api/search", json=payload, timeout=timeout
+        )
+        return _search_result(response, key, query, focus, chat_model, lm_studio_url)
     except Exception as e:
-        error_msg = f"Search error: {str(e)}"
+        return _search_error(e, query, base_url, timeout)
+
+
+async def perplexica_search_async(
+    query: str,
+    focus: str = "webSearch",
+    mode: str = "balanced",
+    base_url: Optional[str] = None,
+    timeout: float = 60.0
+) -> Dict[str, Any]:
+    """
+    Async variant of perplexica_search() on the shared async HTTP client.
+    
+    Args:
+        query: Search question/query
+        focus: Search focus mode (see perplexica_search)
+        mode: Optimization mode (speed, balanced, quality)
+        base_url: Perplexica service URL (None = load from settings)
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Same result dict as perplexica_search()
+    """
+    if base_url is None:
+        base_url = _get_perplexica_url()
+    
+    key = _answer_key(query, focus, mode, base_url)
+    cached = _cached_answer(key, query)
+    if cached is not None:
+        return cached
+    
+    lm_studio_url = _get_lm_studio_url()
+    match = _model_cache.get((base_url, lm_studio_url))
+    if match is None:
+        match = await asyncio.to_thread(find_best_model_match, base_url, lm_studio_url)
+    chat_model, embedding_model = match
+    
+    if not chat_model or not embedding_model:
+        error_msg = "No suitable models available. Ensure LM Studio is running with models loaded."
         logger.error(error_msg)
         return {"error": error_msg, "query": query}
+    
+    payload = _search_payload(query, focus, mode, chat_model, embedding_model)
+    
+    try:
+        async with get_http_client().client_context() as client:
+            # The shared client follows redirects; Perplexica calls never did
+            response = await client.post(
+                f"{base_url}/api/search", json=payload, timeout=timeout, follow_redirects=False
+            )
+        return _search_result(response, key, query, focus, chat_model, lm_studio_url)
+    except Exception as e:
+        return _search_error(e, query, base_url, timeout)
 
 
 def web_search(
@@ -457,7 +675,7 @@ def perplexica_models(base_url: Optional[str] = None) -> Dict[str, Any]:
     try:
         chat_models, embedding_models = get_perplexica_available_models(base_url)
         lm_studio_models = get_lm_studio_models()
-        current_chat, current_embedding = find_best_model_match(base_url)
+        current_chat, current_embedding = find_best_model_match(base_url, refresh=True)
         
         return {
             "perplexica_chat_providers": list(chat_models.keys()),
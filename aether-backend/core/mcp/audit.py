@@ -0,0 +1,272 @@
+"""
+MCP Execution Audit Writer
+
+@.architecture
+Incoming: core/mcp/manager.py (execute_tool, stop, get_execution_history) --- {execution record dicts, flush/stop requests}
+Processing: start(), record(), flush(), stop(), get_stats(), _run(), _collect_batch(), _write_batch(), _fold_counters() --- {6 jobs: backpressure, batch_collection, batched_persistence, counter_aggregation, retry_handling, shutdown_draining}
+Outgoing: core/mcp/database.py (log_executions, apply_usage_deltas) --- {multi-row INSERT batches, per-server usage deltas, audit statistics Dict}
+
+Takes execution auditing off the tool call path. execute_tool() enqueues a
+record and returns; a background task batches records into one multi-row
+INSERT and periodically folds in-memory call/error counters into
+mcp_servers.
+
+Handles:
+- Bounded queue: callers wait when the writer falls behind (backpressure);
+  without a running writer, records that don't fit are dropped
+- Batches flushed when full or after flush_interval, whichever comes first
+- Usage counters accumulated in memory and folded every counter_interval
+- Failed batches retried with backoff, then dropped with an error log
+- Drain on shutdown: stop() returns only after every queued record is written
+
+Production Features:
+- Writes serialized through a lock (background loop and explicit flushes)
+- Statistics for queue depth, batches, drops and backpressure waits
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionAuditWriter:
+    """
+    Background, batched writer for MCP execution audit logs and usage counters.
+
+    Usage:
+        writer = ExecutionAuditWriter(db)
+        await writer.start()
+        await writer.record({"server_id": ..., "tool_name": ..., ...})
+        await writer.stop()   # drains the queue
+    """
+
+    def __init__(
+        self,
+        db: Any,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        counter_interval: float = 5.0,
+        max_retries: int = 3,
+    ):
+        """
+        Initialize audit writer.
+
+        Args:
+            db: MCPDatabase (log_executions / apply_usage_deltas)
+            max_queue_size: Records buffered before record() waits
+            batch_size: Maximum records per INSERT
+            flush_interval: Seconds to wait for a batch to fill
+            counter_interval: Seconds between usage counter folds
+            max_retries: Attempts per batch before it is dropped
+        """
+        self.db = db
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.counter_interval = counter_interval
+        self.max_retries = max_retries
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._usage: Dict[UUID, Dict[str, Any]] = {}
+        self._write_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._last_fold = time.monotonic()
+        self._stopping = False
+        # True only while the loop waits for a first record (safe to cancel)
+        self._idle = False
+
+        self._recorded = 0
+        self._written = 0
+        self._batches = 0
+        self._dropped = 0
+        self._backpressure_waits = 0
+
+    # ========================================================================
+    # LIFECYCLE
+    # ========================================================================
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._task is None or self._task.done():
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Drain every queued record and fold counters, then stop."""
+        if self._task is not None and not self._task.done():
+            await self._queue.join()
+            # A loop busy writing or folding finishes that step and exits;
+            # only one waiting for records holds nothing and is cancelled
+            self._stopping = True
+            if self._idle:
+                self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+        # Covers records queued while the task was not running
+        await self.flush()
+        logger.info(f"MCP audit writer stopped ({self._written} executions written, {self._dropped} dropped)")
+
+    # ========================================================================
+    # PUBLIC API
+    # ========================================================================
+
+    async def record(self, execution: Dict[str, Any]) -> None:
+        """
+        Queue an execution for auditing and count it towards server usage.
+
+        Waits while the queue is full and the writer is running. Without a
+        running writer nothing would drain the queue, so a record that does
+        not fit is dropped (and counted) instead.
+
+        Args:
+            execution: log_execution() fields (server_id, tool_name, arguments,
+                result, status, duration_ms, error_message, execution_context,
+                sandboxed); executed_at defaults to now
+        """
+        execution.setdefault("executed_at", datetime.now(timezone.utc))
+
+        usage = self._usage.setdefault(
+            execution["server_id"], {"calls": 0, "errors": 0, "last_used_at": None}
+        )
+        if execution["status"] == "success":
+            usage["calls"] += 1
+            usage["last_used_at"] = execution["executed_at"]
+        else:
+            usage["errors"] += 1
+
+        if self._task is None or self._task.done():
+            try:
+                self._queue.put_nowait(execution)
+            except asyncio.QueueFull:
+                self._dropped += 1
+                logger.warning("MCP audit queue full and writer not running, execution record dropped")
+                return
+        else:
+            if self._queue.full():
+                self._backpressure_waits += 1
+            await self._queue.put(execution)
+        self._recorded += 1
+
+    async def flush(self) -> None:
+        """Write everything queued now and fold usage counters."""
+        while not self._queue.empty():
+            batch = []
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        await self._fold_counters()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dict with queue depth and write counters
+        """
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "queued": self._queue.qsize(),
+            "pending_usage_servers": len(self._usage),
+            "recorded": self._recorded,
+            "written": self._written,
+            "batches": self._batches,
+            "dropped": self._dropped,
+            "backpressure_waits": self._backpressure_waits,
+        }
+
+    # ========================================================================
+    # BACKGROUND LOOP
+    # ========================================================================
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            batch = await self._collect_batch()
+            if batch:
+                try:
+                    await self._write_batch(batch)
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+
+            if self._usage and time.monotonic() - self._last_fold >= self.counter_interval:
+                await self._fold_counters()
+
+    async def _collect_batch(self) -> List[Dict[str, Any]]:
+        """Wait for a first record, then gather more until full or flush_interval."""
+        # Wake up for pending counters even when no new executions arrive
+        timeout = self.counter_interval if self._usage else None
+        self._idle = True
+        try:
+            first = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return []
+        finally:
+            self._idle = False
+
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        if not batch:
+            return
+
+        async with self._write_lock:
+            for attempt in range(1, self.max_retries + 1):
+                try:
+                    await self.db.log_executions(batch)
+                    self._written += len(batch)
+                    self._batches += 1
+                    return
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        self._dropped += len(batch)
+                        logger.error(f"Dropping {len(batch)} MCP audit records after {attempt} attempts: {e}")
+                        return
+                    logger.warning(f"MCP audit batch write failed (attempt {attempt}): {e}")
+                    await asyncio.sleep(0.1 * 2 ** attempt)
+
+    async def _fold_counters(self) -> None:
+        self._last_fold = time.monotonic()
+        if not self._usage:
+            return
+
+        deltas, self._usage = self._usage, {}
+        async with self._write_lock:
+            try:
+                await self.db.apply_usage_deltas(deltas)
+            except Exception as e:
+                logger.warning(f"Failed to fold MCP usage counters (will retry): {e}")
+                # Merge back so counts are not lost
+                for server_id, delta in deltas.items():
+                    usage = self._usage.setdefault(
+                        server_id, {"calls": 0, "errors": 0, "last_used_at": None}
+                    )
+                    usage["calls"] += delta["calls"]
+                    usage["errors"] += delta["errors"]
+                    if delta["last_used_at"] and (
+                        usage["last_used_at"] is None or delta["last_used_at"] > usage["last_used_at"]
+                    ):
+                        usage["last_used_at"] = delta["last_used_at"]
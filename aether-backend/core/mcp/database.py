@@ -2,8 +2,8 @@
 MCP Database Layer
 
 @.architecture
-Incoming: core/mcp/manager.py, data/database/migrations/mcp_schema.sql --- {connection string, server/tool/execution data dicts, SQL schema}
-Processing: initialize(), close(), create_server(), get_server(), list_servers(), update_server_status(), update_health_status(), upsert_tools(), get_tools(), log_execution(), get_execution_history(), get_server_stats() --- {10 jobs: cleanup, connection_pooling, execution_auditing, health_monitoring, query_execution, schema_initialization, server_crud, statistics_aggregation, tool_caching, transaction_management}
+Incoming: core/mcp/manager.py, core/mcp/audit.py, data/database/migrations/mcp_schema.sql --- {connection string, server/tool/execution data dicts, SQL schema}
+Processing: initialize(), close(), create_server(), get_server(), list_servers(), update_server_status(), update_health_status(), upsert_tools(), get_tools(), log_execution(), log_executions(), apply_usage_deltas(), get_execution_history(), get_server_stats() --- {12 jobs: batch_auditing, cleanup, connection_pooling, execution_auditing, health_monitoring, query_execution, schema_initialization, server_crud, statistics_aggregation, tool_caching, transaction_management, usage_counter_folding}
 Outgoing: PostgreSQL database (via psycopg pool), core/mcp/manager.py --- {SQL queries with async connection pool, Dict[str, Any] server/tool/execution records}
 
 PostgreSQL persistence for MCP server management with:
@@ -333,6 +333,36 @@ class MCPDatabase:
                 )
                 await conn.commit()
 
+    async def apply_usage_deltas(self, deltas: Dict[UUID, Dict[str, Any]]) -> None:
+        """
+        Fold accumulated call/error counts into server counters (one UPDATE).
+        
+        Args:
+            deltas: Per-server {"calls": int, "errors": int, "last_used_at": datetime | None}
+        """
+        if not deltas:
+            return
+        
+        values = ", ".join(["(%s::uuid, %s::int, %s::int, %s::timestamptz)"] * len(deltas))
+        params: List[Any] = []
+        for server_id, delta in deltas.items():
+            params.extend([str(server_id), delta["calls"], delta["errors"], delta["last_used_at"]])
+        
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"""
+                    UPDATE mcp_servers s
+                    SET total_tool_calls = s.total_tool_calls + d.calls,
+                        total_errors = s.total_errors + d.errors,
+                        last_used_at = GREATEST(s.last_used_at, d.last_used_at)
+                    FROM (VALUES {values}) AS d(id, calls, errors, last_used_at)
+                    WHERE s.id = d.id
+                    """,
+                    params
+                )
+                await conn.commit()
+
     # ==================== Tool Operations ====================
 
     async def upsert_tools(
@@ -454,6 +484,58 @@ class MCPDatabase:
                 exec_id = result["id"] if isinstance(result["id"], UUID) else UUID(str(result["id"]))
                 return exec_id
 
+    async def log_executions(self, executions: List[Dict[str, Any]]) -> int:
+        """
+        Log a batch of tool executions with one multi-row INSERT.
+        
+        Rows for servers deleted since the call are skipped instead of
+        failing the whole batch on the foreign key.
+        
+        Args:
+            executions: Dicts with the log_execution() fields plus executed_at
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not executions:
+            return 0
+        
+        row = "(%s::uuid, %s, %s::jsonb, %s, %s, %s::int, %s, %s::jsonb, %s::boolean, %s::timestamptz)"
+        values = ", ".join([row] * len(executions))
+        params: List[Any] = []
+        for execution in executions:
+            context = execution.get("execution_context")
+            params.extend([
+                str(execution["server_id"]),
+                execution["tool_name"],
+                json.dumps(execution["arguments"]),
+                execution.get("result"),
+                execution["status"],
+                execution["duration_ms"],
+                execution.get("error_message"),
+                json.dumps(context) if context else None,
+                execution.get("sandboxed", True),
+                execution["executed_at"],
+            ])
+        
+        async with self._pool.connection() as conn:
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    f"""
+                    INSERT INTO mcp_executions
+                    (server_id, tool_name, arguments, result, status,
+                     duration_ms, error_message, execution_context, sandboxed, executed_at)
+                    SELECT v.*
+                    FROM (VALUES {values}) AS v(server_id, tool_name, arguments, result, status,
+                         duration_ms, error_message, execution_context, sandboxed, executed_at)
+                    WHERE EXISTS (SELECT 1 FROM mcp_servers s WHERE s.id = v.server_id)
+                    """,
+                    params
+                )
+                inserted = cur.rowcount
+                await conn.commit()
+                return inserted
+
     async def get_execution_history(
         self,
         server_id: Optional[UUID] = None,
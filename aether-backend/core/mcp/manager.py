@@ -2,33 +2,45 @@
 MCP Server Manager
 
 @.architecture
-Incoming: app.py (startup_event), api/v1/endpoints/mcp.py, core/mcp/database.py, core/mcp/server.py, core/mcp/sandbox.py --- {MCPDatabase instance, server registration/execution requests, LocalMcpServer/RemoteMcpServer classes, MCPSandbox}
+Incoming: app.py (startup_event), api/v1/endpoints/mcp.py, core/mcp/database.py, core/mcp/audit.py, core/mcp/server.py, core/mcp/sandbox.py --- {MCPDatabase instance, server registration/execution requests, LocalMcpServer/RemoteMcpServer classes, MCPSandbox}
 Processing: start(), stop(), register_server(), get_server(), list_servers(), delete_server(), execute_tool(), check_server_health(), get_server_tools(), get_server_stats(), _health_check_loop() --- {7 jobs: execution_auditing, health_monitoring, lifecycle_management, sandbox_coordination, server_registration, tool_discovery, tool_execution}
-Outgoing: core/mcp/database.py, core/mcp/server.py, core/mcp/sandbox.py, api/v1/endpoints/mcp.py --- {database method calls, McpServer instance control, sandboxed execution, Dict[str, Any] server/tool/execution records}
+Outgoing: core/mcp/database.py, core/mcp/server.py, core/mcp/sandbox.py, core/mcp/audit.py, data/cache/tiered.py, api/v1/endpoints/mcp.py --- {database method calls, McpServer instance control, sandboxed execution, cached tool schemas, Dict[str, Any] server/tool/execution records}
 
 Central orchestrator for MCP server lifecycle and tool execution.
 
 Responsibilities:
 - Server lifecycle (start, stop, restart, health monitoring)
-- Tool discovery and caching
+- Tool discovery and caching (tool schemas read through the tiered cache;
+  servers keep converted schemas in memory, the database copy is only
+  rewritten when the tool list hash changes, and tools/list_changed
+  notifications trigger a refresh)
 - Tool execution with sandboxing
 - Database persistence
 - Error handling and recovery
-- Execution auditing
+- Execution auditing (batched in the background by ExecutionAuditWriter)
 """
 
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
+from core.mcp.audit import ExecutionAuditWriter
 from core.mcp.database import MCPDatabase
 from core.mcp.sandbox import MCPSandbox, NoOpSandbox
 from core.mcp.server import LocalMcpServer, RemoteMcpServer, McpServer, ConfiguredLocalServer
+from data.cache.tiered import TieredCache, get_cache
 
 logger = logging.getLogger(__name__)
 
+# Tool schemas only change when a server restarts; refreshed on every start
+TOOLS_CACHE_TTL = 300
+
+
+def _tools_cache_key(server_id: UUID) -> str:
+    return f"mcp:tools:{server_id}"
+
 
 class MCPServerManager:
     """
@@ -50,18 +62,26 @@ class MCPServerManager:
     - Graceful shutdown handling
     """
 
-    def __init__(self, database: MCPDatabase):
+    def __init__(self, database: MCPDatabase, cache: Optional[TieredCache] = None):
         """
         Initialize MCP server manager.
         
         Args:
             database: MCPDatabase instance for persistence
+            cache: Tool schema cache (defaults to the process-wide tiered cache)
         """
         self.db = database
+        self._cache = cache
+        self._auditor = ExecutionAuditWriter(database)
         self._active_servers: Dict[UUID, McpServer] = {}
         self._sandboxes: Dict[UUID, MCPSandbox] = {}
         self._health_check_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
+        # Hash of the tool list last written to the database, per server
+        self._persisted_tool_hashes: Dict[UUID, str] = {}
+        self._tool_refreshes: Dict[UUID, asyncio.Task] = {}
+        # Servers that announced a tool change while their refresh was running
+        self._stale_tool_lists: Set[UUID] = set()
 
     async def start(self):
         """
@@ -98,6 +118,9 @@ class MCPServerManager:
                 except:
                     pass  # Don't let DB errors block startup
         
+        # Start background audit writer
+        await self._auditor.start()
+        
         # Start health check loop
         logger.debug("Starting health check loop")
         self._health_check_task = asyncio.create_task(self._health_check_loop())
@@ -109,9 +132,10 @@ class MCPServerManager:
         Stop all servers and cleanup resources.
         
         Shutdown sequence:
-        1. Cancel health check task
+        1. Cancel health check task and pending tool refreshes
         2. Stop all active servers (without database updates to avoid race conditions)
         3. Cleanup sandboxes
+        4. Drain queued execution audit records
         """
         logger.info("Stopping MCP Server Manager")
         
@@ -123,6 +147,15 @@ class MCPServerManager:
             except (asyncio.CancelledError, asyncio.TimeoutError):
                 pass
         
+        # Tool refreshes talk to the servers, so end them before the servers
+        refreshes = list(self._tool_refreshes.values())
+        for task in refreshes:
+            task.cancel()
+        if refreshes:
+            await asyncio.gather(*refreshes, return_exceptions=True)
+        self._tool_refreshes.clear()
+        self._stale_tool_lists.clear()
+        
         # Stop all servers with timeout to prevent hanging
         stop_tasks = []
         for server_id in list(self._active_servers.keys()):
@@ -142,6 +175,12 @@ class MCPServerManager:
         # Clear active servers
         self._active_servers.clear()
         
+        # Write every queued audit record before the database goes away
+        try:
+            await self._auditor.stop()
+        except Exception as e:
+            logger.error(f"Failed to drain MCP audit writer: {e}")
+        
         logger.info("MCP Manager stopped")
 
     async def register_server(
@@ -233,6 +272,8 @@ class MCPServerManager:
             
             # Delete from database (cascade deletes tools and executions)
             await self.db.delete_server(server_id)
+            await self.cache.invalidate(_tools_cache_key(server_id))
+            self._persisted_tool_hashes.pop(server_id, None)
             
             logger.info(f"Unregistered server {server_id}")
             return True
@@ -341,6 +382,11 @@ class MCPServerManager:
         server_id = server_record["id"]
         return await self.get_server_tools(server_id, refresh)
 
+    @property
+    def cache(self) -> TieredCache:
+        """Tool schema cache."""
+        return self._cache or get_cache()
+
     async def get_server_tools(self, server_id: UUID, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get tools from server (cached or fresh).
@@ -355,6 +401,18 @@ class MCPServerManager:
         Raises:
             RuntimeError: If server is not running and no cache available
         """
+        cache_key = _tools_cache_key(server_id)
+        if refresh:
+            await self.cache.invalidate(cache_key)
+        
+        return await self.cache.get_or_load(
+            cache_key,
+            lambda: self._load_server_tools(server_id, refresh),
+            TOOLS_CACHE_TTL,
+        )
+
+    async def _load_server_tools(self, server_id: UUID, refresh: bool) -> List[Dict[str, Any]]:
+        """Fetch tools from the running server, or the database copy if stopped."""
         # Check if server is active
         if server_id not in self._active_servers:
             # Try to get cached tools
@@ -367,14 +425,63 @@ class MCPServerManager:
         
         server = self._active_servers[server_id]
         
-        # Fetch tools from server
-        tools = await server.get_tools()
+        # Fetch tools from server (in-memory copy unless refreshing)
+        tools = await server.get_tools(refresh=refresh)
         
         # Cache in database
-        await self.db.upsert_tools(server_id, tools)
+        await self._persist_tools(server_id, server, tools)
         
         return tools
 
+    async def _persist_tools(self, server_id: UUID, server: McpServer, tools: List[Dict[str, Any]]) -> bool:
+        """
+        Write tools to the database if the list changed since the last write.
+        
+        Returns:
+            True if the database copy was updated
+        """
+        if server.tools_hash is not None and self._persisted_tool_hashes.get(server_id) == server.tools_hash:
+            return False
+        await self.db.upsert_tools(server_id, tools)
+        if server.tools_hash is not None:
+            self._persisted_tool_hashes[server_id] = server.tools_hash
+        return True
+
+    def _on_tools_changed(self, server_id: UUID) -> None:
+        """
+        Server notification callback: refresh tools in the background.
+        
+        A notification during a running refresh marks the list stale; the
+        refresh then runs once more, as its list_tools may predate the change.
+        """
+        task = self._tool_refreshes.get(server_id)
+        if task is not None and not task.done():
+            self._stale_tool_lists.add(server_id)
+            return
+        self._tool_refreshes[server_id] = asyncio.create_task(self._refresh_tools(server_id))
+
+    async def _refresh_tools(self, server_id: UUID) -> None:
+        """Re-list tools and update the database and shared cache copies."""
+        try:
+            while True:
+                self._stale_tool_lists.discard(server_id)
+                server = self._active_servers.get(server_id)
+                if server is None:
+                    return
+                try:
+                    tools = await server.get_tools(refresh=True)
+                    await self._persist_tools(server_id, server, tools)
+                    await self.cache.set(_tools_cache_key(server_id), tools, TOOLS_CACHE_TTL)
+                    logger.info(f"Server {server_id}: tool list updated ({len(tools)} tools)")
+                except Exception as e:
+                    await self.cache.invalidate(_tools_cache_key(server_id))
+                    logger.warning(f"Failed to refresh tools for {server_id}: {e}")
+                if server_id not in self._stale_tool_lists:
+                    return
+        finally:
+            self._tool_refreshes.pop(server_id, None)
+            self._stale_tool_lists.discard(server_id)
+
     async def execute_tool(
         self,
         server_id: UUID,
@@ -412,20 +519,17 @@ class MCPServerManager:
             
             duration_ms = int((time.time() - start_time) * 1000)
             
-            # Log execution
-            await self.db.log_execution(
-                server_id=server_id,
-                tool_name=tool_name,
-                arguments=arguments,
-                result=result,
-                status="success",
-                duration_ms=duration_ms,
-                execution_context=execution_context,
-                sandboxed=(server_id in self._sandboxes),
-            )
-            
-            # Update usage stats
-            await self.db.increment_usage(server_id)
+            # Audit log + usage stats (written in the background)
+            await self._auditor.record({
+                "server_id": server_id,
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "result": result,
+                "status": "success",
+                "duration_ms": duration_ms,
+                "execution_context": execution_context,
+                "sandboxed": server_id in self._sandboxes,
+            })
             
             return {
                 "success": True,
@@ -436,21 +540,18 @@ class MCPServerManager:
         except Exception as e:
             duration_ms = int((time.time() - start_time) * 1000)
             
-            # Log error
-            await self.db.log_execution(
-                server_id=server_id,
-                tool_name=tool_name,
-                arguments=arguments,
-                result=None,
-                status="error",
-                duration_ms=duration_ms,
-                error_message=str(e),
-                execution_context=execution_context,
-                sandboxed=(server_id in self._sandboxes),
-            )
-            
-            # Update error stats
-            await self.db.increment_errors(server_id)
+            # Audit log + error stats (written in the background)
+            await self._auditor.record({
+                "server_id": server_id,
+                "tool_name": tool_name,
+                "arguments": arguments,
+                "result": None,
+                "status": "error",
+                "duration_ms": duration_ms,
+                "error_message": str(e),
+                "execution_context": execution_context,
+                "sandboxed": server_id in self._sandboxes,
+            })
             
             return {
                 "success": False,
@@ -483,8 +584,14 @@ class MCPServerManager:
             }
         
         try:
-            # Try to list tools as health check
-            tools = await self._active_servers[server_id].get_tools()
+            # Listing tools doubles as the liveness check and change detection
+            server = self._active_servers[server_id]
+            previous_hash = server.tools_hash
+            tools = await server.get_tools(refresh=True)
+            if server.tools_hash != previous_hash:
+                await self._persist_tools(server_id, server, tools)
+                await self.cache.set(_tools_cache_key(server_id), tools, TOOLS_CACHE_TTL)
+                logger.info(f"Server {server_id}: tool list changed ({len(tools)} tools)")
             
             await self.db.update_health_status(server_id, "healthy")
             
@@ -549,6 +656,8 @@ class MCPServerManager:
         Returns:
             List of execution records
         """
+        # Include executions still waiting in the audit queue
+        await self._auditor.flush()
         return await self.db.get_execution_history(server_id, limit)
 
     async def get_server_stats(self, server_id: UUID) -> Dict[str, Any]:
@@ -561,6 +670,7 @@ class MCPServerManager:
         Returns:
             Statistics dictionary
         """
+        await self._auditor.flush()
         return await self.db.get_server_stats(server_id)
 
     # ==================== Private Methods ====================
@@ -592,12 +702,14 @@ class MCPServerManager:
                 raise ValueError(f"Unknown server type: {server_type}")
             
             self._active_servers[server_id] = server
+            server.on_tools_changed = lambda: self._on_tools_changed(server_id)
             await self.db.update_server_status(server_id, "active")
             
             # Cache tools
             try:
-                tools = await server.get_tools()
-                await self.db.upsert_tools(server_id, tools)
+                tools = await server.get_tools(refresh=True)
+                await self._persist_tools(server_id, server, tools)
+                await self.cache.set(_tools_cache_key(server_id), tools, TOOLS_CACHE_TTL)
                 logger.info(f"Server {server_record['name']}: cached {len(tools)} tools")
             except Exception as e:
                 logger.warning(f"Failed to cache tools: {e}")
@@ -3,20 +3,28 @@ MCP Server Abstractions
 
 @.architecture
 Incoming: core/mcp/manager.py, mcp SDK (ClientSession, StdioServerParameters, stdio_client) --- {server config with command/args/env or API endpoint, start/stop/get_tools/apply_tool requests}
-Processing: McpServer (ABC interface), LocalMcpServer.start(), LocalMcpServer.stop(), LocalMcpServer.get_tools(), LocalMcpServer.apply_tool(), RemoteMcpServer.start(), RemoteMcpServer.stop(), RemoteMcpServer.get_tools(), RemoteMcpServer.apply_tool(), ConfiguredLocalServer.init_server() --- {10 jobs: abstraction, cleanup, http_communication, initialization, lifecycle_management, schema_conversion, session_management, stdio_connection, tool_discovery, tool_execution}
+Processing: McpServer (ABC interface), LocalMcpServer.start(), LocalMcpServer.stop(), LocalMcpServer.get_tools(), LocalMcpServer.apply_tool(), LocalMcpServer._handle_message(), RemoteMcpServer.start(), RemoteMcpServer.stop(), RemoteMcpServer.get_tools(), RemoteMcpServer.apply_tool(), ConfiguredLocalServer.init_server() --- {13 jobs: abstraction, call_limiting, change_detection, cleanup, http_communication, initialization, lifecycle_management, schema_caching, schema_conversion, session_management, stdio_connection, tool_discovery, tool_execution}
 Outgoing: OS (subprocess via MCP SDK stdio_client), External MCP APIs (HTTP GET/POST via aiohttp), core/mcp/manager.py --- {stdio communication, HTTP GET to {api}/tools, HTTP POST to {api}/execute, List[Dict] tool schemas in OpenAI format, str tool results}
 
 Base classes for MCP server implementations supporting:
 - Local stdio-based servers
 - Remote HTTP/SSE servers
 - Unified tool interface
+
+Tool schemas are converted once and kept in memory per server. The copy
+is dropped when the server sends notifications/tools/list_changed, and
+tools_hash lets callers detect changes after a refresh. Concurrent
+call_tool requests on one local stdio session are capped at
+max_concurrent_calls; in_flight_calls reports how many are running.
 """
 
+import asyncio
+import hashlib
 import json
 import ssl
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import aiohttp
 from mcp import ClientSession, StdioServerParameters
@@ -24,6 +32,23 @@ from mcp.client.stdio import stdio_client
 
 logger = logging.getLogger(__name__)
 
+TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
+
+
+def tools_digest(tools: List[Dict[str, Any]]) -> str:
+    """
+    Stable hash of a tool schema list.
+    
+    Args:
+        tools: Tool schemas in OpenAI format
+        
+    Returns:
+        Hex digest (independent of dict key order)
+    """
+    return hashlib.sha256(
+        json.dumps(tools, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
 
 class McpServer(ABC):
     """
@@ -31,13 +56,26 @@ class McpServer(ABC):
     
     Provides unified interface for:
     - Server lifecycle management (start/stop)
-    - Tool discovery (get_tools)
+    - Tool discovery (get_tools, cached in memory)
     - Tool execution (apply_tool)
     """
 
     def __init__(self):
         """Initialize MCP server."""
-        pass
+        self._tools: Optional[List[Dict[str, Any]]] = None
+        self.tools_hash: Optional[str] = None
+        # Called when the server reports that its tool list changed
+        self.on_tools_changed: Optional[Callable[[], None]] = None
+
+    def invalidate_tools(self) -> None:
+        """Drop the cached tool schemas (next get_tools() fetches)."""
+        self._tools = None
+
+    def _store_tools(self, tools: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Cache converted tool schemas and record their hash."""
+        self._tools = tools
+        self.tools_hash = tools_digest(tools)
+        return tools
 
     @abstractmethod
     async def start(self) -> None:
@@ -55,10 +93,13 @@ class McpServer(ABC):
         pass
 
     @abstractmethod
-    async def get_tools(self) -> List[Dict[str, Any]]:
+    async def get_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get available tools from the MCP server.
         
+        Args:
+            refresh: Fetch from the server even if cached
+        
         Returns:
             List of tool schemas in OpenAI function calling format:
             [
@@ -117,14 +158,24 @@ class LocalMcpServer(McpServer):
         }
     """
 
-    def __init__(self):
-        """Initialize local MCP server wrapper."""
+    DEFAULT_MAX_CONCURRENT_CALLS = 8
+
+    def __init__(self, max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS):
+        """
+        Initialize local MCP server wrapper.
+        
+        Args:
+            max_concurrent_calls: Tool calls in flight at once on the session
+        """
         super().__init__()
         self._session: Optional[ClientSession] = None
         self._read = None
         self._write = None
         self._stdio_context = None
         self._session_context = None
+        self.max_concurrent_calls = max_concurrent_calls
+        self._call_slots = asyncio.Semaphore(max_concurrent_calls)
+        self._in_flight = 0
 
     @abstractmethod
     async def init_server(self) -> StdioServerParameters:
@@ -153,7 +204,9 @@ class LocalMcpServer(McpServer):
             self._read, self._write = await self._stdio_context.__aenter__()
 
             # Start session
-            self._session_context = ClientSession(self._read, self._write)
+            self._session_context = ClientSession(
+                self._read, self._write, message_handler=self._handle_message
+            )
             self._session = await self._session_context.__aenter__()
 
             # Initialize session
@@ -196,15 +249,39 @@ class LocalMcpServer(McpServer):
                     self._read = None
                     self._write = None
                 
+            self.invalidate_tools()
             logger.debug("Stopped local MCP server")
             
         except Exception as e:
             logger.error(f"Error stopping local MCP server: {e}")
 
-    async def get_tools(self) -> List[Dict[str, Any]]:
+    async def _handle_message(self, message: Any) -> None:
+        """Session message handler: watch for tool list changes."""
+        if isinstance(message, Exception):
+            logger.debug(f"MCP session transport error: {message}")
+            return
+        notification = getattr(message, "root", message)
+        if getattr(notification, "method", None) == TOOLS_LIST_CHANGED:
+            logger.info("MCP server reported a tool list change")
+            self.invalidate_tools()
+            if self.on_tools_changed is not None:
+                try:
+                    self.on_tools_changed()
+                except Exception as e:
+                    logger.error(f"Tool change callback failed: {e}")
+
+    @property
+    def in_flight_calls(self) -> int:
+        """Tool calls currently awaiting a response."""
+        return self._in_flight
+
+    async def get_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get available tools in OpenAI format.
         
+        Args:
+            refresh: Call tools/list even if schemas are cached
+        
         Returns:
             List of tool schemas in OpenAI format
             
@@ -213,6 +290,9 @@ class LocalMcpServer(McpServer):
         """
         if not self._session:
             raise RuntimeError("Server not started. Call start() first.")
+        
+        if not refresh and self._tools is not None:
+            return self._tools
 
         try:
             # Get available tools from MCP server
@@ -232,7 +312,7 @@ class LocalMcpServer(McpServer):
                 }
                 tool_schemas.append(tool_schema)
 
-            return tool_schemas
+            return self._store_tools(tool_schemas)
             
         except Exception as e:
             logger.error(f"Failed to get tools from local MCP server: {e}")
@@ -256,18 +336,22 @@ class LocalMcpServer(McpServer):
             raise RuntimeError("Server not started. Call start() first.")
 
         try:
-            result = await self._session.call_tool(tool_name, arguments)
+            # Concurrent calls share the session; the semaphore caps them
+            async with self._call_slots:
+                self._in_flight += 1
+                try:
+                    result = await self._session.call_tool(tool_name, arguments)
+                finally:
+                    self._in_flight -= 1
             
             # Extract text content from MCP result
             if hasattr(result, "content") and result.content:
                 if isinstance(result.content, list):
                     # Handle list of content items
-                    content_text = ""
-                    for item in result.content:
-                        if hasattr(item, "text"):
-                            content_text += item.text
-                        else:
-                            content_text += str(item)
+                    content_text = "".join(
+                        item.text if hasattr(item, "text") else str(item)
+                        for item in result.content
+                    )
                 else:
                     content_text = (
                         result.content.text
@@ -334,16 +418,20 @@ class RemoteMcpServer(McpServer):
             if self._session:
                 await self._session.close()
                 self._session = None
+            self.invalidate_tools()
                 
             logger.debug("Stopped remote MCP server client")
             
         except Exception as e:
             logger.error(f"Error stopping remote MCP server: {e}")
 
-    async def get_tools(self) -> List[Dict[str, Any]]:
+    async def get_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get available tools from the API server.
         
+        Args:
+            refresh: Request the tool list even if schemas are cached
+        
         Returns:
             List of tool schemas in OpenAI format
             
@@ -352,6 +440,9 @@ class RemoteMcpServer(McpServer):
         """
         if not self._session:
             raise RuntimeError("Server not started. Call start() first.")
+        
+        if not refresh and self._tools is not None:
+            return self._tools
 
         try:
             async with self._session.get(
@@ -383,7 +474,7 @@ class RemoteMcpServer(McpServer):
                         }
                         tool_schemas.append(tool_schema)
 
-                return tool_schemas
+                return self._store_tools(tool_schemas)
                 
         except Exception as e:
             logger.error(f"Failed to get tools from remote MCP server: {e}")
@@ -428,13 +519,10 @@ class RemoteMcpServer(McpServer):
                             content = result_data["result"]["content"]
                             if isinstance(content, list):
                                 # Handle list of content items
-                                content_text = ""
-                                for item in content:
-                                    if isinstance(item, dict) and "text" in item:
-                                        content_text += item["text"]
-                                    else:
-                                        content_text += str(item)
-                                return content_text
+                                return "".join(
+                                    item["text"] if isinstance(item, dict) and "text" in item else str(item)
+                                    for item in content
+                                )
                             elif isinstance(content, dict) and "text" in content:
                                 return content["text"]
                             else:
@@ -466,9 +554,14 @@ class ConfiguredLocalServer(LocalMcpServer):
         Initialize with configuration.
         
         Args:
-            config: Server configuration with command, args, env
+            config: Server configuration with command, args, env and
+                optional max_concurrent_calls
         """
-        super().__init__()
+        super().__init__(
+            max_concurrent_calls=config.get(
+                "max_concurrent_calls", LocalMcpServer.DEFAULT_MAX_CONCURRENT_CALLS
+            )
+        )
         self._config = config
 
     async def init_server(self) -> StdioServerParameters:
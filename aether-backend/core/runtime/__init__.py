@@ -9,9 +9,12 @@ Core Modules:
 - engine.py: Main runtime orchestrator (replaces oi_runtime + factory)
 - interpreter.py: Open Interpreter lifecycle management
 - streaming.py: Chat streaming with OI and HTTP fallback
+- session.py: Per-client conversation sessions with token-aware history
+- pool.py: Interpreter pool for concurrent agentic sessions
 - document.py: File processing and analysis
 - request.py: Request tracking and cancellation
 - config.py: Configuration and HTTP client management
+- startup.py: Dependency-graph startup orchestration with deferred warm-up
 
 Features:
 - Dependency injection with proper lifecycle management
@@ -25,17 +28,26 @@ Features:
 from .engine import RuntimeEngine
 from .interpreter import InterpreterManager
 from .streaming import ChatStreamer
+from .session import SessionStore, ChatSession
+from .pool import InterpreterPool
 from .document import DocumentProcessor
 from .request import RequestTracker
 from .config import ConfigManager
+from .startup import StartupOrchestrator, StartupComponent, record_time_to_first_request
 
 __all__ = [
     "RuntimeEngine",
     "InterpreterManager",
     "ChatStreamer",
+    "SessionStore",
+    "ChatSession",
+    "InterpreterPool",
     "DocumentProcessor",
     "RequestTracker",
     "ConfigManager",
+    "StartupOrchestrator",
+    "StartupComponent",
+    "record_time_to_first_request",
 ]
 
 __version__ = "2.0.0"
@@ -4,8 +4,8 @@ Consolidated from document_processor.py and file_chat_processor.py
 
 @.architecture
 Incoming: core/runtime/engine.py --- {file paths, file data, user prompts, Docling API URL}
-Processing: process_file(), process_file_chat(), _create_combined_prompt(), _analyze_with_llm() --- {4 jobs: document_conversion, file_validation, llm_integration, prompt_generation}
-Outgoing: Docling API (HTTP POST), core/runtime/interpreter.py --- {HTTP POST to /convert with multipart file upload, AsyncGenerator[Dict] LLM response chunks}
+Processing: process_file(), process_spooled(), process_file_chat(), process_file_chat_multipart(), _spool_stream(), _hash_spooled_upload(), _spool_base64(), _create_combined_prompt(), _analyze_with_llm() --- {6 jobs: document_conversion, file_validation, llm_integration, progress_reporting, prompt_generation, upload_spooling}
+Outgoing: Docling API (HTTP POST), core/runtime/interpreter.py --- {HTTP POST to /convert with multipart file upload streamed from disk, AsyncGenerator[Dict] LLM response chunks, progress display messages}
 
 Handles:
 - Document conversion using Docling API
@@ -23,18 +23,126 @@ Production Features:
 - UI feedback through interpreter
 - Processing time tracking
 - Multipart file upload support
+- Content-addressed conversion cache (see core/runtime/document_cache.py)
+- Uploads spooled to a temp file in chunks and streamed to Docling from
+  disk, so peak memory per upload is bounded by the chunk size
+- Upload progress reported through the interpreter display channel
 
 """
 
+import asyncio
 import base64
+import hashlib
 import json
 import logging
+import os
+import tempfile
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional
+
+import aiofiles
+
+from .document_cache import DocumentCache
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from an upload (or base64 characters decoded) per spool step
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+# Minimum bytes between two progress messages for the same stage
+PROGRESS_STEP_BYTES = 8 * 1024 * 1024
+
+# Progress callback: (bytes_done, bytes_total or None)
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+
+class DoclingAPIError(Exception):
+    """Docling API returned a non-success response."""
+
+    def __init__(self, status_code: int, text: str):
+        super().__init__(f"Docling API error ({status_code}): {text}")
+        self.status_code = status_code
+        self.text = text
+
+
+class UploadTooLargeError(ValueError):
+    """Upload exceeded the configured size limit while spooling."""
+
+
+class InterpreterUnavailableError(RuntimeError):
+    """No interpreter is available to analyse an uploaded file."""
+
+
+@dataclass
+class SpooledUpload:
+    """
+    File content spooled to disk, with its incremental SHA-256.
+
+    The content is either a temp file owned by the upload (path) or a file
+    object spooled by someone else, e.g. Starlette's UploadFile.file
+    (fileobj, never closed or removed here).
+    """
+
+    path: Optional[Path]
+    size: int
+    digest: Any
+    fileobj: Any = None
+
+    @contextmanager
+    def reader(self) -> Iterator[BinaryIO]:
+        """Binary file positioned at the start of the content."""
+        if self.fileobj is not None:
+            self.fileobj.seek(0)
+            yield self.fileobj
+            return
+        with open(self.path, "rb") as source:
+            yield source
+
+    def cleanup(self) -> None:
+        """Remove the spool file (if owned)."""
+        if self.path is None:
+            return
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Failed to remove spool file {self.path}: {e}")
+
+
+class _ProgressReader:
+    """
+    Binary file wrapper reporting read progress.
+
+    httpx streams multipart file fields by calling read() in fixed-size
+    chunks; tell() and seek() let it compute the Content-Length without
+    fileno(), which would force an in-memory spool file to disk.
+    """
+
+    def __init__(self, fileobj, total: int, callback: Optional[ProgressCallback] = None):
+        self._file = fileobj
+        self._callback = callback
+        self._total = total
+        self._done = 0
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        position = self._file.seek(offset, whence)
+        self._done = position
+        return position
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self._file.read(size)
+        if chunk and self._callback:
+            self._done += len(chunk)
+            self._callback(self._done, self._total)
+        return chunk
+
 
 class DocumentProcessor:
     """
@@ -55,32 +163,80 @@ class DocumentProcessor:
     - Other documents (via standard Docling pipeline)
     """
 
-    def __init__(self, config_manager, request_tracker):
+    def __init__(
+        self,
+        config_manager,
+        request_tracker,
+        cache: Optional[DocumentCache] = None,
+        spool_dir: Optional[Path] = None,
+    ):
         """
         Initialize document processor.
         
         Args:
             config_manager: Config manager for HTTP client access
             request_tracker: Request tracker for cancellation support
+            cache: Conversion cache (defaults to a memory + disk DocumentCache)
+            spool_dir: Directory for upload spool files (system temp dir if None)
         """
         self._config_manager = config_manager
         self._request_tracker = request_tracker
         self._docling_url = "http://localhost:8000/convert"
+        self._cache = cache if cache is not None else DocumentCache()
+        self._spool_dir = spool_dir
 
     # ============================================================================
     # DOCUMENT CONVERSION
     # ============================================================================
 
     async def process_file(
-        self, base64_data: str, filename: str, user_prompt: str = ""
+        self,
+        base64_data: str,
+        filename: str,
+        user_prompt: str = "",
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """
         Process a file using Docling API with smart pipeline selection.
         
+        The base64 payload is decoded to a spool file in chunks rather than
+        into a single bytes object.
+        
         Args:
             base64_data: Base64 encoded file content
             filename: Original filename
             user_prompt: Optional user prompt for analysis
+            progress: Optional callback for Docling upload progress
+            
+        Returns:
+            Dict with processing results or error information
+        """
+        try:
+            spooled = await asyncio.to_thread(self._spool_base64, base64_data)
+        except Exception as e:
+            logger.error(f"Error decoding file data: {e}")
+            return self._build_error_response(f"Invalid file data: {str(e)}")
+        
+        try:
+            return await self.process_spooled(spooled, filename, user_prompt, progress)
+        finally:
+            await asyncio.to_thread(spooled.cleanup)
+
+    async def process_spooled(
+        self,
+        spooled: SpooledUpload,
+        filename: str,
+        user_prompt: str = "",
+        progress: Optional[ProgressCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Process a spooled file, streaming the multipart body from disk.
+        
+        Args:
+            spooled: Spooled upload (caller owns cleanup)
+            filename: Original filename
+            user_prompt: Optional user prompt for analysis
+            progress: Optional callback for Docling upload progress
             
         Returns:
             Dict with processing results or error information
@@ -92,31 +248,32 @@ class DocumentProcessor:
             # Prepare API request
             payload = self._build_api_payload(pipeline_config, user_prompt)
             
-            # Convert base64 to file content
-            file_content = base64.b64decode(base64_data)
-            
             # Prepare multipart form data
             data_fields = {k: str(v) for k, v in payload.items() if v is not None}
-            files = {"file": (filename, file_content, "application/octet-stream")}
-            
-            # Make API call
-            async with self._config_manager.client_context() as client:
-                response = await client.post(
-                    self._docling_url,
-                    data=data_fields,
-                    files=files,
-                )
             
-            # Process response
-            if response.status_code == 200:
-                result = response.json()
-                return self._build_success_response(result, user_prompt, filename)
-            else:
-                error_text = response.text
-                return self._build_error_response(
-                    f"Docling API error ({response.status_code}): {error_text}"
-                )
+            async def convert() -> Dict[str, Any]:
+                with spooled.reader() as source:
+                    body = _ProgressReader(source, spooled.size, progress)
+                    files = {"file": (filename, body, "application/octet-stream")}
+                    async with self._config_manager.client_context() as client:
+                        response = await client.post(
+                            self._docling_url,
+                            data=data_fields,
+                            files=files,
+                        )
+                if response.status_code != 200:
+                    raise DoclingAPIError(response.status_code, response.text)
+                return response.json()
+            
+            # Identical content + pipeline returns the stored conversion, and
+            # concurrent identical uploads share a single Docling request
+            key = self._cache.key_from_digest(spooled.digest, data_fields)
+            result = await self._cache.get_or_convert(key, convert)
+            return self._build_success_response(result, user_prompt, filename)
                 
+        except DoclingAPIError as e:
+            return self._build_error_response(str(e))
+            
         except Exception as e:
             logger.error(f"Error processing file with Docling API: {e}")
             return self._build_error_response(
@@ -270,7 +427,12 @@ class DocumentProcessor:
             
             # Process file with Docling
             result = await self.process_file(
-                base64_data=file_base64, filename=file_name, user_prompt=prompt
+                base64_data=file_base64,
+                filename=file_name,
+                user_prompt=prompt,
+                progress=self._progress_reporter(
+                    interpreter, file_name, "Uploading to Docling", request_id
+                ),
             )
             
             # Handle processing result
@@ -310,14 +472,24 @@ class DocumentProcessor:
         
         CRITICAL BUG FIX: Added missing return statement (line 292 in old code)
         
+        The upload is read in chunks (hashed on the way for the conversion
+        cache) and streamed to Docling from disk. An UploadFile already
+        spooled by Starlette is streamed from its own file; other uploads are
+        copied to a spool file first.
+        
         Args:
-            file_data: File data with UploadFile object
+            file_data: File data with UploadFile object and optional
+                max_bytes upload limit
             prompt: User prompt for analysis
             request_id: Optional request identifier
             interpreter: Optional OI interpreter for analysis
             
         Returns:
             Processing result with status and metadata
+            
+        Raises:
+            UploadTooLargeError: If the upload exceeds max_bytes
+            InterpreterUnavailableError: If no interpreter was provided
         """
         # Generate request ID if not provided
         if not request_id:
@@ -326,15 +498,15 @@ class DocumentProcessor:
         # Start tracking this request
         await self._request_tracker.start_request(request_id, "file_processor", prompt)
         
+        spooled: Optional[SpooledUpload] = None
         try:
             # Validate file object
             file_object = file_data.get("file_object")
             if not file_object:
                 return self._create_error_response("No file object provided", request_id)
             
-            # Initialize interpreter if needed
             if not interpreter:
-                return self._create_error_response("Interpreter not available", request_id)
+                raise InterpreterUnavailableError("Interpreter not available")
             
             # Extract file information
             file_name = file_data.get("name", "unknown")
@@ -344,15 +516,30 @@ class DocumentProcessor:
                 interpreter, file_name, prompt, request_id
             )
             
-            # Read file content
-            file_content = await file_object.read()
-            
-            # Convert to base64
-            base64_data = base64.b64encode(file_content).decode("utf-8")
+            # Hash the upload in chunks; spool it to disk unless the server
+            # already did (Starlette UploadFile)
+            spool = (
+                self._hash_spooled_upload
+                if hasattr(file_object, "file")
+                else self._spool_stream
+            )
+            spooled = await spool(
+                file_object,
+                max_bytes=file_data.get("max_bytes"),
+                expected_size=getattr(file_object, "size", None),
+                progress=self._progress_reporter(
+                    interpreter, file_name, "Receiving upload", request_id
+                ),
+            )
             
             # Process file with Docling
-            result = await self.process_file(
-                base64_data=base64_data, filename=file_name, user_prompt=prompt
+            result = await self.process_spooled(
+                spooled,
+                filename=file_name,
+                user_prompt=prompt,
+                progress=self._progress_reporter(
+                    interpreter, file_name, "Uploading to Docling", request_id
+                ),
             )
             
             # Handle result using same logic as base64 method
@@ -365,6 +552,10 @@ class DocumentProcessor:
                 return await self._handle_error_result(
                     result, file_name, request_id, interpreter
                 )
+        
+        except (UploadTooLargeError, InterpreterUnavailableError):
+            # Client errors - the API maps them to their own status codes
+            raise
                 
         except Exception as e:
             import traceback
@@ -376,9 +567,149 @@ class DocumentProcessor:
             return self._create_error_response(error_msg, request_id)
             
         finally:
+            if spooled is not None:
+                await asyncio.to_thread(spooled.cleanup)
             # Clean up request tracking
             await self._request_tracker.end_request(request_id)
 
+    # ============================================================================
+    # UPLOAD SPOOLING
+    # ============================================================================
+
+    def _new_spool_path(self) -> Path:
+        """Create an empty spool file and return its path."""
+        if self._spool_dir is not None:
+            Path(self._spool_dir).mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(
+            prefix="docling-", suffix=".upload", dir=self._spool_dir
+        )
+        os.close(fd)
+        return Path(name)
+
+    async def _spool_stream(
+        self,
+        file_object: Any,
+        max_bytes: Optional[int] = None,
+        expected_size: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SpooledUpload:
+        """
+        Copy an async-readable upload to a spool file chunk by chunk.
+        
+        Args:
+            file_object: Object with async read(size) (e.g. UploadFile)
+            max_bytes: Optional upload size limit
+            expected_size: Declared upload size for progress reporting
+            progress: Optional callback for receive progress
+            
+        Returns:
+            SpooledUpload with size and content hash
+            
+        Raises:
+            UploadTooLargeError: If the upload exceeds max_bytes
+        """
+        path = await asyncio.to_thread(self._new_spool_path)
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(path, "wb") as out:
+                while True:
+                    chunk = await file_object.read(SPOOL_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if max_bytes is not None and size > max_bytes:
+                        raise UploadTooLargeError(
+                            f"File exceeds upload limit of {max_bytes} bytes"
+                        )
+                    digest.update(chunk)
+                    await out.write(chunk)
+                    if progress:
+                        progress(size, expected_size)
+        except BaseException:
+            await asyncio.to_thread(SpooledUpload(path, size, digest).cleanup)
+            raise
+        
+        return SpooledUpload(path=path, size=size, digest=digest)
+
+    async def _hash_spooled_upload(
+        self,
+        file_object: Any,
+        max_bytes: Optional[int] = None,
+        expected_size: Optional[int] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> SpooledUpload:
+        """
+        Hash an upload the server already spooled, without copying it.
+        
+        Args:
+            file_object: UploadFile whose file attribute holds the content
+            max_bytes: Optional upload size limit
+            expected_size: Declared upload size for progress reporting
+            progress: Optional callback for receive progress
+            
+        Returns:
+            SpooledUpload reading from the upload's file
+            
+        Raises:
+            UploadTooLargeError: If the upload exceeds max_bytes
+        """
+        digest = hashlib.sha256()
+        size = 0
+        await file_object.seek(0)
+        while True:
+            chunk = await file_object.read(SPOOL_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if max_bytes is not None and size > max_bytes:
+                raise UploadTooLargeError(
+                    f"File exceeds upload limit of {max_bytes} bytes"
+                )
+            digest.update(chunk)
+            if progress:
+                progress(size, expected_size)
+        
+        return SpooledUpload(path=None, size=size, digest=digest, fileobj=file_object.file)
+
+    def _spool_base64(self, base64_data: str) -> SpooledUpload:
+        """
+        Decode base64 content to a spool file in chunks (runs in a thread).
+        
+        Args:
+            base64_data: Base64 encoded file content
+            
+        Returns:
+            SpooledUpload with size and content hash
+        """
+        path = self._new_spool_path()
+        digest = hashlib.sha256()
+        size = 0
+        carry = ""
+        try:
+            with open(path, "wb") as out:
+                for start in range(0, len(base64_data), SPOOL_CHUNK_SIZE):
+                    # Whitespace would break 4-character alignment between chunks
+                    piece = carry + "".join(
+                        base64_data[start:start + SPOOL_CHUNK_SIZE].split()
+                    )
+                    aligned = len(piece) - len(piece) % 4
+                    carry = piece[aligned:]
+                    chunk = base64.b64decode(piece[:aligned])
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+                if carry:
+                    chunk = base64.b64decode(carry)
+                    digest.update(chunk)
+                    out.write(chunk)
+                    size += len(chunk)
+        except BaseException:
+            SpooledUpload(path, size, digest).cleanup()
+            raise
+        
+        return SpooledUpload(path=path, size=size, digest=digest)
+
     # ============================================================================
     # HELPER METHODS
     # ============================================================================
@@ -410,6 +741,56 @@ class DocumentProcessor:
         except Exception as e:
             logger.warning(f"Failed to send processing start message: {e}")
 
+    def _progress_reporter(
+        self, interpreter: Any, file_name: str, stage: str, request_id: str
+    ) -> Optional[ProgressCallback]:
+        """Build a throttled progress callback for one upload stage."""
+        if interpreter is None:
+            return None
+        
+        last_reported = 0
+        
+        def report(done: int, total: Optional[int]) -> None:
+            nonlocal last_reported
+            finished = total is not None and done >= total
+            if done - last_reported < PROGRESS_STEP_BYTES and not finished:
+                return
+            if done == last_reported:
+                return
+            last_reported = done
+            self._send_progress_message(
+                interpreter, file_name, stage, done, total, request_id
+            )
+        
+        return report
+
+    def _send_progress_message(
+        self,
+        interpreter: Any,
+        file_name: str,
+        stage: str,
+        done: int,
+        total: Optional[int],
+        request_id: str,
+    ) -> None:
+        """Send upload progress message to UI (same channel as the start message)."""
+        done_mb = done / (1024 * 1024)
+        line = f"{stage}: {done_mb:.1f} MB"
+        if total:
+            line += f" / {total / (1024 * 1024):.1f} MB ({min(100, done * 100 // total)}%)"
+        try:
+            interpreter.display_message(
+                {
+                    "role": "computer",
+                    "type": "code",
+                    "content": f"{file_name} - {line}\n",
+                    "format": "markdown",
+                    "id": request_id,
+                }
+            )
+        except Exception as e:
+            logger.debug(f"Failed to send progress message: {e}")
+
     async def _handle_success_result(
         self,
         result: Dict[str, Any],
@@ -589,6 +970,7 @@ class DocumentProcessor:
         """
         return {
             "docling_url": self._docling_url,
+            "conversion_cache": self._cache.get_stats(),
             "config_manager_available": self._config_manager is not None,
             "request_tracker_available": self._request_tracker is not None,
         }
@@ -0,0 +1,357 @@
+"""
+Document Cache - Content-addressed cache for Docling conversions
+
+@.architecture
+Incoming: core/runtime/document.py --- {file bytes, pipeline payload Dict, Docling API result Dict, conversion coroutine}
+Processing: make_key(), key_from_digest(), get(), put(), get_or_convert(), _evict_memory(), _evict_disk(), _load_disk_index() --- {5 jobs: content_hashing, memory_caching, disk_caching, lru_eviction, request_coalescing}
+Outgoing: core/runtime/document.py --- {cached Docling result Dict, cache statistics Dict}
+
+Handles:
+- Cache keys from SHA-256 of file content plus pipeline configuration
+- Memory tier (hot entries) and disk tier (persistent across restarts)
+- Size-based LRU eviction on both tiers
+- Collapsing concurrent identical conversions into one in-flight request
+
+Production Features:
+- Disk I/O off the event loop (asyncio.to_thread)
+- Atomic disk writes (temp file + rename)
+- Corrupt disk entries are dropped instead of failing requests
+- Failed conversions are never cached
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentCache:
+    """
+    Two-tier content-addressed cache of Docling conversion results.
+
+    Features:
+    - Memory tier bounded by serialized size (LRU)
+    - Disk tier bounded by total file size (LRU by access)
+    - In-flight deduplication of identical conversions
+    - Hit/miss statistics
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = Path("./data/docling_cache"),
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        max_disk_bytes: int = 1024 * 1024 * 1024,
+    ):
+        """
+        Initialize document cache.
+
+        Args:
+            cache_dir: Directory for the disk tier
+            max_memory_bytes: Memory tier size limit (0 disables the tier)
+            max_disk_bytes: Disk tier size limit (0 disables the tier)
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_memory_bytes = max_memory_bytes
+        self._max_disk_bytes = max_disk_bytes
+
+        # key -> (result, size)
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._memory_bytes = 0
+
+        # key -> file size, ordered by last access
+        self._disk_index: Optional["OrderedDict[str, int]"] = None
+        self._disk_bytes = 0
+        self._disk_lock = asyncio.Lock()
+
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+
+    # ============================================================================
+    # KEYS
+    # ============================================================================
+
+    @staticmethod
+    def make_key(content: bytes, pipeline_config: Dict[str, Any]) -> str:
+        """
+        Build a cache key from file content and pipeline configuration.
+
+        Args:
+            content: Raw file bytes
+            pipeline_config: Conversion parameters sent to Docling
+
+        Returns:
+            Hex digest identifying this conversion
+        """
+        return DocumentCache.key_from_digest(hashlib.sha256(content), pipeline_config)
+
+    @staticmethod
+    def key_from_digest(content_digest: Any, pipeline_config: Dict[str, Any]) -> str:
+        """
+        Build a cache key from an incrementally computed content hash.
+
+        Lets streamed uploads be keyed without holding the whole file in
+        memory; produces the same key as make_key() for the same bytes.
+
+        Args:
+            content_digest: hashlib.sha256 object fed with the file content
+            pipeline_config: Conversion parameters sent to Docling
+
+        Returns:
+            Hex digest identifying this conversion
+        """
+        digest = content_digest.copy()
+        digest.update(b"\0")
+        digest.update(
+            json.dumps(pipeline_config, sort_keys=True, default=str).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    # ============================================================================
+    # LOOKUP / STORE
+    # ============================================================================
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result (memory first, then disk).
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            Cached Docling result or None
+        """
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self._memory_hits += 1
+            return entry[0]
+
+        if self._max_disk_bytes:
+            result = await self._read_disk(key)
+            if result is not None:
+                self._disk_hits += 1
+                self._store_memory(key, result, self._disk_index.get(key, 0))
+                return result
+
+        return None
+
+    async def put(self, key: str, result: Dict[str, Any]) -> None:
+        """
+        Store a conversion result in both tiers.
+
+        Args:
+            key: Cache key from make_key()
+            result: Docling API result
+        """
+        try:
+            payload = json.dumps(result).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Docling result not cacheable: {e}")
+            return
+
+        self._store_memory(key, result, len(payload))
+        if self._max_disk_bytes:
+            await self._write_disk(key, payload)
+
+    async def get_or_convert(
+        self, key: str, convert: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Return a cached result or run the conversion once for all concurrent callers.
+
+        Args:
+            key: Cache key from make_key()
+            convert: Coroutine function performing the conversion; raising
+                marks the conversion as failed (not cached); if the converting
+                caller is cancelled, a waiting caller runs it instead
+
+        Returns:
+            Docling result (cached or fresh)
+        """
+        while True:
+            cached = await self.get(key)
+            if cached is not None:
+                return cached
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            self._coalesced += 1
+            result = await asyncio.shield(pending)
+            if result is not None:
+                return result
+            # The converting caller was cancelled - take the conversion over
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        result = None
+        try:
+            result = await convert()
+            await self.put(key, result)
+        except asyncio.CancelledError:
+            # Only the cancelled caller fails; waiters retry (None) unless
+            # the conversion already finished
+            future.set_result(result)
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an un-awaited failure is not logged as lost
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    # ============================================================================
+    # MEMORY TIER
+    # ============================================================================
+
+    def _store_memory(self, key: str, result: Dict[str, Any], size: int) -> None:
+        if not self._max_memory_bytes or size > self._max_memory_bytes:
+            return
+
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous[1]
+
+        self._memory[key] = (result, size)
+        self._memory_bytes += size
+        while self._memory_bytes > self._max_memory_bytes and self._memory:
+            _, (_, evicted_size) = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted_size
+
+    # ============================================================================
+    # DISK TIER
+    # ============================================================================
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"{key}.json"
+
+    def _load_disk_index(self) -> None:
+        """Build the LRU index from files on disk, oldest access first."""
+        index: "OrderedDict[str, int]" = OrderedDict()
+        total = 0
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            entries = []
+            for path in self._cache_dir.glob("*.json"):
+                stat = path.stat()
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+            for _, key, size in sorted(entries):
+                index[key] = size
+                total += size
+        except OSError as e:
+            logger.warning(f"Failed to scan document cache directory: {e}")
+
+        self._disk_index = index
+        self._disk_bytes = total
+
+    async def _ensure_disk_index(self) -> None:
+        if self._disk_index is None:
+            await asyncio.to_thread(self._load_disk_index)
+
+    async def _read_disk(self, key: str) -> Optional[Dict[str, Any]]:
+        async with self._disk_lock:
+            await self._ensure_disk_index()
+            if key not in self._disk_index:
+                return None
+            self._disk_index.move_to_end(key)
+
+        path = self._path(key)
+
+        def _read() -> Optional[Dict[str, Any]]:
+            data = path.read_bytes()
+            os.utime(path)  # Persist access order across restarts
+            return json.loads(data)
+
+        try:
+            return await asyncio.to_thread(_read)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dropping unreadable document cache entry {key[:12]}: {e}")
+            async with self._disk_lock:
+                size = self._disk_index.pop(key, 0)
+                self._disk_bytes -= size
+            await asyncio.to_thread(self._unlink, path)
+            return None
+
+    async def _write_disk(self, key: str, payload: bytes) -> None:
+        if len(payload) > self._max_disk_bytes:
+            return
+
+        path = self._path(key)
+
+        def _write() -> None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, path)
+
+        try:
+            await asyncio.to_thread(_write)
+        except OSError as e:
+            logger.warning(f"Failed to write document cache entry: {e}")
+            return
+
+        async with self._disk_lock:
+            await self._ensure_disk_index()
+            self._disk_bytes -= self._disk_index.pop(key, 0)
+            self._disk_index[key] = len(payload)
+            self._disk_bytes += len(payload)
+            evicted = self._evict_disk()
+
+        for victim in evicted:
+            await asyncio.to_thread(self._unlink, self._path(victim))
+
+    def _evict_disk(self) -> list:
+        """Pop least recently used disk entries until under the size limit."""
+        evicted = []
+        while self._disk_bytes > self._max_disk_bytes and self._disk_index:
+            victim, size = self._disk_index.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(victim)
+        return evicted
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Failed to remove cache file {path}: {e}")
+
+    # ============================================================================
+    # STATUS
+    # ============================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with tier sizes, hit/miss counters and in-flight count
+        """
+        return {
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk_index) if self._disk_index is not None else None,
+            "disk_bytes": self._disk_bytes,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "inflight": len(self._inflight),
+        }
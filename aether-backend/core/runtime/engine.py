@@ -12,6 +12,7 @@ Handles:
 - Integration loading and validation
 - MCP bridge installation
 - Request coordination across modules
+- Interpreter pool for concurrent agentic sessions
 - Health monitoring and diagnostics
 - Resource cleanup
 
@@ -29,7 +30,8 @@ This is the entry point for the entire runtime system.
 
 import asyncio
 import logging
-from typing import Any, AsyncGenerator, Dict, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +59,7 @@ class RuntimeEngine:
     - ConfigManager: Configuration and HTTP client
     - RequestTracker: Request lifecycle management
     - InterpreterManager: Open Interpreter lifecycle
+    - InterpreterPool: Concurrent interpreter instances with session affinity
     - DocumentProcessor: File processing
     - ChatStreamer: Chat streaming
     """
@@ -76,10 +79,12 @@ class RuntimeEngine:
         self._interpreter_manager: Optional[Any] = None
         self._document_processor: Optional[Any] = None
         self._chat_streamer: Optional[Any] = None
+        self._interpreter_pool: Optional[Any] = None
         
         # State tracking
         self._initialized = False
         self._startup_complete = False
+        self._integrations_validated = False
         
         # Legacy compatibility
         self._audio_sessions: Dict[str, bool] = {}
@@ -120,7 +125,7 @@ class RuntimeEngine:
 
     async def _initialize_all_modules(self) -> bool:
         """
-        Initialize all modules in dependency order.
+        Initialize all modules, concurrently where dependencies allow.
         
         Returns:
             True if all modules initialized successfully
@@ -131,12 +136,23 @@ class RuntimeEngine:
         try:
             logger.info("Initializing runtime modules...")
             
-            # Initialize modules in dependency order
-            await self._init_config_manager()
-            await self._init_request_tracker()
-            await self._init_interpreter_manager()
-            await self._init_document_processor()
-            await self._init_chat_streamer()
+            from .startup import StartupOrchestrator
+            
+            # Independent modules start together; the Open Interpreter import
+            # (the slow one) overlaps with everything else
+            startup = StartupOrchestrator("runtime")
+            startup.add("config_manager", self._init_config_manager, critical=True)
+            startup.add("request_tracker", self._init_request_tracker, critical=True)
+            startup.add("interpreter_manager", self._init_interpreter_manager, critical=True)
+            startup.add(
+                "document_processor", self._init_document_processor,
+                depends_on=["config_manager", "request_tracker"], critical=True,
+            )
+            startup.add(
+                "chat_streamer", self._init_chat_streamer,
+                depends_on=["config_manager", "request_tracker"], critical=True,
+            )
+            await startup.run()
             
             self._initialized = True
             logger.info("✅ All runtime modules initialized successfully")
@@ -202,17 +218,39 @@ class RuntimeEngine:
         logger.debug("Chat streamer initialized")
 
     async def _setup_interpreter(self, mcp_manager) -> None:
-        """Setup Open Interpreter with all integrations."""
+        """Warm the interpreter pool with fully configured instances."""
+        from .pool import InterpreterPool
+        
+        interpreter_settings = self.settings.interpreter
+        pool = InterpreterPool(
+            factory=lambda: self._create_configured_interpreter(mcp_manager),
+            size=getattr(interpreter_settings, "pool_size", 1),
+            max_requests=getattr(interpreter_settings, "pool_max_requests", 200),
+            acquire_timeout=getattr(interpreter_settings, "pool_acquire_timeout", 300.0),
+            on_retire=self._retire_interpreter,
+        )
+        await pool.start()
+        self._interpreter_pool = pool
+
+    async def _retire_interpreter(self, interpreter: Any, replacement: Optional[Any]) -> None:
+        """Drop a pool instance from the manager and tear it down."""
+        self._interpreter_manager.replace_interpreter(interpreter, replacement)
+        await self._interpreter_manager.close_interpreter(interpreter)
+
+    async def _create_configured_interpreter(self, mcp_manager) -> Any:
+        """Create one interpreter instance with settings and all integrations."""
         # Create interpreter instance
         interpreter = await self._interpreter_manager.create_interpreter()
         if not interpreter:
             raise RuntimeError("Failed to create interpreter instance")
         
         # Apply settings
-        self._interpreter_manager.apply_settings(self.settings, init=True)
+        self._interpreter_manager.apply_settings(
+            self.settings, init=True, interpreter=interpreter
+        )
         
         # Add web search capability
-        self._interpreter_manager.add_web_search_capability()
+        self._interpreter_manager.add_web_search_capability(interpreter)
         
         # Load integrations through unified loader
         await self._load_integrations(interpreter)
@@ -220,6 +258,8 @@ class RuntimeEngine:
         # Install MCP bridge if manager provided
         if mcp_manager:
             await self._setup_mcp_bridge(interpreter, mcp_manager)
+        
+        return interpreter
 
     async def _load_integrations(self, interpreter) -> None:
         """Load all integrations using the unified loader."""
@@ -230,8 +270,10 @@ class RuntimeEngine:
             results = loader.load_all()
             logger.info(f"✅ Integration loader: {loader.get_integration_summary()}")
             
-            # Validate integrations
-            await self._validate_integrations()
+            # Validate integrations (once per process, not per pooled instance)
+            if not self._integrations_validated:
+                self._integrations_validated = True
+                await self._validate_integrations()
             
         except Exception as e:
             logger.error(f"Failed to load integrations: {e}", exc_info=True)
@@ -315,6 +357,14 @@ class RuntimeEngine:
         """Cleanup all modules in reverse initialization order."""
         logger.info("Cleaning up runtime modules...")
         
+        # Release pooled interpreters before their manager goes away
+        if self._interpreter_pool:
+            try:
+                await self._interpreter_pool.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping interpreter pool: {e}")
+            self._interpreter_pool = None
+        
         # Cleanup in reverse order to handle dependencies
         cleanup_tasks = [
             ("chat_streamer", self._chat_streamer),
@@ -382,9 +432,14 @@ class RuntimeEngine:
         logger.info(f"🔄 Context reset for client {client_id}")
         
         try:
-            # Reset interpreter conversation context
+            # Reset interpreter conversation context (the pooled instance
+            # currently holding this client's session, if any)
             if self._interpreter_manager and self._interpreter_manager.is_available():
-                interpreter = self._interpreter_manager.get_interpreter()
+                interpreter = (
+                    self._interpreter_pool.get_session_interpreter(client_id)
+                    if self._interpreter_pool
+                    else self._interpreter_manager.get_interpreter()
+                )
                 if interpreter:
                     # Clear message history (critical for context isolation)
                     if hasattr(interpreter, 'messages'):
@@ -420,12 +475,14 @@ class RuntimeEngine:
                             interpreter.llm.reset()
                         logger.debug(f"Reset LLM state for client {client_id}")
             
-            # Clear HTTP fallback conversation history (critical for chat isolation)
+            # Drop stashed context and instance affinity for this client
+            if self._interpreter_pool:
+                self._interpreter_pool.reset_session(client_id)
+            
+            # Clear this client's HTTP fallback session (other clients untouched)
             if self._chat_streamer:
-                if hasattr(self._chat_streamer, '_conversation_history'):
-                    history_count = len(self._chat_streamer._conversation_history)
-                    self._chat_streamer._conversation_history.clear()
-                    logger.info(f"✅ Cleared {history_count} HTTP fallback messages for client {client_id}")
+                history_count = self._chat_streamer.reset_session(client_id)
+                logger.info(f"✅ Cleared {history_count} HTTP fallback messages for client {client_id}")
             
             # Reset HTTP client state (clears connection pool and any cached state)
             if self._config_manager:
@@ -448,7 +505,7 @@ class RuntimeEngine:
 
     async def _stop_interpreter_generation(self, request_id: str) -> None:
         """Stop interpreter generation using multiple methods."""
-        interpreter = self._interpreter_manager.get_interpreter()
+        interpreter = self._get_interpreter_for_request(request_id)
         if not interpreter:
             return
         
@@ -503,14 +560,13 @@ class RuntimeEngine:
         Returns:
             Dict with processing status and results
         """
-        interpreter = self._interpreter_manager.get_interpreter()
-        
-        return await self._document_processor.process_file_chat(
-            file_data=file_data,
-            prompt=prompt,
-            request_id=request_id,
-            interpreter=interpreter,
-        )
+        async with self._checkout_interpreter(None, request_id) as interpreter:
+            return await self._document_processor.process_file_chat(
+                file_data=file_data,
+                prompt=prompt,
+                request_id=request_id,
+                interpreter=interpreter,
+            )
 
     async def handle_file_chat_multipart(
         self,
@@ -529,14 +585,13 @@ class RuntimeEngine:
         Returns:
             Dict with processing status and results
         """
-        interpreter = self._interpreter_manager.get_interpreter()
-        
-        return await self._document_processor.process_file_chat_multipart(
-            file_data=file_data,
-            prompt=prompt,
-            request_id=request_id,
-            interpreter=interpreter,
-        )
+        async with self._checkout_interpreter(None, request_id) as interpreter:
+            return await self._document_processor.process_file_chat_multipart(
+                file_data=file_data,
+                prompt=prompt,
+                request_id=request_id,
+                interpreter=interpreter,
+            )
 
     # ============================================================================
     # AUDIO PROCESSING (STUB)
@@ -591,18 +646,80 @@ class RuntimeEngine:
                 logger.error("Startup did not complete in time!")
                 return
         
-        # Delegate to chat streamer
-        interpreter = self._interpreter_manager.get_interpreter()
+        # Delegate to chat streamer with an interpreter checked out for this client
+        async with self._checkout_interpreter(client_id, request_id) as interpreter:
+            async for chunk in self._chat_streamer.stream_chat(
+                client_id=client_id,
+                text=text,
+                image_b64=image_b64,
+                request_id=request_id,
+                interpreter=interpreter,
+                settings=self.settings,
+            ):
+                yield chunk
+
+    # ============================================================================
+    # INTERPRETER POOL ACCESS
+    # ============================================================================
+
+    @asynccontextmanager
+    async def _checkout_interpreter(
+        self, session_id: Optional[str], request_id: Optional[str]
+    ) -> AsyncIterator[Optional[Any]]:
+        """
+        Check out a pooled interpreter for one request.
+        
+        Yields None when no pool exists so callers fall back to HTTP streaming.
+        """
+        if not self._interpreter_pool:
+            yield None
+            return
         
-        async for chunk in self._chat_streamer.stream_chat(
-            client_id=client_id,
-            text=text,
-            image_b64=image_b64,
-            request_id=request_id,
-            interpreter=interpreter,
-            settings=self.settings,
-        ):
-            yield chunk
+        async with self._interpreter_pool.acquire(session_id, request_id) as interpreter:
+            yield interpreter
+
+    def _get_interpreter_for_request(self, request_id: str) -> Optional[Any]:
+        """
+        Interpreter serving a request.
+        
+        With a pool only the instance checked out for the request is returned;
+        any other instance may be serving another client.
+        """
+        if self._interpreter_pool:
+            return self._interpreter_pool.get_request_interpreter(request_id)
+        return self._interpreter_manager.get_interpreter()
+
+    async def send_raw_input(
+        self, payload: Dict[str, Any], client_id: Optional[str] = None
+    ) -> None:
+        """
+        Pass a raw LMC message to the interpreter holding the client's context.
+        
+        While the client's request is running, the message goes to the
+        interpreter checked out for it. Otherwise an idle interpreter is
+        checked out without waiting.
+        
+        Args:
+            payload: LMC message
+            client_id: Client identifier (session affinity in the pool)
+            
+        Raises:
+            RuntimeError: If no interpreter is free for the client
+        """
+        if not self._interpreter_pool:
+            interpreter = self._interpreter_manager.get_interpreter()
+            if interpreter:
+                await interpreter.input(payload)
+            return
+        
+        if client_id is not None:
+            interpreter = self._interpreter_pool.get_busy_session_interpreter(client_id)
+            if interpreter is not None:
+                await interpreter.input(payload)
+                return
+        
+        async with self._interpreter_pool.acquire(client_id, timeout=0) as interpreter:
+            await interpreter.input(payload)
 
     # ============================================================================
     # HEALTH AND STATUS
@@ -628,6 +745,11 @@ class RuntimeEngine:
                 else 0
             ),
             "active_audio_sessions": len(self._audio_sessions),
+            "interpreter_pool": (
+                self._interpreter_pool.get_stats()
+                if self._interpreter_pool
+                else {"size": 0}
+            ),
         }
         
         return status
@@ -716,12 +838,12 @@ class RuntimeEngine:
         Returns:
             List of conversation messages
             
-        Note: Currently returns in-memory history from chat streamer.
+        Note: Currently returns in-memory session history from chat streamer.
         For persistent storage, use database repositories.
         """
         if not self._chat_streamer:
             return []
         
-        # Return a copy to prevent external modification
-        return list(self._chat_streamer._conversation_history)
+        # Returns a copy to prevent external modification
+        return self._chat_streamer.get_session_history(session_id)
 
@@ -92,6 +92,12 @@ class InterpreterManager:
 
     async def _import_oi_components(self) -> None:
         """Import and validate Open Interpreter components."""
+        # The import is slow; keep it off the event loop so other startup
+        # work (database, MCP) proceeds concurrently
+        await asyncio.to_thread(self._import_oi_modules)
+
+    def _import_oi_modules(self) -> None:
+        """Import Open Interpreter (blocking)."""
         import os
         
         # Add local open-interpreter package to path
@@ -141,10 +147,14 @@ class InterpreterManager:
 
     async def create_interpreter(self) -> Optional[Any]:
         """
-        Create and configure new interpreter instance.
+        Create a new interpreter instance.
+        
+        The first instance created becomes the primary interpreter returned by
+        get_interpreter(); further instances (interpreter pool) are returned
+        to the caller only.
         
         Returns:
-            Configured interpreter instance or None on failure
+            Interpreter instance or None on failure
         """
         if not self._oi_available:
             logger.warning("Open Interpreter not available")
@@ -152,46 +162,48 @@ class InterpreterManager:
             
         try:
             logger.info("Creating interpreter instance...")
-            self._interpreter = self._AsyncInterpreter()
+            interpreter = self._AsyncInterpreter()
+            if self._interpreter is None:
+                self._interpreter = interpreter
             logger.info("Interpreter instance created")
-            return self._interpreter
+            return interpreter
             
         except Exception as e:
             logger.error(f"Failed to create interpreter: {e}", exc_info=True)
             return None
 
-    def apply_settings(self, settings: Any, init: bool = False) -> None:
+    def apply_settings(
+        self, settings: Any, init: bool = False, interpreter: Optional[Any] = None
+    ) -> None:
         """
         Apply runtime settings to interpreter instance.
         
         Args:
             settings: Runtime settings object
             init: Whether this is initial setup
+            interpreter: Instance to configure (defaults to primary interpreter)
         """
-        if not self._interpreter:
+        interp = interpreter or self._interpreter
+        if not interp:
             logger.warning("No interpreter instance to configure")
             return
             
-        self._apply_privacy_settings()
-        self._apply_profile_settings(settings, init)
-        self._apply_llm_settings(settings.llm)
-        self._apply_interpreter_settings(settings.interpreter)
-        self._apply_environment_settings()
+        self._apply_privacy_settings(interp)
+        self._apply_profile_settings(interp, settings, init)
+        self._apply_llm_settings(interp, settings.llm)
+        self._apply_interpreter_settings(interp, settings.interpreter)
+        self._apply_environment_settings(interp)
         
         logger.info("Interpreter settings applied successfully")
 
-    def _apply_privacy_settings(self) -> None:
+    def _apply_privacy_settings(self, interp: Any) -> None:
         """Apply privacy and security settings."""
-        interp = self._interpreter
-        
         # Offline-first and privacy preserving
         interp.offline = True
         interp.disable_telemetry = True
 
-    def _apply_profile_settings(self, settings: Any, init: bool) -> None:
+    def _apply_profile_settings(self, interp: Any, settings: Any, init: bool) -> None:
         """Apply GURU profile from our templates directory."""
-        interp = self._interpreter
-        
         # Use our custom GURU profile from templates
         desired_profile = settings.interpreter.profile or "GURU"
         
@@ -269,10 +281,8 @@ class InterpreterManager:
         except Exception as e:
             logger.debug(f"Basic profile settings failed: {e}")
     
-    def _apply_llm_settings(self, llm_settings: Any) -> None:
+    def _apply_llm_settings(self, interp: Any, llm_settings: Any) -> None:
         """Apply LLM configuration settings."""
-        interp = self._interpreter
-        
         # Model configuration
         model = llm_settings.model
         if llm_settings.provider == "openai-compatible" and not model.startswith("openai/"):
@@ -298,10 +308,8 @@ class InterpreterManager:
         except Exception:
             pass
 
-    def _apply_interpreter_settings(self, interpreter_settings: Any) -> None:
+    def _apply_interpreter_settings(self, interp: Any, interpreter_settings: Any) -> None:
         """Apply interpreter behavior settings."""
-        interp = self._interpreter
-        
         # Behavior settings
         interp.auto_run = True
         interp.loop = False
@@ -358,10 +366,8 @@ class InterpreterManager:
         except Exception:
             pass
 
-    def _apply_environment_settings(self) -> None:
+    def _apply_environment_settings(self, interp: Any) -> None:
         """Apply environment-specific settings."""
-        interp = self._interpreter
-        
         # Append OS/environment info to system message
         try:
             os_name = platform.system()
@@ -378,9 +384,15 @@ class InterpreterManager:
         except Exception as e:
             logger.debug(f"Failed to append environment info: {e}")
 
-    def add_web_search_capability(self) -> None:
-        """Add basic web search capability to computer API."""
-        if not self._interpreter:
+    def add_web_search_capability(self, interpreter: Optional[Any] = None) -> None:
+        """
+        Add basic web search capability to computer API.
+        
+        Args:
+            interpreter: Instance to extend (defaults to primary interpreter)
+        """
+        interp = interpreter or self._interpreter
+        if not interp:
             return
             
         async def basic_web_search(query: str, max_results: int = 5) -> str:
@@ -424,14 +436,44 @@ class InterpreterManager:
                 return f"Search error: {str(e)}. Query was: {query}"
         
         # Add to computer API if available
-        if hasattr(self._interpreter, "computer"):
-            self._interpreter.computer.web_search = basic_web_search
+        if hasattr(interp, "computer"):
+            interp.computer.web_search = basic_web_search
             logger.info("✅ Basic web search capability added to computer API")
 
     def get_interpreter(self) -> Optional[Any]:
         """Get current interpreter instance."""
         return self._interpreter
 
+    def replace_interpreter(self, retired: Any, replacement: Optional[Any]) -> None:
+        """
+        Point the primary interpreter away from a retired instance.
+        
+        Args:
+            retired: Instance leaving the interpreter pool
+            replacement: Instance taking its place (None clears the primary)
+        """
+        if self._interpreter is retired:
+            self._interpreter = replacement
+
+    async def close_interpreter(self, interpreter: Any) -> None:
+        """
+        Tear down an interpreter instance that is no longer used.
+        
+        Stops a running generation and terminates the computer's languages
+        (code execution subprocesses) of the instance.
+        """
+        if hasattr(interpreter, "stop_event"):
+            interpreter.stop_event.set()
+        
+        computer = getattr(interpreter, "computer", None)
+        terminate = getattr(computer, "terminate", None)
+        if callable(terminate):
+            try:
+                await asyncio.to_thread(terminate)
+            except Exception as e:
+                logger.debug(f"Failed to terminate interpreter computer: {e}")
+        logger.debug("Interpreter instance closed")
+
     def is_available(self) -> bool:
         """Check if Open Interpreter is available."""
         return self._oi_available
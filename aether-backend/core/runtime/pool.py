@@ -0,0 +1,434 @@
+"""
+Interpreter Pool - Concurrent Open Interpreter instances with session affinity
+
+@.architecture
+Incoming: core/runtime/engine.py --- {async interpreter factory, pool size/recycle settings, session_id and request_id per checkout}
+Processing: start(), acquire(), _checkout(), _checkin(), _bind_session(), _recycle(), _retire(), reset_session(), stop(), get_stats() --- {6 jobs: instance_warmup, checkout_management, session_affinity, context_isolation, instance_recycling, metrics_collection}
+Outgoing: core/runtime/engine.py, core/runtime/streaming.py --- {checked-out interpreter instances, pool statistics Dict}
+
+Handles:
+- Warm-up of N configured interpreter instances at startup
+- Per-request checkout with bounded waiting
+- Session affinity (a session returns to the instance holding its context)
+- Context isolation when an instance switches sessions (message stash/restore)
+- Recycling after N requests
+- Pool metrics for health reporting
+
+Production Features:
+- asyncio.Condition based checkout (no polling)
+- Background recycling so callers never wait on instance construction
+- Bounded session stash with LRU eviction
+- Request-to-instance mapping for targeted cancellation
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PooledInterpreter:
+    """
+    Pool slot holding one interpreter instance.
+
+    Attributes:
+        index: Slot index in the pool
+        interpreter: Open Interpreter instance
+        created_at: Instance creation timestamp
+        request_count: Requests served by this instance
+        session_id: Session whose context the instance currently holds
+        request_id: Request currently using the instance
+        in_use: Whether the instance is checked out
+        recycling: Whether the instance is being replaced
+        last_used: Last checkin timestamp
+    """
+    index: int
+    interpreter: Any
+    created_at: float
+    request_count: int = 0
+    session_id: Optional[str] = None
+    request_id: Optional[str] = None
+    in_use: bool = False
+    recycling: bool = False
+    last_used: float = 0.0
+
+
+class InterpreterPool:
+    """
+    Pool of configured interpreter instances for concurrent chat sessions.
+
+    Checkout rules:
+    1. A session whose instance is idle gets that instance back (affinity)
+    2. A session whose instance is busy waits for it (its context lives there)
+    3. Otherwise an idle unbound instance, else the least recently used idle one
+
+    When an instance switches sessions, the outgoing session's message list is
+    stashed and the incoming session's list restored, so contexts never bleed
+    even when there are more sessions than instances.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[Any]],
+        size: int = 1,
+        max_requests: int = 200,
+        acquire_timeout: float = 300.0,
+        max_stashed_sessions: int = 1000,
+        on_retire: Optional[Callable[[Any, Optional[Any]], Awaitable[None]]] = None,
+    ):
+        """
+        Initialize interpreter pool.
+
+        Args:
+            factory: Coroutine function creating a fully configured interpreter
+            size: Number of interpreter instances
+            max_requests: Recycle an instance after this many requests (0 disables)
+            acquire_timeout: Max seconds to wait for a free instance
+            max_stashed_sessions: Max sessions whose context is kept off-instance
+            on_retire: Coroutine function called with (retired, replacement) when
+                an instance leaves the pool (replacement is None on stop)
+        """
+        self._factory = factory
+        self._size = max(1, size)
+        self._max_requests = max_requests
+        self._acquire_timeout = acquire_timeout
+        self._max_stashed_sessions = max_stashed_sessions
+        self._on_retire = on_retire
+
+        self._slots: List[PooledInterpreter] = []
+        self._cond = asyncio.Condition()
+        self._session_slots: Dict[str, PooledInterpreter] = {}
+        self._request_slots: Dict[str, PooledInterpreter] = {}
+        self._stash: "OrderedDict[str, list]" = OrderedDict()
+        self._recycle_tasks: set = set()
+        self._started = False
+
+        # Metrics
+        self._waiting = 0
+        self._checkouts = 0
+        self._wait_time_total = 0.0
+        self._timeouts = 0
+        self._recycled = 0
+        self._recycle_failures = 0
+
+    # ============================================================================
+    # LIFECYCLE
+    # ============================================================================
+
+    async def start(self) -> None:
+        """
+        Warm all pool instances concurrently.
+
+        Raises:
+            RuntimeError: If no instance could be created
+        """
+        if self._started:
+            return
+
+        start = time.time()
+        results = await asyncio.gather(
+            *(self._factory() for _ in range(self._size)),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, BaseException) or result is None:
+                logger.error(f"Failed to warm interpreter instance: {result}")
+                continue
+            self._slots.append(
+                PooledInterpreter(
+                    index=len(self._slots),
+                    interpreter=result,
+                    created_at=time.time(),
+                )
+            )
+
+        if not self._slots:
+            raise RuntimeError("Failed to create any interpreter instance")
+
+        self._started = True
+        logger.info(
+            f"Interpreter pool warmed {len(self._slots)}/{self._size} instances "
+            f"in {time.time() - start:.2f}s"
+        )
+
+    async def stop(self) -> None:
+        """Cancel pending recycles, then retire and drop all instances."""
+        for task in list(self._recycle_tasks):
+            task.cancel()
+        if self._recycle_tasks:
+            await asyncio.gather(*self._recycle_tasks, return_exceptions=True)
+
+        for slot in self._slots:
+            await self._retire(slot.interpreter, None)
+        self._slots.clear()
+        self._session_slots.clear()
+        self._request_slots.clear()
+        self._stash.clear()
+        self._started = False
+
+    @property
+    def primary(self) -> Optional[Any]:
+        """First pool instance (for callers without a session)."""
+        return self._slots[0].interpreter if self._slots else None
+
+    # ============================================================================
+    # CHECKOUT / CHECKIN
+    # ============================================================================
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        session_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Check out an interpreter for the duration of a request.
+
+        Args:
+            session_id: Client/chat identifier for affinity (None for no affinity)
+            request_id: Request identifier for targeted cancellation
+            timeout: Max seconds to wait (None for acquire_timeout, 0 to not wait)
+
+        Yields:
+            Interpreter instance bound to the session's context
+        """
+        slot = await self._checkout(session_id, request_id, timeout)
+        try:
+            yield slot.interpreter
+        finally:
+            await self._checkin(slot)
+
+    async def _checkout(
+        self,
+        session_id: Optional[str],
+        request_id: Optional[str],
+        timeout: Optional[float] = None,
+    ) -> PooledInterpreter:
+        """Wait for and claim a slot for the session."""
+        if not self._slots:
+            raise RuntimeError("Interpreter pool is not started")
+
+        if timeout is None:
+            timeout = self._acquire_timeout
+        start = time.monotonic()
+        async with self._cond:
+            if timeout <= 0:
+                if self._pick(session_id) is None:
+                    self._timeouts += 1
+                    raise RuntimeError("No interpreter is free for the session")
+            else:
+                self._waiting += 1
+                try:
+                    await asyncio.wait_for(
+                        self._cond.wait_for(lambda: self._pick(session_id) is not None),
+                        timeout=timeout,
+                    )
+                except asyncio.TimeoutError:
+                    self._timeouts += 1
+                    raise RuntimeError(
+                        f"Timed out after {timeout}s waiting for an interpreter"
+                    )
+                finally:
+                    self._waiting -= 1
+
+            slot = self._pick(session_id)
+            slot.in_use = True
+            slot.request_id = request_id
+            self._bind_session(slot, session_id)
+            if request_id:
+                self._request_slots[request_id] = slot
+
+        self._checkouts += 1
+        self._wait_time_total += time.monotonic() - start
+        return slot
+
+    def _pick(self, session_id: Optional[str]) -> Optional[PooledInterpreter]:
+        """Choose a slot for the session, or None if it must wait."""
+        if session_id is not None:
+            affine = self._session_slots.get(session_id)
+            if affine is not None:
+                if not affine.in_use and not affine.recycling:
+                    return affine
+                if affine.in_use:
+                    # Context lives on a busy instance - wait for it
+                    return None
+
+        idle = [s for s in self._slots if not s.in_use and not s.recycling]
+        if not idle:
+            return None
+
+        unbound = [s for s in idle if s.session_id is None]
+        if unbound:
+            return unbound[0]
+        return min(idle, key=lambda s: s.last_used)
+
+    def _bind_session(self, slot: PooledInterpreter, session_id: Optional[str]) -> None:
+        """Swap the slot's conversation context to the given session."""
+        if session_id is not None and slot.session_id == session_id:
+            return
+
+        interpreter = slot.interpreter
+        has_messages = hasattr(interpreter, "messages")
+
+        # Stash the outgoing session's context
+        if slot.session_id is not None:
+            if has_messages:
+                self._stash_messages(slot.session_id, interpreter.messages)
+            self._session_slots.pop(slot.session_id, None)
+
+        # Restore the incoming session's context (fresh list if unknown)
+        if has_messages:
+            interpreter.messages = (
+                self._stash.pop(session_id, []) if session_id is not None else []
+            )
+
+        slot.session_id = session_id
+        if session_id is not None:
+            self._session_slots[session_id] = slot
+
+    def _stash_messages(self, session_id: str, messages: list) -> None:
+        """Keep a session's messages off-instance (bounded LRU)."""
+        self._stash[session_id] = messages
+        self._stash.move_to_end(session_id)
+        while len(self._stash) > self._max_stashed_sessions:
+            self._stash.popitem(last=False)
+
+    async def _checkin(self, slot: PooledInterpreter) -> None:
+        """Return a slot to the pool, recycling it if limits are exceeded."""
+        slot.request_count += 1
+        slot.last_used = time.time()
+
+        reason = None
+        if self._max_requests and slot.request_count >= self._max_requests:
+            reason = f"served {slot.request_count} requests"
+
+        async with self._cond:
+            if slot.request_id:
+                self._request_slots.pop(slot.request_id, None)
+            slot.request_id = None
+            slot.in_use = False
+
+            if reason:
+                # Move the session's context off the instance so the session
+                # can be served elsewhere while the replacement is built
+                self._bind_session(slot, None)
+                slot.recycling = True
+                task = asyncio.create_task(self._recycle(slot, reason))
+                self._recycle_tasks.add(task)
+                task.add_done_callback(self._recycle_tasks.discard)
+
+            self._cond.notify_all()
+
+    async def _recycle(self, slot: PooledInterpreter, reason: str) -> None:
+        """Replace a slot's instance with a fresh one."""
+        logger.info(f"Recycling interpreter {slot.index} ({reason})")
+        try:
+            fresh = await self._factory()
+            if fresh is None:
+                raise RuntimeError("factory returned no interpreter")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._recycle_failures += 1
+            logger.warning(f"Interpreter {slot.index} recycle failed, keeping instance: {e}")
+            fresh = None
+
+        retired = None
+        async with self._cond:
+            if fresh is not None:
+                retired = slot.interpreter
+                slot.interpreter = fresh
+                slot.created_at = time.time()
+                self._recycled += 1
+            slot.request_count = 0
+            slot.recycling = False
+            self._cond.notify_all()
+
+        if retired is not None:
+            await self._retire(retired, fresh)
+
+    async def _retire(self, interpreter: Any, replacement: Optional[Any]) -> None:
+        """Hand a retired instance to the on_retire hook for teardown."""
+        if self._on_retire is None:
+            return
+        try:
+            await self._on_retire(interpreter, replacement)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to retire interpreter instance: {e}")
+
+    # ============================================================================
+    # SESSION / REQUEST LOOKUP
+    # ============================================================================
+
+    def get_session_interpreter(self, session_id: str) -> Optional[Any]:
+        """Interpreter currently holding the session's context, if any."""
+        slot = self._session_slots.get(session_id)
+        return slot.interpreter if slot else None
+
+    def get_busy_session_interpreter(self, session_id: str) -> Optional[Any]:
+        """Interpreter holding the session's context while it serves a request."""
+        slot = self._session_slots.get(session_id)
+        return slot.interpreter if slot is not None and slot.in_use else None
+
+    def get_request_interpreter(self, request_id: str) -> Optional[Any]:
+        """Interpreter currently serving the request, if any."""
+        slot = self._request_slots.get(request_id)
+        return slot.interpreter if slot else None
+
+    def reset_session(self, session_id: str) -> None:
+        """Forget a session's stashed context and instance affinity."""
+        self._stash.pop(session_id, None)
+        slot = self._session_slots.get(session_id)
+        if slot is not None and not slot.in_use:
+            self._session_slots.pop(session_id, None)
+            slot.session_id = None
+
+    # ============================================================================
+    # METRICS
+    # ============================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pool metrics.
+
+        Returns:
+            Dict with size, utilisation, wait and recycle statistics
+        """
+        busy = sum(1 for s in self._slots if s.in_use)
+        return {
+            "size": len(self._slots),
+            "configured_size": self._size,
+            "busy": busy,
+            "idle": len(self._slots) - busy,
+            "recycling": sum(1 for s in self._slots if s.recycling),
+            "waiting": self._waiting,
+            "checkouts": self._checkouts,
+            "avg_wait_ms": (
+                round(self._wait_time_total / self._checkouts * 1000, 2)
+                if self._checkouts
+                else 0.0
+            ),
+            "timeouts": self._timeouts,
+            "recycled": self._recycled,
+            "recycle_failures": self._recycle_failures,
+            "bound_sessions": len(self._session_slots),
+            "stashed_sessions": len(self._stash),
+            "instances": [
+                {
+                    "index": s.index,
+                    "in_use": s.in_use,
+                    "requests": s.request_count,
+                    "age_seconds": round(time.time() - s.created_at, 1),
+                }
+                for s in self._slots
+            ],
+        }
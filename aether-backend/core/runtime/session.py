@@ -0,0 +1,350 @@
+"""
+Session Store - Per-client conversation sessions with token-aware history
+
+@.architecture
+Incoming: core/runtime/streaming.py, core/runtime/engine.py --- {session_id (client/chat id), user and assistant messages, token budget}
+Processing: get(), get_or_create(), reset(), evict_idle(), ChatSession.build_messages(), ChatSession.append(), ChatSession.trim() --- {5 jobs: session_isolation, lru_eviction, token_budgeting, prefix_caching, history_management}
+Outgoing: core/runtime/streaming.py, core/runtime/engine.py --- {List[Dict] chat messages for HTTP payloads, session statistics Dict}
+
+Handles:
+- One conversation history per client/chat id (no cross-client bleed)
+- LRU eviction of idle sessions with a hard session cap
+- History trimming by token budget instead of message count
+- Cached prompt prefix reuse between turns
+- Image payload stripping so base64 data never lives in history
+
+Production Features:
+- O(1) session lookup and LRU touch via OrderedDict
+- Incremental token accounting (no re-counting on every request)
+- System message pinning during trimming
+- Bounded memory regardless of client count
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Rough chars-per-token ratio for OpenAI-compatible tokenizers
+CHARS_PER_TOKEN = 4
+# Fixed per-message overhead (role, separators) charged by chat templates
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(content: Any) -> int:
+    """
+    Estimate token count for message content.
+
+    Args:
+        content: Message content (string or list of content blocks)
+
+    Returns:
+        Estimated token count including per-message overhead
+    """
+    if isinstance(content, str):
+        return MESSAGE_OVERHEAD_TOKENS + (len(content) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+    tokens = MESSAGE_OVERHEAD_TOKENS
+    if isinstance(content, list):
+        for block in content:
+            if isinstance(block, dict) and block.get("type") == "text":
+                text = block.get("text") or ""
+                tokens += (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+    return tokens
+
+
+class ChatSession:
+    """
+    Conversation history for a single client/chat.
+
+    Features:
+    - Token-budgeted history with pinned system message
+    - Cached prompt prefix (rebuilt only when history changes)
+    - Per-message token counts kept alongside messages
+    """
+
+    def __init__(self, session_id: str, token_budget: int):
+        """
+        Initialize chat session.
+
+        Args:
+            session_id: Client or chat identifier
+            token_budget: Maximum tokens retained in history
+        """
+        self.session_id = session_id
+        self.token_budget = token_budget
+        self.created_at = time.time()
+        self.last_used = self.created_at
+
+        self._messages: List[Dict[str, Any]] = []
+        self._token_counts: List[int] = []
+        self._total_tokens = 0
+
+        # Cached prompt prefix - invalidated on any history mutation
+        self._prefix_cache: Optional[List[Dict[str, Any]]] = None
+        self.prefix_hits = 0
+        self.prefix_misses = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Estimated tokens currently held in history."""
+        return self._total_tokens
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def touch(self) -> None:
+        """Mark session as recently used."""
+        self.last_used = time.time()
+
+    def get_messages(self) -> List[Dict[str, Any]]:
+        """Return a copy of the history messages."""
+        return list(self._messages)
+
+    def build_messages(
+        self, user_message: Dict[str, Any], max_history_tokens: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build request messages from cached prefix plus the new user message.
+
+        Args:
+            user_message: Message for the current turn
+            max_history_tokens: Tighter history limit for this request
+                (e.g. remaining context window), if smaller than the budget
+
+        Returns:
+            List of messages for the chat completion payload
+        """
+        if max_history_tokens is not None and max_history_tokens < self.token_budget:
+            self.trim(max_history_tokens)
+
+        if self._prefix_cache is None:
+            self._prefix_cache = list(self._messages)
+            self.prefix_misses += 1
+        else:
+            self.prefix_hits += 1
+
+        # Shallow concatenation - prefix message dicts are shared, not copied
+        return self._prefix_cache + [user_message]
+
+    def append(self, role: str, content: Any) -> None:
+        """
+        Append a message to history and enforce the token budget.
+
+        Image blocks are stripped so base64 payloads are never retained.
+
+        Args:
+            role: Message role
+            content: Message content (string or content blocks)
+        """
+        content = self._strip_images(content)
+        if not content:
+            return
+
+        tokens = estimate_tokens(content)
+        self._messages.append({"role": role, "content": content})
+        self._token_counts.append(tokens)
+        self._total_tokens += tokens
+        self._prefix_cache = None
+
+        self.trim()
+
+    def trim(self, budget: Optional[int] = None) -> int:
+        """
+        Drop oldest messages until history fits within the token budget.
+
+        The leading system message (if any) is always kept.
+
+        Args:
+            budget: Token budget override (defaults to session budget)
+
+        Returns:
+            Number of messages dropped
+        """
+        budget = self.token_budget if budget is None else max(budget, 0)
+        if self._total_tokens <= budget:
+            return 0
+
+        start = 1 if self._messages and self._messages[0].get("role") == "system" else 0
+        drop = 0
+        total = self._total_tokens
+        while total > budget and start + drop < len(self._messages):
+            total -= self._token_counts[start + drop]
+            drop += 1
+
+        if drop:
+            del self._messages[start:start + drop]
+            del self._token_counts[start:start + drop]
+            self._total_tokens = total
+            self._prefix_cache = None
+            logger.debug(
+                f"Trimmed {drop} messages from session {self.session_id} "
+                f"({total}/{budget} tokens)"
+            )
+        return drop
+
+    def clear(self) -> int:
+        """
+        Clear session history.
+
+        Returns:
+            Number of messages cleared
+        """
+        count = len(self._messages)
+        self._messages.clear()
+        self._token_counts.clear()
+        self._total_tokens = 0
+        self._prefix_cache = None
+        return count
+
+    @staticmethod
+    def _strip_images(content: Any) -> Any:
+        """Remove image blocks, collapsing pure-text block lists to a string."""
+        if not isinstance(content, list):
+            return content
+
+        texts = [
+            block.get("text") or ""
+            for block in content
+            if isinstance(block, dict) and block.get("type") == "text"
+        ]
+        return "\n".join(t for t in texts if t)
+
+
+class SessionStore:
+    """
+    LRU store of chat sessions keyed by client/chat id.
+
+    Features:
+    - Hard cap on live sessions with least-recently-used eviction
+    - Idle timeout eviction
+    - Aggregated statistics for health reporting
+
+    All operations are synchronous and non-awaiting, so they are safe to call
+    from coroutines on a single event loop without locking.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        idle_timeout: float = 3600.0,
+        token_budget: int = 8000,
+    ):
+        """
+        Initialize session store.
+
+        Args:
+            max_sessions: Maximum number of live sessions
+            idle_timeout: Seconds after which an unused session is evicted
+            token_budget: Default per-session history token budget
+        """
+        self._max_sessions = max_sessions
+        self._idle_timeout = idle_timeout
+        self._token_budget = token_budget
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def get(self, session_id: str) -> Optional[ChatSession]:
+        """
+        Get an existing session without creating one.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            ChatSession or None if not found
+        """
+        return self._sessions.get(session_id)
+
+    def get_or_create(self, session_id: str) -> ChatSession:
+        """
+        Get a session, creating it if needed, and mark it most recently used.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            ChatSession instance
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            self.evict_idle()
+            session = ChatSession(session_id, self._token_budget)
+            self._sessions[session_id] = session
+
+            while len(self._sessions) > self._max_sessions:
+                evicted_id, _ = self._sessions.popitem(last=False)
+                self._evictions += 1
+                logger.debug(f"Evicted LRU session {evicted_id}")
+        else:
+            self._sessions.move_to_end(session_id)
+
+        session.touch()
+        return session
+
+    def reset(self, session_id: str) -> int:
+        """
+        Drop a session entirely.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Number of history messages discarded
+        """
+        session = self._sessions.pop(session_id, None)
+        return len(session) if session else 0
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Evict sessions idle longer than the idle timeout.
+
+        Sessions are ordered by recency, so scanning stops at the first live one.
+
+        Returns:
+            Number of sessions evicted
+        """
+        now = time.time() if now is None else now
+        evicted = 0
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_used <= self._idle_timeout:
+                break
+            del self._sessions[session_id]
+            evicted += 1
+
+        if evicted:
+            self._evictions += evicted
+            logger.debug(f"Evicted {evicted} idle sessions")
+        return evicted
+
+    def clear(self) -> None:
+        """Drop all sessions."""
+        self._sessions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get aggregated session statistics.
+
+        Returns:
+            Dict with session counts, token totals and prefix cache stats
+        """
+        sessions = self._sessions.values()
+        return {
+            "active_sessions": len(self._sessions),
+            "max_sessions": self._max_sessions,
+            "evictions": self._evictions,
+            "total_messages": sum(len(s) for s in sessions),
+            "total_tokens": sum(s.total_tokens for s in sessions),
+            "token_budget": self._token_budget,
+            "prefix_cache_hits": sum(s.prefix_hits for s in sessions),
+            "prefix_cache_misses": sum(s.prefix_misses for s in sessions),
+        }
@@ -12,7 +12,7 @@ Handles:
 - HTTP fallback to OpenAI-compatible servers
 - Request tracking and cancellation support
 - Vision content support with base64 images
-- Conversation history management
+- Per-client conversation sessions (see core/runtime/session.py)
 - Error handling and recovery
 - Graceful fallback between OI and HTTP
 
@@ -20,7 +20,7 @@ Production Features:
 - Complete async streaming support
 - Proper cancellation detection
 - Error boundaries for each stream
-- Conversation history with size limits
+- Token-budgeted history with LRU session eviction
 - Vision support detection
 - Request ID injection for tracking
 """
@@ -28,7 +28,9 @@ Production Features:
 import asyncio
 import json
 import logging
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from .session import SessionStore, estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -42,7 +44,7 @@ class ChatStreamer:
     - HTTP fallback for OpenAI-compatible servers
     - Request tracking and cancellation
     - Vision content support with base64 images
-    - Conversation history management with size limits
+    - Per-client conversation sessions with token-budgeted history
     - Error handling and graceful recovery
     - Proper start/end message coordination
     
@@ -51,18 +53,31 @@ class ChatStreamer:
     2. HTTP Path: Direct API calls for simple completion
     """
 
-    def __init__(self, config_manager, request_tracker):
+    def __init__(
+        self,
+        config_manager,
+        request_tracker,
+        max_sessions: int = 1000,
+        session_idle_timeout: float = 3600.0,
+        history_token_budget: int = 8000,
+    ):
         """
         Initialize chat streamer.
         
         Args:
             config_manager: Config manager for HTTP client access
             request_tracker: Request tracker for cancellation support
+            max_sessions: Maximum live conversation sessions (LRU evicted)
+            session_idle_timeout: Seconds before an idle session is evicted
+            history_token_budget: Per-session history token budget
         """
         self._config_manager = config_manager
         self._request_tracker = request_tracker
-        self._max_history_messages = 30  # Cap history length
-        self._conversation_history = []
+        self._sessions = SessionStore(
+            max_sessions=max_sessions,
+            idle_timeout=session_idle_timeout,
+            token_budget=history_token_budget,
+        )
 
     async def stream_chat(
         self,
@@ -290,10 +305,18 @@ class ChatStreamer:
                 "image_url": {"url": f"data:image/png;base64,{image_b64}"},
             })
         
-        # Get conversation history
-        messages = list(self._conversation_history)
+        # Build messages from this client's cached history prefix, keeping
+        # room in the context window for the new turn and the response
+        session = self._sessions.get_or_create(client_id)
         user_message = {"role": "user", "content": content_blocks or text}
-        messages.append(user_message)
+        history_limit = None
+        if llm.context_window:
+            history_limit = (
+                llm.context_window
+                - llm.max_tokens
+                - estimate_tokens(user_message["content"])
+            )
+        messages = session.build_messages(user_message, max_history_tokens=history_limit)
         
         # Build payload
         payload = {
@@ -385,7 +408,7 @@ class ChatStreamer:
         
         # Update conversation history
         if assistant_accum:
-            self._update_conversation_history(messages, assistant_accum)
+            self._update_conversation_history(client_id, user_message, assistant_accum)
 
     # ============================================================================
     # HELPER METHODS
@@ -403,28 +426,48 @@ class ChatStreamer:
         }
 
     def _update_conversation_history(
-        self, messages: list, assistant_response: list
+        self,
+        client_id: str,
+        user_message: Dict[str, Any],
+        assistant_response: list,
     ) -> None:
-        """Update conversation history with assistant response."""
-        assistant_content = "".join(assistant_response)
-        self._conversation_history.append({
-            "role": "assistant",
-            "content": assistant_content,
-        })
+        """Append the completed turn to the client's session history."""
+        session = self._sessions.get_or_create(client_id)
+        session.append("user", user_message["content"])
+        session.append("assistant", "".join(assistant_response))
+
+    # ============================================================================
+    # SESSION MANAGEMENT
+    # ============================================================================
+
+    def get_session_history(self, session_id: str) -> List[Dict[str, Any]]:
+        """
+        Get conversation history for a session.
         
-        # Cap history length
-        if len(self._conversation_history) > self._max_history_messages:
-            system_msg = None
-            if (
-                self._conversation_history
-                and self._conversation_history[0].get("role") == "system"
-            ):
-                system_msg = self._conversation_history[0]
+        Args:
+            session_id: Client/chat identifier
             
-            recent = self._conversation_history[
-                -(self._max_history_messages - (1 if system_msg else 0)) :
-            ]
-            self._conversation_history = ([system_msg] if system_msg else []) + recent
+        Returns:
+            Copy of the session's history messages (empty if unknown)
+        """
+        session = self._sessions.get(session_id)
+        return session.get_messages() if session else []
+
+    def reset_session(self, session_id: str) -> int:
+        """
+        Discard conversation history for a session.
+        
+        Args:
+            session_id: Client/chat identifier
+            
+        Returns:
+            Number of messages discarded
+        """
+        return self._sessions.reset(session_id)
+
+    async def cleanup(self) -> None:
+        """Drop all sessions."""
+        self._sessions.clear()
 
     # ============================================================================
     # HEALTH AND STATUS
@@ -440,6 +483,6 @@ class ChatStreamer:
         return {
             "config_manager_available": self._config_manager is not None,
             "request_tracker_available": self._request_tracker is not None,
-            "conversation_history_length": len(self._conversation_history),
+            "sessions": self._sessions.get_stats(),
         }
 
@@ -7,6 +7,9 @@ Provides caching capabilities:
 - Key namespacing
 - JSON serialization
 
+TieredCache puts a bounded in-process LRU in front of RedisCache for hot
+read-through lookups shared by all backend workers.
+
 Cache layer improves performance for:
 - Frequently accessed data
 - Expensive computations
@@ -14,6 +17,7 @@ Cache layer improves performance for:
 """
 
 from .redis import RedisCache
+from .tiered import TieredCache, cached, get_cache, set_cache
 
-__all__ = ["RedisCache"]
+__all__ = ["RedisCache", "TieredCache", "cached", "get_cache", "set_cache"]
 
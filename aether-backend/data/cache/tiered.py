@@ -0,0 +1,383 @@
+"""
+Tiered Cache - Two-tier read-through cache (in-process LRU + shared Redis)
+
+@.architecture
+Incoming: app.py (startup_event set_cache), data/database/repositories/chat.py, api/v1/endpoints/models.py, core/mcp/manager.py --- {cache keys, loader coroutines, invalidation requests, optional RedisCache instance}
+Processing: get(), set(), get_or_load(), invalidate(), clear_local(), get_stats(), cached(), get_cache(), set_cache(), _encode(), _decode() --- {7 jobs: lru_eviction, metrics_recording, read_through_loading, single_flight, tagged_json_serialization, ttl_management, invalidation}
+Outgoing: data/cache/redis.py (RedisCache get/set/delete), monitoring/metrics.py (aether_cache_requests_total) --- {cached values, hit/miss counters, cache statistics Dict}
+
+Read path: local LRU -> Redis -> loader. A value loaded on one worker is
+written to Redis so other workers find it there; the local tier only keeps
+a short-TTL copy to skip the Redis round trip for very hot keys.
+
+Invalidation deletes the key from both tiers of this process and from Redis,
+and stamps a per-key invalidation marker in Redis. A load compares the
+marker before and after it writes its value; if another worker invalidated
+the key meanwhile, the load deletes the value it wrote again, so a value
+loaded before an invalidation does not outlive it in the shared tier.
+Other workers may keep serving their local copy until its (short) local TTL
+expires, which bounds cross-worker staleness to local_ttl seconds.
+
+Handles:
+- Read-through loading with per-key single flight (no stampedes)
+- Loads racing an invalidation in another worker dropped from Redis
+- TTLs per tier (local_ttl caps the shared TTL for the local copy)
+- JSON round trip of UUID/datetime values through Redis
+- Graceful degradation when Redis is missing or unreachable
+
+Production Features:
+- Bounded OrderedDict LRU
+- Hit/miss counters per cache and tier in the metrics registry
+- Process-wide default instance (local-only until Redis is configured)
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from uuid import UUID, uuid4
+
+from monitoring.metrics import counter
+
+from .redis import RedisCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Result of a shared load whose caller was cancelled: waiters retry
+_LOAD_CANCELLED = object()
+
+# Lifetime of a key's invalidation marker (must outlast any load)
+INVALIDATION_MARKER_TTL = 3600
+
+
+def _marker_key(key: str) -> str:
+    return f"__invalidated__:{key}"
+
+_cache_requests = counter(
+    "aether_cache_requests_total",
+    "Tiered cache lookups",
+    labels=["cache", "tier", "result"],
+)
+
+
+# ============================================================================
+# SERIALIZATION
+# ============================================================================
+
+def _encode(value: Any) -> Any:
+    """Convert a value into JSON-safe form, tagging UUIDs and datetimes."""
+    if isinstance(value, UUID):
+        return {"__uuid__": str(value)}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
+
+
+def _decode(value: Any) -> Any:
+    """Reverse _encode()."""
+    if isinstance(value, dict):
+        if len(value) == 1:
+            if "__uuid__" in value:
+                return UUID(value["__uuid__"])
+            if "__datetime__" in value:
+                return datetime.fromisoformat(value["__datetime__"])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
+
+
+# ============================================================================
+# TIERED CACHE
+# ============================================================================
+
+class TieredCache:
+    """
+    In-process LRU in front of an optional shared RedisCache.
+
+    Values must be JSON-compatible (plus UUID/datetime). Cached values are
+    shared between callers and must not be mutated.
+
+    Usage:
+        cache = TieredCache(redis=redis_cache, name="api")
+        chat = await cache.get_or_load(f"chat:{chat_id}", load_chat, ttl=60)
+        await cache.invalidate(f"chat:{chat_id}")
+    """
+
+    def __init__(
+        self,
+        redis: Optional[RedisCache] = None,
+        max_entries: int = 1024,
+        local_ttl: float = 5.0,
+        default_ttl: int = 60,
+        name: str = "default",
+    ):
+        """
+        Initialize tiered cache.
+
+        Args:
+            redis: Shared tier (None for a local-only cache)
+            max_entries: Maximum entries held in the local LRU
+            local_ttl: Maximum seconds a value lives in the local tier
+            default_ttl: Default TTL in seconds when set() is given none
+            name: Cache name used as the metrics label
+        """
+        self.redis = redis
+        self.max_entries = max_entries
+        self.local_ttl = local_ttl
+        self.default_ttl = default_ttl
+        self.name = name
+
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._loading: Dict[str, asyncio.Future] = {}
+        self._hits = {"local": 0, "redis": 0}
+        self._misses = 0
+        self._invalidations = 0
+
+    # ========================================================================
+    # PUBLIC API
+    # ========================================================================
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Look a key up in the local tier, then in Redis.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not cached
+        """
+        value = self._get_local(key)
+        if value is not _MISSING:
+            self._record("local", "hit")
+            return value
+        self._record("local", "miss")
+
+        if self._redis_ready():
+            stored = await self.redis.get(key)
+            if stored is not None:
+                self._record("redis", "hit")
+                value = _decode(stored)
+                self._set_local(key, value, self.local_ttl)
+                return value
+            self._record("redis", "miss")
+
+        self._misses += 1
+        return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in both tiers.
+
+        Args:
+            key: Cache key
+            value: Value to cache (not None)
+            ttl: Shared TTL in seconds (default_ttl if omitted)
+        """
+        ttl = ttl or self.default_ttl
+        self._set_local(key, value, min(self.local_ttl, ttl))
+        if self._redis_ready():
+            await self.redis.set(key, _encode(value), ttl=ttl)
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+    ) -> Any:
+        """
+        Read-through lookup: return the cached value or load and cache it.
+
+        Concurrent misses for the same key share one loader call. None
+        results are returned but not cached. If the loading caller is
+        cancelled, a waiting caller takes the load over.
+
+        Args:
+            key: Cache key
+            loader: Coroutine function producing the value on a miss
+            ttl: Shared TTL in seconds
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        while True:
+            value = await self.get(key)
+            if value is not None:
+                return value
+
+            pending = self._loading.get(key)
+            if pending is None:
+                break
+            value = await asyncio.shield(pending)
+            if value is not _LOAD_CANCELLED:
+                return value
+
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        value = _LOAD_CANCELLED
+        try:
+            marker = await self._get_marker(key)
+            value = await loader()
+            # Skip caching if the key was invalidated while loading
+            if value is not None and self._loading.get(key) is future:
+                await self.set(key, value, ttl)
+                if await self._get_marker(key) != marker:
+                    # Invalidated by another worker while loading
+                    self._local.pop(key, None)
+                    await self.redis.delete(key)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            # Only this caller is cancelled; waiters retry unless the value
+            # was already loaded
+            future.set_result(value)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+
+    async def invalidate(self, *keys: str) -> None:
+        """
+        Remove keys from the local tier and from Redis.
+
+        Args:
+            *keys: Cache keys to drop
+        """
+        for key in keys:
+            self._local.pop(key, None)
+            # A load that started before the write must not repopulate the key
+            self._loading.pop(key, None)
+            if self._redis_ready():
+                # Marker first: a load that wrote before the delete sees it
+                await self.redis.set(_marker_key(key), uuid4().hex, ttl=INVALIDATION_MARKER_TTL)
+                await self.redis.delete(key)
+        self._invalidations += len(keys)
+
+    def clear_local(self) -> None:
+        """Drop every entry held in the local tier."""
+        self._local.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with entry count, hits per tier, misses and invalidations
+        """
+        return {
+            "name": self.name,
+            "local_entries": len(self._local),
+            "max_entries": self.max_entries,
+            "redis_connected": self._redis_ready(),
+            "local_hits": self._hits["local"],
+            "redis_hits": self._hits["redis"],
+            "misses": self._misses,
+            "invalidations": self._invalidations,
+        }
+
+    # ========================================================================
+    # LOCAL TIER
+    # ========================================================================
+
+    def _get_local(self, key: str) -> Any:
+        entry = self._local.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return _MISSING
+        self._local.move_to_end(key)
+        return value
+
+    def _set_local(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0 or self.max_entries <= 0:
+            return
+        self._local[key] = (time.monotonic() + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    def _redis_ready(self) -> bool:
+        return self.redis is not None and self.redis.is_connected()
+
+    async def _get_marker(self, key: str) -> Optional[str]:
+        """Current invalidation marker of a key (None without Redis)."""
+        if not self._redis_ready():
+            return None
+        return await self.redis.get(_marker_key(key))
+
+    def _record(self, tier: str, result: str) -> None:
+        if result == "hit":
+            self._hits[tier] += 1
+        _cache_requests.inc(cache=self.name, tier=tier, result=result)
+
+
+# ============================================================================
+# DEFAULT INSTANCE
+# ============================================================================
+
+_default_cache: Optional[TieredCache] = None
+
+
+def get_cache() -> TieredCache:
+    """
+    Get the process-wide tiered cache (local-only until set_cache() is called).
+
+    Returns:
+        TieredCache instance
+    """
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TieredCache(name="api")
+    return _default_cache
+
+
+def set_cache(cache: Optional[TieredCache]) -> None:
+    """Replace the process-wide tiered cache (e.g. once Redis is connected)."""
+    global _default_cache
+    _default_cache = cache
+
+
+def cached(
+    key: Callable[..., str],
+    ttl: Optional[int] = None,
+    cache: Optional[Callable[[], TieredCache]] = None,
+):
+    """
+    Decorator making an async function read-through cached.
+
+    Args:
+        key: Builds the cache key from the call's arguments
+        ttl: Shared TTL in seconds
+        cache: Returns the cache to use (defaults to get_cache())
+
+    Usage:
+        @cached(lambda base: f"models:{base}", ttl=300)
+        async def fetch_models(base: str) -> List[str]: ...
+    """
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            target = (cache or get_cache)()
+            return await target.get_or_load(
+                key(*args, **kwargs),
+                lambda: func(*args, **kwargs),
+                ttl,
+            )
+        return wrapper
+    return decorator
@@ -0,0 +1,76 @@
+-- Migration: Denormalised chat list counters and keyset pagination index
+-- Author: Aether Architecture Team
+-- Date: 2025-11-12
+-- Description: Stores message_count / last_message_at on chats so the sidebar
+--              listing no longer aggregates the messages table, and adds a
+--              covering (updated_at, id) index for cursor pagination.
+
+-- ============================================================================
+-- Chats Table Columns
+-- ============================================================================
+
+-- Maintained transactionally by ChatRepository.create_message() and
+-- ChatRepository.delete_messages_after()
+ALTER TABLE chats ADD COLUMN IF NOT EXISTS message_count INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE chats ADD COLUMN IF NOT EXISTS last_message_at TIMESTAMPTZ;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'chats_message_count_non_negative'
+    ) THEN
+        ALTER TABLE chats
+            ADD CONSTRAINT chats_message_count_non_negative CHECK (message_count >= 0);
+    END IF;
+END $$;
+
+-- Backfill from existing messages (one pass over messages)
+UPDATE chats c
+SET message_count = s.message_count,
+    last_message_at = s.last_message_at
+FROM (
+    SELECT chat_id, COUNT(*) AS message_count, MAX(timestamp) AS last_message_at
+    FROM messages
+    GROUP BY chat_id
+) s
+WHERE c.id = s.chat_id;
+
+-- ============================================================================
+-- Keyset Pagination Index
+-- ============================================================================
+
+-- Covers the whole sidebar row so listing is an index-only scan.
+-- This supports: SELECT ... FROM chats
+--                WHERE (updated_at, id) < (%s, %s)
+--                ORDER BY updated_at DESC, id DESC LIMIT %s
+CREATE INDEX IF NOT EXISTS idx_chats_updated_at_id
+ON chats(updated_at DESC, id DESC)
+INCLUDE (title, created_at, message_count, last_message_at);
+
+-- ============================================================================
+-- Triggers
+-- ============================================================================
+
+-- create_message() now bumps updated_at in the same UPDATE that maintains the
+-- counters; the per-message trigger would rewrite the chat row a second time
+DROP TRIGGER IF EXISTS trigger_update_chat_on_message ON messages;
+
+-- ============================================================================
+-- Views
+-- ============================================================================
+
+-- Column types change (COUNT() bigint -> integer), so the view is recreated
+DROP VIEW IF EXISTS chat_list;
+CREATE VIEW chat_list AS
+SELECT
+    c.id,
+    c.title,
+    c.created_at,
+    c.updated_at,
+    c.message_count,
+    c.last_message_at
+FROM chats c
+ORDER BY c.updated_at DESC, c.id DESC;
+
+COMMENT ON COLUMN chats.message_count IS 'Number of messages in chat (maintained by ChatRepository)';
+COMMENT ON COLUMN chats.last_message_at IS 'Timestamp of newest message (maintained by ChatRepository)';
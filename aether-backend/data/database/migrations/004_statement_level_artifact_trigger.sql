@@ -0,0 +1,31 @@
+-- Migration: Statement-level chat timestamp trigger for artifacts
+-- Author: Aether Architecture Team
+-- Date: 2025-11-12
+-- Description: Bulk artifact ingestion (COPY) would fire the row-level trigger
+--              once per artifact, rewriting the same chats row N times. The
+--              statement-level trigger touches each affected chat once.
+
+-- ============================================================================
+-- Trigger Function
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION update_chat_timestamp_from_artifacts()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE chats SET updated_at = NOW()
+    WHERE id IN (SELECT DISTINCT chat_id FROM new_artifacts);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- Trigger
+-- ============================================================================
+
+DROP TRIGGER IF EXISTS trigger_update_chat_on_artifact ON artifacts;
+
+CREATE TRIGGER trigger_update_chat_on_artifact
+    AFTER INSERT ON artifacts
+    REFERENCING NEW TABLE AS new_artifacts
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_chat_timestamp_from_artifacts();
@@ -0,0 +1,36 @@
+-- Migration: Trail state and traceability tables
+-- Author: Aether Architecture Team
+-- Date: 2025-11-12
+-- Description: StorageRepository used to issue CREATE TABLE IF NOT EXISTS on
+--              every trail/traceability save. The tables are now created once
+--              here and the save path is a plain prepared upsert.
+
+-- ============================================================================
+-- Tables
+-- ============================================================================
+
+-- Trail container state per chat (written by StorageRepository.upsert_trail_state())
+CREATE TABLE IF NOT EXISTS trail_states (
+    chat_id VARCHAR(255) PRIMARY KEY,
+    data JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Message-artifact relationship indexes (single 'global' row)
+CREATE TABLE IF NOT EXISTS traceability_data (
+    id VARCHAR(50) PRIMARY KEY,
+    data JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- ============================================================================
+-- Indexes
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_trail_states_updated ON trail_states(updated_at DESC);
+CREATE INDEX IF NOT EXISTS idx_traceability_data_updated ON traceability_data(updated_at DESC);
+
+COMMENT ON TABLE trail_states IS 'Execution trail UI state per chat (debounced autosaves)';
+COMMENT ON TABLE traceability_data IS 'Message-artifact relationship indexes for debugging and audit trails';
@@ -11,11 +11,21 @@ CREATE TABLE IF NOT EXISTS chats (
     title VARCHAR(255) NOT NULL DEFAULT 'New Chat',
     created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
     updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
-    CONSTRAINT chats_title_not_empty CHECK (LENGTH(TRIM(title)) > 0)
+    
+    -- Sidebar counters (maintained by ChatRepository, see 003_chat_list_counters.sql)
+    message_count INTEGER NOT NULL DEFAULT 0,
+    last_message_at TIMESTAMPTZ,
+    
+    CONSTRAINT chats_title_not_empty CHECK (LENGTH(TRIM(title)) > 0),
+    CONSTRAINT chats_message_count_non_negative CHECK (message_count >= 0)
 );
 
 -- Index for sidebar ordering (most recently updated first)
 CREATE INDEX IF NOT EXISTS idx_chats_updated_at ON chats(updated_at DESC);
+
+-- Covering index for keyset-paginated sidebar listing (index-only scan)
+CREATE INDEX IF NOT EXISTS idx_chats_updated_at_id ON chats(updated_at DESC, id DESC)
+    INCLUDE (title, created_at, message_count, last_message_at);
 CREATE INDEX IF NOT EXISTS idx_chats_created_at ON chats(created_at DESC);
 
 -- Messages table: All user/assistant interactions
@@ -72,24 +82,23 @@ CREATE INDEX IF NOT EXISTS idx_artifacts_type ON artifacts(type);
 -- Full-text search on artifact content
 CREATE INDEX IF NOT EXISTS idx_artifacts_content_search ON artifacts USING GIN (to_tsvector('english', content));
 
--- Trigger to auto-update chat.updated_at when messages added
-CREATE OR REPLACE FUNCTION update_chat_timestamp()
+-- Trigger to auto-update chat.updated_at when artifacts added
+-- (messages update chats.updated_at together with the counters in ChatRepository)
+-- Statement-level so bulk COPY touches each chat once, not once per artifact
+CREATE OR REPLACE FUNCTION update_chat_timestamp_from_artifacts()
 RETURNS TRIGGER AS $$
 BEGIN
-    UPDATE chats SET updated_at = NOW() WHERE id = NEW.chat_id;
-    RETURN NEW;
+    UPDATE chats SET updated_at = NOW()
+    WHERE id IN (SELECT DISTINCT chat_id FROM new_artifacts);
+    RETURN NULL;
 END;
 $$ LANGUAGE plpgsql;
 
-CREATE TRIGGER trigger_update_chat_on_message
-    AFTER INSERT ON messages
-    FOR EACH ROW
-    EXECUTE FUNCTION update_chat_timestamp();
-
 CREATE TRIGGER trigger_update_chat_on_artifact
     AFTER INSERT ON artifacts
-    FOR EACH ROW
-    EXECUTE FUNCTION update_chat_timestamp();
+    REFERENCING NEW TABLE AS new_artifacts
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION update_chat_timestamp_from_artifacts();
 
 -- View for chat list with metadata (for sidebar)
 CREATE OR REPLACE VIEW chat_list AS
@@ -98,12 +107,10 @@ SELECT
     c.title,
     c.created_at,
     c.updated_at,
-    COUNT(m.id) AS message_count,
-    MAX(m.timestamp) AS last_message_at
+    c.message_count,
+    c.last_message_at
 FROM chats c
-LEFT JOIN messages m ON c.id = m.chat_id
-GROUP BY c.id, c.title, c.created_at, c.updated_at
-ORDER BY c.updated_at DESC;
+ORDER BY c.updated_at DESC, c.id DESC;
 
 -- View for messages with LLM metadata
 CREATE OR REPLACE VIEW messages_with_metadata AS
@@ -134,11 +141,23 @@ CREATE TABLE IF NOT EXISTS traceability_data (
 -- Index for traceability data retrieval
 CREATE INDEX IF NOT EXISTS idx_traceability_data_updated ON traceability_data(updated_at DESC);
 
+-- Trail state table: Execution trail UI state per chat
+CREATE TABLE IF NOT EXISTS trail_states (
+    chat_id VARCHAR(255) PRIMARY KEY,
+    data JSONB NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- Index for trail state retrieval
+CREATE INDEX IF NOT EXISTS idx_trail_states_updated ON trail_states(updated_at DESC);
+
 -- Comment documentation
 COMMENT ON TABLE chats IS 'Top-level conversation containers';
 COMMENT ON TABLE messages IS 'All user and assistant messages with LLM tracking';
 COMMENT ON TABLE artifacts IS 'Generated outputs (code, files, etc) linked to chats and messages';
 COMMENT ON TABLE traceability_data IS 'Message-artifact relationship indexes for debugging and audit trails';
+COMMENT ON TABLE trail_states IS 'Execution trail UI state per chat (debounced autosaves)';
 COMMENT ON COLUMN messages.correlation_id IS 'Links user request to assistant response for traceability';
 COMMENT ON COLUMN messages.llm_model IS 'Model used (e.g., gpt-4, claude-3-sonnet)';
 COMMENT ON COLUMN messages.llm_provider IS 'Provider (e.g., openai, anthropic)';
@@ -3,8 +3,8 @@ Chat Repository - Data access layer for chat operations
 
 @.architecture
 Incoming: api/v1/endpoints/storage.py, data/database/connection.py --- {DatabaseConnection instance, CRUD operation requests for chats/messages/artifacts}
-Processing: create_chat(), get_chat(), list_chats(), update_chat(), delete_chat(), create_message(), get_message(), get_messages(), create_artifact(), get_artifact(), get_artifacts(), update_artifact_message_id() --- {12 jobs: chat_crud, message_crud, artifact_crud, transaction_management, query_execution}
-Outgoing: PostgreSQL (via DatabaseConnection), api/v1/endpoints/storage.py --- {SQL INSERT/SELECT/UPDATE/DELETE via async connection, Pydantic model instances: Chat, Message, Artifact}
+Processing: create_chat(), get_chat(), list_chats(), list_chats_page(), update_chat(), delete_chat(), create_message(), create_messages_bulk(), get_message(), get_messages(), create_artifact(), create_artifacts_bulk(), get_artifact(), get_artifacts(), update_artifact_message_id(), _invalidate() --- {15 jobs: chat_crud, message_crud, artifact_crud, bulk_ingestion, cache_invalidation, counter_maintenance, keyset_pagination, transaction_management, query_execution}
+Outgoing: PostgreSQL (via DatabaseConnection), data/cache/tiered.py (optional TieredCache), api/v1/endpoints/storage.py --- {SQL INSERT/SELECT/UPDATE/DELETE via async connection, cache read-through/invalidation, Pydantic model instances: Chat, Message, Artifact}
 
 Provides CRUD operations for:
 - Chats (conversation containers)
@@ -12,19 +12,66 @@ Provides CRUD operations for:
 - Artifacts (generated outputs)
 
 All operations use async/await and proper transaction management.
+
+Chat list counters (message_count, last_message_at) are stored on the chats
+row and kept in sync inside the message write transactions, so listing never
+aggregates the messages table.
+
+Bulk ingestion (imports/sync) validates the chat once and streams all rows
+with COPY inside a single transaction.
+
+With a TieredCache, get_chat() and full-history get_messages() are
+read-through cached; every write method invalidates the affected keys after
+its transaction commits.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
-from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
 import psycopg.types.json
 
+from data.cache.tiered import TieredCache
+
 from ..connection import DatabaseConnection
 from ..models.chat import Artifact, Chat, Message
 
 logger = logging.getLogger(__name__)
 
+# Columns served by idx_chats_updated_at_id (index-only scan for listing)
+CHAT_LIST_COLUMNS = "id, title, created_at, updated_at, message_count, last_message_at"
+
+# COPY column lists for bulk ingestion (ids/timestamps generated client-side)
+MESSAGE_COPY_SQL = """
+    COPY messages
+    (id, chat_id, role, content, timestamp, llm_model, llm_provider, tokens_used, correlation_id)
+    FROM STDIN
+"""
+ARTIFACT_COPY_SQL = """
+    COPY artifacts
+    (id, chat_id, message_id, artifact_id, type, filename, content, language, metadata)
+    FROM STDIN
+"""
+
+# Shared-tier TTL for cached chat rows and message histories (seconds)
+CHAT_CACHE_TTL = 60
+
+
+def _chat_key(chat_id: UUID) -> str:
+    return f"chat:{chat_id}"
+
+
+def _messages_key(chat_id: UUID) -> str:
+    return f"chat:{chat_id}:messages"
+
+
+def _as_utc(timestamp: Optional[datetime]) -> Optional[datetime]:
+    """Treat naive timestamps as UTC so they compare with aware ones."""
+    if timestamp is not None and timestamp.tzinfo is None:
+        return timestamp.replace(tzinfo=timezone.utc)
+    return timestamp
+
 
 class ChatRepository:
     """
@@ -39,14 +86,16 @@ class ChatRepository:
     All methods are async and use connection pooling.
     """
     
-    def __init__(self, db: DatabaseConnection):
+    def __init__(self, db: DatabaseConnection, cache: Optional[TieredCache] = None):
         """
         Initialize chat repository.
         
         Args:
             db: Database connection manager
+            cache: Optional read-through cache for hot chat/message reads
         """
         self.db = db
+        self.cache = cache
     
     # =========================================================================
     # CHAT OPERATIONS
@@ -89,14 +138,22 @@ class ChatRepository:
         Returns:
             Chat object or None if not found
         """
+        if self.cache is not None:
+            row = await self.cache.get_or_load(
+                _chat_key(chat_id), lambda: self._fetch_chat_row(chat_id), CHAT_CACHE_TTL
+            )
+        else:
+            row = await self._fetch_chat_row(chat_id)
+            
+        return Chat(**row) if row else None
+    
+    async def _fetch_chat_row(self, chat_id: UUID) -> Optional[Dict[str, Any]]:
         async with self.db.get_connection() as conn:
             cursor = await conn.execute(
                 "SELECT * FROM chats WHERE id = %s",
                 (chat_id,),
             )
-            row = await cursor.fetchone()
-            
-        return Chat(**row) if row else None
+            return await cursor.fetchone()
     
     async def list_chats(
         self,
@@ -106,6 +163,9 @@ class ChatRepository:
         """
         List chats ordered by most recently updated.
         
+        Prefer list_chats_page() for sidebar paging; OFFSET still has to walk
+        the skipped index entries.
+        
         Args:
             limit: Maximum number of chats to return
             offset: Number of chats to skip
@@ -115,18 +175,10 @@ class ChatRepository:
         """
         async with self.db.get_connection() as conn:
             cursor = await conn.execute(
-                """
-                SELECT 
-                    c.id,
-                    c.title,
-                    c.created_at,
-                    c.updated_at,
-                    COUNT(m.id) AS message_count,
-                    MAX(m.timestamp) AS last_message_at
-                FROM chats c
-                LEFT JOIN messages m ON c.id = m.chat_id
-                GROUP BY c.id, c.title, c.created_at, c.updated_at
-                ORDER BY c.updated_at DESC
+                f"""
+                SELECT {CHAT_LIST_COLUMNS}
+                FROM chats
+                ORDER BY updated_at DESC, id DESC
                 LIMIT %s OFFSET %s
                 """,
                 (limit, offset),
@@ -135,6 +187,42 @@ class ChatRepository:
             
         return [Chat(**row) for row in rows]
     
+    async def list_chats_page(
+        self,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, UUID]] = None
+    ) -> Tuple[List[Chat], bool]:
+        """
+        List chats with keyset pagination on (updated_at, id).
+        
+        Cost depends only on the page size, not on how deep the page is or
+        how many messages exist.
+        
+        Args:
+            limit: Maximum number of chats to return
+            after: (updated_at, id) of the last chat on the previous page
+            
+        Returns:
+            Tuple of (chats, has_more)
+        """
+        query = f"SELECT {CHAT_LIST_COLUMNS} FROM chats"
+        params: List[Any] = []
+        
+        if after is not None:
+            query += " WHERE (updated_at, id) < (%s, %s)"
+            params.extend(after)
+        
+        # Fetch one extra row to know whether another page exists
+        query += " ORDER BY updated_at DESC, id DESC LIMIT %s"
+        params.append(limit + 1)
+        
+        async with self.db.get_connection() as conn:
+            cursor = await conn.execute(query, tuple(params))
+            rows = await cursor.fetchall()
+            
+        has_more = len(rows) > limit
+        return [Chat(**row) for row in rows[:limit]], has_more
+    
     async def update_chat(
         self,
         chat_id: UUID,
@@ -166,6 +254,7 @@ class ChatRepository:
             row = await cursor.fetchone()
             
         if row:
+            await self._invalidate(chat_id)
             logger.debug(f"Updated chat {chat_id} title to '{title}'")
             return Chat(**row)
         return None
@@ -188,6 +277,7 @@ class ChatRepository:
             row = await cursor.fetchone()
             
         if row:
+            await self._invalidate(chat_id, messages=True)
             logger.info(f"Deleted chat {chat_id} and all associated data")
             return True
         return False
@@ -225,9 +315,18 @@ class ChatRepository:
             Exception: If chat doesn't exist or creation fails
         """
         async with self.db.transaction() as conn:
-            # Verify chat exists
+            # Verify chat exists and maintain list counters; the row lock also
+            # serialises concurrent writers to the same chat. NOW() is the
+            # transaction timestamp, identical to the message's default timestamp.
             cursor = await conn.execute(
-                "SELECT id FROM chats WHERE id = %s",
+                """
+                UPDATE chats
+                SET message_count = message_count + 1,
+                    last_message_at = NOW(),
+                    updated_at = NOW()
+                WHERE id = %s
+                RETURNING id
+                """,
                 (chat_id,),
             )
             if not await cursor.fetchone():
@@ -253,9 +352,78 @@ class ChatRepository:
             )
             row = await cursor.fetchone()
             
+        await self._invalidate(chat_id, messages=True)
         logger.debug(f"Created {role} message {row['id']} in chat {chat_id}")
         return Message(**row)
     
+    async def create_messages_bulk(
+        self,
+        chat_id: UUID,
+        messages: List[Dict[str, Any]],
+    ) -> List[UUID]:
+        """
+        Insert many messages into a chat in one transaction.
+        
+        The chat is checked (and its list counters updated) by a single
+        UPDATE, then all rows are streamed with COPY. Messages without a
+        timestamp get increasing timestamps in batch order so history
+        ordering is preserved. Naive timestamps are taken as UTC.
+        
+        Args:
+            chat_id: Parent chat UUID
+            messages: Dicts with role, content and optional timestamp,
+                llm_model, llm_provider, tokens_used, correlation_id
+            
+        Returns:
+            IDs of the created messages, in input order
+            
+        Raises:
+            ValueError: If chat doesn't exist
+        """
+        if not messages:
+            return []
+        
+        base = datetime.now(timezone.utc)
+        rows = [
+            (
+                uuid4(),
+                chat_id,
+                message["role"],
+                message["content"],
+                _as_utc(message.get("timestamp")) or base + timedelta(microseconds=index),
+                message.get("llm_model"),
+                message.get("llm_provider"),
+                message.get("tokens_used"),
+                message.get("correlation_id"),
+            )
+            for index, message in enumerate(messages)
+        ]
+        last_message_at = max(row[4] for row in rows)
+        
+        async with self.db.transaction() as conn:
+            cursor = await conn.execute(
+                """
+                UPDATE chats
+                SET message_count = message_count + %s,
+                    last_message_at = GREATEST(last_message_at, %s),
+                    updated_at = NOW()
+                WHERE id = %s
+                RETURNING id
+                """,
+                (len(rows), last_message_at, chat_id),
+            )
+            if not await cursor.fetchone():
+                raise ValueError(f"Chat {chat_id} not found")
+            
+            async with conn.cursor() as cur:
+                async with cur.copy(MESSAGE_COPY_SQL) as copy:
+                    for row in rows:
+                        await copy.write_row(row)
+            
+        await self._invalidate(chat_id, messages=True)
+        logger.debug(f"Bulk inserted {len(rows)} messages in chat {chat_id}")
+        return [row[0] for row in rows]
+    
     async def get_messages(
         self,
         chat_id: UUID,
@@ -273,6 +441,22 @@ class ChatRepository:
         Returns:
             List of Message objects
         """
+        if self.cache is not None and limit is None and offset == 0:
+            # Only the full history is cached (the hot path when opening a chat)
+            rows = await self.cache.get_or_load(
+                _messages_key(chat_id), lambda: self._fetch_message_rows(chat_id), CHAT_CACHE_TTL
+            )
+        else:
+            rows = await self._fetch_message_rows(chat_id, limit, offset)
+            
+        return [Message(**row) for row in rows]
+    
+    async def _fetch_message_rows(
+        self,
+        chat_id: UUID,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         query = """
             SELECT * FROM messages
             WHERE chat_id = %s
@@ -286,9 +470,7 @@ class ChatRepository:
         
         async with self.db.get_connection() as conn:
             cursor = await conn.execute(query, tuple(params))
-            rows = await cursor.fetchall()
-            
-        return [Message(**row) for row in rows]
+            return await cursor.fetchall()
     
     async def delete_messages_after(
         self,
@@ -320,7 +502,23 @@ class ChatRepository:
             rows = await cursor.fetchall()
             deleted_count = len(rows)
             
+            if deleted_count > 0:
+                # Keep list counters in sync (served by idx_messages_chat_id)
+                await conn.execute(
+                    """
+                    UPDATE chats
+                    SET message_count = GREATEST(message_count - %s, 0),
+                        last_message_at = (
+                            SELECT MAX(timestamp) FROM messages WHERE chat_id = %s
+                        ),
+                        updated_at = NOW()
+                    WHERE id = %s
+                    """,
+                    (deleted_count, chat_id, chat_id),
+                )
+            
         if deleted_count > 0:
+            await self._invalidate(chat_id, messages=True)
             logger.debug(
                 f"Deleted {deleted_count} messages after {message_id} in chat {chat_id}"
             )
@@ -395,9 +593,67 @@ class ChatRepository:
             )
             row = await cursor.fetchone()
             
+        await self._invalidate(chat_id)  # Trigger bumped chats.updated_at
         logger.debug(f"Created {type} artifact {row['id']} in chat {chat_id}")
         return Artifact(**row)
     
+    async def create_artifacts_bulk(
+        self,
+        chat_id: UUID,
+        artifacts: List[Dict[str, Any]],
+    ) -> List[UUID]:
+        """
+        Insert many artifacts into a chat in one transaction.
+        
+        Args:
+            chat_id: Parent chat UUID
+            artifacts: Dicts with type and optional content, filename,
+                language, message_id, artifact_id, metadata
+            
+        Returns:
+            IDs of the created artifacts, in input order
+            
+        Raises:
+            ValueError: If chat doesn't exist
+        """
+        if not artifacts:
+            return []
+        
+        rows = [
+            (
+                uuid4(),
+                chat_id,
+                artifact.get("message_id"),
+                artifact.get("artifact_id"),
+                artifact["type"],
+                artifact.get("filename"),
+                artifact.get("content"),
+                artifact.get("language"),
+                psycopg.types.json.Json(artifact["metadata"])
+                if artifact.get("metadata") else None,
+            )
+            for artifact in artifacts
+        ]
+        
+        async with self.db.transaction() as conn:
+            # Verify chat exists once for the whole batch; updated_at is set
+            # by the statement-level artifact trigger
+            cursor = await conn.execute(
+                "SELECT id FROM chats WHERE id = %s",
+                (chat_id,),
+            )
+            if not await cursor.fetchone():
+                raise ValueError(f"Chat {chat_id} not found")
+            
+            async with conn.cursor() as cur:
+                async with cur.copy(ARTIFACT_COPY_SQL) as copy:
+                    for row in rows:
+                        await copy.write_row(row)
+            
+        await self._invalidate(chat_id)
+        logger.debug(f"Bulk inserted {len(rows)} artifacts in chat {chat_id}")
+        return [row[0] for row in rows]
+    
     async def get_artifacts(
         self,
         chat_id: UUID,
@@ -478,6 +734,21 @@ class ChatRepository:
     # UTILITY METHODS
     # =========================================================================
     
+    async def _invalidate(self, chat_id: UUID, messages: bool = False) -> None:
+        """
+        Drop cached reads for a chat after a committed write.
+        
+        Args:
+            chat_id: Chat UUID
+            messages: Also drop the cached message history
+        """
+        if self.cache is None:
+            return
+        keys = [_chat_key(chat_id)]
+        if messages:
+            keys.append(_messages_key(chat_id))
+        await self.cache.invalidate(*keys)
+    
     async def get_chat_statistics(self, chat_id: UUID) -> Dict[str, Any]:
         """
         Get statistics for a chat.
@@ -492,12 +763,14 @@ class ChatRepository:
             cursor = await conn.execute(
                 """
                 SELECT 
-                    (SELECT COUNT(*) FROM messages WHERE chat_id = %s) as message_count,
-                    (SELECT COUNT(*) FROM artifacts WHERE chat_id = %s) as artifact_count,
-                    (SELECT MAX(timestamp) FROM messages WHERE chat_id = %s) as last_message_at,
-                    (SELECT MAX(created_at) FROM artifacts WHERE chat_id = %s) as last_artifact_at
+                    c.message_count,
+                    (SELECT COUNT(*) FROM artifacts WHERE chat_id = c.id) as artifact_count,
+                    c.last_message_at,
+                    (SELECT MAX(created_at) FROM artifacts WHERE chat_id = c.id) as last_artifact_at
+                FROM chats c
+                WHERE c.id = %s
                 """,
-                (chat_id, chat_id, chat_id, chat_id),
+                (chat_id,),
             )
             row = await cursor.fetchone()
             
@@ -3,7 +3,7 @@ Storage Repository - Data access layer for file storage metadata and trail state
 
 @.architecture
 Incoming: api/v1/endpoints/storage.py, data/database/connection.py --- {DatabaseConnection instance, artifact query requests, search requests, statistics requests, trail state save/load/delete requests, traceability data requests}
-Processing: get_all_artifacts(), search_artifacts(), get_artifacts_by_filename(), get_storage_statistics(), get_chat_storage_usage(), delete_orphaned_artifacts(), save_trail_state(), load_trail_state(), delete_trail_state(), save_traceability_data(), load_traceability_data() --- {11 jobs: artifact_querying, cleanup_operations, data_validation, fulltext_search, json_serialization, statistics_aggregation, trail_state_persistence, traceability_tracking, transaction_management}
+Processing: get_all_artifacts(), search_artifacts(), get_artifacts_by_filename(), get_storage_statistics(), get_chat_storage_usage(), delete_orphaned_artifacts(), save_trail_state(), upsert_trail_state(), load_trail_state(), delete_trail_state(), save_traceability_data(), load_traceability_data() --- {12 jobs: artifact_querying, cleanup_operations, data_validation, fulltext_search, json_serialization, statistics_aggregation, trail_state_persistence, traceability_tracking, transaction_management, write_behind_debouncing}
 Outgoing: PostgreSQL (via DatabaseConnection), api/v1/endpoints/storage.py --- {SQL SELECT/INSERT/UPDATE/DELETE with PostgreSQL FTS (GIN index), artifact dicts with chat_title, statistics dicts, trail state JSONB, traceability JSONB}
 
 Provides operations for:
@@ -16,16 +16,41 @@ Provides operations for:
 This repository tracks metadata about files stored on disk.
 The actual file content is managed by LocalFileStorage in data/storage/.
 Trail states and traceability data stored as JSONB for frontend UI continuity.
+Their tables are created by migrations (005_trail_state_tables.sql);
+the save path is a prepared upsert, and trail autosaves can be debounced
+through a WriteBehindBuffer.
 """
 
+import json
 import logging
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import psycopg.types.json
+
 from ..connection import DatabaseConnection
+from ..write_behind import WriteBehindBuffer
 
 logger = logging.getLogger(__name__)
 
+TRACEABILITY_UPSERT_SQL = """
+    INSERT INTO traceability_data (id, data, created_at, updated_at)
+    VALUES ('global', %s, NOW(), NOW())
+    ON CONFLICT (id)
+    DO UPDATE SET
+        data = EXCLUDED.data,
+        updated_at = NOW()
+"""
+
+TRAIL_STATE_UPSERT_SQL = """
+    INSERT INTO trail_states (chat_id, data, created_at, updated_at)
+    VALUES (%s, %s, NOW(), NOW())
+    ON CONFLICT (chat_id)
+    DO UPDATE SET
+        data = EXCLUDED.data,
+        updated_at = NOW()
+"""
+
 
 class StorageRepository:
     """
@@ -41,14 +66,21 @@ class StorageRepository:
     since files are stored as artifacts linked to chats.
     """
     
-    def __init__(self, db: DatabaseConnection):
+    def __init__(
+        self,
+        db: DatabaseConnection,
+        trail_writer: Optional[WriteBehindBuffer] = None
+    ):
         """
         Initialize storage repository.
         
         Args:
             db: Database connection manager
+            trail_writer: Optional shared write-behind buffer for trail
+                autosaves (writes go straight to the database if None)
         """
         self.db = db
+        self.trail_writer = trail_writer
     
     # =========================================================================
     # QUERY HELPERS
@@ -264,33 +296,13 @@ class StorageRepository:
         Args:
             data: Traceability data structure with indexes
         """
-        import json
-        
         try:
-            # Create table if it doesn't exist
-            create_table_query = """
-                CREATE TABLE IF NOT EXISTS traceability_data (
-                    id VARCHAR(255) PRIMARY KEY,
-                    data JSONB NOT NULL,
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """
-            
-            # Store in a metadata table or as JSON in a dedicated traceability table
-            # For simplicity, we'll use a key-value approach
-            query = """
-                INSERT INTO traceability_data (id, data, created_at, updated_at)
-                VALUES ('global', %s::jsonb, NOW(), NOW())
-                ON CONFLICT (id) 
-                DO UPDATE SET 
-                    data = EXCLUDED.data,
-                    updated_at = NOW()
-            """
-            
             async with self.db.transaction() as conn:
-                await conn.execute(create_table_query)
-                await conn.execute(query, (json.dumps(data),))
+                await conn.execute(
+                    TRACEABILITY_UPSERT_SQL,
+                    (psycopg.types.json.Jsonb(data),),
+                    prepare=True,
+                )
             
             logger.info(f"Saved traceability data: {len(data.get('messages', []))} messages, {len(data.get('artifacts', []))} artifacts")
         except Exception as e:
@@ -307,8 +319,6 @@ class StorageRepository:
         Returns:
             Traceability data structure or None if not found
         """
-        import json
-        
         try:
             # Load from metadata table
             query = """
@@ -341,44 +351,43 @@ class StorageRepository:
         Save trail container state to PostgreSQL.
         
         Trail state includes DOM snapshots and metadata for execution trail UI.
-        Allows trails to persist across frontend restarts.
+        Allows trails to persist across frontend restarts. With a trail writer,
+        rapid successive saves for the same chat collapse into one write.
         
         Args:
             chat_id: Chat ID to associate trail state with
             trail_data: Trail state structure with trails array and metadata
         """
-        import json
+        if self.trail_writer is not None:
+            self.trail_writer.submit(chat_id, trail_data)
+            return
         
         try:
-            # Create table if it doesn't exist
-            create_table_query = """
-                CREATE TABLE IF NOT EXISTS trail_states (
-                    chat_id VARCHAR(255) PRIMARY KEY,
-                    data JSONB NOT NULL,
-                    created_at TIMESTAMP DEFAULT NOW(),
-                    updated_at TIMESTAMP DEFAULT NOW()
-                )
-            """
-            
-            # Upsert trail state for this chat
-            query = """
-                INSERT INTO trail_states (chat_id, data, created_at, updated_at)
-                VALUES (%s, %s::jsonb, NOW(), NOW())
-                ON CONFLICT (chat_id) 
-                DO UPDATE SET 
-                    data = EXCLUDED.data,
-                    updated_at = NOW()
-            """
-            
-            async with self.db.transaction() as conn:
-                await conn.execute(create_table_query)
-                await conn.execute(query, (chat_id, json.dumps(trail_data)))
-            
-            logger.info(f"Saved trail state for chat {chat_id}: {len(trail_data.get('trails', []))} trails")
+            await self.upsert_trail_state(chat_id, trail_data)
         except Exception as e:
             logger.warning(f"Failed to save trail state for chat {chat_id} (non-critical): {e}")
             # Don't raise - this is a non-critical feature
     
+    async def upsert_trail_state(self, chat_id: str, trail_data: Dict[str, Any]) -> None:
+        """
+        Write trail state immediately (prepared upsert).
+        
+        Args:
+            chat_id: Chat ID to associate trail state with
+            trail_data: Trail state structure with trails array and metadata
+            
+        Raises:
+            Exception: If the write fails
+        """
+        async with self.db.transaction() as conn:
+            await conn.execute(
+                TRAIL_STATE_UPSERT_SQL,
+                (chat_id, psycopg.types.json.Jsonb(trail_data)),
+                prepare=True,
+            )
+        
+        logger.debug(f"Saved trail state for chat {chat_id}: {len(trail_data.get('trails', []))} trails")
+    
     async def load_trail_state(self, chat_id: str) -> Optional[Dict[str, Any]]:
         """
         Load trail container state from PostgreSQL.
@@ -389,7 +398,10 @@ class StorageRepository:
         Returns:
             Trail state structure or None if not found
         """
-        import json
+        if self.trail_writer is not None:
+            pending = self.trail_writer.get_pending(chat_id)
+            if pending is not None:
+                return pending
         
         try:
             query = """
@@ -423,6 +435,10 @@ class StorageRepository:
         Returns:
             True if deleted, False if not found
         """
+        discarded = False
+        if self.trail_writer is not None:
+            discarded = await self.trail_writer.discard(chat_id)
+        
         try:
             query = """
                 DELETE FROM trail_states
@@ -440,5 +456,5 @@ class StorageRepository:
         except Exception as e:
             logger.warning(f"Failed to delete trail state for chat {chat_id}: {e}")
         
-        return False
+        return discarded
 
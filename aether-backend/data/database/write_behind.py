@@ -0,0 +1,214 @@
+"""
+Write-Behind Buffer - Debounced, per-key persistence of frequently saved state
+
+@.architecture
+Incoming: data/database/repositories/storage.py, api/dependencies.py, app.py (shutdown_event) --- {keyed state values from autosave endpoints, flush coroutine, close requests}
+Processing: submit(), get_pending(), discard(), flush(), close(), _flush_later(), _write() --- {5 jobs: debouncing, write_coalescing, read_your_writes, retry_handling, shutdown_flushing}
+Outgoing: data/database/repositories/storage.py (flush coroutine) --- {one upsert per key per interval, buffer statistics Dict}
+
+Handles:
+- Collapsing rapid successive saves for the same key into one write per interval
+- Serving not-yet-written values to readers (read-your-writes)
+- Dropping pending writes when the underlying record is deleted
+- Flushing everything on shutdown
+
+Production Features:
+- At most one scheduled flush task per key
+- Failed writes retried on the next interval (bounded)
+- Writes for different keys run independently
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class WriteBehindBuffer:
+    """
+    Debounces keyed writes: only the latest value per key is persisted,
+    at most once per interval.
+
+    Usage:
+        buffer = WriteBehindBuffer(flush=repo.upsert_trail_state, interval=1.0)
+        buffer.submit(chat_id, trail_data)   # returns immediately
+        await buffer.close()                 # on shutdown
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[str, Any], Awaitable[None]],
+        interval: float = 1.0,
+        max_retries: int = 3,
+    ):
+        """
+        Initialize write-behind buffer.
+
+        Args:
+            flush: Coroutine function persisting (key, value)
+            interval: Seconds a value waits for newer saves before it is written
+            max_retries: Attempts per value before a failing write is dropped
+        """
+        self._flush_fn = flush
+        self._interval = interval
+        self._max_retries = max_retries
+
+        self._pending: Dict[str, Any] = {}
+        self._inflight: Dict[str, Any] = {}
+        self._attempts: Dict[str, int] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._closed = False
+
+        self._submitted = 0
+        self._written = 0
+        self._coalesced = 0
+        self._failed = 0
+
+    # ============================================================================
+    # PUBLIC API
+    # ============================================================================
+
+    def submit(self, key: str, value: Any) -> None:
+        """
+        Queue the latest value for a key.
+
+        Args:
+            key: Record key (e.g. chat_id)
+            value: Value to persist; replaces any pending value for the key
+        """
+        if self._closed:
+            raise RuntimeError("Write-behind buffer is closed")
+
+        self._submitted += 1
+        if key in self._pending:
+            self._coalesced += 1
+        self._pending[key] = value
+        self._attempts.pop(key, None)
+
+        if key not in self._tasks:
+            self._tasks[key] = asyncio.create_task(self._flush_later(key))
+
+    def get_pending(self, key: str) -> Optional[Any]:
+        """
+        Get a value that is queued or being written for a key.
+
+        Args:
+            key: Record key
+
+        Returns:
+            Latest unwritten value or None
+        """
+        value = self._pending.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._inflight.get(key)
+        return value
+
+    async def discard(self, key: str) -> bool:
+        """
+        Drop any queued value for a key (e.g. when the record is deleted).
+
+        A write already in progress is allowed to finish first, so a delete
+        issued after discard() cannot be overtaken by it.
+
+        Args:
+            key: Record key
+
+        Returns:
+            True if a pending value was dropped
+        """
+        dropped = self._pending.pop(key, _MISSING) is not _MISSING
+        self._attempts.pop(key, None)
+        task = self._tasks.get(key)
+        if task is not None:
+            if key in self._inflight:
+                await asyncio.gather(task, return_exceptions=True)
+            else:
+                task.cancel()
+        return dropped
+
+    async def flush(self, key: Optional[str] = None) -> None:
+        """
+        Write pending values now instead of waiting for the interval.
+
+        Args:
+            key: Key to flush, or None for all keys
+        """
+        keys = [key] if key is not None else list(self._pending)
+        await asyncio.gather(*(self._write(k) for k in keys))
+
+    async def close(self) -> None:
+        """Stop scheduling and flush everything still pending."""
+        self._closed = True
+        tasks = list(self._tasks.items())
+        for key, task in tasks:
+            if key not in self._inflight:
+                task.cancel()
+        await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+        await self.flush()
+        if self._pending:
+            logger.warning(f"Write-behind buffer closed with {len(self._pending)} unwritten keys")
+
+    # ============================================================================
+    # INTERNAL
+    # ============================================================================
+
+    async def _flush_later(self, key: str) -> None:
+        try:
+            await asyncio.sleep(self._interval)
+            await self._write(key)
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
+            # A newer value arrived while writing (or the write failed): go again
+            if key in self._pending and key not in self._tasks and not self._closed:
+                self._tasks[key] = asyncio.create_task(self._flush_later(key))
+
+    async def _write(self, key: str) -> None:
+        value = self._pending.pop(key, _MISSING)
+        if value is _MISSING:
+            return
+
+        self._inflight[key] = value
+        try:
+            await self._flush_fn(key, value)
+            self._written += 1
+            self._attempts.pop(key, None)
+        except Exception as e:
+            self._failed += 1
+            attempts = self._attempts.get(key, 0) + 1
+            if key in self._pending:
+                pass  # A newer value supersedes the failed one
+            elif attempts < self._max_retries and not self._closed:
+                self._pending[key] = value
+                self._attempts[key] = attempts
+                logger.warning(f"Write-behind flush for {key} failed (attempt {attempts}): {e}")
+            else:
+                self._attempts.pop(key, None)
+                logger.error(f"Write-behind flush for {key} failed, dropping value: {e}")
+        finally:
+            if self._inflight.get(key) is value:
+                del self._inflight[key]
+
+    # ============================================================================
+    # STATUS
+    # ============================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get buffer statistics.
+
+        Returns:
+            Dict with pending count and submit/write/coalesce/failure counters
+        """
+        return {
+            "pending": len(self._pending),
+            "inflight": len(self._inflight),
+            "interval": self._interval,
+            "submitted": self._submitted,
+            "written": self._written,
+            "coalesced": self._coalesced,
+            "failed": self._failed,
+        }
@@ -33,11 +33,13 @@ from .metrics import (
     Counter,
     Gauge,
     Histogram,
+    Summary,
     MetricsRegistry,
     get_registry,
     counter,
     gauge,
     histogram,
+    summary,
     setup_standard_metrics,
 )
 
@@ -46,6 +48,7 @@ from .health import (
     HealthStatus,
     HealthCheckResult,
     HealthChecker,
+    SystemMetricsSampler,
     RuntimeHealthChecker,
     IntegrationHealthChecker,
     DatabaseHealthChecker,
@@ -61,13 +64,20 @@ from .tracing import (
     Span,
     Tracer,
     SpanContext,
+    Sampler,
+    AlwaysOnSampler,
+    TraceIdRatioSampler,
+    TailSamplingPolicy,
+    OTLPFileExporter,
     trace,
     get_tracer,
+    configure_tracer,
     get_current_span,
     get_trace_id,
     set_trace_id,
     clear_trace_context,
     export_traces_json,
+    export_traces_otlp,
 )
 
 __all__ = [
@@ -91,17 +101,20 @@ __all__ = [
     'Counter',
     'Gauge',
     'Histogram',
+    'Summary',
     'MetricsRegistry',
     'get_registry',
     'counter',
     'gauge',
     'histogram',
+    'summary',
     'setup_standard_metrics',
     
     # Health
     'HealthStatus',
     'HealthCheckResult',
     'HealthChecker',
+    'SystemMetricsSampler',
     'RuntimeHealthChecker',
     'IntegrationHealthChecker',
     'DatabaseHealthChecker',
@@ -116,11 +129,18 @@ __all__ = [
     'Tracer',
     'SpanContext',
     'trace',
+    'Sampler',
+    'AlwaysOnSampler',
+    'TraceIdRatioSampler',
+    'TailSamplingPolicy',
+    'OTLPFileExporter',
     'get_tracer',
+    'configure_tracer',
     'get_current_span',
     'get_trace_id',
     'set_trace_id',
     'clear_trace_context',
     'export_traces_json',
+    'export_traces_otlp',
 ]
 
@@ -10,12 +10,20 @@ Provides comprehensive health checks and diagnostics for:
 
 @.architecture
 Incoming: app.py, api/v1/endpoints/health.py, Component instances --- {RuntimeEngine, IntegrationLoader, Database, MCPManager, str component_name}
-Processing: check_all(), check_component(), _check_system(), register_checker(), _aggregate_status() --- {5 jobs: aggregation, health_checking, monitoring, registration, resource_monitoring}
-Outgoing: api/v1/endpoints/health.py --- {Dict[str, Any] health status, HealthCheckResult, HealthStatus enum}
+Processing: check_all(), check_component(), get_snapshot(), peek_snapshot(), _run_checker(), _check_system(), register_checker(), _aggregate_status(), SystemMetricsSampler --- {7 jobs: aggregation, background_sampling, concurrent_checking, health_checking, registration, resource_monitoring, snapshot_caching}
+Outgoing: api/v1/endpoints/health.py --- {Dict[str, Any] health status, HealthCheckResult, HealthStatus enum, system metrics snapshot}
+
+Component checks run concurrently, each bounded by a timeout, so one slow
+dependency cannot stall the whole report. System metrics come from a
+background sampler instead of blocking psutil calls on the event loop, and
+the last report is cached for cache_ttl seconds so high-frequency probes do
+not re-run checks.
 """
 
 import time
 import asyncio
+import inspect
+import logging
 import psutil
 import platform
 from typing import Dict, List, Optional, Any
@@ -23,6 +31,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 
 class HealthStatus(str, Enum):
     """Health check status levels."""
@@ -53,6 +63,89 @@ class HealthCheckResult:
     response_time_ms: Optional[float] = None
 
 
+class SystemMetricsSampler:
+    """
+    Samples CPU, memory and disk usage in the background.
+
+    psutil calls run in a worker thread every `interval` seconds; readers get
+    the latest sample without touching the OS. CPU percent is measured over
+    the time between samples rather than by sleeping.
+    """
+
+    def __init__(self, interval: float = 5.0, disk_path: str = '/'):
+        """
+        Initialize sampler.
+
+        Args:
+            interval: Seconds between samples
+            disk_path: Mount point reported for disk usage
+        """
+        self.interval = interval
+        self.disk_path = disk_path
+        self._latest: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._cpu_count = psutil.cpu_count()
+
+    async def start(self) -> None:
+        """Start the background sampling task."""
+        if self._task is None or self._task.done():
+            # First call only establishes the CPU baseline (returns 0.0)
+            psutil.cpu_percent(interval=None)
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background sampling task."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is active."""
+        return self._task is not None and not self._task.done()
+
+    def sample(self) -> Dict[str, Any]:
+        """
+        Take a sample now (non-blocking psutil calls only).
+
+        Returns:
+            Metrics dict (see snapshot())
+        """
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage(self.disk_path)
+        self._latest = {
+            'cpu_percent': psutil.cpu_percent(interval=None),
+            'cpu_count': self._cpu_count,
+            'memory_total': memory.total,
+            'memory_available': memory.available,
+            'memory_percent': memory.percent,
+            'disk_total': disk.total,
+            'disk_free': disk.free,
+            'disk_percent': disk.percent,
+            'sampled_at': time.time(),
+        }
+        return self._latest
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the latest sample, sampling once if none exists yet.
+
+        Returns:
+            Dict with cpu_percent, cpu_count, memory_* and disk_* values
+            (bytes / percent) and sampled_at timestamp
+        """
+        return self._latest if self._latest is not None else self.sample()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.sample)
+            except Exception as e:
+                logger.warning(f"System metrics sampling failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
 class HealthChecker:
     """
     Comprehensive health check system.
@@ -60,10 +153,39 @@ class HealthChecker:
     Performs health checks on all system components and aggregates results.
     """
     
-    def __init__(self):
-        """Initialize health checker."""
+    def __init__(
+        self,
+        check_timeout: float = 5.0,
+        cache_ttl: float = 2.0,
+        sampler: Optional[SystemMetricsSampler] = None
+    ):
+        """
+        Initialize health checker.
+        
+        Args:
+            check_timeout: Seconds a single component check may take
+            cache_ttl: Seconds a full report is reused by get_snapshot()
+            sampler: System metrics sampler (created if omitted)
+        """
         self._start_time = time.time()
         self._checkers: Dict[str, Any] = {}
+        self.check_timeout = check_timeout
+        self.cache_ttl = cache_ttl
+        self.sampler = sampler or SystemMetricsSampler()
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_at = 0.0
+        self._refresh: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """Start background system metrics sampling."""
+        await self.sampler.start()
+    
+    async def stop(self) -> None:
+        """Stop background sampling and any in-flight refresh."""
+        await self.sampler.stop()
+        if self._refresh is not None and not self._refresh.done():
+            self._refresh.cancel()
+            await asyncio.gather(self._refresh, return_exceptions=True)
     
     def register_checker(self, name: str, checker: Any) -> None:
         """
@@ -77,44 +199,24 @@ class HealthChecker:
     
     async def check_all(self) -> Dict[str, Any]:
         """
-        Run all health checks.
+        Run all health checks concurrently and cache the report.
         
         Returns:
             Aggregated health check results
         """
         start = time.time()
-        results = []
+        results = [await self._check_system()]
         
-        # Check system resources
-        results.append(await self._check_system())
-        
-        # Check runtime components
-        for name, checker in self._checkers.items():
-            try:
-                check_start = time.time()
-                result = await checker.check_health()
-                check_time = (time.time() - check_start) * 1000
-                
-                results.append(HealthCheckResult(
-                    component=name,
-                    status=HealthStatus.HEALTHY if result.get('healthy', False) else HealthStatus.UNHEALTHY,
-                    message=result.get('message', 'Component check completed'),
-                    details=result,
-                    response_time_ms=check_time
-                ))
-            except Exception as e:
-                results.append(HealthCheckResult(
-                    component=name,
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"Health check failed: {str(e)}",
-                    details={'error': str(e)}
-                ))
+        # Each runner converts its own failures and timeouts into results
+        results.extend(await asyncio.gather(*(
+            self._run_checker(name, checker) for name, checker in self._checkers.items()
+        )))
         
         # Aggregate status
         overall_status = self._aggregate_status(results)
         total_time = (time.time() - start) * 1000
         
-        return {
+        report = {
             'status': overall_status.value,
             'timestamp': datetime.utcnow().isoformat() + 'Z',
             'uptime_seconds': time.time() - self._start_time,
@@ -130,6 +232,48 @@ class HealthChecker:
                 for r in results
             ]
         }
+        self._snapshot = report
+        self._snapshot_at = time.monotonic()
+        return report
+    
+    async def get_snapshot(self, max_age: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Get a health report no older than max_age seconds.
+        
+        Concurrent callers share a single refresh.
+        
+        Args:
+            max_age: Maximum report age (defaults to cache_ttl)
+            
+        Returns:
+            Aggregated health check results (as check_all())
+        """
+        max_age = self.cache_ttl if max_age is None else max_age
+        if self._snapshot is not None and time.monotonic() - self._snapshot_at <= max_age:
+            return self._snapshot
+        
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self.check_all())
+        # Shielded so a disconnecting caller does not cancel the shared refresh
+        return await asyncio.shield(self._refresh)
+    
+    def peek_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the last report without waiting for any check.
+        
+        Schedules a background refresh when the report is missing or older
+        than cache_ttl.
+        
+        Returns:
+            Last aggregated report, or None if no check has completed yet
+        """
+        stale = self._snapshot is None or time.monotonic() - self._snapshot_at > self.cache_ttl
+        if stale and (self._refresh is None or self._refresh.done()):
+            try:
+                self._refresh = asyncio.get_running_loop().create_task(self.check_all())
+            except RuntimeError:
+                pass  # No running loop
+        return self._snapshot
     
     async def check_component(self, component: str) -> Optional[HealthCheckResult]:
         """
@@ -148,21 +292,43 @@ class HealthChecker:
         if component not in self._checkers:
             return None
         
+        return await self._run_checker(component, self._checkers[component])
+    
+    async def _run_checker(self, name: str, checker: Any) -> HealthCheckResult:
+        """
+        Run one component check bounded by check_timeout.
+        
+        Args:
+            name: Component name
+            checker: Object with async check_health() method
+            
+        Returns:
+            HealthCheckResult (UNHEALTHY on error or timeout)
+        """
+        check_start = time.time()
         try:
-            check_start = time.time()
-            result = await self._checkers[component].check_health()
+            result = await asyncio.wait_for(checker.check_health(), self.check_timeout)
             check_time = (time.time() - check_start) * 1000
             
             return HealthCheckResult(
-                component=component,
+                component=name,
                 status=HealthStatus.HEALTHY if result.get('healthy', False) else HealthStatus.UNHEALTHY,
                 message=result.get('message', 'Component check completed'),
                 details=result,
                 response_time_ms=check_time
             )
+        except asyncio.TimeoutError:
+            logger.warning(f"Health check for {name} timed out after {self.check_timeout}s")
+            return HealthCheckResult(
+                component=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"Health check timed out after {self.check_timeout}s",
+                details={'error': 'timeout'},
+                response_time_ms=(time.time() - check_start) * 1000
+            )
         except Exception as e:
             return HealthCheckResult(
-                component=component,
+                component=name,
                 status=HealthStatus.UNHEALTHY,
                 message=f"Health check failed: {str(e)}",
                 details={'error': str(e)}
@@ -170,27 +336,28 @@ class HealthChecker:
     
     async def _check_system(self) -> HealthCheckResult:
         """
-        Check system resources.
+        Check system resources from the latest background sample.
         
         Returns:
             System health check result
         """
         try:
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            sample = self.sampler.snapshot()
+            cpu_percent = sample['cpu_percent']
+            memory_percent = sample['memory_percent']
+            disk_percent = sample['disk_percent']
             
             # Determine status based on resource usage
             status = HealthStatus.HEALTHY
             issues = []
             
-            if memory.percent > 90:
+            if memory_percent > 90:
                 status = HealthStatus.DEGRADED
-                issues.append(f"High memory usage: {memory.percent}%")
+                issues.append(f"High memory usage: {memory_percent}%")
             
-            if disk.percent > 90:
+            if disk_percent > 90:
                 status = HealthStatus.DEGRADED
-                issues.append(f"High disk usage: {disk.percent}%")
+                issues.append(f"High disk usage: {disk_percent}%")
             
             if cpu_percent > 90:
                 status = HealthStatus.DEGRADED
@@ -207,18 +374,19 @@ class HealthChecker:
                     'python_version': platform.python_version(),
                     'cpu': {
                         'percent': cpu_percent,
-                        'count': psutil.cpu_count()
+                        'count': sample['cpu_count']
                     },
                     'memory': {
-                        'total_gb': round(memory.total / (1024**3), 2),
-                        'available_gb': round(memory.available / (1024**3), 2),
-                        'percent_used': memory.percent
+                        'total_gb': round(sample['memory_total'] / (1024**3), 2),
+                        'available_gb': round(sample['memory_available'] / (1024**3), 2),
+                        'percent_used': memory_percent
                     },
                     'disk': {
-                        'total_gb': round(disk.total / (1024**3), 2),
-                        'free_gb': round(disk.free / (1024**3), 2),
-                        'percent_used': disk.percent
+                        'total_gb': round(sample['disk_total'] / (1024**3), 2),
+                        'free_gb': round(sample['disk_free'] / (1024**3), 2),
+                        'percent_used': disk_percent
                     },
+                    'sampled_at': sample['sampled_at'],
                     'uptime_seconds': time.time() - self._start_time
                 }
             )
@@ -382,6 +550,8 @@ class DatabaseHealthChecker:
             
             if hasattr(self.db, 'health_check'):
                 result = self.db.health_check()
+                if inspect.isawaitable(result):
+                    result = await result
             else:
                 # Fallback: try to get connection
                 if hasattr(self.db, 'get_connection'):
@@ -497,7 +667,10 @@ def initialize_health_checks(
     runtime: Optional[Any] = None,
     integration_loader: Optional[Any] = None,
     database: Optional[Any] = None,
-    mcp_manager: Optional[Any] = None
+    mcp_manager: Optional[Any] = None,
+    check_timeout: Optional[float] = None,
+    cache_ttl: Optional[float] = None,
+    sample_interval: Optional[float] = None
 ) -> HealthChecker:
     """
     Initialize health checks for components.
@@ -507,12 +680,22 @@ def initialize_health_checks(
         integration_loader: Integration loader
         database: Database instance
         mcp_manager: MCP server manager
+        check_timeout: Per-component check timeout in seconds
+        cache_ttl: Seconds a full report is reused
+        sample_interval: Seconds between system metrics samples
         
     Returns:
         Configured HealthChecker
     """
     checker = get_health_checker()
     
+    if check_timeout is not None:
+        checker.check_timeout = check_timeout
+    if cache_ttl is not None:
+        checker.cache_ttl = cache_ttl
+    if sample_interval is not None:
+        checker.sampler.interval = sample_interval
+    
     if runtime:
         checker.register_checker('runtime', RuntimeHealthChecker(runtime))
     
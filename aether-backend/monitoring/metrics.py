@@ -5,22 +5,37 @@ Provides Prometheus-compatible metrics for application monitoring:
 - Counters (monotonically increasing)
 - Gauges (can go up or down)
 - Histograms (distribution of values)
-- Summaries (percentiles)
+- Summaries (sliding-window quantiles)
 
-Metrics can be exposed via /metrics endpoint for Prometheus scraping.
+Metrics are exposed via the /metrics endpoint for Prometheus scraping.
 
 @.architecture
-Incoming: app.py, api/v1/endpoints/*.py, core/*, Future /metrics endpoint --- {str metric_name, float value, Dict[str, str] labels, metric recording calls}
-Processing: inc(), set(), observe(), collect_all(), export_prometheus() --- {5 jobs: collection, export, metric_aggregation, metric_creation, recording}
-Outgoing: Future /metrics endpoint, api/v1/endpoints/*.py --- {Counter/Gauge/Histogram instances, Dict[str, Any] collected metrics, str Prometheus format}
+Incoming: app.py, api/v1/endpoints/*.py, core/*, data/cache/tiered.py --- {str metric_name, float value, Dict[str, str] labels, metric recording calls}
+Processing: labels(), inc(), set(), observe(), quantiles(), collect_all(), export_prometheus() --- {8 jobs: bucket_lookup, child_caching, collection, export, metric_creation, quantile_estimation, recording, shard_merging}
+Outgoing: api/v1/endpoints/health.py (/metrics), api/v1/endpoints/*.py --- {Counter/Gauge/Histogram/Summary instances, Dict[str, Any] collected metrics, str Prometheus format}
+
+Hot-path design:
+- Every label combination is a cached child; metric.labels(...) returns it,
+  so callers can keep a handle and skip label handling on each update
+- Updates take no locks. Children are written from the event loop thread;
+  metrics also written from worker threads can be created with
+  sharded=True, which gives each thread its own cell, merged at scrape time
+- Histogram buckets are located with bisect and stored non-cumulatively;
+  cumulative counts are computed at scrape time
+- Label strings for export are rendered once per child
 """
 
+import math
 import time
 import threading
-from typing import Dict, List, Optional, Tuple, Any
+from bisect import bisect_left
+from itertools import accumulate
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Any, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict
+
+_get_ident = threading.get_ident
 
 
 class MetricType(str, Enum):
@@ -40,14 +55,176 @@ class Metric:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-class Counter:
+def _escape_label_value(value: Any) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _render_labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    """Render {name="value",...} (empty string without labels)."""
+    if not names:
+        return ""
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    """Format a bucket bound for the le label."""
+    return "+Inf" if bound == math.inf else str(bound)
+
+
+# ============================================================================
+# LABELED METRIC BASE
+# ============================================================================
+
+class _MetricFamily:
+    """
+    Shared label handling: one cached child per label-value tuple.
+
+    Subclasses implement _new_child().
+    """
+
+    def __init__(self, name: str, help_text: str, labels: Optional[List[str]] = None, sharded: bool = False):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = list(labels or [])
+        self.sharded = sharded
+        self._children: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()  # Child creation only
+
+        count = len(self.label_names)
+        if count == 1:
+            getter = itemgetter(self.label_names[0])
+            self._key_from = lambda labels: (getter(labels),)
+        elif count > 1:
+            self._key_from = itemgetter(*self.label_names)
+        else:
+            self._key_from = lambda labels: ()
+
+        # Unlabeled metrics update their single child directly
+        self._default = self.labels() if not self.label_names else None
+
+    def labels(self, *values: Any, **labels: Any) -> Any:
+        """
+        Get the child for one label combination (created once, then cached).
+
+        Hold the returned child on hot paths to skip label handling:
+            hits = cache_requests.labels("api", "local", "hit")
+            hits.inc()
+
+        Args:
+            *values: Label values in label_names order
+            **labels: Label values by name (instead of positional)
+
+        Returns:
+            Child metric with the same update methods, minus labels
+        """
+        if labels:
+            if values:
+                raise ValueError("Pass label values positionally or by name, not both")
+            key = self._key(labels)
+        else:
+            key = values
+            if len(key) != len(self.label_names):
+                raise ValueError(f"Expected labels {self.label_names}, got {len(key)} values")
+
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child(key)
+                    self._children[key] = child
+        return child
+
+    def _child_for(self, labels: Dict[str, Any]) -> Any:
+        """Child for an update call's keyword labels."""
+        if not labels and self._default is not None:
+            return self._default
+        child = self._children.get(self._key(labels))
+        return child if child is not None else self.labels(**labels)
+
+    def _existing_child(self, labels: Dict[str, Any]) -> Optional[Any]:
+        """Child for a read call, without creating it."""
+        return self._children.get(self._key(labels))
+
+    def _key(self, labels: Dict[str, Any]) -> Tuple[Any, ...]:
+        """Validate label names and return values in label_names order."""
+        if len(labels) != len(self.label_names):
+            raise ValueError(f"Expected labels {self.label_names}, got {list(labels.keys())}")
+        try:
+            return self._key_from(labels)
+        except KeyError:
+            raise ValueError(f"Expected labels {self.label_names}, got {list(labels.keys())}") from None
+
+    def children(self) -> List[Tuple[Dict[str, Any], Any]]:
+        """
+        Snapshot of all children.
+
+        Returns:
+            List of (label_dict, child) tuples
+        """
+        return [
+            (dict(zip(self.label_names, key)), child)
+            for key, child in list(self._children.items())
+        ]
+
+    def _new_child(self, key: Tuple[Any, ...]) -> Any:
+        raise NotImplementedError
+
+
+# ============================================================================
+# COUNTER
+# ============================================================================
+
+class CounterChild:
+    """Counter value for one label combination."""
+
+    __slots__ = ("label_str", "_value", "_shards")
+
+    def __init__(self, label_str: str, sharded: bool):
+        self.label_str = label_str
+        self._value = 0.0
+        self._shards: Optional[Dict[int, List[float]]] = {} if sharded else None
+
+    def inc(self, value: float = 1.0) -> None:
+        """
+        Increment counter.
+
+        Args:
+            value: Amount to increment (must be >= 0)
+        """
+        if value < 0:
+            raise ValueError("Counter can only be incremented by non-negative values")
+        if self._shards is None:
+            self._value += value
+        else:
+            cell = self._shards.get(_get_ident())
+            if cell is None:
+                cell = self._shards.setdefault(_get_ident(), [0.0])
+            cell[0] += value
+
+    def get(self) -> float:
+        """Current value (all shards merged)."""
+        if self._shards is None:
+            return self._value
+        return self._value + sum(cell[0] for cell in list(self._shards.values()))
+
+
+class Counter(_MetricFamily):
     """
     Counter metric - monotonically increasing value.
     
     Use for: request counts, error counts, bytes processed, etc.
     """
     
-    def __init__(self, name: str, help_text: str, labels: Optional[List[str]] = None):
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Optional[List[str]] = None,
+        sharded: bool = False
+    ):
         """
         Initialize counter.
         
@@ -55,12 +232,12 @@ class Counter:
             name: Metric name
             help_text: Description
             labels: Label names for metric dimensions
+            sharded: Per-thread cells (for counters incremented from worker threads)
         """
-        self.name = name
-        self.help_text = help_text
-        self.label_names = labels or []
-        self._lock = threading.Lock()
-        self._values: Dict[Tuple[str, ...], float] = defaultdict(float)
+        super().__init__(name, help_text, labels, sharded)
+    
+    def _new_child(self, key: Tuple[Any, ...]) -> CounterChild:
+        return CounterChild(_render_labels(self.label_names, key), self.sharded)
     
     def inc(self, value: float = 1.0, **labels: str) -> None:
         """
@@ -70,13 +247,7 @@ class Counter:
             value: Amount to increment (must be >= 0)
             **labels: Label values
         """
-        if value < 0:
-            raise ValueError("Counter can only be incremented by non-negative values")
-        
-        label_values = self._validate_labels(labels)
-        
-        with self._lock:
-            self._values[label_values] += value
+        self._child_for(labels).inc(value)
     
     def get(self, **labels: str) -> float:
         """
@@ -88,14 +259,8 @@ class Counter:
         Returns:
             Current value
         """
-        label_values = self._validate_labels(labels)
-        return self._values.get(label_values, 0.0)
-    
-    def _validate_labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
-        """Validate and order labels."""
-        if set(labels.keys()) != set(self.label_names):
-            raise ValueError(f"Expected labels {self.label_names}, got {list(labels.keys())}")
-        return tuple(labels[name] for name in self.label_names)
+        child = self._existing_child(labels)
+        return child.get() if child is not None else 0.0
     
     def collect(self) -> List[Tuple[Dict[str, str], float]]:
         """
@@ -104,19 +269,47 @@ class Counter:
         Returns:
             List of (label_dict, value) tuples
         """
-        with self._lock:
-            results = []
-            for label_values, value in self._values.items():
-                label_dict = dict(zip(self.label_names, label_values))
-                results.append((label_dict, value))
-            return results
+        return [(label_dict, child.get()) for label_dict, child in self.children()]
+
+
+# ============================================================================
+# GAUGE
+# ============================================================================
+
+class GaugeChild:
+    """Gauge value for one label combination."""
+
+    __slots__ = ("label_str", "_value")
+
+    def __init__(self, label_str: str):
+        self.label_str = label_str
+        self._value = 0.0
 
+    def set(self, value: float) -> None:
+        """Set gauge value."""
+        self._value = value
 
-class Gauge:
+    def inc(self, value: float = 1.0) -> None:
+        """Increment gauge."""
+        self._value += value
+
+    def dec(self, value: float = 1.0) -> None:
+        """Decrement gauge."""
+        self._value -= value
+
+    def get(self) -> float:
+        """Current value."""
+        return self._value
+
+
+class Gauge(_MetricFamily):
     """
     Gauge metric - can go up or down.
     
     Use for: current connections, memory usage, queue size, etc.
+    
+    set() is safe from any thread; inc()/dec() belong to a single writer
+    thread (gauges are not sharded, since set() must replace every shard).
     """
     
     def __init__(self, name: str, help_text: str, labels: Optional[List[str]] = None):
@@ -128,11 +321,10 @@ class Gauge:
             help_text: Description
             labels: Label names for metric dimensions
         """
-        self.name = name
-        self.help_text = help_text
-        self.label_names = labels or []
-        self._lock = threading.Lock()
-        self._values: Dict[Tuple[str, ...], float] = defaultdict(float)
+        super().__init__(name, help_text, labels)
+    
+    def _new_child(self, key: Tuple[Any, ...]) -> GaugeChild:
+        return GaugeChild(_render_labels(self.label_names, key))
     
     def set(self, value: float, **labels: str) -> None:
         """
@@ -142,10 +334,7 @@ class Gauge:
             value: New value
             **labels: Label values
         """
-        label_values = self._validate_labels(labels)
-        
-        with self._lock:
-            self._values[label_values] = value
+        self._child_for(labels).set(value)
     
     def inc(self, value: float = 1.0, **labels: str) -> None:
         """
@@ -155,10 +344,7 @@ class Gauge:
             value: Amount to add
             **labels: Label values
         """
-        label_values = self._validate_labels(labels)
-        
-        with self._lock:
-            self._values[label_values] += value
+        self._child_for(labels).inc(value)
     
     def dec(self, value: float = 1.0, **labels: str) -> None:
         """
@@ -168,7 +354,7 @@ class Gauge:
             value: Amount to subtract
             **labels: Label values
         """
-        self.inc(-value, **labels)
+        self._child_for(labels).dec(value)
     
     def get(self, **labels: str) -> float:
         """
@@ -180,14 +366,8 @@ class Gauge:
         Returns:
             Current value
         """
-        label_values = self._validate_labels(labels)
-        return self._values.get(label_values, 0.0)
-    
-    def _validate_labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
-        """Validate and order labels."""
-        if set(labels.keys()) != set(self.label_names):
-            raise ValueError(f"Expected labels {self.label_names}, got {list(labels.keys())}")
-        return tuple(labels[name] for name in self.label_names)
+        child = self._existing_child(labels)
+        return child.get() if child is not None else 0.0
     
     def collect(self) -> List[Tuple[Dict[str, str], float]]:
         """
@@ -196,15 +376,81 @@ class Gauge:
         Returns:
             List of (label_dict, value) tuples
         """
-        with self._lock:
-            results = []
-            for label_values, value in self._values.items():
-                label_dict = dict(zip(self.label_names, label_values))
-                results.append((label_dict, value))
-            return results
+        return [(label_dict, child.get()) for label_dict, child in self.children()]
+
+
+# ============================================================================
+# HISTOGRAM
+# ============================================================================
+
+class HistogramChild:
+    """
+    Histogram state for one label combination.
+
+    Per-bucket counts are non-cumulative (one increment per observation);
+    each bucket also keeps the most recent exemplar passed to observe().
+    """
+
+    __slots__ = ("label_str", "bucket_label_strs", "_bounds", "_state", "_shards", "_exemplars")
+
+    def __init__(self, bounds: List[float], label_names: List[str], key: Tuple[Any, ...], sharded: bool):
+        self._bounds = bounds
+        self.label_str = _render_labels(label_names, key)
+        le_names = [*label_names, "le"]
+        self.bucket_label_strs = [
+            _render_labels(le_names, (*key, _format_bound(bound)))
+            for bound in (*bounds, math.inf)
+        ]
+        # [per-bucket counts (+Inf last), sum]
+        self._state: List[Any] = [[0] * (len(bounds) + 1), 0.0]
+        self._shards: Optional[Dict[int, List[Any]]] = {} if sharded else None
+        self._exemplars: List[Optional[Tuple[Dict[str, str], float, float]]] = [None] * (len(bounds) + 1)
+
+    def observe(self, value: float, exemplar: Optional[Dict[str, str]] = None) -> None:
+        """
+        Observe a value.
+
+        Args:
+            value: Value to observe
+            exemplar: Optional labels linking this observation (e.g. trace_id)
+        """
+        index = bisect_left(self._bounds, value)
+        if self._shards is None:
+            state = self._state
+        else:
+            state = self._shards.get(_get_ident())
+            if state is None:
+                state = self._shards.setdefault(_get_ident(), [[0] * (len(self._bounds) + 1), 0.0])
+        state[0][index] += 1
+        state[1] += value
+        if exemplar is not None:
+            self._exemplars[index] = (exemplar, value, time.time())
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        """
+        Merged state.
+
+        Returns:
+            Tuple of (cumulative bucket counts ending with +Inf, sum)
+        """
+        counts = list(self._state[0])
+        total = self._state[1]
+        if self._shards is not None:
+            for shard_counts, shard_sum in list(self._shards.values()):
+                counts = [a + b for a, b in zip(counts, shard_counts)]
+                total += shard_sum
+        return list(accumulate(counts)), total
 
+    def exemplars(self) -> Dict[float, Dict[str, Any]]:
+        """Latest exemplar per bucket upper bound."""
+        return {
+            bound: {"labels": exemplar[0], "value": exemplar[1], "timestamp": exemplar[2]}
+            for bound, exemplar in zip((*self._bounds, math.inf), self._exemplars)
+            if exemplar is not None
+        }
 
-class Histogram:
+
+class Histogram(_MetricFamily):
     """
     Histogram metric - distribution of values into buckets.
     
@@ -219,7 +465,8 @@ class Histogram:
         name: str,
         help_text: str,
         labels: Optional[List[str]] = None,
-        buckets: Optional[List[float]] = None
+        buckets: Optional[List[float]] = None,
+        sharded: bool = False
     ):
         """
         Initialize histogram.
@@ -229,42 +476,24 @@ class Histogram:
             help_text: Description
             labels: Label names for metric dimensions
             buckets: Bucket boundaries (sorted)
+            sharded: Per-thread state (for histograms observed from worker threads)
         """
-        self.name = name
-        self.help_text = help_text
-        self.label_names = labels or []
         self.buckets = sorted(buckets or self.DEFAULT_BUCKETS)
-        self._lock = threading.Lock()
-        
-        # Store bucket counts and sum/count
-        self._bucket_counts: Dict[Tuple[str, ...], List[int]] = defaultdict(
-            lambda: [0] * (len(self.buckets) + 1)
-        )
-        self._sum: Dict[Tuple[str, ...], float] = defaultdict(float)
-        self._count: Dict[Tuple[str, ...], int] = defaultdict(int)
+        super().__init__(name, help_text, labels, sharded)
     
-    def observe(self, value: float, **labels: str) -> None:
+    def _new_child(self, key: Tuple[Any, ...]) -> HistogramChild:
+        return HistogramChild(self.buckets, self.label_names, key, self.sharded)
+    
+    def observe(self, value: float, exemplar: Optional[Dict[str, str]] = None, **labels: str) -> None:
         """
         Observe a value.
         
         Args:
             value: Value to observe
+            exemplar: Optional labels linking this observation (e.g. trace_id)
             **labels: Label values
         """
-        label_values = self._validate_labels(labels)
-        
-        with self._lock:
-            # Update sum and count
-            self._sum[label_values] += value
-            self._count[label_values] += 1
-            
-            # Update buckets
-            bucket_counts = self._bucket_counts[label_values]
-            for i, bucket in enumerate(self.buckets):
-                if value <= bucket:
-                    bucket_counts[i] += 1
-            # +Inf bucket
-            bucket_counts[-1] += 1
+        self._child_for(labels).observe(value, exemplar)
     
     def get_stats(self, **labels: str) -> Dict[str, Any]:
         """
@@ -274,49 +503,193 @@ class Histogram:
             **labels: Label values
             
         Returns:
-            Dict with count, sum, average, buckets
+            Dict with count, sum, average, cumulative buckets and exemplars
+        """
+        child = self._existing_child(labels)
+        if child is None:
+            return self._stats(None)
+        return self._stats(child)
+    
+    def _stats(self, child: Optional[HistogramChild]) -> Dict[str, Any]:
+        if child is None:
+            cumulative, sum_value, exemplars = [0] * (len(self.buckets) + 1), 0.0, {}
+        else:
+            (cumulative, sum_value), exemplars = child.snapshot(), child.exemplars()
+        count = cumulative[-1]
+        return {
+            'count': count,
+            'sum': sum_value,
+            'average': sum_value / count if count > 0 else 0.0,
+            'buckets': dict(zip([*self.buckets, float('inf')], cumulative)),
+            'exemplars': exemplars,
+        }
+    
+    def collect(self) -> List[Tuple[Dict[str, str], Dict[str, Any]]]:
         """
-        label_values = self._validate_labels(labels)
+        Collect all histogram data for export.
         
-        with self._lock:
-            count = self._count.get(label_values, 0)
-            sum_value = self._sum.get(label_values, 0.0)
-            avg = sum_value / count if count > 0 else 0.0
-            
-            bucket_counts = self._bucket_counts.get(label_values, [0] * (len(self.buckets) + 1))
+        Returns:
+            List of (label_dict, stats_dict) tuples
+        """
+        return [(label_dict, self._stats(child)) for label_dict, child in self.children()]
+
+
+# ============================================================================
+# SUMMARY
+# ============================================================================
+
+class SummaryChild:
+    """
+    Sliding-window quantile state for one label combination.
+
+    Keeps the most recent window_size observations in a ring buffer
+    (O(1) per observation); quantiles are computed from it at read time.
+    Count and sum cover every observation.
+    """
+
+    __slots__ = ("label_str", "quantile_label_strs", "_quantiles", "_window_size", "_state", "_shards")
+
+    def __init__(
+        self,
+        quantiles: Sequence[float],
+        window_size: int,
+        label_names: List[str],
+        key: Tuple[Any, ...],
+        sharded: bool
+    ):
+        self._quantiles = quantiles
+        self._window_size = window_size
+        self.label_str = _render_labels(label_names, key)
+        q_names = [*label_names, "quantile"]
+        self.quantile_label_strs = [_render_labels(q_names, (*key, str(q))) for q in quantiles]
+        # [ring buffer, next write position, count, sum]
+        self._state: List[Any] = [[], 0, 0, 0.0]
+        self._shards: Optional[Dict[int, List[Any]]] = {} if sharded else None
+
+    def observe(self, value: float) -> None:
+        """Observe a value."""
+        if self._shards is None:
+            state = self._state
+        else:
+            state = self._shards.get(_get_ident())
+            if state is None:
+                state = self._shards.setdefault(_get_ident(), [[], 0, 0, 0.0])
+        ring = state[0]
+        if len(ring) < self._window_size:
+            ring.append(value)
+        else:
+            position = state[1]
+            ring[position] = value
+            state[1] = (position + 1) % self._window_size
+        state[2] += 1
+        state[3] += value
+
+    def snapshot(self) -> Tuple[List[float], int, float]:
+        """
+        Merged state.
+
+        Returns:
+            Tuple of (quantile values in configured order, count, sum)
+        """
+        states = [self._state]
+        if self._shards is not None:
+            states.extend(list(self._shards.values()))
+        window = sorted(v for state in states for v in list(state[0]))
+        count = sum(state[2] for state in states)
+        total = sum(state[3] for state in states)
+        if not window:
+            return [math.nan] * len(self._quantiles), count, total
+        last = len(window) - 1
+        # Nearest-rank quantiles
+        values = [window[min(last, max(0, math.ceil(q * len(window)) - 1))] for q in self._quantiles]
+        return values, count, total
+
+
+class Summary(_MetricFamily):
+    """
+    Summary metric - streaming quantiles over a sliding window.
+    
+    Use for: latency percentiles where bucket boundaries are unknown.
+    """
+    
+    DEFAULT_QUANTILES = (0.5, 0.9, 0.99)
+    
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Optional[List[str]] = None,
+        quantiles: Optional[Sequence[float]] = None,
+        window_size: int = 1024,
+        sharded: bool = False
+    ):
+        """
+        Initialize summary.
+        
+        Args:
+            name: Metric name
+            help_text: Description
+            labels: Label names for metric dimensions
+            quantiles: Quantiles to report (0-1)
+            window_size: Most recent observations used for quantiles
+            sharded: Per-thread state (for summaries observed from worker threads)
+        """
+        self.quantiles = tuple(sorted(quantiles or self.DEFAULT_QUANTILES))
+        if any(not 0 <= q <= 1 for q in self.quantiles):
+            raise ValueError("Quantiles must be between 0 and 1")
+        self.window_size = window_size
+        super().__init__(name, help_text, labels, sharded)
+    
+    def _new_child(self, key: Tuple[Any, ...]) -> SummaryChild:
+        return SummaryChild(self.quantiles, self.window_size, self.label_names, key, self.sharded)
+    
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Observe a value.
+        
+        Args:
+            value: Value to observe
+            **labels: Label values
+        """
+        self._child_for(labels).observe(value)
+    
+    def get_stats(self, **labels: str) -> Dict[str, Any]:
+        """
+        Get summary statistics.
+        
+        Args:
+            **labels: Label values
             
-            return {
-                'count': count,
-                'sum': sum_value,
-                'average': avg,
-                'buckets': dict(zip(
-                    [*self.buckets, float('inf')],
-                    bucket_counts
-                ))
-            }
+        Returns:
+            Dict with count, sum and quantiles
+        """
+        return self._stats(self._existing_child(labels))
     
-    def _validate_labels(self, labels: Dict[str, str]) -> Tuple[str, ...]:
-        """Validate and order labels."""
-        if set(labels.keys()) != set(self.label_names):
-            raise ValueError(f"Expected labels {self.label_names}, got {list(labels.keys())}")
-        return tuple(labels[name] for name in self.label_names)
+    def _stats(self, child: Optional[SummaryChild]) -> Dict[str, Any]:
+        if child is None:
+            values, count, sum_value = [math.nan] * len(self.quantiles), 0, 0.0
+        else:
+            values, count, sum_value = child.snapshot()
+        return {
+            'count': count,
+            'sum': sum_value,
+            'quantiles': dict(zip(self.quantiles, values)),
+        }
     
     def collect(self) -> List[Tuple[Dict[str, str], Dict[str, Any]]]:
         """
-        Collect all histogram data for export.
+        Collect all summary data for export.
         
         Returns:
             List of (label_dict, stats_dict) tuples
         """
-        with self._lock:
-            results = []
-            for label_values in self._count.keys():
-                label_dict = dict(zip(self.label_names, label_values))
-                stats = self.get_stats(**label_dict)
-                results.append((label_dict, stats))
-            return results
+        return [(label_dict, self._stats(child)) for label_dict, child in self.children()]
 
 
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
 class MetricsRegistry:
     """
     Central registry for all metrics.
@@ -330,12 +703,14 @@ class MetricsRegistry:
         self._counters: Dict[str, Counter] = {}
         self._gauges: Dict[str, Gauge] = {}
         self._histograms: Dict[str, Histogram] = {}
+        self._summaries: Dict[str, Summary] = {}
     
     def counter(
         self,
         name: str,
         help_text: str,
-        labels: Optional[List[str]] = None
+        labels: Optional[List[str]] = None,
+        sharded: bool = False
     ) -> Counter:
         """
         Get or create counter metric.
@@ -344,13 +719,14 @@ class MetricsRegistry:
             name: Metric name
             help_text: Description
             labels: Label names
+            sharded: Per-thread cells
             
         Returns:
             Counter instance
         """
         with self._lock:
             if name not in self._counters:
-                self._counters[name] = Counter(name, help_text, labels)
+                self._counters[name] = Counter(name, help_text, labels, sharded)
             return self._counters[name]
     
     def gauge(
@@ -380,7 +756,8 @@ class MetricsRegistry:
         name: str,
         help_text: str,
         labels: Optional[List[str]] = None,
-        buckets: Optional[List[float]] = None
+        buckets: Optional[List[float]] = None,
+        sharded: bool = False
     ) -> Histogram:
         """
         Get or create histogram metric.
@@ -390,15 +767,44 @@ class MetricsRegistry:
             help_text: Description
             labels: Label names
             buckets: Bucket boundaries
+            sharded: Per-thread state
             
         Returns:
             Histogram instance
         """
         with self._lock:
             if name not in self._histograms:
-                self._histograms[name] = Histogram(name, help_text, labels, buckets)
+                self._histograms[name] = Histogram(name, help_text, labels, buckets, sharded)
             return self._histograms[name]
     
+    def summary(
+        self,
+        name: str,
+        help_text: str,
+        labels: Optional[List[str]] = None,
+        quantiles: Optional[Sequence[float]] = None,
+        window_size: int = 1024,
+        sharded: bool = False
+    ) -> Summary:
+        """
+        Get or create summary metric.
+        
+        Args:
+            name: Metric name
+            help_text: Description
+            labels: Label names
+            quantiles: Quantiles to report
+            window_size: Most recent observations used for quantiles
+            sharded: Per-thread state
+            
+        Returns:
+            Summary instance
+        """
+        with self._lock:
+            if name not in self._summaries:
+                self._summaries[name] = Summary(name, help_text, labels, quantiles, window_size, sharded)
+            return self._summaries[name]
+    
     def collect_all(self) -> Dict[str, Any]:
         """
         Collect all metrics for export.
@@ -409,7 +815,7 @@ class MetricsRegistry:
         result = {}
         
         # Collect counters
-        for name, counter in self._counters.items():
+        for name, counter in list(self._counters.items()):
             result[name] = {
                 'type': 'counter',
                 'help': counter.help_text,
@@ -417,7 +823,7 @@ class MetricsRegistry:
             }
         
         # Collect gauges
-        for name, gauge in self._gauges.items():
+        for name, gauge in list(self._gauges.items()):
             result[name] = {
                 'type': 'gauge',
                 'help': gauge.help_text,
@@ -425,7 +831,7 @@ class MetricsRegistry:
             }
         
         # Collect histograms
-        for name, histogram in self._histograms.items():
+        for name, histogram in list(self._histograms.items()):
             result[name] = {
                 'type': 'histogram',
                 'help': histogram.help_text,
@@ -433,6 +839,15 @@ class MetricsRegistry:
                 'values': histogram.collect()
             }
         
+        # Collect summaries
+        for name, summary in list(self._summaries.items()):
+            result[name] = {
+                'type': 'summary',
+                'help': summary.help_text,
+                'quantiles': list(summary.quantiles),
+                'values': summary.collect()
+            }
+        
         return result
     
     def export_prometheus(self) -> str:
@@ -443,46 +858,49 @@ class MetricsRegistry:
             Prometheus-formatted metrics string
         """
         lines = []
+        append = lines.append
         
         # Export counters
-        for name, counter in self._counters.items():
-            lines.append(f"# HELP {name} {counter.help_text}")
-            lines.append(f"# TYPE {name} counter")
-            for label_dict, value in counter.collect():
-                label_str = self._format_labels(label_dict)
-                lines.append(f"{name}{label_str} {value}")
+        for name, counter in list(self._counters.items()):
+            append(f"# HELP {name} {counter.help_text}")
+            append(f"# TYPE {name} counter")
+            for _, child in counter.children():
+                append(f"{name}{child.label_str} {child.get()}")
         
         # Export gauges
-        for name, gauge in self._gauges.items():
-            lines.append(f"# HELP {name} {gauge.help_text}")
-            lines.append(f"# TYPE {name} gauge")
-            for label_dict, value in gauge.collect():
-                label_str = self._format_labels(label_dict)
-                lines.append(f"{name}{label_str} {value}")
+        for name, gauge in list(self._gauges.items()):
+            append(f"# HELP {name} {gauge.help_text}")
+            append(f"# TYPE {name} gauge")
+            for _, child in gauge.children():
+                append(f"{name}{child.label_str} {child.get()}")
         
         # Export histograms
-        for name, histogram in self._histograms.items():
-            lines.append(f"# HELP {name} {histogram.help_text}")
-            lines.append(f"# TYPE {name} histogram")
-            for label_dict, stats in histogram.collect():
-                label_str = self._format_labels(label_dict)
-                # Export buckets
-                for bucket, count in stats['buckets'].items():
-                    bucket_label = dict(label_dict, le=str(bucket))
-                    bucket_str = self._format_labels(bucket_label)
-                    lines.append(f"{name}_bucket{bucket_str} {count}")
-                # Export sum and count
-                lines.append(f"{name}_sum{label_str} {stats['sum']}")
-                lines.append(f"{name}_count{label_str} {stats['count']}")
+        for name, histogram in list(self._histograms.items()):
+            append(f"# HELP {name} {histogram.help_text}")
+            append(f"# TYPE {name} histogram")
+            for _, child in histogram.children():
+                cumulative, sum_value = child.snapshot()
+                for label_str, count in zip(child.bucket_label_strs, cumulative):
+                    append(f"{name}_bucket{label_str} {count}")
+                append(f"{name}_sum{child.label_str} {sum_value}")
+                append(f"{name}_count{child.label_str} {cumulative[-1]}")
+        
+        # Export summaries
+        for name, summary in list(self._summaries.items()):
+            append(f"# HELP {name} {summary.help_text}")
+            append(f"# TYPE {name} summary")
+            for _, child in summary.children():
+                values, count, sum_value = child.snapshot()
+                for label_str, value in zip(child.quantile_label_strs, values):
+                    append(f"{name}{label_str} {value}")
+                append(f"{name}_sum{child.label_str} {sum_value}")
+                append(f"{name}_count{child.label_str} {count}")
         
         return '\n'.join(lines) + '\n'
     
     def _format_labels(self, labels: Dict[str, str]) -> str:
         """Format labels for Prometheus output."""
-        if not labels:
-            return ""
-        label_pairs = [f'{k}="{v}"' for k, v in labels.items()]
-        return "{" + ",".join(label_pairs) + "}"
+        return _render_labels(list(labels.keys()), list(labels.values()))
 
 
 # Global registry instance
@@ -503,9 +921,14 @@ def get_registry() -> MetricsRegistry:
 
 
 # Convenience functions for common metrics
-def counter(name: str, help_text: str, labels: Optional[List[str]] = None) -> Counter:
+def counter(
+    name: str,
+    help_text: str,
+    labels: Optional[List[str]] = None,
+    sharded: bool = False
+) -> Counter:
     """Get or create counter from global registry."""
-    return get_registry().counter(name, help_text, labels)
+    return get_registry().counter(name, help_text, labels, sharded)
 
 
 def gauge(name: str, help_text: str, labels: Optional[List[str]] = None) -> Gauge:
@@ -517,10 +940,23 @@ def histogram(
     name: str,
     help_text: str,
     labels: Optional[List[str]] = None,
-    buckets: Optional[List[float]] = None
+    buckets: Optional[List[float]] = None,
+    sharded: bool = False
 ) -> Histogram:
     """Get or create histogram from global registry."""
-    return get_registry().histogram(name, help_text, labels, buckets)
+    return get_registry().histogram(name, help_text, labels, buckets, sharded)
+
+
+def summary(
+    name: str,
+    help_text: str,
+    labels: Optional[List[str]] = None,
+    quantiles: Optional[Sequence[float]] = None,
+    window_size: int = 1024,
+    sharded: bool = False
+) -> Summary:
+    """Get or create summary from global registry."""
+    return get_registry().summary(name, help_text, labels, quantiles, window_size, sharded)
 
 
 # Standard application metrics
@@ -11,19 +11,40 @@ Optional: Can be enabled in production for detailed observability.
 
 @.architecture
 Incoming: app.py, @trace decorated functions, api/dependencies.py --- {str trace_id, str span_name, SpanKind enum, Dict[str, Any] attributes}
-Processing: create_span(), start_span(), SpanContext.__enter__/__exit__(), trace(), export_traces_json() --- {5 jobs: context_management, span_creation, span_recording, trace_export, tracing}
-Outgoing: Future observability backends, Decorated functions --- {Span, SpanContext, list[Dict[str, Any]] trace data, trace_id context var}
+Processing: create_span(), start_span(), SpanContext.__enter__/__exit__(), _record_span(), trace(), configure_tracer(), export_traces_json(), export_traces_otlp() --- {9 jobs: batch_export, context_management, head_sampling, span_creation, span_indexing, span_recording, tail_sampling, trace_export, tracing}
+Outgoing: OTLP-JSON lines file (collector stand-in), api/*, Decorated functions --- {Span, SpanContext, list[Dict[str, Any]] trace data, OTLP ExportTraceServiceRequest JSON, trace_id context var}
+
+Production Features:
+- Finished spans kept in a fixed-capacity ring buffer (oldest evicted)
+- Per-trace index: get_spans(trace_id) does not scan the buffer
+- Head sampling: trace-ID ratio decided when a trace's first span starts,
+  identical for every span of the trace
+- Tail sampling: spans are held until the trace's root span finishes, then
+  kept if any span errored or the root was slow (even if head sampling
+  said no); pending traces are bounded
+- Batched background exporter writing OTLP-JSON lines; export never
+  blocks the traced code (spans are dropped and counted when the queue
+  is full)
 """
 
+import asyncio
+import json
+import logging
+import queue
+import threading
 import time
 import functools
-from typing import Any, Callable, Optional, Dict
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Deque, List, Optional, Dict, Union
 from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import uuid
 
+logger = logging.getLogger(__name__)
+
 
 class SpanKind(str, Enum):
     """Span kinds following OpenTelemetry conventions."""
@@ -58,6 +79,7 @@ class Span:
         status: Span status
         attributes: Span attributes (tags)
         events: Span events (logs within span)
+        sampled: Head sampling decision for the span's trace
     """
     trace_id: str
     span_id: str
@@ -70,6 +92,7 @@ class Span:
     status: SpanStatus = SpanStatus.UNSET
     attributes: Dict[str, Any] = field(default_factory=dict)
     events: list = field(default_factory=list)
+    sampled: bool = True
     
     def set_attribute(self, key: str, value: Any) -> None:
         """Set span attribute."""
@@ -101,23 +124,314 @@ current_span_ctx: ContextVar[Optional[Span]] = ContextVar('current_span', defaul
 trace_id_ctx: ContextVar[Optional[str]] = ContextVar('trace_id', default=None)
 
 
+# ============================================================================
+# SAMPLING
+# ============================================================================
+
+class Sampler:
+    """Head sampler: decides whether a trace is recorded when it starts."""
+    
+    def should_sample(self, trace_id: str, name: str) -> bool:
+        """
+        Decide whether to sample a new trace.
+        
+        Args:
+            trace_id: Trace identifier
+            name: Name of the trace's first span
+            
+        Returns:
+            True to record the trace
+        """
+        return True
+
+
+class AlwaysOnSampler(Sampler):
+    """Sample every trace."""
+
+
+class TraceIdRatioSampler(Sampler):
+    """
+    Sample a fixed fraction of traces.
+    
+    The decision is derived from the trace ID, so spans of the same trace
+    agree even when they have no parent span in the current context.
+    """
+    
+    def __init__(self, ratio: float):
+        """
+        Initialize sampler.
+        
+        Args:
+            ratio: Fraction of traces to sample (0-1)
+        """
+        if not 0.0 <= ratio <= 1.0:
+            raise ValueError("Sampling ratio must be between 0 and 1")
+        self.ratio = ratio
+        self._threshold = int(ratio * (1 << 64))
+    
+    def should_sample(self, trace_id: str, name: str) -> bool:
+        try:
+            # Leading digits: in uuid4 hex the trailing half starts with fixed variant bits
+            return int(trace_id[:16], 16) < self._threshold
+        except ValueError:
+            # Non-hex trace IDs (e.g. set by callers) fall back to hashing
+            return (hash(trace_id) & 0xFFFFFFFFFFFFFFFF) < self._threshold
+
+
+class TailSamplingPolicy:
+    """
+    Tail sampling: keep traces by outcome once their root span finishes.
+    
+    Traces head sampling dropped are still kept when they contain an
+    error or the root span exceeded the latency threshold.
+    """
+    
+    def __init__(
+        self,
+        latency_threshold_ms: Optional[float] = None,
+        keep_errors: bool = True,
+        max_pending_traces: int = 1000
+    ):
+        """
+        Initialize policy.
+        
+        Args:
+            latency_threshold_ms: Keep traces whose root span took at least this long
+            keep_errors: Keep traces containing an errored span
+            max_pending_traces: Unfinished traces held in memory; the oldest
+                is decided early when exceeded
+        """
+        self.latency_threshold_ms = latency_threshold_ms
+        self.keep_errors = keep_errors
+        self.max_pending_traces = max_pending_traces
+    
+    def should_keep(self, spans: List[Span]) -> bool:
+        """
+        Decide whether to keep a finished trace.
+        
+        Args:
+            spans: Finished spans of the trace
+            
+        Returns:
+            True to record the trace
+        """
+        if self.keep_errors and any(s.status == SpanStatus.ERROR for s in spans):
+            return True
+        if self.latency_threshold_ms is not None:
+            return any(
+                s.parent_span_id is None and (s.duration_ms or 0) >= self.latency_threshold_ms
+                for s in spans
+            )
+        return False
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+_FLUSH_TIMEOUT = 5.0
+_STOP = object()
+
+
+class OTLPFileExporter:
+    """
+    Batched background exporter writing OTLP-JSON lines.
+    
+    Each line is one OTLP ExportTraceServiceRequest (JSON encoding), the
+    format the OpenTelemetry collector's file exporter and receiver use,
+    so the file can be replayed into a collector later.
+    
+    A daemon thread drains the queue; export() only enqueues, so spans
+    finished on the event loop or in worker threads never wait on disk.
+    """
+    
+    def __init__(
+        self,
+        path: Union[str, Path],
+        service_name: str = "aether-backend",
+        batch_size: int = 512,
+        flush_interval: float = 5.0,
+        max_queue_size: int = 10000
+    ):
+        """
+        Initialize exporter.
+        
+        Args:
+            path: OTLP-JSON lines file (appended to; parent directories created)
+            service_name: service.name resource attribute
+            batch_size: Spans per written line
+            flush_interval: Seconds before a partial batch is written
+            max_queue_size: Spans buffered before new ones are dropped
+        """
+        self.path = Path(path)
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._exported = 0
+        self._dropped = 0
+        self._failed = 0
+    
+    def start(self) -> None:
+        """Start the writer thread (also started by the first export)."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="otlp-file-exporter", daemon=True
+                )
+                self._thread.start()
+    
+    def export(self, spans: List[Span]) -> None:
+        """
+        Queue spans for export without blocking.
+        
+        Args:
+            spans: Finished spans
+        """
+        if self._thread is None:
+            self.start()
+        for span in spans:
+            try:
+                self._queue.put_nowait(span)
+            except queue.Full:
+                self._dropped += 1
+    
+    def flush(self, timeout: float = _FLUSH_TIMEOUT) -> bool:
+        """
+        Write everything queued so far.
+        
+        Args:
+            timeout: Seconds to wait
+            
+        Returns:
+            True if the queue was written within the timeout
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        done = threading.Event()
+        try:
+            self._queue.put(done, timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout)
+    
+    def shutdown(self, timeout: float = _FLUSH_TIMEOUT) -> None:
+        """
+        Write queued spans and stop the writer thread.
+        
+        Args:
+            timeout: Seconds to wait for the final write
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Trace export queue full at shutdown; pending spans dropped")
+            return
+        self._thread.join(timeout)
+        self._thread = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get exporter statistics.
+        
+        Returns:
+            Dict with exported, dropped, failed and queued span counts
+        """
+        return {
+            'path': str(self.path),
+            'exported': self._exported,
+            'dropped': self._dropped,
+            'failed': self._failed,
+            'queued': self._queue.qsize(),
+        }
+    
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            
+            if isinstance(item, Span):
+                batch.append(item)
+                if len(batch) < self.batch_size and time.monotonic() < deadline:
+                    continue
+            
+            # Full batch, interval elapsed, flush request or shutdown
+            if batch:
+                self._write(batch)
+                batch = []
+            deadline = time.monotonic() + self.flush_interval
+            
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+    
+    def _write(self, batch: List[Span]) -> None:
+        try:
+            line = json.dumps(export_traces_otlp(batch, self.service_name), default=str)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open('a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self._exported += len(batch)
+        except Exception as e:
+            self._failed += len(batch)
+            logger.error(f"Failed to export {len(batch)} spans to {self.path}: {e}")
+
+
+# ============================================================================
+# TRACER
+# ============================================================================
+
 class Tracer:
     """
     Lightweight tracer for distributed tracing.
     
     Provides context managers and decorators for tracing operations.
+    Finished spans are kept in a bounded ring buffer indexed by trace ID
+    and optionally handed to an exporter.
     """
     
-    def __init__(self, service_name: str = "aether-backend"):
+    DEFAULT_CAPACITY = 10000
+    
+    def __init__(
+        self,
+        service_name: str = "aether-backend",
+        capacity: int = DEFAULT_CAPACITY,
+        sampler: Optional[Sampler] = None,
+        tail_policy: Optional[TailSamplingPolicy] = None,
+        exporter: Optional[OTLPFileExporter] = None
+    ):
         """
         Initialize tracer.
         
         Args:
             service_name: Service name for traces
+            capacity: Finished spans kept in memory (oldest evicted)
+            sampler: Head sampler (default: sample everything)
+            tail_policy: Tail sampling policy (default: head decision only)
+            exporter: Exporter receiving recorded spans
         """
         self.service_name = service_name
-        self._spans: list[Span] = []
+        self.capacity = capacity
+        self.sampler = sampler or AlwaysOnSampler()
+        self.tail_policy = tail_policy
+        self.exporter = exporter
+        self._spans: Deque[Span] = deque()
+        self._index: Dict[str, Deque[Span]] = {}
+        self._pending: "OrderedDict[str, List[Span]]" = OrderedDict()
+        self._lock = threading.Lock()
         self._enabled = True
+        self._recorded = 0
+        self._evicted = 0
+        self._sampled_out = 0
     
     def create_span(
         self,
@@ -142,9 +456,14 @@ class Tracer:
             trace_id = self._generate_trace_id()
             trace_id_ctx.set(trace_id)
         
-        # Get parent span if exists
+        # Get parent span if exists; children inherit its sampling decision
         parent_span = current_span_ctx.get()
-        parent_span_id = parent_span.span_id if parent_span else None
+        if parent_span is not None:
+            parent_span_id = parent_span.span_id
+            sampled = parent_span.sampled
+        else:
+            parent_span_id = None
+            sampled = self.sampler.should_sample(trace_id, name)
         
         # Create span
         span = Span(
@@ -153,7 +472,8 @@ class Tracer:
             parent_span_id=parent_span_id,
             name=name,
             kind=kind,
-            attributes=attributes or {}
+            attributes=attributes or {},
+            sampled=sampled
         )
         
         # Add service name
@@ -182,9 +502,56 @@ class Tracer:
         return SpanContext(span, self)
     
     def _record_span(self, span: Span) -> None:
-        """Record completed span."""
-        if self._enabled:
-            self._spans.append(span)
+        """Record completed span (subject to sampling)."""
+        if not self._enabled:
+            return
+        
+        if self.tail_policy is None:
+            if span.sampled:
+                self._store([span])
+            else:
+                self._sampled_out += 1
+            return
+        
+        # Tail sampling: hold spans until the trace's root span finishes
+        decided: List[List[Span]] = []
+        with self._lock:
+            pending = self._pending.get(span.trace_id)
+            if pending is None:
+                pending = self._pending[span.trace_id] = []
+            pending.append(span)
+            if span.parent_span_id is None:
+                decided.append(self._pending.pop(span.trace_id))
+            while len(self._pending) > self.tail_policy.max_pending_traces:
+                decided.append(self._pending.popitem(last=False)[1])
+        
+        for spans in decided:
+            if any(s.sampled for s in spans) or self.tail_policy.should_keep(spans):
+                self._store(spans)
+            else:
+                self._sampled_out += len(spans)
+    
+    def _store(self, spans: List[Span]) -> None:
+        """Add spans to the ring buffer and trace index, then export."""
+        with self._lock:
+            for span in spans:
+                if len(self._spans) >= self.capacity:
+                    oldest = self._spans.popleft()
+                    # Spans are indexed in recording order, so it is first in its trace
+                    trace_spans = self._index[oldest.trace_id]
+                    trace_spans.popleft()
+                    if not trace_spans:
+                        del self._index[oldest.trace_id]
+                    self._evicted += 1
+                self._spans.append(span)
+                trace_spans = self._index.get(span.trace_id)
+                if trace_spans is None:
+                    trace_spans = self._index[span.trace_id] = deque()
+                trace_spans.append(span)
+            self._recorded += len(spans)
+        
+        if self.exporter is not None:
+            self.exporter.export(spans)
     
     def get_spans(self, trace_id: Optional[str] = None) -> list[Span]:
         """
@@ -196,13 +563,44 @@ class Tracer:
         Returns:
             List of spans
         """
-        if trace_id:
-            return [s for s in self._spans if s.trace_id == trace_id]
-        return self._spans.copy()
+        with self._lock:
+            if trace_id:
+                return list(self._index.get(trace_id, ()))
+            return list(self._spans)
     
     def clear_spans(self) -> None:
         """Clear recorded spans."""
-        self._spans.clear()
+        with self._lock:
+            self._spans.clear()
+            self._index.clear()
+            self._pending.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get tracer statistics.
+        
+        Returns:
+            Dict with buffer usage, sampling and export counters
+        """
+        with self._lock:
+            stats = {
+                'enabled': self._enabled,
+                'capacity': self.capacity,
+                'buffered_spans': len(self._spans),
+                'buffered_traces': len(self._index),
+                'pending_traces': len(self._pending),
+                'recorded': self._recorded,
+                'evicted': self._evicted,
+                'sampled_out': self._sampled_out,
+            }
+        if self.exporter is not None:
+            stats['exporter'] = self.exporter.get_stats()
+        return stats
+    
+    def shutdown(self) -> None:
+        """Flush the exporter and stop its writer thread."""
+        if self.exporter is not None:
+            self.exporter.shutdown()
     
     def enable(self) -> None:
         """Enable tracing."""
@@ -344,6 +742,55 @@ def get_tracer(service_name: str = "aether-backend") -> Tracer:
     return _global_tracer
 
 
+def configure_tracer(
+    service_name: str = "aether-backend",
+    capacity: int = Tracer.DEFAULT_CAPACITY,
+    sample_ratio: float = 1.0,
+    tail_latency_ms: Optional[float] = None,
+    tail_keep_errors: bool = True,
+    export_path: Optional[Union[str, Path]] = None,
+    enabled: bool = True
+) -> Tracer:
+    """
+    Replace the global tracer.
+    
+    Args:
+        service_name: Service name
+        capacity: Finished spans kept in memory
+        sample_ratio: Fraction of traces sampled when they start
+        tail_latency_ms: Also keep unsampled traces whose root took this long
+        tail_keep_errors: Also keep unsampled traces containing an error
+        export_path: OTLP-JSON lines file (None = no export)
+        enabled: Record spans at all
+        
+    Returns:
+        The new global Tracer
+    """
+    global _global_tracer
+    
+    tail_policy = None
+    if sample_ratio < 1.0 and (tail_keep_errors or tail_latency_ms is not None):
+        tail_policy = TailSamplingPolicy(
+            latency_threshold_ms=tail_latency_ms,
+            keep_errors=tail_keep_errors
+        )
+    exporter = OTLPFileExporter(export_path, service_name) if export_path else None
+    
+    previous = _global_tracer
+    _global_tracer = Tracer(
+        service_name,
+        capacity=capacity,
+        sampler=TraceIdRatioSampler(sample_ratio) if sample_ratio < 1.0 else AlwaysOnSampler(),
+        tail_policy=tail_policy,
+        exporter=exporter
+    )
+    if not enabled:
+        _global_tracer.disable()
+    if previous is not None:
+        previous.shutdown()
+    return _global_tracer
+
+
 def get_current_span() -> Optional[Span]:
     """
     Get current span from context.
@@ -407,3 +854,85 @@ def export_traces_json(spans: list[Span]) -> list[Dict[str, Any]]:
         for span in spans
     ]
 
+
+# OTLP SpanKind / StatusCode enum values
+_OTLP_SPAN_KIND = {
+    SpanKind.INTERNAL: 1,
+    SpanKind.SERVER: 2,
+    SpanKind.CLIENT: 3,
+    SpanKind.PRODUCER: 4,
+    SpanKind.CONSUMER: 5,
+}
+_OTLP_STATUS_CODE = {
+    SpanStatus.UNSET: 0,
+    SpanStatus.OK: 1,
+    SpanStatus.ERROR: 2,
+}
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """Encode an attribute value as an OTLP AnyValue."""
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> list[Dict[str, Any]]:
+    return [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _unix_nano(timestamp: Optional[float]) -> str:
+    return str(int(timestamp * 1e9)) if timestamp is not None else "0"
+
+
+def export_traces_otlp(spans: list[Span], service_name: str = "aether-backend") -> Dict[str, Any]:
+    """
+    Export spans as an OTLP ExportTraceServiceRequest (JSON encoding).
+    
+    Args:
+        spans: List of spans to export
+        service_name: service.name resource attribute
+        
+    Returns:
+        Request dict with a single resourceSpans entry
+    """
+    otlp_spans = []
+    for span in spans:
+        status = {'code': _OTLP_STATUS_CODE[span.status]}
+        attributes = dict(span.attributes)
+        description = attributes.pop('status_description', None)
+        if description:
+            status['message'] = description
+        otlp_spans.append({
+            'traceId': span.trace_id,
+            'spanId': span.span_id,
+            'parentSpanId': span.parent_span_id or '',
+            'name': span.name,
+            'kind': _OTLP_SPAN_KIND[span.kind],
+            'startTimeUnixNano': _unix_nano(span.start_time),
+            'endTimeUnixNano': _unix_nano(span.end_time),
+            'attributes': _otlp_attributes(attributes),
+            'events': [
+                {
+                    'timeUnixNano': _unix_nano(event['timestamp']),
+                    'name': event['name'],
+                    'attributes': _otlp_attributes(event.get('attributes') or {}),
+                }
+                for event in span.events
+            ],
+            'status': status,
+        })
+    
+    return {
+        'resourceSpans': [{
+            'resource': {'attributes': _otlp_attributes({'service.name': service_name})},
+            'scopeSpans': [{
+                'scope': {'name': 'aether-backend.monitoring.tracing'},
+                'spans': otlp_spans,
+            }],
+        }]
+    }
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Aether Backend - MCP Bridge Tool-Call Overhead Benchmark
+
+Measures the latency the MCP bridge adds to a tool call while many agent
+calls are in flight at once:
+- legacy:     the previous pattern, one run_coroutine_threadsafe hop for
+              the server lookup and another for the call
+- sync:       MCPBridge.execute() from agent worker threads
+- registered: computer.mcp_<server>_<tool>() executors (server resolved
+              at registration)
+- async:      MCPBridge.aexecute() awaited directly on the loop
+
+The MCP manager is an in-process fake whose tool takes a fixed time, so
+overhead = observed latency - tool time.
+
+@.architecture
+Incoming: Command line --- {CLI args: --calls, --concurrency, --tool-ms}
+Processing: FakeManager, legacy_execute(), run_threaded(), run_async(), main_async() --- {3 jobs: concurrency_driving, latency_measurement, mode_comparison}
+Outgoing: stdout --- {per-mode overhead table in microseconds}
+
+Usage:
+    python scripts/benchmark_mcp_bridge.py --calls 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.integrations.providers.mcp.bridge import MCPBridge
+
+SERVER_ID = uuid4()
+
+
+# =============================================================================
+# Fake Manager
+# =============================================================================
+
+class FakeManager:
+    """MCP manager stand-in with a fixed tool latency."""
+
+    def __init__(self, tool_seconds: float):
+        self.tool_seconds = tool_seconds
+        self.db = self
+
+    async def get_server_by_name(self, name):
+        return {"id": str(SERVER_ID)}
+
+    async def list_servers(self):
+        return [{
+            "id": SERVER_ID, "name": "bench", "display_name": "Bench",
+            "server_type": "local", "status": "running", "is_running": True,
+        }]
+
+    async def get_server_tools(self, server_id, refresh=False):
+        return [{"function": {"name": "echo", "description": "Echo", "parameters": {}}}]
+
+    async def execute_tool(self, server_id, tool_name, arguments, execution_context=None):
+        await asyncio.sleep(self.tool_seconds)
+        return {"success": True, "result": arguments, "duration_ms": 0}
+
+
+def legacy_execute(bridge: MCPBridge, loop: asyncio.AbstractEventLoop, **arguments):
+    """Previous bridge pattern: two blocking cross-thread hops per call."""
+    server_id = asyncio.run_coroutine_threadsafe(bridge._get_server_id("bench"), loop).result(5)
+    return asyncio.run_coroutine_threadsafe(
+        bridge._manager.execute_tool(server_id, "echo", arguments), loop
+    ).result(300)
+
+
+# =============================================================================
+# Drivers
+# =============================================================================
+
+async def run_threaded(call: Callable[[], object], calls: int, concurrency: int) -> List[float]:
+    """Run calls from a pool of agent threads; return per-call latencies."""
+    loop = asyncio.get_running_loop()
+
+    def timed():
+        start = time.perf_counter()
+        call()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return await asyncio.gather(*(loop.run_in_executor(pool, timed) for _ in range(calls)))
+
+
+async def run_async(bridge: MCPBridge, calls: int, concurrency: int) -> List[float]:
+    """Run aexecute() calls with bounded concurrency; return per-call latencies."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed():
+        async with semaphore:
+            start = time.perf_counter()
+            await bridge.aexecute("bench", "echo", value=1)
+            return time.perf_counter() - start
+
+    return await asyncio.gather(*(timed() for _ in range(calls)))
+
+
+def summarize(latencies: List[float], tool_seconds: float, wall: float) -> Dict[str, float]:
+    overhead = sorted((l - tool_seconds) * 1e6 for l in latencies)
+    return {
+        "mean_us": statistics.fmean(overhead),
+        "p50_us": overhead[len(overhead) // 2],
+        "p99_us": overhead[int(len(overhead) * 0.99) - 1],
+        "calls_per_s": len(latencies) / wall,
+    }
+
+
+async def main_async(calls: int, concurrency: int, tool_ms: float) -> None:
+    tool_seconds = tool_ms / 1000
+    computer = SimpleNamespace()
+    bridge = MCPBridge(SimpleNamespace(computer=computer), FakeManager(tool_seconds))
+    bridge.install()
+    await bridge._register_dynamic_tools_async()
+    loop = asyncio.get_running_loop()
+
+    modes = {
+        "legacy": lambda: run_threaded(lambda: legacy_execute(bridge, loop, value=1), calls, concurrency),
+        "sync": lambda: run_threaded(lambda: bridge.execute("bench", "echo", value=1), calls, concurrency),
+        "registered": lambda: run_threaded(lambda: computer.mcp_bench_echo(value=1), calls, concurrency),
+        "async": lambda: run_async(bridge, calls, concurrency),
+    }
+
+    print(f"{calls} calls, {concurrency} concurrent, tool time {tool_ms} ms")
+    print(f"{'mode':<11} {'mean µs':>10} {'p50 µs':>10} {'p99 µs':>10} {'calls/s':>10}")
+    for name, run in modes.items():
+        start = time.perf_counter()
+        latencies = await run()
+        stats = summarize(latencies, tool_seconds, time.perf_counter() - start)
+        print(
+            f"{name:<11} {stats['mean_us']:>10.1f} {stats['p50_us']:>10.1f} "
+            f"{stats['p99_us']:>10.1f} {stats['calls_per_s']:>10.0f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MCP bridge tool-call overhead benchmark")
+    parser.add_argument("--calls", type=int, default=2000, help="Tool calls per mode")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent agent calls")
+    parser.add_argument("--tool-ms", type=float, default=5.0, help="Simulated tool latency")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.calls, args.concurrency, args.tool_ms))
+
+
+if __name__ == "__main__":
+    main()
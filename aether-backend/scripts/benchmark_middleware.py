@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Aether Backend - Middleware Overhead Micro-Benchmark
+
+Measures per-request latency added by the HTTP middleware stack:
+- bare:   the application with no middleware
+- legacy: the previous BaseHTTPMiddleware chain (error handler, rate
+          limiter, security headers), reproduced here for comparison
+- asgi:   the current pure-ASGI middlewares from api/middleware
+
+Requests are driven straight through the ASGI interface (no sockets), so
+the numbers isolate middleware cost. The streaming case also reports when
+the first body chunk reaches the server relative to the last one.
+
+@.architecture
+Incoming: Command line --- {CLI args: --requests, --chunks}
+Processing: build_app(), build_stacks(), run_request(), benchmark(), main() --- {3 jobs: asgi_driving, latency_measurement, stack_comparison}
+Outgoing: stdout --- {per-stack latency table in microseconds}
+
+Usage:
+    python scripts/benchmark_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from api.middleware import (
+    ErrorHandlerConfig,
+    ErrorHandlerMiddleware,
+    RateLimiterMiddleware,
+    SecurityHeadersConfig,
+    SecurityHeadersMiddleware,
+)
+
+
+# =============================================================================
+# Application
+# =============================================================================
+
+def build_app(chunks: int) -> Starlette:
+    """Minimal app with a plain and a streaming endpoint."""
+
+    async def ping(request):
+        return PlainTextResponse("pong")
+
+    async def stream(request):
+        async def body():
+            for _ in range(chunks):
+                yield b"x" * 1024
+                await asyncio.sleep(0)
+        return StreamingResponse(body(), media_type="application/octet-stream")
+
+    return Starlette(routes=[Route("/ping", ping), Route("/stream", stream)])
+
+
+# =============================================================================
+# Legacy BaseHTTPMiddleware Chain (previous implementation)
+# =============================================================================
+
+class LegacySecurityHeaders(BaseHTTPMiddleware):
+    def __init__(self, app, config: SecurityHeadersConfig):
+        super().__init__(app)
+        self.config = config
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        # Header values were rebuilt on every request
+        for name, value in self.config.build_raw_headers():
+            response.headers[name.decode()] = value.decode()
+        return response
+
+
+class LegacyRateLimiter(BaseHTTPMiddleware):
+    def __init__(self, app):
+        super().__init__(app)
+        from security.rate_limit import get_rate_limiter
+        self._limiter = get_rate_limiter()
+
+    async def dispatch(self, request, call_next):
+        client_id = request.headers.get("X-Forwarded-For", "unknown")
+        await self._limiter.check_rate_limit(client_id, "api_default")
+        info = await self._limiter.get_limit_info(client_id, "api_default")
+        response = await call_next(request)
+        response.headers["X-RateLimit-Limit"] = str(info["limit"])
+        response.headers["X-RateLimit-Remaining"] = str(info["remaining"])
+        response.headers["X-RateLimit-Reset"] = str(info["reset"])
+        return response
+
+
+class LegacyErrorHandler(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        try:
+            return await call_next(request)
+        except Exception as e:
+            return JSONResponse({"error": {"code": 500, "message": str(e)}}, status_code=500)
+
+
+def build_stacks(chunks: int) -> Dict[str, Any]:
+    """Build the three application variants (outermost middleware last)."""
+    config = SecurityHeadersConfig()
+
+    legacy = build_app(chunks)
+    legacy.add_middleware(LegacySecurityHeaders, config=config)
+    legacy.add_middleware(LegacyRateLimiter)
+    legacy.add_middleware(LegacyErrorHandler)
+
+    current = build_app(chunks)
+    current.add_middleware(SecurityHeadersMiddleware, config=config)
+    current.add_middleware(RateLimiterMiddleware, enabled=True)
+    current.add_middleware(ErrorHandlerMiddleware, config=ErrorHandlerConfig())
+
+    return {"bare": build_app(chunks), "legacy": legacy, "asgi": current}
+
+
+# =============================================================================
+# ASGI Driver
+# =============================================================================
+
+async def run_request(app: Callable, path: str, client: str) -> Tuple[float, float]:
+    """
+    Send one GET request through the ASGI app.
+
+    Returns:
+        Tuple of (seconds to first body chunk, seconds to completion)
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"x-forwarded-for", client.encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # Client never disconnects
+
+    start = time.perf_counter()
+    first_chunk = None
+
+    async def send(message):
+        nonlocal first_chunk
+        if message["type"] == "http.response.body" and first_chunk is None and message.get("body"):
+            first_chunk = time.perf_counter() - start
+
+    await app(scope, receive, send)
+    total = time.perf_counter() - start
+    return (first_chunk if first_chunk is not None else total), total
+
+
+async def benchmark(app: Callable, path: str, requests: int) -> Dict[str, float]:
+    """Run sequential requests and return mean latencies in microseconds."""
+    # Warm up (route compilation, limiter buckets)
+    for i in range(min(200, requests)):
+        await run_request(app, path, f"warmup-{i}")
+
+    first_total = 0.0
+    total = 0.0
+    for i in range(requests):
+        # Spread clients so the rate limiter never rejects
+        first, elapsed = await run_request(app, path, f"client-{i // 10}")
+        first_total += first
+        total += elapsed
+    return {
+        "mean_us": total / requests * 1e6,
+        "first_chunk_us": first_total / requests * 1e6,
+    }
+
+
+async def main_async(requests: int, chunks: int) -> None:
+    stacks = build_stacks(chunks)
+    results: List[Tuple[str, str, Dict[str, float]]] = []
+    for path in ("/ping", "/stream"):
+        for name, app in stacks.items():
+            results.append((path, name, await benchmark(app, path, requests)))
+
+    print(f"{'path':<8} {'stack':<8} {'mean µs':>10} {'overhead µs':>12} {'first chunk µs':>15}")
+    for path, name, stats in results:
+        bare = next(s for p, n, s in results if p == path and n == "bare")
+        overhead = stats["mean_us"] - bare["mean_us"]
+        print(
+            f"{path:<8} {name:<8} {stats['mean_us']:>10.1f} {overhead:>12.1f} "
+            f"{stats['first_chunk_us']:>15.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Middleware overhead micro-benchmark")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per stack and path")
+    parser.add_argument("--chunks", type=int, default=64, help="Chunks per streaming response")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests, args.chunks))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ from __future__ import annotations
 __all__ = ["ExpireCacheCfg", "ExpireCacheStats", "ExpireCache", "ExpireCacheSQLite"]
 
 import abc
-from collections.abc import Iterator
+import atexit
+from collections.abc import Iterable, Iterator
 import dataclasses
 import datetime
 import hashlib
@@ -20,8 +21,10 @@ import pickle
 import sqlite3
 import string
 import tempfile
+import threading
 import time
 import typing
+import weakref
 
 import msgspec
 
@@ -57,13 +60,27 @@ class ExpireCacheCfg(msgspec.Struct):  # pylint: disable=too-few-public-methods
 
     ``auto``:
       Maintenance is carried out automatically as part of the maintenance
-      intervals (:py:obj:`MAINTENANCE_PERIOD`); no external process is required.
+      intervals (:py:obj:`MAINTENANCE_PERIOD`) by a background thread; no
+      external process is required.
 
     ``off``:
       Maintenance is switched off and must be carried out by an external process
       if required.
     """
 
+    MAINTENANCE_BATCH: int = 1000
+    """Max number of expired values the maintenance deletes in one transaction;
+    the DB is not locked for the whole maintenance."""
+
+    WRITE_BUFFER_SIZE: int = 100
+    """Number of values :py:obj:`ExpireCacheSQLite.set` keeps in memory before
+    they are written to the DB (*write-behind*).  The values are written in one
+    transaction by a background thread.  ``0`` writes each value immediately."""
+
+    WRITE_BUFFER_DELAY: float = 1.0
+    """Seconds after which buffered values are written to the DB at the latest;
+    until then other processes sharing the DB don't see them."""
+
     password: bytes = get_setting("server.secret_key").encode()  # type: ignore
     """Password used by :py:obj:`ExpireCache.secret_hash`.
 
@@ -151,6 +168,28 @@ class ExpireCache(abc.ABC):
     def get(self, key: str, default=None, ctx: str | None = None) -> typing.Any:
         """Return *value* of *key*.  If key is unset, ``None`` is returned."""
 
+    def set_many(
+        self,
+        items: dict[str, typing.Any] | Iterable[tuple[str, typing.Any]],
+        expire: int | None,
+        ctx: str | None = None,
+    ) -> bool:
+        """Set several key/value pairs, see :py:obj:`ExpireCache.set`.  Returns
+        ``False`` if a value could not be set."""
+        items = items.items() if isinstance(items, dict) else items
+        return all([self.set(key, value, expire, ctx=ctx) for key, value in items])
+
+    def get_many(self, keys: Iterable[str], ctx: str | None = None) -> dict[str, typing.Any]:
+        """Return the values of the ``keys`` that are in the cache
+        (``{key: value}``)."""
+        missing = object()
+        values = {}
+        for key in keys:
+            value = self.get(key, default=missing, ctx=ctx)
+            if value is not missing:
+                values[key] = value
+        return values
+
     @abc.abstractmethod
     def maintenance(self, force: bool = False, truncate: bool = False) -> bool:
         """Performs maintenance on the cache.
@@ -209,6 +248,18 @@ class ExpireCache(abc.ABC):
         return m.hexdigest()
 
 
+_BUFFERED_CACHES: weakref.WeakSet[ExpireCacheSQLite] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_caches():
+    for cache in list(_BUFFERED_CACHES):
+        try:
+            cache.flush()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+
 class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
     """Cache that manages key/value pairs in a SQLite DB.  The DB model in the
     SQLite DB is implemented in abstract class :py:obj:`SQLiteAppl
@@ -220,6 +271,15 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
     - :py:obj:`ExpireCacheCfg.MAXHOLD_TIME`
     - :py:obj:`ExpireCacheCfg.MAINTENANCE_PERIOD`
     - :py:obj:`ExpireCacheCfg.MAINTENANCE_MODE`
+    - :py:obj:`ExpireCacheCfg.MAINTENANCE_BATCH`
+    - :py:obj:`ExpireCacheCfg.WRITE_BUFFER_SIZE`
+    - :py:obj:`ExpireCacheCfg.WRITE_BUFFER_DELAY`
+
+    Writing the buffered values and the maintenance is done by a
+    :py:obj:`background thread <searx.sqlitedb.BackgroundWorker>`, not in the
+    request that happens to hit the maintenance interval.  A DB in ``:memory:``
+    can't be shared with a thread, its values are written immediately and the
+    maintenance is done in the request.
     """
 
     DB_SCHEMA = 1
@@ -229,6 +289,9 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
 
     CACHE_TABLE_PREFIX = "CACHE-TABLE"
 
+    SQL_CHUNK_SIZE = 500
+    """Max number of keys in one ``SELECT .. WHERE key IN (..)``."""
+
     def __init__(self, cfg: ExpireCacheCfg):
         """An instance of the SQLite expire cache is build up from a
         :py:obj:`config <ExpireCacheCfg>`."""
@@ -238,6 +301,18 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
             log.critical("don't use SQLite DB in :memory: in production!!")
         super().__init__(cfg.db_url)
 
+        # write-behind buffer: {table: {key: (serialized value, expire)}}
+        self._buffer: dict[str, dict[str, tuple[bytes, int]]] = {}
+        self._flushing: dict[str, dict[str, tuple[bytes, int]]] = {}
+        self._buffer_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+        self.worker: sqlitedb.BackgroundWorker | None = None
+        if cfg.db_url != ":memory:":
+            interval = cfg.WRITE_BUFFER_DELAY if cfg.WRITE_BUFFER_SIZE else min(cfg.MAINTENANCE_PERIOD, 60)
+            self.worker = sqlitedb.BackgroundWorker(f"cache {cfg.name}", self._background_work, interval)
+            _BUFFERED_CACHES.add(self)
+
     def init(self, conn: sqlite3.Connection) -> bool:
         ret_val = super().init(conn)
         if not ret_val:
@@ -253,6 +328,18 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
 
         return True
 
+    def _background_work(self):
+        self.flush()
+        if self.cfg.MAINTENANCE_MODE == "auto":
+            self.maintenance()
+
+    def _auto_maintenance(self):
+        if self.worker is None:
+            self.maintenance()
+        else:
+            # maintenance and buffered writes are done in the background
+            self.worker.start()
+
     def maintenance(self, force: bool = False, truncate: bool = False) -> bool:
 
         if not force and int(time.time()) < self.next_maintenance_time:
@@ -267,13 +354,24 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
             self.truncate_tables(self.table_names)
             return True
 
-        # drop items by expire time stamp ..
+        # drop items by expire time stamp, MAINTENANCE_BATCH items per
+        # transaction (the connection is in autocommit mode) ..
         expire = int(time.time())
+        batch = self.cfg.MAINTENANCE_BATCH
 
         with self.connect() as conn:
             for table in self.table_names:
-                res = conn.execute(f"DELETE FROM {table} WHERE expire < ?", (expire,))
-                log.debug("deleted %s keys from table %s (expire date reached)", res.rowcount, table)
+                deleted = 0
+                while True:
+                    res = conn.execute(
+                        f"DELETE FROM {table} WHERE rowid IN"
+                        f" (SELECT rowid FROM {table} WHERE expire < ? LIMIT ?)",
+                        (expire, batch),
+                    )
+                    deleted += res.rowcount
+                    if res.rowcount < batch:
+                        break
+                log.debug("deleted %s keys from table %s (expire date reached)", deleted, table)
 
         # Vacuuming the WALs
         # https://www.theunterminatedstring.com/sqlite-vacuuming/
@@ -331,6 +429,72 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
 
         return self.cfg.MAINTENANCE_PERIOD + self.properties.m_time("LAST_MAINTENANCE", int(time.time()))
 
+    def _table_name(self, ctx: str | None) -> str:
+        return ctx or self.normalize_name(self.cfg.name)
+
+    def _write(self, table: str, rows: list[tuple[str, bytes, int]]):
+        """Write ``rows`` (key, value, expire) to ``table`` in one transaction."""
+        self.create_table(table)
+        sql = (
+            f"INSERT INTO {table} (key, value, expire) VALUES (?, ?, ?)"
+            f"    ON CONFLICT DO "
+            f"UPDATE SET value=excluded.value, expire=excluded.expire"
+        )
+        # self.DB is shared with the readers of this thread, the explicit
+        # transaction needs a connection of its own.
+        with self.connect() as conn:
+            conn.execute("BEGIN")
+            conn.executemany(sql, rows)
+        conn.close()
+
+    def _store(self, table: str, rows: list[tuple[str, bytes, int]]):
+        if self.worker is None or not self.cfg.WRITE_BUFFER_SIZE:
+            self._write(table, rows)
+            return
+
+        with self._buffer_lock:
+            buffer = self._buffer.setdefault(table, {})
+            for key, value, expire in rows:
+                buffer[key] = (value, expire)
+            full = sum(len(items) for items in self._buffer.values()) >= self.cfg.WRITE_BUFFER_SIZE
+        if full:
+            self.worker.wake()
+
+    def flush(self) -> int:
+        """Write the values buffered by :py:obj:`ExpireCacheSQLite.set` to the
+        DB, one transaction per table.  Returns the number of values written."""
+        with self._flush_lock:
+            with self._buffer_lock:
+                if not self._buffer:
+                    return 0
+                # values being written are still found by get()
+                self._flushing, self._buffer = self._buffer, {}
+            try:
+                for table, items in self._flushing.items():
+                    self._write(table, [(key, value, expire) for key, (value, expire) in items.items()])
+                return sum(len(items) for items in self._flushing.values())
+            finally:
+                with self._buffer_lock:
+                    self._flushing = {}
+
+    def _buffered(self, table: str, key: str) -> tuple[bytes, int] | None:
+        with self._buffer_lock:
+            for buffer in (self._buffer, self._flushing):
+                item = buffer.get(table, {}).get(key)
+                if item is not None:
+                    return item
+        return None
+
+    def _serialize(self, table: str, key: str, value: typing.Any, expire: int | None) -> tuple[str, bytes, int] | None:
+        value = self.serialize(value=value)
+        if len(value) > self.cfg.MAX_VALUE_LEN:
+            log.warning("ExpireCache.set(): %s.key='%s' - value too big to cache (len: %s)  ", table, key, len(value))
+            return None
+
+        if not expire:
+            expire = self.cfg.MAXHOLD_TIME
+        return key, value, int(time.time()) + expire
+
     # implement ABC methods of ExpireCache
 
     def set(self, key: str, value: typing.Any, expire: int | None, ctx: str | None = None) -> bool:
@@ -340,40 +504,33 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         generated from the :py:obj:`ExpireCacheCfg.name`.  If DB table does not
         exists, it will be created (on demand) by :py:obj:`self.create_table
         <ExpireCacheSQLite.create_table>`.
-        """
-        table = ctx
-        self.maintenance()
 
-        value = self.serialize(value=value)
-        if len(value) > self.cfg.MAX_VALUE_LEN:
-            log.warning("ExpireCache.set(): %s.key='%s' - value too big to cache (len: %s)  ", table, value, len(value))
+        The value is buffered and written to the DB later, see
+        :py:obj:`ExpireCacheCfg.WRITE_BUFFER_SIZE`.
+        """
+        self._auto_maintenance()
+        table = self._table_name(ctx)
+        row = self._serialize(table, key, value, expire)
+        if row is None:
             return False
-
-        if not expire:
-            expire = self.cfg.MAXHOLD_TIME
-        expire = int(time.time()) + expire
-
-        table_name = table
-        if not table_name:
-            table_name = self.normalize_name(self.cfg.name)
-        self.create_table(table_name)
-
-        sql = (
-            f"INSERT INTO {table_name} (key, value, expire) VALUES (?, ?, ?)"
-            f"    ON CONFLICT DO "
-            f"UPDATE SET value=?, expire=?"
-        )
-
-        if table:
-            with self.DB:
-                self.DB.execute(sql, (key, value, expire, value, expire))
-        else:
-            with self.connect() as conn:
-                conn.execute(sql, (key, value, expire, value, expire))
-            conn.close()
-
+        self._store(table, [row])
         return True
 
+    def set_many(
+        self,
+        items: dict[str, typing.Any] | Iterable[tuple[str, typing.Any]],
+        expire: int | None,
+        ctx: str | None = None,
+    ) -> bool:
+        self._auto_maintenance()
+        table = self._table_name(ctx)
+        items = items.items() if isinstance(items, dict) else items
+        rows = [self._serialize(table, key, value, expire) for key, value in items]
+        valid = [row for row in rows if row is not None]
+        if valid:
+            self._store(table, valid)
+        return len(valid) == len(rows)
+
     def get(self, key: str, default=None, ctx: str | None = None) -> typing.Any:
         """Get value of ``key`` from table given by argument ``ctx``.  If
         ``ctx`` argument is ``None`` (the default), a table name is generated
@@ -381,37 +538,61 @@ class ExpireCacheSQLite(sqlitedb.SQLiteAppl, ExpireCache):
         table), the ``default`` value is returned.
 
         """
-        table = ctx
-        self.maintenance()
+        self._auto_maintenance()
+        table = self._table_name(ctx)
+        now = int(time.time())
 
-        if not table:
-            table = self.normalize_name(self.cfg.name)
+        item = self._buffered(table, key)
+        if item is not None:
+            return self.deserialize(item[0]) if item[1] >= now else default
 
         if table not in self.table_names:
             return default
 
-        sql = f"SELECT value FROM {table} WHERE key = ?"
-        row = self.DB.execute(sql, (key,)).fetchone()
+        # expired rows are only deleted by the maintenance
+        sql = f"SELECT value FROM {table} WHERE key = ? AND expire >= ?"
+        row = self.DB.execute(sql, (key, now)).fetchone()
         if row is None:
             return default
 
         return self.deserialize(row[0])
 
+    def get_many(self, keys: Iterable[str], ctx: str | None = None) -> dict[str, typing.Any]:
+        self._auto_maintenance()
+        table = self._table_name(ctx)
+        now = int(time.time())
+
+        values = {}
+        missing = []
+        for key in keys:
+            item = self._buffered(table, key)
+            if item is None:
+                missing.append(key)
+            elif item[1] >= now:
+                values[key] = self.deserialize(item[0])
+
+        if missing and table in self.table_names:
+            for i in range(0, len(missing), self.SQL_CHUNK_SIZE):
+                chunk = missing[i : i + self.SQL_CHUNK_SIZE]
+                sql = f"SELECT key, value FROM {table} WHERE expire >= ? AND key IN ({','.join('?' * len(chunk))})"
+                for key, value in self.DB.execute(sql, (now, *chunk)):
+                    values[key] = self.deserialize(value)
+        return values
+
     def pairs(self, ctx: str) -> Iterator[tuple[str, typing.Any]]:
         """Iterate over key/value pairs from table given by argument ``ctx``.
         If ``ctx`` argument is ``None`` (the default), a table name is
         generated from the :py:obj:`ExpireCacheCfg.name`."""
-        table = ctx
-        self.maintenance()
-
-        if not table:
-            table = self.normalize_name(self.cfg.name)
+        self._auto_maintenance()
+        self.flush()
+        table = self._table_name(ctx)
 
         if table in self.table_names:
             for row in self.DB.execute(f"SELECT key, value FROM {table}"):
                 yield row[0], self.deserialize(row[1])
 
     def state(self) -> ExpireCacheStats:
+        self.flush()
         cached_items = {}
         for table in self.table_names:
             cached_items[table] = []
@@ -249,6 +249,10 @@ class Engine:  # pylint: disable=too-few-public-methods
     timeout: float
     """Specific timeout for search-engine."""
 
+    parse_in_process: bool
+    """Parse the responses of this engine in the process pool of the engine
+    pool (``search.engine_pool.parse_processes``), see :py:obj:`searx.search.pool`."""
+
     display_error_messages: bool
     """Display error messages on the web UI."""
 
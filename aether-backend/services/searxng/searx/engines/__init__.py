@@ -12,9 +12,12 @@ from __future__ import annotations
 
 import sys
 import copy
-from os.path import realpath, dirname
+import importlib.util
+import threading
+from os.path import realpath, dirname, join
+from timeit import default_timer
 
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Callable, Dict, List
 import types
 import inspect
 
@@ -45,6 +48,7 @@ ENGINE_DEFAULT_ARGS = {
     "send_accept_language_header": False,
     "tokens": [],
     "max_page": 0,
+    "parse_in_process": False,
 }
 # set automatically when an engine does not have any tab category
 DEFAULT_CATEGORY = 'other'
@@ -64,6 +68,65 @@ engine_shortcuts = {}
 :meta hide-value:
 """
 
+engine_load_times: Dict[str, float] = {}
+"""Time (in ms) it took to import the module of an engine, see
+:py:func:`log_engine_load_times`."""
+
+LAZY_REQUIRED_SETTINGS = ('categories', 'shortcut', 'disabled')
+"""Settings an engine needs to be loaded lazily: what is needed to register
+the engine without its module (a module may set ``disabled`` itself)."""
+
+LAZY_DEFAULT_SETTINGS = ('tokens',)
+"""Defaults from :py:obj:`ENGINE_DEFAULT_ARGS` a :py:obj:`LazyEngine` gets
+without its module: settings that are read on every request (e.g. ``tokens``
+by :py:obj:`searx.preferences.Preferences.validate_token`)."""
+
+ENGINE_LOAD_HOOKS: List[Callable[[str, Engine | types.ModuleType], None]] = []
+"""Functions called with ``(engine_name, engine)`` after a :py:obj:`LazyEngine`
+has been loaded (e.g. to set up its network and processor)."""
+
+
+class LazyEngine(types.ModuleType):
+    """Namespace of an active engine whose module has not been imported yet
+    (:ref:`settings search <settings search>` ``lazy_engines``).
+
+    The namespace only holds the attributes from ``settings.yml``.  On first
+    access to any other attribute, the module of the engine is imported into
+    this namespace and the engine is initialized as :py:func:`load_engine`
+    does, see :py:func:`load_lazy_engine`.  Afterwards the namespace is a
+    regular module.
+    """
+
+    def __init__(self, engine_data: dict):
+        super().__init__(engine_data['engine'])
+        self._lazy_data = engine_data
+        self._lazy_lock = threading.RLock()
+        # attribute lookups of a namespace in the making must not load it
+        self._lazy_loading = True
+        update_engine_attributes(self, engine_data, defaults=False)
+        for arg_name in LAZY_DEFAULT_SETTINGS:
+            if arg_name not in engine_data:
+                setattr(self, arg_name, copy.deepcopy(ENGINE_DEFAULT_ARGS[arg_name]))
+        set_loggers(self, engine_data['name'])
+        self._lazy_loading = False
+
+    def __getattr__(self, name: str):
+        if name.startswith('__'):
+            raise AttributeError(f"engine {self.__name__!r} has no attribute {name!r}")
+        lock = self.__dict__.get('_lazy_lock')
+        if lock is not None:
+            with lock:
+                if isinstance(self, LazyEngine):
+                    if self._lazy_loading:
+                        raise AttributeError(f"engine {self.__name__!r} has no attribute {name!r}")
+                    load_lazy_engine(self)
+        return getattr(self, name)
+
+
+def is_engine_loaded(engine: Engine | types.ModuleType) -> bool:
+    """``False`` if the module of the ``engine`` has not been imported yet."""
+    return not isinstance(engine, LazyEngine)
+
 
 def check_engine_module(module: types.ModuleType):
     # probe unintentional name collisions / for example name collisions caused
@@ -77,10 +140,12 @@ def check_engine_module(module: types.ModuleType):
         raise TypeError(msg)
 
 
-def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
+def load_engine(engine_data: dict, lazy: bool = False) -> Engine | types.ModuleType | None:
     """Load engine from ``engine_data``.
 
     :param dict engine_data:  Attributes from YAML ``settings:engines/<engine>``
+    :param lazy: return a :py:obj:`LazyEngine` instead of importing the module
+      (only if ``engine_data`` has all :py:obj:`LAZY_REQUIRED_SETTINGS`)
     :return: initialized namespace of the ``<engine>``.
 
     1. create a namespace and load module of the ``<engine>``
@@ -88,7 +153,8 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     3. update namespace with values from ``engine_data``
 
     If engine *is active*, return namespace of the engine, otherwise return
-    ``None``.
+    ``None``.  The module of an engine that is disabled or inactive by
+    ``engine_data`` is not imported at all.
 
     This function also returns ``None`` if initialization of the namespace fails
     for one of the following reasons:
@@ -118,8 +184,23 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     if module_name is None:
         logger.error('The "engine" field is missing for the engine named "{}"'.format(engine_name))
         return None
+
+    # settings.yml overrides the module, no need to import an engine that is
+    # switched off there
+    if engine_data.get('inactive') is True or engine_data.get('disabled') is True:
+        return None
+
+    if lazy and all(key in engine_data for key in LAZY_REQUIRED_SETTINGS):
+        if not is_engine_active(types.SimpleNamespace(**{**ENGINE_DEFAULT_ARGS, **engine_data})):
+            return None
+        engine = LazyEngine(engine_data)
+        set_default_category(engine)
+        return engine
+
     try:
+        start = default_timer()
         engine = load_module(module_name + '.py', ENGINE_DIR)
+        engine_load_times[engine_name] = (default_timer() - start) * 1000
     except (SyntaxError, KeyboardInterrupt, SystemExit, SystemError, ImportError, RuntimeError):
         logger.exception('Fatal exception in engine "{}"'.format(module_name))
         sys.exit(1)
@@ -127,6 +208,15 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
         logger.exception('Cannot load engine "{}"'.format(module_name))
         return None
 
+    if not setup_engine(engine, engine_data):
+        return None
+    return engine
+
+
+def setup_engine(engine: Engine | types.ModuleType, engine_data: dict) -> bool:
+    """Initialize the namespace of a loaded engine module from ``engine_data``.
+    Returns ``False`` if the engine is not active or misconfigured."""
+
     check_engine_module(engine)
     update_engine_attributes(engine, engine_data)
     update_attributes_for_tor(engine)
@@ -139,18 +229,75 @@ def load_engine(engine_data: dict) -> Engine | types.ModuleType | None:
     trait_map.set_traits(engine)
 
     if not is_engine_active(engine):
-        return None
+        return False
 
     if is_missing_required_attributes(engine):
-        return None
+        return False
+
+    set_loggers(engine, engine_data['name'])
+    set_default_category(engine)
+    return True
+
+
+def load_lazy_engine(engine: Engine | types.ModuleType) -> bool:
+    """Import the module of a :py:obj:`LazyEngine` into its namespace and run
+    the :py:obj:`ENGINE_LOAD_HOOKS`.  Other threads using the engine wait until
+    loading is done.
+
+    Returns ``False`` if the engine can't be loaded, in this case the engine
+    is unregistered.
+    """
+    if not isinstance(engine, LazyEngine):
+        return True
+
+    with engine._lazy_lock:  # pylint: disable=protected-access
+        if not isinstance(engine, LazyEngine):
+            # loaded by another thread meanwhile
+            return engines.get(engine.name) is engine
+
+        engine_data = engine._lazy_data  # pylint: disable=protected-access
+        engine_name = engine_data['name']
+        engine._lazy_loading = True  # pylint: disable=protected-access
+        ok = False
+        try:
+            start = default_timer()
+            spec = importlib.util.spec_from_file_location(
+                engine_data['engine'], join(ENGINE_DIR, engine_data['engine'] + '.py')
+            )
+            engine.__spec__, engine.__loader__, engine.__file__ = spec, spec.loader, spec.origin  # type: ignore
+            spec.loader.exec_module(engine)  # type: ignore
+            engine_load_times[engine_name] = (default_timer() - start) * 1000
+            ok = setup_engine(engine, engine_data)
+            if ok:
+                for hook in ENGINE_LOAD_HOOKS:
+                    hook(engine_name, engine)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception('Cannot load engine "{}"'.format(engine_data['engine']))
+            ok = False
+        finally:
+            engine.__class__ = types.ModuleType
+            del engine._lazy_data, engine._lazy_lock, engine._lazy_loading
+
+        if ok:
+            logger.debug('engine %s loaded in %.1f ms', engine_name, engine_load_times[engine_name])
+        else:
+            unregister_engine(engine)
+        return ok
+
 
-    set_loggers(engine, engine_name)
+def load_lazy_engines():
+    """Load all engines that have not been loaded yet (e.g. before checking
+    all engines)."""
+    for engine in list(engines.values()):
+        load_lazy_engine(engine)
 
+
+def set_default_category(engine: Engine | types.ModuleType):
+    if DEFAULT_CATEGORY in engine.categories:
+        return
     if not any(cat in settings['categories_as_tabs'] for cat in engine.categories):
         engine.categories.append(DEFAULT_CATEGORY)
 
-    return engine
-
 
 def set_loggers(engine, engine_name):
     # set the logger for engine
@@ -171,7 +318,7 @@ def set_loggers(engine, engine_name):
             module.logger = logger.getChild(module_engine_name)  # type: ignore
 
 
-def update_engine_attributes(engine: Engine | types.ModuleType, engine_data):
+def update_engine_attributes(engine: Engine | types.ModuleType, engine_data, defaults: bool = True):
     # set engine attributes from engine_data
     for param_name, param_value in engine_data.items():
         if param_name == 'categories':
@@ -183,6 +330,9 @@ def update_engine_attributes(engine: Engine | types.ModuleType, engine_data):
         else:
             setattr(engine, param_name, param_value)
 
+    if not defaults:
+        return
+
     # set default attributes
     for arg_name, arg_value in ENGINE_DEFAULT_ARGS.items():
         if not hasattr(engine, arg_name):
@@ -244,14 +394,48 @@ def register_engine(engine: Engine | types.ModuleType):
         categories.setdefault(category_name, []).append(engine)
 
 
-def load_engines(engine_list):
-    """usage: ``engine_list = settings['engines']``"""
+def unregister_engine(engine: Engine | types.ModuleType):
+    if engines.get(engine.name) is not engine:
+        return
+    del engines[engine.name]
+    if engine_shortcuts.get(engine.shortcut) == engine.name:
+        del engine_shortcuts[engine.shortcut]
+    for category_engines in categories.values():
+        if engine in category_engines:
+            category_engines.remove(engine)
+
+
+def load_engines(engine_list, lazy: bool | None = None):
+    """usage: ``engine_list = settings['engines']``
+
+    With ``lazy`` (default: ``settings['search']['lazy_engines']``) the engine
+    modules are imported on first use, see :py:obj:`LazyEngine`.
+    """
+    if lazy is None:
+        lazy = settings['search']['lazy_engines']
     engines.clear()
     engine_shortcuts.clear()
     categories.clear()
     categories['general'] = []
+    engine_load_times.clear()
     for engine_data in engine_list:
-        engine = load_engine(engine_data)
+        engine = load_engine(engine_data, lazy)
         if engine:
             register_engine(engine)
+    log_engine_load_times()
     return engines
+
+
+def log_engine_load_times():
+    """Log the time it took to import the engine modules (slowest first)."""
+    lazy = [name for name, engine in engines.items() if not is_engine_loaded(engine)]
+    report = ', '.join(
+        '%s %.1f ms' % (name, ms) for name, ms in sorted(engine_load_times.items(), key=lambda x: x[1], reverse=True)
+    )
+    logger.info(
+        'imported %s engine modules in %.1f ms (%s lazy): %s',
+        len(engine_load_times),
+        sum(engine_load_times.values()),
+        len(lazy),
+        report or '-',
+    )
@@ -314,6 +314,10 @@ CREATE TABLE IF NOT EXISTS blob_map (
             logger.critical("don't use SQLite DB in :memory: in production!!")
         super().__init__(cfg.db_url)
         self.cfg = cfg
+        # a DB in :memory: can't be shared with a thread
+        self.worker: sqlitedb.BackgroundWorker | None = None
+        if cfg.db_url != ":memory:":
+            self.worker = sqlitedb.BackgroundWorker("favicon cache", self.maintenance, 60)
 
     def __call__(self, resolver: str, authority: str) -> None | tuple[None | bytes, None | str]:
 
@@ -335,9 +339,11 @@ CREATE TABLE IF NOT EXISTS blob_map (
 
     def set(self, resolver: str, authority: str, mime: str | None, data: bytes | None) -> bool:
 
-        if self.cfg.MAINTENANCE_MODE == "auto" and int(time.time()) > self.next_maintenance_time:
-            # Should automatic maintenance be moved to a new thread?
-            self.maintenance()
+        if self.cfg.MAINTENANCE_MODE == "auto":
+            if self.worker is not None:
+                self.worker.start()
+            elif int(time.time()) > self.next_maintenance_time:
+                self.maintenance()
 
         if data is not None and mime is None:
             logger.error(
@@ -16,6 +16,7 @@ __all__ = [
     "initialize",
     "get_engines_stats",
     "get_engine_errors",
+    "get_search_cache_stats",
     "histogram",
     "histogram_observe",
     "histogram_observe_time",
@@ -86,7 +87,14 @@ def initialize(engine_names=None, enabled=True):
     max_timeout = 2
     for engine_name in engine_names or engines:
         if engine_name in engines:
-            max_timeout = max(max_timeout, engines[engine_name].timeout)
+            # vars(): don't load an engine (LazyEngine) just for its timeout
+            max_timeout = max(max_timeout, vars(engines[engine_name]).get('timeout', 0))
+
+    # search result cache
+    for result in ('hit', 'shared', 'miss'):
+        counter_storage.configure('search', 'cache', result)
+    # searches returned early by the adaptive scheduler
+    counter_storage.configure('search', 'scheduler', 'quorum')
 
     # histogram configuration
     histogram_width = 0.1
@@ -99,6 +107,9 @@ def initialize(engine_names=None, enabled=True):
         counter_storage.configure('engine', engine_name, 'search', 'count', 'successful')
         # global counter of errors
         counter_storage.configure('engine', engine_name, 'search', 'count', 'error')
+        # requests skipped and duplicated by the adaptive scheduler
+        counter_storage.configure('engine', engine_name, 'search', 'count', 'skipped')
+        counter_storage.configure('engine', engine_name, 'search', 'count', 'hedged')
         # score of the engine
         counter_storage.configure('engine', engine_name, 'score')
         # result count per requests
@@ -251,7 +262,16 @@ def get_engines_stats(engine_name_list):
     }
 
 
-def openmetrics(engine_stats, engine_reliabilities):
+def get_search_cache_stats():
+    """Lookups of the search result cache: ``hit`` (from the cache), ``shared``
+    (waited for an identical running search), ``miss`` and the hit ``ratio``."""
+    stats = {result: counter('search', 'cache', result) for result in ('hit', 'shared', 'miss')}
+    total = sum(stats.values())
+    stats['ratio'] = (stats['hit'] + stats['shared']) / total if total else 0
+    return stats
+
+
+def openmetrics(engine_stats, engine_reliabilities, search_cache_stats=None, network_stats=None):
     metrics = [
         OpenMetricsFamily(
             key="searxng_engines_response_time_total_seconds",
@@ -302,4 +322,71 @@ def openmetrics(engine_stats, engine_reliabilities):
             ],
         ),
     ]
+    if search_cache_stats is not None:
+        metrics += [
+            OpenMetricsFamily(
+                key="searxng_search_cache_requests_total",
+                type_hint="counter",
+                help_hint="The lookups of the search result cache",
+                data_info=[{'result': result} for result in ('hit', 'shared', 'miss')],
+                data=[search_cache_stats[result] for result in ('hit', 'shared', 'miss')],
+            ),
+            OpenMetricsFamily(
+                key="searxng_search_cache_hit_ratio",
+                type_hint="gauge",
+                help_hint="The share of searches answered by the search result cache",
+                data_info=[{'cache': 'search'}],
+                data=[search_cache_stats['ratio']],
+            ),
+        ]
+    if network_stats is not None:
+        networks = [{'network': name} for name in network_stats]
+        metrics += [
+            OpenMetricsFamily(
+                key="searxng_network_requests_total",
+                type_hint="counter",
+                help_hint="The HTTP requests sent by the network",
+                data_info=networks,
+                data=[stats['requests'] for stats in network_stats.values()],
+            ),
+            OpenMetricsFamily(
+                key="searxng_network_connection_reuse_total",
+                type_hint="counter",
+                help_hint="The HTTP requests sent on a connection kept alive by the pool",
+                data_info=networks,
+                data=[stats['reused'] for stats in network_stats.values()],
+            ),
+            OpenMetricsFamily(
+                key="searxng_network_pool_wait_seconds_total",
+                type_hint="counter",
+                help_hint="The time the HTTP requests waited for a connection of the pool",
+                data_info=networks,
+                data=[stats['wait_time'] for stats in network_stats.values()],
+            ),
+            OpenMetricsFamily(
+                key="searxng_network_pool_connections",
+                type_hint="gauge",
+                help_hint="The open connections of the pools of the network",
+                data_info=[{**network, 'state': state} for network in networks for state in ('active', 'idle')],
+                data=[
+                    value
+                    for stats in network_stats.values()
+                    for value in (stats['active'], stats['connections'] - stats['active'])
+                ],
+            ),
+            OpenMetricsFamily(
+                key="searxng_network_pool_queued_requests",
+                type_hint="gauge",
+                help_hint="The HTTP requests waiting for a connection of the pool",
+                data_info=networks,
+                data=[stats['queued'] for stats in network_stats.values()],
+            ),
+            OpenMetricsFamily(
+                key="searxng_network_pool_utilization",
+                type_hint="gauge",
+                help_hint="The share of the max. connections of the pools in use",
+                data_info=networks,
+                data=[stats['utilization'] for stats in network_stats.values()],
+            ),
+        ]
     return "".join([str(metric) for metric in metrics])
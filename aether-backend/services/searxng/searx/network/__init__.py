@@ -14,7 +14,12 @@ import httpx
 import anyio
 
 from searx.extended_types import SXNG_Response
-from .network import get_network, initialize, check_network_configuration  # pylint:disable=cyclic-import
+from .network import (  # pylint:disable=cyclic-import
+    get_network,
+    get_network_stats,
+    initialize,
+    check_network_configuration,
+)
 from .client import get_loop
 from .raise_for_httperror import raise_for_httperror
 
@@ -23,6 +28,12 @@ THREADLOCAL = threading.local()
 """Thread-local data is data for thread specific values."""
 
 
+def clear_thread_context():
+    """Forget the thread's total time, timeout and network (thread reused for
+    another request)."""
+    THREADLOCAL.__dict__.clear()
+
+
 def reset_time_for_thread():
     THREADLOCAL.total_time = 0
 
@@ -98,30 +109,34 @@ def request(method, url, **kwargs) -> SXNG_Response:
             raise httpx.TimeoutException('Timeout', request=None) from e
 
 
+async def _send_requests(network, request_list: List["Request"], timeouts: List[float]):
+    async def send(request_desc, timeout):
+        coroutine = network.request(request_desc.method, request_desc.url, **request_desc.kwargs)
+        try:
+            return await asyncio.wait_for(coroutine, timeout)
+        except asyncio.TimeoutError:
+            return httpx.TimeoutException('Timeout', request=None)
+
+    return await asyncio.gather(
+        *[send(request_desc, timeout) for request_desc, timeout in zip(request_list, timeouts)], return_exceptions=True
+    )
+
+
 def multi_requests(request_list: List["Request"]) -> List[Union[httpx.Response, Exception]]:
-    """send multiple HTTP requests in parallel. Wait for all requests to finish."""
+    """send multiple HTTP requests in parallel. Wait for all requests to finish.
+
+    The requests are handed over to the event loop at once (one cross-thread
+    call for all requests)."""
     with _record_http_time() as start_time:
-        # send the requests
         network = get_context_network()
-        loop = get_loop()
-        future_list = []
-        for request_desc in request_list:
-            timeout = _get_timeout(start_time, request_desc.kwargs)
-            future = asyncio.run_coroutine_threadsafe(
-                network.request(request_desc.method, request_desc.url, **request_desc.kwargs), loop
-            )
-            future_list.append((future, timeout))
-
-        # read the responses
-        responses = []
-        for future, timeout in future_list:
-            try:
-                responses.append(future.result(timeout))
-            except concurrent.futures.TimeoutError:
-                responses.append(httpx.TimeoutException('Timeout', request=None))
-            except Exception as e:  # pylint: disable=broad-except
-                responses.append(e)
-        return responses
+        timeouts = [_get_timeout(start_time, request_desc.kwargs) for request_desc in request_list]
+        future = asyncio.run_coroutine_threadsafe(_send_requests(network, request_list, timeouts), get_loop())
+        try:
+            # each request times out in the loop, this is a safeguard
+            return future.result(max(timeouts, default=0) + 1)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return [httpx.TimeoutException('Timeout', request=None) for _ in request_list]
 
 
 class Request(NamedTuple):
@@ -8,6 +8,7 @@ import atexit
 import asyncio
 import ipaddress
 from itertools import cycle
+from timeit import default_timer
 from typing import Dict
 
 import httpx
@@ -38,6 +39,58 @@ PROXY_PATTERN_MAPPING = {
 ADDRESS_MAPPING = {'ipv4': '0.0.0.0', 'ipv6': '::'}
 
 
+class NetworkStats:
+    """Connection pool counters of a :py:obj:`Network`, updated by the
+    :py:obj:`RequestTrace` of its requests."""
+
+    __slots__ = 'requests', 'reused', 'wait_time'
+
+    def __init__(self):
+        self.requests = 0
+        self.reused = 0
+        self.wait_time = 0.0
+
+    def observe(self, wait_time: float, reused: bool):
+        # called in the event loop (one thread)
+        self.requests += 1
+        self.reused += reused
+        self.wait_time += wait_time
+
+
+class RequestTrace:
+    """httpcore ``trace`` extension of a request: measures the time the request
+    waits for a connection of the pool and whether it reuses a connection.
+
+    The wait ends with the first trace event of a connection: ``connect_*``
+    (new connection) or ``send_request_headers`` (reused connection).  Only the
+    first request is measured, not the redirects.
+
+    A ``trace`` extension passed by the caller of the request gets all events.
+    """
+
+    __slots__ = 'stats', 'start', 'done', 'trace'
+
+    def __init__(self, stats: NetworkStats, trace: typing.Callable[[str, dict], typing.Awaitable[None]] | None = None):
+        self.stats = stats
+        self.start = default_timer()
+        self.done = False
+        self.trace = trace
+
+    async def __call__(self, name: str, info: dict):
+        if self.trace is not None:
+            await self.trace(name, info)
+        if self.done or not name.endswith('.started'):
+            return
+        if name.startswith('connection.connect_'):
+            reused = False
+        elif name.endswith('.send_request_headers.started'):
+            reused = True
+        else:
+            return
+        self.done = True
+        self.stats.observe(default_timer() - self.start, reused)
+
+
 class Network:
 
     __slots__ = (
@@ -57,6 +110,8 @@ class Network:
         '_proxies_cycle',
         '_clients',
         '_logger',
+        'stats',
+        'name',
     )
 
     _TOR_CHECK_RESULT = {}
@@ -95,6 +150,8 @@ class Network:
         self._proxies_cycle = self.get_proxy_cycles()
         self._clients = {}
         self._logger = logger.getChild(logger_name) if logger_name else logger
+        self.stats = NetworkStats()
+        self.name = logger_name
         self.check_parameters()
 
     def check_parameters(self):
@@ -207,6 +264,31 @@ class Network:
             self._clients[key] = client
         return self._clients[key]
 
+    def pool_stats(self) -> dict:
+        """Request counters and the current state of the connection pools of
+        the network's clients."""
+        # pylint: disable=protected-access
+        pools = []
+        for client in list(self._clients.values()):
+            for transport in [client._transport, *client._mounts.values()]:
+                pool = getattr(transport, '_pool', None)
+                if pool is not None:
+                    pools.append(pool)
+
+        connections = [connection for pool in pools for connection in getattr(pool, 'connections', [])]
+        active = sum(1 for connection in connections if not connection.is_idle())
+        queued = sum(1 for pool in pools for request in list(getattr(pool, '_requests', [])) if request.is_queued())
+        capacity = self.max_connections * len(pools) if self.max_connections else 0
+        return {
+            'requests': self.stats.requests,
+            'reused': self.stats.reused,
+            'wait_time': self.stats.wait_time,
+            'connections': len(connections),
+            'active': active,
+            'queued': queued,
+            'utilization': active / capacity if capacity else 0.0,
+        }
+
     async def aclose(self):
         async def close_client(client):
             try:
@@ -267,10 +349,12 @@ class Network:
         was_disconnected = False
         do_raise_for_httperror = Network.extract_do_raise_for_httperror(kwargs)
         kwargs_clients = Network.extract_kwargs_clients(kwargs)
+        extensions = kwargs.pop('extensions', None) or {}
         while retries >= 0:  # pragma: no cover
             client = await self.get_client(**kwargs_clients)
             cookies = kwargs.pop("cookies", None)
             client.cookies = httpx.Cookies(cookies)
+            kwargs['extensions'] = {**extensions, 'trace': RequestTrace(self.stats, extensions.get('trace'))}
             try:
                 if stream:
                     response = client.stream(method, url, **kwargs)
@@ -308,6 +392,21 @@ def get_network(name=None):
     return NETWORKS.get(name or DEFAULT_NAME)
 
 
+def get_network_stats() -> dict[str, dict]:
+    """The :py:obj:`Network.pool_stats` by network name; a network shared by
+    several engines is listed once, under the name it was defined with."""
+    stats = {}
+    seen = set()
+    default = NETWORKS.get(DEFAULT_NAME)
+    for name, network in list(NETWORKS.items()):
+        if id(network) in seen:
+            continue
+        seen.add(id(network))
+        label = DEFAULT_NAME if network is default else network.name or name
+        stats[label] = network.pool_stats()
+    return stats
+
+
 def check_network_configuration():
     async def check():
         exception_count = 0
@@ -326,9 +425,35 @@ def check_network_configuration():
         raise RuntimeError("Invalid network configuration")
 
 
+DEFAULT_PARAMS = {}
+"""Default parameters of a network (:py:func:`initialize`)."""
+
+
+def new_network(params, logger_name=None):
+    result = {}
+    result.update(DEFAULT_PARAMS)
+    result.update(params)
+    if logger_name:
+        result['logger_name'] = logger_name
+    return Network(**result)
+
+
+def new_engine_network(engine_name, engine, network):
+    """Network of an engine, defined by ``engine.network`` (dict) or by the
+    network attributes of the engine."""
+    if network is None:
+        network = {}
+        for attribute_name, attribute_value in DEFAULT_PARAMS.items():
+            if hasattr(engine, attribute_name):
+                network[attribute_name] = getattr(engine, attribute_name)
+            else:
+                network[attribute_name] = attribute_value
+    return new_network(network, logger_name=engine_name)
+
+
 def initialize(settings_engines=None, settings_outgoing=None):
     # pylint: disable=import-outside-toplevel)
-    from searx.engines import engines
+    from searx.engines import engines, is_engine_loaded
     from searx import settings
 
     # pylint: enable=import-outside-toplevel)
@@ -338,36 +463,32 @@ def initialize(settings_engines=None, settings_outgoing=None):
 
     # default parameters for AsyncHTTPTransport
     # see https://github.com/encode/httpx/blob/e05a5372eb6172287458b37447c30f650047e1b8/httpx/_transports/default.py#L108-L121  # pylint: disable=line-too-long
-    default_params = {
-        'enable_http': False,
-        'verify': settings_outgoing['verify'],
-        'enable_http2': settings_outgoing['enable_http2'],
-        'max_connections': settings_outgoing['pool_connections'],
-        'max_keepalive_connections': settings_outgoing['pool_maxsize'],
-        'keepalive_expiry': settings_outgoing['keepalive_expiry'],
-        'local_addresses': settings_outgoing['source_ips'],
-        'using_tor_proxy': settings_outgoing['using_tor_proxy'],
-        'proxies': settings_outgoing['proxies'],
-        'max_redirects': settings_outgoing['max_redirects'],
-        'retries': settings_outgoing['retries'],
-        'retry_on_http_error': None,
-    }
-
-    def new_network(params, logger_name=None):
-        nonlocal default_params
-        result = {}
-        result.update(default_params)
-        result.update(params)
-        if logger_name:
-            result['logger_name'] = logger_name
-        return Network(**result)
+    DEFAULT_PARAMS.clear()
+    DEFAULT_PARAMS.update(
+        {
+            'enable_http': False,
+            'verify': settings_outgoing['verify'],
+            'enable_http2': settings_outgoing['enable_http2'],
+            'max_connections': settings_outgoing['pool_connections'],
+            'max_keepalive_connections': settings_outgoing['pool_maxsize'],
+            'keepalive_expiry': settings_outgoing['keepalive_expiry'],
+            'local_addresses': settings_outgoing['source_ips'],
+            'using_tor_proxy': settings_outgoing['using_tor_proxy'],
+            'proxies': settings_outgoing['proxies'],
+            'max_redirects': settings_outgoing['max_redirects'],
+            'retries': settings_outgoing['retries'],
+            'retry_on_http_error': None,
+        }
+    )
 
     def iter_networks():
         nonlocal settings_engines
         for engine_spec in settings_engines:
             engine_name = engine_spec['name']
             engine = engines.get(engine_name)
-            if engine is None:
+            # engines loaded on first use get their network when they are
+            # loaded (initialize_engine)
+            if engine is None or not is_engine_loaded(engine):
                 continue
             network = getattr(engine, 'network', None)
             yield engine_name, engine, network
@@ -385,31 +506,42 @@ def initialize(settings_engines=None, settings_outgoing=None):
 
     # define networks from engines.[i].network (except references)
     for engine_name, engine, network in iter_networks():
-        if network is None:
-            network = {}
-            for attribute_name, attribute_value in default_params.items():
-                if hasattr(engine, attribute_name):
-                    network[attribute_name] = getattr(engine, attribute_name)
-                else:
-                    network[attribute_name] = attribute_value
-            NETWORKS[engine_name] = new_network(network, logger_name=engine_name)
-        elif isinstance(network, dict):
-            NETWORKS[engine_name] = new_network(network, logger_name=engine_name)
+        if network is None or isinstance(network, dict):
+            NETWORKS[engine_name] = new_engine_network(engine_name, engine, network)
 
-    # define networks from engines.[i].network (references)
+    # define networks from engines.[i].network (references), the referenced
+    # engine may not be loaded yet
     for engine_name, engine, network in iter_networks():
         if isinstance(network, str):
-            NETWORKS[engine_name] = NETWORKS[network]
+            initialize_engine(engine_name, engine)
 
     # the /image_proxy endpoint has a dedicated network.
     # same parameters than the default network, but HTTP/2 is disabled.
     # It decreases the CPU load average, and the total time is more or less the same
     if 'image_proxy' not in NETWORKS:
-        image_proxy_params = default_params.copy()
+        image_proxy_params = DEFAULT_PARAMS.copy()
         image_proxy_params['enable_http2'] = False
         NETWORKS['image_proxy'] = new_network(image_proxy_params, logger_name='image_proxy')
 
 
+def initialize_engine(engine_name, engine):
+    """Define the network of an engine that is loaded after :py:func:`initialize`."""
+    # pylint: disable=import-outside-toplevel)
+    from searx.engines import engines, load_lazy_engine
+
+    network = getattr(engine, 'network', None)
+    if network is None or isinstance(network, dict):
+        NETWORKS[engine_name] = new_engine_network(engine_name, engine, network)
+        return
+    if network not in NETWORKS and network in engines:
+        # reference to the network of another engine, not loaded yet
+        referenced = engines[network]
+        if load_lazy_engine(referenced) and network not in NETWORKS:
+            # no load hook defined it (e.g. called from initialize)
+            initialize_engine(network, referenced)
+    NETWORKS[engine_name] = NETWORKS[network]
+
+
 @atexit.register
 def done():
     """Close all HTTP client
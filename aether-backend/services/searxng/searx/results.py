@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import warnings
 from collections import defaultdict
+from operator import attrgetter
 from threading import RLock
 from typing import List, NamedTuple, Set
 
@@ -35,6 +36,55 @@ def calculate_score(result, priority) -> float:
     return score
 
 
+GROUP_MAX_COUNT = 8
+"""Max number of results pulled up into a group of results of the same
+category (:py:func:`group_results`)."""
+
+GROUP_MAX_DISTANCE = 20
+"""A result is only pulled up into a group if there are less than this number
+of results behind the group (:py:func:`group_results`)."""
+
+
+def group_results(results: list[MainResult | LegacyResult]) -> list[MainResult | LegacyResult]:
+    """Group the results (sorted by score) by category and template.
+
+    A result is appended to the open group of its category if the group is
+    not full (:py:obj:`GROUP_MAX_COUNT`) and not too far from the end of the
+    list (:py:obj:`GROUP_MAX_DISTANCE`), otherwise it opens a new group.  A
+    result is never moved up by :py:obj:`GROUP_MAX_DISTANCE` or more
+    positions.
+    """
+    groups: list[list[MainResult | LegacyResult]] = []
+    open_groups: dict[str, int] = {}
+
+    for res in results:
+        # do we need to handle more than one category per engine?
+        engine = searx.engines.engines.get(res.engine or "")
+        if engine:
+            res.category = engine.categories[0] if len(engine.categories) > 0 else ""
+
+        # do we need to handle more than one category per engine?
+        category = f"{res.category}:{res.template}:{'img_src' if (res.thumbnail or res.img_src) else ''}"
+        index = open_groups.get(category)
+
+        if index is not None and len(groups[index]) <= GROUP_MAX_COUNT:
+            # number of results behind the group (only the last groups can be
+            # close enough, each group has at least one result)
+            behind = 0
+            for group in groups[index + 1 : index + 1 + GROUP_MAX_DISTANCE]:
+                behind += len(group)
+                if behind >= GROUP_MAX_DISTANCE:
+                    break
+            if behind < GROUP_MAX_DISTANCE:
+                groups[index].append(res)
+                continue
+
+        open_groups[category] = len(groups)
+        groups.append([res])
+
+    return [res for group in groups for res in group]
+
+
 class Timing(NamedTuple):
     engine: str
     total: float
@@ -53,14 +103,14 @@ class ResultContainer:
 
     # pylint: disable=too-many-statements
 
-    main_results_map: dict[int, MainResult | LegacyResult]
     infoboxes: list[LegacyResult]
     suggestions: set[str]
     answers: AnswerSet
     corrections: set[str]
 
     def __init__(self):
-        self.main_results_map = {}
+        self._main_results_map: dict[int, MainResult | LegacyResult] = {}
+        self._staged: dict[str, list[tuple[int, MainResult | LegacyResult]]] = {}
         self.infoboxes = []
         self.suggestions = set()
         self.answers = AnswerSet()
@@ -73,15 +123,39 @@ class ResultContainer:
         self.unresponsive_engines: Set[UnresponsiveEngine] = set()
         self.timings: List[Timing] = []
         self.redirect_url: str | None = None
+        # the scheduler returned before all engines answered (quorum)
+        self.partial: bool = False
         self.on_result = lambda _: True
         self._lock = RLock()
         self._main_results_sorted: list[MainResult | LegacyResult] = None  # type: ignore
 
+    def __getstate__(self):
+        # drop the lock and the (plugin) callback, to store containers in the
+        # search result cache
+        self._merge_staged()
+        state = self.__dict__.copy()
+        del state['_lock']
+        del state['on_result']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = RLock()
+        self.on_result = lambda _: True
+
+    @property
+    def main_results_map(self) -> dict[int, MainResult | LegacyResult]:
+        """The main results, duplicates merged, by their hash (the URL without
+        scheme, see :py:obj:`searx.result_types.MainResult.__hash__`)."""
+        self._merge_staged()
+        return self._main_results_map
+
     def extend(self, engine_name: str | None, results):  # pylint: disable=too-many-branches
         if self._closed:
             log.debug("container is closed, ignoring results: %s", results)
             return
         main_count = 0
+        main_results: list[tuple[int, MainResult | LegacyResult]] = []
 
         for result in list(results):
 
@@ -95,7 +169,8 @@ class ResultContainer:
                     self.answers.add(result)
                 elif isinstance(result, MainResult):
                     main_count += 1
-                    self._merge_main_result(result, main_count)
+                    result.positions = [main_count]
+                    main_results.append((hash(result), result))
                 else:
                     # more types need to be implemented in the future ..
                     raise NotImplementedError(f"no handler implemented to process the result of type {result}")
@@ -143,9 +218,17 @@ class ResultContainer:
 
                 if self.on_result(result):
                     main_count += 1
-                    self._merge_main_result(result, main_count)
+                    result.positions = [main_count]
+                    main_results.append((hash(result), result))
                     continue
 
+        if main_results:
+            # the results of an engine are merged into the main results on
+            # demand, not under the lock while other engines are responding
+            # (the hash is computed here, outside of the lock)
+            with self._lock:
+                self._staged.setdefault(engine_name or "", []).extend(main_results)
+
         if engine_name in searx.engines.engines:
             eng = searx.engines.engines[engine_name]
             histogram_observe(main_count, "engine", eng.name, "result", "count")
@@ -165,27 +248,35 @@ class ResultContainer:
         if add_infobox:
             self.infoboxes.append(new_infobox)
 
-    def _merge_main_result(self, result: MainResult | LegacyResult, position):
-        result_hash = hash(result)
-
+    def _merge_staged(self):
         with self._lock:
-
-            merged = self.main_results_map.get(result_hash)
-            if not merged:
-                # if there is no duplicate in the merged results, append result
-                result.positions = [position]
-                self.main_results_map[result_hash] = result
+            if not self._staged:
                 return
-
-            merge_two_main_results(merged, result)
-            # add the new position
-            merged.positions.append(position)
+            staged, self._staged = self._staged, {}
+            touched: dict[int, MainResult | LegacyResult] = {}
+            for results in staged.values():
+                for result_hash, result in results:
+                    touched[result_hash] = self._merge_main_result(result_hash, result)
+            # only the scores of new and merged results change
+            for result in touched.values():
+                result.score = calculate_score(result, result.priority)
+
+    def _merge_main_result(self, result_hash: int, result: MainResult | LegacyResult) -> MainResult | LegacyResult:
+        merged = self._main_results_map.get(result_hash)
+        if merged is None:
+            # if there is no duplicate in the merged results, append result
+            self._main_results_map[result_hash] = result
+            return result
+
+        merge_two_main_results(merged, result)
+        # add the new position
+        merged.positions.extend(result.positions)
+        return merged
 
     def close(self):
         self._closed = True
 
         for result in self.main_results_map.values():
-            result.score = calculate_score(result, result.priority)
             for eng_name in result.engines:
                 counter_add(result.score, 'engine', eng_name, 'score')
 
@@ -199,52 +290,9 @@ class ResultContainer:
         if self._main_results_sorted:
             return self._main_results_sorted
 
-        # first pass, sort results by "score" (descanding)
-        results = sorted(self.main_results_map.values(), key=lambda x: x.score, reverse=True)
-
-        # pass 2 : group results by category and template
-        gresults = []
-        categoryPositions = {}
-        max_count = 8
-        max_distance = 20
-
-        for res in results:
-            # do we need to handle more than one category per engine?
-            engine = searx.engines.engines.get(res.engine or "")
-            if engine:
-                res.category = engine.categories[0] if len(engine.categories) > 0 else ""
-
-            # do we need to handle more than one category per engine?
-            category = f"{res.category}:{res.template}:{'img_src' if (res.thumbnail or res.img_src) else ''}"
-            grp = categoryPositions.get(category)
-
-            # group with previous results using the same category, if the group
-            # can accept more result and is not too far from the current
-            # position
-
-            if (grp is not None) and (grp["count"] > 0) and (len(gresults) - grp["index"] < max_distance):
-                # group with the previous results using the same category with
-                # this one
-                index = grp["index"]
-                gresults.insert(index, res)
-
-                # update every index after the current one (including the
-                # current one)
-                for item in categoryPositions.values():
-                    v = item["index"]
-                    if v >= index:
-                        item["index"] = v + 1
-
-                # update this category
-                grp["count"] -= 1
-
-            else:
-                gresults.append(res)
-                # update categoryIndex
-                categoryPositions[category] = {"index": len(gresults), "count": max_count}
-                continue
-
-        self._main_results_sorted = gresults
+        # sort results by "score" (descending) and group them by category
+        results = sorted(self.main_results_map.values(), key=attrgetter("score"), reverse=True)
+        self._main_results_sorted = group_results(results)
         return self._main_results_sorted
 
     @property
@@ -4,9 +4,7 @@
 # the public namespace has not yet been finally defined ..
 # __all__ = ["EngineRef", "SearchQuery"]
 
-import threading
 from timeit import default_timer
-from uuid import uuid4
 
 from flask import copy_current_request_context
 
@@ -14,15 +12,23 @@ from searx import logger
 from searx import settings
 import searx.answerers
 import searx.plugins
-from searx.engines import load_engines
+from searx.engines import load_engines, ENGINE_LOAD_HOOKS
 from searx.extended_types import SXNG_Request
 from searx.external_bang import get_bang_url
 from searx.metrics import initialize as initialize_metrics, counter_inc, histogram_observe_time
 from searx.network import initialize as initialize_network, check_network_configuration
+from searx.network.network import initialize_engine as initialize_engine_network
 from searx.results import ResultContainer
 from searx.search.checker import initialize as initialize_checker
 from searx.search.models import SearchQuery
-from searx.search.processors import PROCESSORS, initialize as initialize_processors
+from searx.search.pool import get_engine_pool, initialize as initialize_engine_pool
+from searx.search.result_cache import get_result_cache, initialize as initialize_result_cache
+from searx.search.scheduler import get_scheduler, initialize as initialize_scheduler
+from searx.search.processors import (
+    PROCESSORS,
+    initialize as initialize_processors,
+    initialize_engine as initialize_engine_processor,
+)
 
 from .models import EngineRef, SearchQuery
 
@@ -37,14 +43,26 @@ def initialize(settings_engines=None, enable_checker=False, check_network=False,
         check_network_configuration()
     initialize_metrics([engine['name'] for engine in settings_engines], enable_metrics)
     initialize_processors(settings_engines)
+    initialize_engine_pool(settings['search']['engine_pool'], settings_engines)
+    initialize_result_cache(settings['search']['result_cache'])
+    initialize_scheduler(settings['search']['scheduler'])
+    if initialize_engine not in ENGINE_LOAD_HOOKS:
+        ENGINE_LOAD_HOOKS.append(initialize_engine)
     if enable_checker:
         initialize_checker()
 
 
+def initialize_engine(engine_name, engine):
+    """Set up network and processor of an engine loaded on first use
+    (:py:obj:`searx.engines.LazyEngine`)."""
+    initialize_engine_network(engine_name, engine)
+    initialize_engine_processor(engine_name, engine)
+
+
 class Search:
     """Search information container"""
 
-    __slots__ = "search_query", "result_container", "start_time", "actual_timeout"
+    __slots__ = "search_query", "result_container", "start_time", "actual_timeout", "scheduler"
 
     def __init__(self, search_query: SearchQuery):
         """Initialize the Search"""
@@ -54,6 +72,7 @@ class Search:
         self.result_container = ResultContainer()
         self.start_time = None
         self.actual_timeout = None
+        self.scheduler = get_scheduler()
 
     def search_external_bang(self):
         """
@@ -85,7 +104,10 @@ class Search:
 
         # start search-request for all selected engines
         for engineref in self.search_query.engineref_list:
-            processor = PROCESSORS[engineref.name]
+            processor = PROCESSORS.load(engineref.name)
+            if processor is None:
+                # engine failed to load on first use
+                continue
 
             # stop the request now if the engine is suspend
             if processor.extend_container_if_suspended(self.result_container):
@@ -96,8 +118,6 @@ class Search:
             if request_params is None:
                 continue
 
-            counter_inc('engine', engineref.name, 'search', 'count', 'sent')
-
             # append request to list
             requests.append((engineref.name, self.search_query.query, request_params))
 
@@ -128,44 +148,83 @@ class Search:
             )
         )
 
+        # don't wait for engines that are too slow for the timeout
+        if self.scheduler is not None:
+            requests = self.scheduler.skip(requests, actual_timeout)
+
+        for engine_name, _, _ in requests:
+            counter_inc('engine', engine_name, 'search', 'count', 'sent')
+
         return requests, actual_timeout
 
     def search_multiple_requests(self, requests):
-        # pylint: disable=protected-access
-        search_id = str(uuid4())
+        pool = get_engine_pool()
+        deadline = self.start_time + self.actual_timeout
 
+        if self.scheduler is not None:
+
+            def submit(engine_name, query, request_params, group):
+                _search = copy_current_request_context(PROCESSORS[engine_name].search)
+                args = (query, request_params, self.result_container, self.start_time, self.actual_timeout)
+                return pool.submit(engine_name, _search, args, deadline, group)
+
+            for engine_name in self.scheduler.run(requests, submit, self.result_container, self.start_time, deadline):
+                self.result_container.add_unresponsive_engine(engine_name, 'timeout')
+                PROCESSORS[engine_name].logger.error('engine timeout')
+            return
+
+        tasks = []
         for engine_name, query, request_params in requests:
             _search = copy_current_request_context(PROCESSORS[engine_name].search)
-            th = threading.Thread(  # pylint: disable=invalid-name
-                target=_search,
-                args=(query, request_params, self.result_container, self.start_time, self.actual_timeout),
-                name=search_id,
-            )
-            th._timeout = False
-            th._engine_name = engine_name
-            th.start()
-
-        for th in threading.enumerate():  # pylint: disable=invalid-name
-            if th.name == search_id:
-                remaining_time = max(0.0, self.actual_timeout - (default_timer() - self.start_time))
-                th.join(remaining_time)
-                if th.is_alive():
-                    th._timeout = True
-                    self.result_container.add_unresponsive_engine(th._engine_name, 'timeout')
-                    PROCESSORS[th._engine_name].logger.error('engine timeout')
+            args = (query, request_params, self.result_container, self.start_time, self.actual_timeout)
+            tasks.append(pool.submit(engine_name, _search, args, deadline))
+
+        for task in pool.wait(tasks, deadline):
+            self.result_container.add_unresponsive_engine(task.engine_name, 'timeout')
+            PROCESSORS[task.engine_name].logger.error('engine timeout')
 
     def search_standard(self):
         """
         Update self.result_container, self.actual_timeout
         """
+        result_cache = get_result_cache()
+        if result_cache is not None:
+            cached = result_cache.search(
+                self.search_query, self.cache_scope(), self._max_timeout(), self._search_engines
+            )
+            if cached is not None:
+                cached.on_result = self.result_container.on_result
+                self.result_container = cached
+            return True
+
+        self._search_engines()
+
+        # return results, suggestions, answers and infoboxes
+        return True
+
+    def _search_engines(self) -> ResultContainer:
         requests, self.actual_timeout = self._get_requests()
 
         # send all search-request
         if requests:
             self.search_multiple_requests(requests)
 
-        # return results, suggestions, answers and infoboxes
-        return True
+        return self.result_container
+
+    def _max_timeout(self) -> float:
+        """Upper bound of the time the engines of this search may take."""
+        engine_names = [ref.name for ref in self.search_query.engineref_list if ref.name in PROCESSORS]
+        timeouts = [PROCESSORS[name].engine.timeout for name in engine_names]
+        timeout = max(timeouts, default=settings['outgoing']['request_timeout'])
+        for limit in (self.search_query.timeout_limit, settings['outgoing']['max_request_timeout']):
+            if limit is not None:
+                timeout = min(timeout, limit)
+        return timeout + 0.5
+
+    def cache_scope(self) -> tuple[str, ...]:
+        """Names that are part of the result cache key in addition to the
+        search query (the plugins that may modify engine results)."""
+        return ()
 
     # do search-request
     def search(self) -> ResultContainer:
@@ -197,6 +256,9 @@ class SearchWithPlugins(Search):
     def _on_result(self, result):
         return searx.plugins.STORAGE.on_result(self.request, self, result)
 
+    def cache_scope(self) -> tuple[str, ...]:
+        return tuple(self.user_plugins)
+
     def search(self) -> ResultContainer:
 
         if searx.plugins.STORAGE.pre_search(self.request, self):
@@ -10,7 +10,7 @@ import logging
 import searx.search
 import searx.search.checker
 from searx.search import PROCESSORS
-from searx.engines import engine_shortcuts
+from searx.engines import engine_shortcuts, load_lazy_engines
 
 
 # configure logging
@@ -63,6 +63,7 @@ def iter_processor(engine_name_list):
 # actual check & display
 def run(engine_name_list, verbose):
     searx.search.initialize()
+    load_lazy_engines()
     name_checker_list = []
     for name, processor in iter_processor(engine_name_list):
         stdout.write(f'{BOLD_SEQ}Engine {name:30}{RESET_SEQ}Checking\n')
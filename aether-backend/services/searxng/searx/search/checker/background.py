@@ -13,6 +13,7 @@ import valkey.exceptions
 from searx import logger, settings, sxng_debug
 from searx.valkeydb import client as get_valkey_client
 from searx.exceptions import SearxSettingsException
+from searx.engines import load_lazy_engines
 from searx.search.processors import PROCESSORS
 from searx.search.checker import Checker
 from searx.search.checker.scheduler import scheduler_function
@@ -107,6 +108,7 @@ def run():
         with get_valkey_client().lock(VALKEY_LOCK_KEY, blocking_timeout=60, timeout=3600):
             logger.info('Starting checker')
             result: CheckerOk = {'status': 'ok', 'engines': {}, 'timestamp': _timestamp()}
+            load_lazy_engines()
             for name, processor in PROCESSORS.items():
                 logger.debug('Checking %s engine', name)
                 checker = Checker(processor)
@@ -0,0 +1,234 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Persistent worker pool for engine requests.
+
+:py:obj:`searx.search.Search.search_multiple_requests` used to start a new
+thread for each engine of each query.  The :py:obj:`EnginePool` keeps a
+bounded set of worker threads instead, and -- optionally -- a process pool
+that parses the responses of CPU-heavy engines outside of the GIL.
+
+Configuration (``settings.yml``):
+
+.. code:: yaml
+
+   search:
+     engine_pool:
+       max_workers: 64      # threads sending engine requests
+       parse_processes: 0   # processes parsing responses (0: parse in thread)
+
+   engines:
+     - name: wikipedia
+       parse_in_process: true
+
+Deadlines: each task carries the absolute deadline of its search.  Tasks that
+are still queued when the deadline passes are cancelled, tasks that are still
+running are flagged; :py:obj:`searx.search.processors.abstract.EngineProcessor.extend_container`
+reports the late result of a flagged task as a timeout, as it did for the
+former per-engine threads.
+
+Response parsing in a process: the child gets a copy of the HTTP response
+(status, headers, body, URL and ``search_params``) and calls the engine's
+``response()`` function.  The engines are loaded in the child without calling
+their ``init()`` function; engines whose parser depends on state built by
+``init()`` must not set ``parse_in_process``.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import threading
+import typing as t
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future, wait
+from timeit import default_timer
+
+import httpx
+
+from searx import logger
+from searx.network import clear_thread_context
+
+logger = logger.getChild('search.pool')
+
+_THREADLOCAL = threading.local()
+_POOL_LOCK = threading.Lock()
+ENGINE_POOL: EnginePool | None = None
+
+
+class TaskGroup:
+    """The requests of one engine in a search: a request and its hedged
+    duplicates (:py:obj:`searx.search.scheduler`).  The first request to
+    deliver -- results or an error -- wins, the others are dropped."""
+
+    __slots__ = 'lock', 'winner'
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.winner: EngineTask | None = None
+
+    def claim(self, task: EngineTask) -> bool:
+        with self.lock:
+            if self.winner is None:
+                self.winner = task
+            return self.winner is task
+
+
+class EngineTask:
+    """One engine request of a search, running in the :py:obj:`EnginePool`."""
+
+    __slots__ = 'engine_name', 'deadline', 'future', 'timed_out', 'cut_off', 'group'
+
+    def __init__(self, engine_name: str, deadline: float, group: TaskGroup | None = None):
+        self.engine_name = engine_name
+        self.deadline = deadline
+        self.future: Future | None = None
+        self.timed_out = False
+        self.cut_off = False
+        self.group = group
+
+
+def current_task() -> EngineTask | None:
+    """The task the calling worker thread is running (``None`` outside of the
+    pool, e.g. in the checker)."""
+    return getattr(_THREADLOCAL, 'task', None)
+
+
+def current_task_timed_out() -> bool:
+    """``True`` if the search of the calling worker thread is not waiting for
+    its result anymore."""
+    task = current_task()
+    return task is not None and task.timed_out
+
+
+def claim_current_task() -> bool:
+    """``False`` if the result of the calling worker thread is not wanted
+    anymore: the search returned early (quorum) or another request of its
+    :py:obj:`TaskGroup` delivered first."""
+    task = current_task()
+    if task is None:
+        return True
+    if task.cut_off:
+        return False
+    return task.group is None or task.group.claim(task)
+
+
+def _init_parse_worker(engine_list: list[dict]):
+    # pylint: disable=import-outside-toplevel
+    from searx.engines import load_engines
+
+    load_engines(engine_list)
+
+
+def _parse_response(engine_name: str, method: str, url: str, status_code: int, headers, content, search_params):
+    # pylint: disable=import-outside-toplevel
+    from searx.engines import engines
+
+    response = httpx.Response(status_code, headers=headers, content=content, request=httpx.Request(method, url))
+    response.search_params = search_params  # type: ignore
+    return engines[engine_name].response(response)
+
+
+class EnginePool:
+    """Bounded thread pool for engine requests with an optional process pool
+    for parsing engine responses."""
+
+    def __init__(self, max_workers: int = 64, parse_processes: int = 0, parse_engines: list[dict] | None = None):
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='searx-engine')
+        self.parse_executor: ProcessPoolExecutor | None = None
+        if parse_processes > 0 and parse_engines:
+            self.parse_executor = ProcessPoolExecutor(
+                max_workers=parse_processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_parse_worker,
+                initargs=(parse_engines,),
+            )
+
+    def submit(
+        self, engine_name: str, func: t.Callable, args: tuple, deadline: float, group: TaskGroup | None = None
+    ) -> EngineTask:
+        """Queue ``func(*args)`` for ``engine_name``; the result has to be
+        delivered before ``deadline`` (:py:obj:`timeit.default_timer` time)."""
+        task = EngineTask(engine_name, deadline, group)
+        task.future = self.executor.submit(self._run, task, func, args)
+        return task
+
+    @staticmethod
+    def _run(task: EngineTask, func: t.Callable, args: tuple):
+        if default_timer() >= task.deadline:
+            # queued behind other requests until the search gave up
+            task.timed_out = True
+            return
+        # the thread ran other engines before: start without their http
+        # time, timeout and network
+        clear_thread_context()
+        _THREADLOCAL.task = task
+        try:
+            func(*args)
+        finally:
+            _THREADLOCAL.task = None
+
+    def wait(self, tasks: list[EngineTask], deadline: float) -> list[EngineTask]:
+        """Wait for ``tasks`` until ``deadline``.  Tasks not done by then are
+        flagged (and cancelled if they have not started yet).
+
+        :return: the tasks that missed the deadline
+        """
+        wait([task.future for task in tasks], timeout=max(0.0, deadline - default_timer()))
+        late = []
+        for task in tasks:
+            if not task.future.done():
+                task.timed_out = True
+                task.future.cancel()
+            if task.timed_out:
+                late.append(task)
+        return late
+
+    def parse_response(self, engine_name: str, response: httpx.Response):
+        """Run the engine's ``response()`` function in the process pool and
+        wait for the results until the deadline of the calling task."""
+        task = current_task()
+        timeout = max(0.0, task.deadline - default_timer()) if task else None
+        future = self.parse_executor.submit(  # type: ignore
+            _parse_response,
+            engine_name,
+            response.request.method,
+            str(response.url),
+            response.status_code,
+            response.headers.multi_items(),
+            response.content,
+            response.search_params,  # type: ignore
+        )
+        return future.result(timeout)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self.parse_executor is not None:
+            self.parse_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def initialize(pool_settings: dict, engine_list: list[dict]):
+    """Replace the :py:obj:`ENGINE_POOL` by a pool built from
+    ``settings['search']['engine_pool']``."""
+    global ENGINE_POOL  # pylint: disable=global-statement
+
+    parse_engines = [engine for engine in engine_list if engine.get('parse_in_process')]
+    with _POOL_LOCK:
+        if ENGINE_POOL is not None:
+            ENGINE_POOL.shutdown()
+        ENGINE_POOL = EnginePool(pool_settings['max_workers'], pool_settings['parse_processes'], parse_engines)
+    logger.debug(
+        'engine pool: %s threads, %s parse processes (%s engines)',
+        pool_settings['max_workers'],
+        pool_settings['parse_processes'],
+        len(parse_engines),
+    )
+
+
+def get_engine_pool() -> EnginePool:
+    """The process wide :py:obj:`EnginePool`, created with default settings on
+    first use if :py:obj:`initialize` has not been called."""
+    global ENGINE_POOL  # pylint: disable=global-statement
+
+    if ENGINE_POOL is None:
+        with _POOL_LOCK:
+            if ENGINE_POOL is None:
+                ENGINE_POOL = EnginePool()
+    return ENGINE_POOL
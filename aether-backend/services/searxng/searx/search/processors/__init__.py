@@ -15,7 +15,7 @@ __all__ = [
 ]
 
 import threading
-from typing import Dict
+from typing import Dict, Optional
 
 from searx import logger
 from searx import engines
@@ -28,7 +28,29 @@ from .online_url_search import OnlineUrlSearchProcessor
 from .abstract import EngineProcessor
 
 logger = logger.getChild('search.processors')
-PROCESSORS: Dict[str, EngineProcessor] = {}
+
+
+class ProcessorMap(dict):
+    """Processors by *engine-name*.  Looking up the processor of an engine that
+    has not been loaded yet (:py:obj:`searx.engines.LazyEngine`) loads the
+    engine first."""
+
+    def __missing__(self, engine_name: str) -> EngineProcessor:
+        processor = self.load(engine_name)
+        if processor is None:
+            raise KeyError(engine_name)
+        return processor
+
+    def load(self, engine_name: str) -> Optional[EngineProcessor]:
+        """Load the engine ``engine_name`` (if not yet done) and return its
+        processor (``None`` if there is none)."""
+        engine = engines.engines.get(engine_name)
+        if engine is not None:
+            engines.load_lazy_engine(engine)
+        return self.get(engine_name)
+
+
+PROCESSORS: ProcessorMap = ProcessorMap()
 """Cache request processors, stored by *engine-name* (:py:func:`initialize`)
 
 :meta hide-value:
@@ -69,14 +91,33 @@ def initialize_processor(processor):
 
 
 def initialize(engine_list):
-    """Initialize all engines and store a processor for each engine in :py:obj:`PROCESSORS`."""
+    """Initialize all engines and store a processor for each engine in :py:obj:`PROCESSORS`.
+
+    Engines that have not been loaded yet get their processor when they are
+    loaded (:py:func:`initialize_engine`).
+    """
     for engine_data in engine_list:
         engine_name = engine_data['name']
         engine = engines.engines.get(engine_name)
-        if engine:
-            processor = get_processor(engine, engine_name)
-            initialize_processor(processor)
-            if processor is None:
-                engine.logger.error('Error get processor for engine %s', engine_name)
-            else:
-                PROCESSORS[engine_name] = processor
+        if engine and engines.is_engine_loaded(engine):
+            register_processor(engine, engine_name)
+
+
+def initialize_engine(engine_name, engine):
+    """Store the processor of a lazy loaded engine in :py:obj:`PROCESSORS`
+    and call the init function of the engine (the caller is waiting for the
+    engine, the init function is not run in a thread)."""
+    processor = register_processor(engine, engine_name, background=False)
+    if processor is not None and processor.has_initialize_function:
+        processor.initialize()
+
+
+def register_processor(engine, engine_name, background=True):
+    processor = get_processor(engine, engine_name)
+    if processor is None:
+        engine.logger.error('Error get processor for engine %s', engine_name)
+        return None
+    if background:
+        initialize_processor(processor)
+    PROCESSORS[engine_name] = processor
+    return processor
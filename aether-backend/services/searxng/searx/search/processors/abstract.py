@@ -12,6 +12,7 @@ from searx import settings, logger
 from searx.engines import engines
 from searx.network import get_time_for_thread, get_network
 from searx.metrics import histogram_observe, counter_inc, count_exception, count_error
+from searx.search.pool import current_task, current_task_timed_out, claim_current_task
 from searx.exceptions import SearxEngineAccessDeniedException, SearxEngineResponseException
 from searx.utils import get_engine_from_settings
 
@@ -83,6 +84,9 @@ class EngineProcessor(ABC):
         return hasattr(self.engine, 'init')
 
     def handle_exception(self, result_container, exception_or_message, suspend=False):
+        if not claim_current_task():
+            # the search does not need this request anymore (quorum, hedging)
+            return
         # update result_container
         if isinstance(exception_or_message, BaseException):
             exception_class = exception_or_message.__class__
@@ -118,8 +122,16 @@ class EngineProcessor(ABC):
             histogram_observe(page_load_time, 'engine', self.engine_name, 'time', 'http')
 
     def extend_container(self, result_container, start_time, search_results):
-        if getattr(threading.current_thread(), '_timeout', False):
-            # the main thread is not waiting anymore
+        task = current_task()
+        if task is not None and task.cut_off:
+            # the search returned early (quorum), keep the engine's latency up to date
+            histogram_observe(default_timer() - start_time, 'engine', self.engine_name, 'time', 'total')
+            return
+        if not claim_current_task():
+            # the other request of a hedged pair delivered first
+            return
+        if current_task_timed_out():
+            # the search is not waiting anymore
             self.handle_exception(result_container, 'timeout', None)
         else:
             # check if the engine accepted the request
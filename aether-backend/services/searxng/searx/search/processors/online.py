@@ -17,6 +17,7 @@ from searx.exceptions import (
     SearxEngineTooManyRequestsException,
 )
 from searx.metrics.error_recorder import count_error
+from searx.search.pool import get_engine_pool
 from .abstract import EngineProcessor
 
 
@@ -145,6 +146,9 @@ class OnlineProcessor(EngineProcessor):
 
         # parse the response
         response.search_params = params
+        pool = get_engine_pool()
+        if pool.parse_executor is not None and getattr(self.engine, 'parse_in_process', False):
+            return pool.parse_response(self.engine_name, response)
         return self.engine.response(response)
 
     def search(self, query, params, result_container, start_time, timeout_limit):
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Cache of the merged engine results of a search.
+
+Identical searches -- same normalised query, categories, engines, language,
+page, safe search, time range and enabled plugins -- are answered from the
+cache instead of being sent to the engines again.  The values are stored in
+an :py:obj:`searx.cache.ExpireCache`, so workers sharing the cache DB share
+the results.
+
+Configuration (``settings.yml``):
+
+.. code:: yaml
+
+   search:
+     result_cache:
+       enabled: true
+       ttl: 300            # seconds, default for all categories
+       category_ttl:       # seconds, per category (the smallest one wins)
+         news: 60
+
+What is cached is the :py:obj:`searx.results.ResultContainer` after all
+engines have answered and before ``post_search`` plugins run, so plugin
+answers that depend on the request (e.g. *self information*) are never
+shared.  Containers with unresponsive engines or engines dropped by the
+:py:obj:`quorum <searx.search.scheduler>` are not cached.
+
+Identical searches running at the same time in one process are deduplicated:
+the first one queries the engines, the others wait for its result.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import typing as t
+
+from searx import logger
+from searx.cache import ExpireCache, ExpireCacheCfg
+from searx.metrics import counter_inc
+
+if t.TYPE_CHECKING:
+    from searx.results import ResultContainer
+    from searx.search.models import SearchQuery
+
+logger = logger.getChild('search.result_cache')
+
+RESULT_CACHE: ResultCache | None = None
+
+
+class ResultCache:
+    """Result cache with deduplication of in-flight searches."""
+
+    MAX_VALUE_LEN = 1024 * 1024 * 2
+    """Max length of a serialized result container."""
+
+    def __init__(self, ttl: int = 300, category_ttl: dict[str, int] | None = None, db_url: str = ""):
+        self.ttl = ttl
+        self.category_ttl = category_ttl or {}
+        maxhold = max([ttl, *self.category_ttl.values()])
+        self.cache = ExpireCache.build_cache(
+            ExpireCacheCfg(
+                name="SEARCH_RESULTS",
+                db_url=db_url,
+                MAX_VALUE_LEN=self.MAX_VALUE_LEN,
+                MAXHOLD_TIME=maxhold,
+                MAINTENANCE_PERIOD=max(60, maxhold),
+            )
+        )
+        self._inflight: dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Case and whitespace insensitive form of the query."""
+        return " ".join(query.casefold().split())
+
+    def key(self, search_query: SearchQuery, user_plugins: t.Iterable[str] = ()) -> str:
+        """Hashed cache key of ``search_query`` searched with ``user_plugins``."""
+        parts = [
+            self.normalize_query(search_query.query),
+            ",".join(sorted(search_query.categories)),
+            ",".join(sorted(f"{ref.name}/{ref.category}" for ref in search_query.engineref_list)),
+            search_query.lang,
+            str(search_query.pageno),
+            str(search_query.safesearch),
+            search_query.time_range or "",
+            json.dumps(search_query.engine_data, sort_keys=True),
+            ",".join(sorted(user_plugins)),
+        ]
+        return self.cache.secret_hash("\x1f".join(parts))
+
+    def ttl_for(self, search_query: SearchQuery) -> int:
+        """TTL of the results of ``search_query``: the smallest TTL of its
+        categories."""
+        return min([self.category_ttl.get(category, self.ttl) for category in search_query.categories] or [self.ttl])
+
+    @staticmethod
+    def cacheable(container: ResultContainer) -> bool:
+        if container.partial or any(not engine.suspended for engine in container.unresponsive_engines):
+            return False
+        return bool(container.main_results_map or container.answers or container.infoboxes or container.suggestions)
+
+    def search(
+        self,
+        search_query: SearchQuery,
+        user_plugins: t.Iterable[str],
+        wait_timeout: float,
+        do_search: t.Callable[[], ResultContainer],
+    ) -> ResultContainer | None:
+        """Look ``search_query`` up in the cache.
+
+        On a hit the cached container is returned.  Otherwise ``do_search()``
+        is called, its container is cached and ``None`` is returned.  If an
+        identical search is already running in this process, wait (at most
+        ``wait_timeout`` seconds) for its result first.
+        """
+        key = self.key(search_query, user_plugins)
+        cached = self.cache.get(key)
+        if cached is not None:
+            counter_inc('search', 'cache', 'hit')
+            return cached
+
+        with self._lock:
+            event = self._inflight.get(key)
+            leader = event is None
+            if leader:
+                event = self._inflight[key] = threading.Event()
+
+        if not leader:
+            event.wait(wait_timeout)  # type: ignore
+            cached = self.cache.get(key)
+            if cached is not None:
+                counter_inc('search', 'cache', 'shared')
+                return cached
+            counter_inc('search', 'cache', 'miss')
+            do_search()
+            return None
+
+        counter_inc('search', 'cache', 'miss')
+        try:
+            container = do_search()
+            if self.cacheable(container):
+                self.cache.set(key, container, self.ttl_for(search_query))
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            event.set()  # type: ignore
+        return None
+
+
+def initialize(cache_settings: dict):
+    """Set up :py:obj:`RESULT_CACHE` from ``settings['search']['result_cache']``."""
+    global RESULT_CACHE  # pylint: disable=global-statement
+
+    RESULT_CACHE = None
+    if cache_settings['enabled']:
+        RESULT_CACHE = ResultCache(cache_settings['ttl'], cache_settings['category_ttl'])
+        logger.debug('result cache enabled (ttl: %ss, category ttl: %s)', RESULT_CACHE.ttl, RESULT_CACHE.category_ttl)
+
+
+def get_result_cache() -> ResultCache | None:
+    """The result cache or ``None`` if it is disabled."""
+    return RESULT_CACHE
@@ -0,0 +1,219 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+"""Adaptive scheduling of the engine requests of a search.
+
+Without the scheduler a search waits for every engine until the search
+timeout.  The scheduler uses the latency the engines had in earlier searches
+(the ``time/total`` histograms of :py:obj:`searx.metrics`) to:
+
+- *skip* engines whose latency percentile ``skip_percentile`` exceeds the
+  timeout of the search.  Every ``probe_interval`` skipped search the request
+  is sent anyway, to keep the latency of the engine up to date.
+
+- *hedge* requests of important engines (``weight`` of at least
+  ``hedge_min_weight``): when an engine has not answered after its latency
+  percentile ``hedge_percentile``, a duplicate request is sent.  The first
+  request to answer wins, the other one is dropped
+  (:py:obj:`searx.search.pool.TaskGroup`).
+
+- *return early* once ``quorum`` results of engines with a ``weight`` of at
+  least ``quorum_min_weight`` have arrived.  The requests still running are
+  dropped; they are not reported as unresponsive, but the container is
+  marked as ``partial`` and not stored in the result cache.
+
+The latency of an engine is only used once ``min_samples`` requests have been
+measured.
+
+Configuration (``settings.yml``):
+
+.. code:: yaml
+
+   search:
+     scheduler:
+       enabled: true
+       min_samples: 20
+       skip_percentile: 95
+       probe_interval: 10
+       hedge_percentile: 90
+       hedge_min_weight: 2.0
+       quorum: 0             # 0: wait for all engines
+       quorum_min_weight: 1.0
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import typing as t
+from concurrent.futures import wait, FIRST_COMPLETED
+from timeit import default_timer
+
+from searx import logger
+from searx.engines import engines
+from searx.metrics import histogram, counter_inc
+from searx.search.pool import EngineTask, TaskGroup
+
+if t.TYPE_CHECKING:
+    from searx.results import ResultContainer
+
+logger = logger.getChild('search.scheduler')
+
+SCHEDULER: AdaptiveScheduler | None = None
+
+Request = t.Tuple[str, str, dict]
+"""An engine request of a search: engine name, query and request params."""
+
+
+class AdaptiveScheduler:
+    """Skips, hedges and cuts off engine requests based on the measured
+    engine latencies."""
+
+    def __init__(
+        self,
+        min_samples: int = 20,
+        skip_percentile: int = 95,
+        probe_interval: int = 10,
+        hedge_percentile: int = 90,
+        hedge_min_weight: float = 2.0,
+        quorum: int = 0,
+        quorum_min_weight: float = 1.0,
+    ):  # pylint: disable=too-many-arguments
+        self.min_samples = min_samples
+        self.skip_percentile = skip_percentile
+        self.probe_interval = probe_interval
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_weight = hedge_min_weight
+        self.quorum = quorum
+        self.quorum_min_weight = quorum_min_weight
+        self._skipped: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def latency(self, engine_name: str, percentile: int) -> float | None:
+        """The ``percentile`` of the total time of the requests of the engine,
+        ``None`` if less than ``min_samples`` requests have been measured."""
+        measures = histogram('engine', engine_name, 'time', 'total', raise_on_not_found=False)
+        if measures is None or measures.count < self.min_samples:
+            return None
+        value = measures.percentage(percentile)
+        return None if value is None else float(value)
+
+    @staticmethod
+    def weight(engine_name: str) -> float:
+        return getattr(engines[engine_name], 'weight', 1.0)
+
+    def _probe(self, engine_name: str) -> bool:
+        with self._lock:
+            count = self._skipped.get(engine_name, 0) + 1
+            self._skipped[engine_name] = 0 if count >= self.probe_interval else count
+        return count >= self.probe_interval
+
+    def skip(self, requests: list[Request], budget: float) -> list[Request]:
+        """The ``requests`` without the requests to engines that are too slow
+        for ``budget`` (the timeout of the search).  If all engines are too
+        slow, all requests are kept."""
+        slow = set()
+        for engine_name, _, _ in requests:
+            latency = self.latency(engine_name, self.skip_percentile)
+            if latency is not None and latency > budget and not self._probe(engine_name):
+                slow.add(engine_name)
+
+        if not slow or len(slow) == len(requests):
+            return requests
+        for engine_name in slow:
+            counter_inc('engine', engine_name, 'search', 'count', 'skipped')
+        logger.debug('skip slow engines: %s', ', '.join(sorted(slow)))
+        return [request for request in requests if request[0] not in slow]
+
+    def hedge_delay(self, engine_name: str) -> float | None:
+        """Seconds after which a duplicate request is sent to the engine,
+        ``None`` if the engine is not hedged."""
+        if self.weight(engine_name) < self.hedge_min_weight:
+            return None
+        return self.latency(engine_name, self.hedge_percentile)
+
+    def quorum_reached(self, result_container: ResultContainer, quorum_engines: set[str]) -> bool:
+        if not self.quorum or not quorum_engines:
+            return False
+        results = result_container.main_results_map.values()
+        return sum(1 for result in results if not quorum_engines.isdisjoint(result.engines)) >= self.quorum
+
+    def run(
+        self,
+        requests: list[Request],
+        submit: t.Callable[[str, str, dict, TaskGroup], EngineTask],
+        result_container: ResultContainer,
+        start_time: float,
+        deadline: float,
+    ) -> list[str]:
+        """Send the ``requests`` by ``submit(engine_name, query, params, group)``
+        and wait for the answers until ``deadline`` or until the quorum is
+        reached.
+
+        :return: the names of the engines that missed the deadline
+        """
+        # pylint: disable=too-many-locals
+        pending: dict[str, list[EngineTask]] = {}
+        hedges: dict[str, tuple[float, str, dict]] = {}
+        for engine_name, query, params in requests:
+            delay = self.hedge_delay(engine_name)
+            if delay is not None and start_time + delay < deadline:
+                # the first request modifies its params
+                hedges[engine_name] = (start_time + delay, query, copy.deepcopy(params))
+            pending[engine_name] = [submit(engine_name, query, params, TaskGroup())]
+
+        quorum_engines = {name for name in pending if self.weight(name) >= self.quorum_min_weight}
+
+        while pending:
+            now = default_timer()
+            if now >= deadline:
+                break
+            wake_up = min([deadline, *(hedge[0] for name, hedge in hedges.items() if name in pending)])
+            futures = []
+            for tasks in pending.values():
+                # once a request delivers, the engine is done when that request is
+                winner = tasks[0].group.winner  # type: ignore
+                futures.extend([winner.future] if winner else [task.future for task in tasks])
+            wait(futures, timeout=max(0.0, wake_up - now), return_when=FIRST_COMPLETED)  # type: ignore
+
+            for engine_name, tasks in list(pending.items()):
+                winner = tasks[0].group.winner  # type: ignore
+                if any(task.future.done() for task in tasks) and (winner is None or winner.future.done()):
+                    del pending[engine_name]
+
+            now = default_timer()
+            for engine_name, tasks in pending.items():
+                if engine_name in hedges and hedges[engine_name][0] <= now:
+                    _, query, params = hedges.pop(engine_name)
+                    tasks.append(submit(engine_name, query, params, tasks[0].group))  # type: ignore
+                    counter_inc('engine', engine_name, 'search', 'count', 'hedged')
+
+            if pending and self.quorum_reached(result_container, quorum_engines):
+                logger.debug('quorum reached, drop engines: %s', ', '.join(sorted(pending)))
+                counter_inc('search', 'scheduler', 'quorum')
+                result_container.partial = True
+                for tasks in pending.values():
+                    for task in tasks:
+                        task.cut_off = True
+                        task.future.cancel()  # type: ignore
+                return []
+
+        for tasks in pending.values():
+            for task in tasks:
+                task.timed_out = True
+                task.future.cancel()  # type: ignore
+        return list(pending)
+
+
+def initialize(scheduler_settings: dict):
+    """Set up :py:obj:`SCHEDULER` from ``settings['search']['scheduler']``."""
+    global SCHEDULER  # pylint: disable=global-statement
+
+    SCHEDULER = None
+    if scheduler_settings['enabled']:
+        options = {key: value for key, value in scheduler_settings.items() if key != 'enabled'}
+        SCHEDULER = AdaptiveScheduler(**options)
+        logger.debug('adaptive scheduler enabled: %s', options)
+
+
+def get_scheduler() -> AdaptiveScheduler | None:
+    """The adaptive scheduler or ``None`` if it is disabled."""
+    return SCHEDULER
@@ -172,6 +172,26 @@ SCHEMA = {
         },
         'formats': SettingsValue(list, OUTPUT_FORMATS),
         'max_page': SettingsValue(int, 0),
+        'engine_pool': {
+            'max_workers': SettingsValue(int, 64),
+            'parse_processes': SettingsValue(int, 0),
+        },
+        'result_cache': {
+            'enabled': SettingsValue(bool, False),
+            'ttl': SettingsValue(int, 300),
+            'category_ttl': SettingsValue(dict, {}),
+        },
+        'lazy_engines': SettingsValue(bool, False),
+        'scheduler': {
+            'enabled': SettingsValue(bool, False),
+            'min_samples': SettingsValue(int, 20),
+            'skip_percentile': SettingsValue(int, 95),
+            'probe_interval': SettingsValue(int, 10),
+            'hedge_percentile': SettingsValue(int, 90),
+            'hedge_min_weight': SettingsValue((int, float), 2.0),
+            'quorum': SettingsValue(int, 0),
+            'quorum_min_weight': SettingsValue((int, float), 1.0),
+        },
     },
     'server': {
         'port': SettingsValue((int, str), 8888, 'SEARXNG_PORT'),
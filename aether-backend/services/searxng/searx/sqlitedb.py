@@ -7,6 +7,9 @@
 :py:obj:`SQLiteProperties`:
   Class to manage properties stored in a database.
 
+:py:obj:`BackgroundWorker`:
+  Thread running the maintenance (and buffered writes) of a DB application.
+
 Examplarical implementations based on :py:obj:`SQLiteAppl`:
 
 :py:obj:`searx.cache.ExpireCacheSQLite` :
@@ -23,10 +26,12 @@ from __future__ import annotations
 
 import abc
 import datetime
+import os
 import re
 import sqlite3
 import sys
 import threading
+import typing
 import uuid
 
 from searx import logger
@@ -86,6 +91,69 @@ class DBSession:
             pass
 
 
+class BackgroundWorker:
+    """Daemon thread that calls ``func`` every ``interval`` seconds and when it
+    is woken up (:py:obj:`BackgroundWorker.wake`).  Used to take DB maintenance
+    and buffered writes out of the request handling.
+
+    The thread is started on first use in each process, threads do not survive
+    the fork of a server's worker processes.
+    """
+
+    def __init__(self, name: str, func: typing.Callable[[], typing.Any], interval: float):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._event = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._event = threading.Event()
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._event, self._stopped), name=self.name, daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the thread and wait (at most ``timeout`` seconds) for its
+        current run to finish.  The next :py:obj:`BackgroundWorker.start`
+        starts a new thread."""
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            self._pid = None
+            thread = self._thread
+            self._stopped.set()
+            self._event.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def wake(self):
+        self.start()
+        self._event.set()
+
+    def _run(self, event: threading.Event, stopped: threading.Event):
+        while True:
+            event.wait(self.interval)
+            event.clear()
+            if stopped.is_set():
+                return
+            try:
+                self.func()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception("background worker %s failed", self.name)
+
+
 class SQLiteAppl(abc.ABC):
     """Abstract base class for implementing convenient DB access in SQLite
     applications.  In the constructor, a :py:obj:`SQLiteProperties` instance is
@@ -154,6 +222,7 @@ class SQLiteAppl(abc.ABC):
         self.db_url = db_url
         self.properties = SQLiteProperties(db_url)
         self._init_done = False
+        self._init_lock = threading.RLock()
         self._compatibility()
         # atexit.register(self.tear_down)
 
@@ -208,7 +277,7 @@ class SQLiteAppl(abc.ABC):
         )
         logger.debug(msg)
 
-        with self._connect() as conn:
+        with self._connect() as conn, self._init_lock:
             self.init(conn)
         return conn
 
@@ -270,8 +339,10 @@ class SQLiteAppl(abc.ABC):
 
         # Since more than one instance of SQLiteAppl share the same DB
         # connection, we need to make sure that each SQLiteAppl instance has run
-        # its init method at least once.
-        self.init(conn)
+        # its init method at least once.  Other threads have to wait until the
+        # schema has been created.
+        with self._init_lock:
+            self.init(conn)
 
         return conn
 
@@ -357,6 +428,7 @@ CREATE TABLE IF NOT EXISTS properties (
 
         self.db_url = db_url
         self._init_done = False
+        self._init_lock = threading.RLock()
         self._compatibility()
 
     def init(self, conn: sqlite3.Connection) -> bool:
@@ -99,7 +99,15 @@ import searx.answerers
 import searx.plugins
 
 
-from searx.metrics import get_engines_stats, get_engine_errors, get_reliabilities, histogram, counter, openmetrics
+from searx.metrics import (
+    get_engines_stats,
+    get_engine_errors,
+    get_reliabilities,
+    get_search_cache_stats,
+    histogram,
+    counter,
+    openmetrics,
+)
 from searx.flaskfix import patch_application
 
 from searx.locales import (
@@ -118,7 +126,7 @@ from searx import favicons
 from searx.valkeydb import initialize as valkey_initialize
 from searx.sxng_locales import sxng_locales
 import searx.search
-from searx.network import stream as http_stream, set_context_network_name
+from searx.network import stream as http_stream, set_context_network_name, get_network_stats
 from searx.search.checker import get_result as checker_get_result
 
 
@@ -1194,7 +1202,7 @@ def stats_open_metrics():
 
     engine_stats = get_engines_stats(filtered_engines)
     engine_reliabilities = get_reliabilities(filtered_engines, checker_results)
-    metrics_text = openmetrics(engine_stats, engine_reliabilities)
+    metrics_text = openmetrics(engine_stats, engine_reliabilities, get_search_cache_stats(), get_network_stats())
 
     return Response(metrics_text, mimetype='text/plain')
 
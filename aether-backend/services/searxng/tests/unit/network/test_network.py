@@ -1,13 +1,47 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # pylint: disable=missing-module-docstring,disable=missing-class-docstring,invalid-name
 
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import httpx
 from mock import patch
 
-from searx.network.network import Network, NETWORKS
+import searx.network
+from searx import engines, settings
+from searx.network.network import DEFAULT_NAME, Network, NETWORKS, get_network_stats, initialize
 from tests import SearxTestCase
 
 
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        time.sleep(float(self.path.rsplit('/', 1)[-1] or 0))
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except BrokenPipeError:
+            # the client timed out
+            pass
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def start_server(test):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    test.addCleanup(server.server_close)
+    test.addCleanup(server.shutdown)
+    return f'http://127.0.0.1:{server.server_address[1]}'
+
+
 class TestNetwork(SearxTestCase):
     # pylint: disable=protected-access
 
@@ -245,3 +279,102 @@ class TestNetworkStreamRetries(SearxTestCase):
             response = await network.stream('GET', 'https://example.com/', raise_for_httperror=False)
             self.assertEqual(response.status_code, 403)
             await network.aclose()
+
+
+class TestNetworkPoolStats(SearxTestCase):
+
+    async def test_connection_reuse(self):
+        url = start_server(self)
+        network = Network(enable_http=True, max_connections=4)
+        for _ in range(3):
+            await network.request('GET', url + '/0')
+        stats = network.pool_stats()
+        await network.aclose()
+
+        self.assertEqual(stats['requests'], 3)
+        self.assertEqual(stats['reused'], 2)
+        self.assertEqual((stats['connections'], stats['active'], stats['queued']), (1, 0, 0))
+
+    async def test_pool_wait(self):
+        url = start_server(self)
+        network = Network(enable_http=True, max_connections=1)
+        NETWORKS['pool wait'] = network
+        self.addCleanup(NETWORKS.pop, 'pool wait')
+
+        requests = asyncio.gather(*[network.request('GET', url + '/0.1') for _ in range(3)])
+        await asyncio.sleep(0.05)
+        during = network.pool_stats()
+        await requests
+        stats = get_network_stats()['pool wait']
+        await network.aclose()
+
+        self.assertEqual((during['active'], during['queued'], during['utilization']), (1, 2, 1.0))
+        self.assertEqual(stats['requests'], 3)
+        # the second request waits ~0.1s, the third ~0.2s
+        self.assertGreater(stats['wait_time'], 0.25)
+
+    async def test_caller_trace(self):
+        url = start_server(self)
+        network = Network(enable_http=True)
+        events = []
+
+        async def trace(name, info):  # pylint: disable=unused-argument
+            events.append(name)
+
+        await network.request('GET', url + '/0', extensions={'trace': trace})
+        stats = network.pool_stats()
+        await network.aclose()
+
+        self.assertIn('connection.connect_tcp.started', events)
+        self.assertIn('http11.receive_response_body.complete', events)
+        self.assertEqual(stats['requests'], 1)
+
+    def test_network_names(self):
+        shared = Network(logger_name='shared')
+        default = Network(logger_name='default')
+        # engines that reference a network come first
+        networks = {'engine a': shared, 'engine b': default, 'shared': shared, DEFAULT_NAME: default}
+        self.setattr4test(searx.network.network, 'NETWORKS', networks)
+
+        self.assertEqual(sorted(get_network_stats()), [DEFAULT_NAME, 'shared'])
+
+
+class TestNetworkInitialize(SearxTestCase):
+
+    def test_reference_to_lazy_engine(self):
+        engine_list = [
+            {'engine': 'dummy', 'name': 'engine1', 'shortcut': 'e1', 'categories': 'general', 'disabled': False},
+            {'engine': 'dummy', 'name': 'engine2', 'shortcut': 'e2', 'categories': 'general', 'network': 'engine1'},
+        ]
+        engines.load_engines(engine_list, lazy=True)
+        self.assertFalse(engines.is_engine_loaded(engines.engines['engine1']))
+        self.setattr4test(searx.network.network, 'NETWORKS', {})
+
+        initialize(engine_list, settings['outgoing'])
+
+        networks = searx.network.network.NETWORKS
+        self.assertTrue(engines.is_engine_loaded(engines.engines['engine1']))
+        self.assertIs(networks['engine2'], networks['engine1'])
+
+
+class TestMultiRequests(SearxTestCase):
+
+    def test_multi_requests(self):
+        url = start_server(self)
+        network = Network(enable_http=True)
+        NETWORKS['multi requests'] = network
+        self.addCleanup(NETWORKS.pop, 'multi requests')
+        self.addCleanup(lambda: asyncio.run_coroutine_threadsafe(network.aclose(), searx.network.get_loop()).result())
+        searx.network.set_context_network_name('multi requests')
+        self.addCleanup(searx.network.set_context_network_name, None)
+        searx.network.set_timeout_for_thread(0.5)
+        self.addCleanup(searx.network.set_timeout_for_thread, None)
+
+        request_list = [searx.network.Request.get(url + '/0', raise_for_httperror=False) for _ in range(3)]
+        request_list.append(searx.network.Request.get(url + '/1', raise_for_httperror=False))
+        with patch('asyncio.run_coroutine_threadsafe', wraps=asyncio.run_coroutine_threadsafe) as submit:
+            responses = searx.network.multi_requests(request_list)
+
+        self.assertEqual(submit.call_count, 1)
+        self.assertEqual([response.text for response in responses[:3]], ['/0'] * 3)
+        self.assertIsInstance(responses[3], httpx.TimeoutException)
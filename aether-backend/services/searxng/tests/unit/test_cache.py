@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# pylint: disable=missing-module-docstring,disable=missing-class-docstring,invalid-name
+
+import os
+import tempfile
+import time
+
+from searx.cache import ExpireCacheCfg, ExpireCacheSQLite
+
+from tests import SearxTestCase
+
+
+def build_cache(test, **kwargs):
+    # the directory also takes the -wal and -shm files of the DB
+    tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    test.addCleanup(tmp_dir.cleanup)
+    db_url = os.path.join(tmp_dir.name, 'cache.db')
+    kwargs.setdefault('WRITE_BUFFER_DELAY', 60.0)
+    cache = ExpireCacheSQLite(ExpireCacheCfg(name='TEST', db_url=db_url, **kwargs))
+    # stop writing before the directory is removed
+    test.addCleanup(cache.worker.stop)
+    return cache
+
+
+def db_rows(cache, table='TEST'):
+    if table not in cache.table_names:
+        return {}
+    return {row[0]: row[1] for row in cache.DB.execute(f'SELECT key, expire FROM {table}')}
+
+
+class TestWriteBuffer(SearxTestCase):
+
+    def test_buffered_until_flush(self):
+        cache = build_cache(self)
+        self.assertTrue(cache.set('foo', {'bar': 1}, None))
+
+        self.assertEqual(cache.get('foo'), {'bar': 1})
+        self.assertEqual(db_rows(cache), {})
+
+        self.assertEqual(cache.flush(), 1)
+        self.assertEqual(list(db_rows(cache)), ['foo'])
+        self.assertEqual(cache.get('foo'), {'bar': 1})
+        self.assertEqual(cache.flush(), 0)
+
+    def test_full_buffer_wakes_worker(self):
+        cache = build_cache(self, WRITE_BUFFER_SIZE=10)
+        cache.set_many({f'key-{i}': i for i in range(10)}, None)
+
+        for _ in range(50):
+            if len(db_rows(cache)) == 10:
+                break
+            time.sleep(0.05)
+        self.assertEqual(len(db_rows(cache)), 10)
+
+    def test_stop_worker(self):
+        cache = build_cache(self)
+        cache.set('foo', 'bar', None)
+        thread = cache.worker._thread  # pylint: disable=protected-access
+        cache.worker.stop()
+        self.assertFalse(thread.is_alive())
+        # the buffered value is still there and the next use starts a new thread
+        self.assertEqual(cache.flush(), 1)
+        cache.set('foo', 'baz', None)
+        self.assertIsNot(cache.worker._thread, thread)  # pylint: disable=protected-access
+
+    def test_write_through(self):
+        cache = build_cache(self, WRITE_BUFFER_SIZE=0)
+        cache.set('foo', 'bar', None)
+        self.assertEqual(list(db_rows(cache)), ['foo'])
+
+    def test_value_too_big(self):
+        cache = build_cache(self, MAX_VALUE_LEN=10)
+        self.assertFalse(cache.set('foo', 'x' * 100, None))
+        self.assertIsNone(cache.get('foo'))
+        self.assertFalse(cache.set_many({'a': 1, 'b': 'x' * 100}, None))
+        self.assertEqual(cache.get_many(['a', 'b']), {'a': 1})
+
+    def test_state_includes_buffered_values(self):
+        cache = build_cache(self)
+        cache.set('foo', 'bar', None, ctx='OTHER')
+        self.assertEqual([(key, value) for key, value, _ in cache.state().cached_items['OTHER']], [('foo', 'bar')])
+
+
+class TestBulk(SearxTestCase):
+
+    def test_get_many(self):
+        cache = build_cache(self)
+        self.setattr4test(ExpireCacheSQLite, 'SQL_CHUNK_SIZE', 3)
+        cache.set_many([(f'db-{i}', i) for i in range(7)], None)
+        cache.flush()
+        cache.set_many({'buffered': 'b', 'db-0': 'new'}, None)
+
+        values = cache.get_many(['db-0', 'db-4', 'db-6', 'buffered', 'missing'])
+        self.assertEqual(values, {'db-0': 'new', 'db-4': 4, 'db-6': 6, 'buffered': 'b'})
+        self.assertEqual(cache.get_many(['db-1'], ctx='OTHER'), {})
+
+    def test_expired_values_not_returned(self):
+        cache = build_cache(self)
+        cache.set('foo', 'bar', None)
+        cache.flush()
+        cache.DB.execute('UPDATE TEST SET expire = 0')
+        self.assertIsNone(cache.get('foo'))
+        self.assertEqual(cache.get_many(['foo']), {})
+
+
+class TestMaintenance(SearxTestCase):
+
+    def test_batched_delete(self):
+        cache = build_cache(self, MAINTENANCE_BATCH=3)
+        cache.set_many({f'old-{i}': i for i in range(8)}, None)
+        cache.set('new', 'value', None)
+        cache.flush()
+        cache.DB.execute("UPDATE TEST SET expire = 0 WHERE key LIKE 'old-%'")
+
+        self.assertTrue(cache.maintenance(force=True))
+        self.assertEqual(list(db_rows(cache)), ['new'])
+        self.assertFalse(cache.maintenance())
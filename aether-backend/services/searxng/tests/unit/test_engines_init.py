@@ -1,7 +1,9 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # pylint: disable=missing-module-docstring,disable=missing-class-docstring,invalid-name
 
+import searx.plugins
 from searx import settings, engines
+from searx.preferences import Preferences
 from tests import SearxTestCase
 
 
@@ -74,3 +76,78 @@ class TestEnginesInit(SearxTestCase):
             self.assertEqual(
                 cm.output, ['ERROR:searx.engines:The "engine" field is missing for the engine named "engine2"']
             )
+
+    def test_disabled_engine_not_imported(self):
+        settings['outgoing']['using_tor_proxy'] = False
+        engine_list = [
+            {'engine': 'dummy', 'name': 'engine1', 'shortcut': 'e1'},
+            {'engine': 'does_not_exist', 'name': 'engine2', 'shortcut': 'e2', 'disabled': True},
+        ]
+
+        engines.load_engines(engine_list)
+        self.assertEqual(list(engines.engines), ['engine1'])
+        self.assertEqual(list(engines.engine_load_times), ['engine1'])
+
+    def test_lazy_engines(self):
+        settings['outgoing']['using_tor_proxy'] = False
+        loaded = []
+        engines.ENGINE_LOAD_HOOKS.append(lambda name, engine: loaded.append(name))
+        self.addCleanup(engines.ENGINE_LOAD_HOOKS.pop)
+        engine_list = [
+            {'engine': 'dummy', 'name': 'engine1', 'shortcut': 'e1', 'categories': 'general', 'disabled': False},
+            {'engine': 'dummy', 'name': 'engine2', 'shortcut': 'e2', 'categories': 'general'},
+            {'engine': 'dummy', 'name': 'engine3', 'shortcut': 'e3', 'categories': 'onions', 'disabled': False},
+        ]
+
+        engines.load_engines(engine_list, lazy=True)
+        engine1 = engines.engines['engine1']
+        self.assertEqual(list(engines.engines), ['engine1', 'engine2'])
+        self.assertFalse(engines.is_engine_loaded(engine1))
+        self.assertTrue(engines.is_engine_loaded(engines.engines['engine2']))
+        self.assertEqual(engines.engine_shortcuts['e1'], 'engine1')
+        self.assertIn(engine1, engines.categories['general'])
+        self.assertEqual(engine1.categories, ['general'])
+        self.assertEqual(loaded, [])
+
+        self.assertTrue(callable(engine1.request))
+        self.assertTrue(engines.is_engine_loaded(engine1))
+        self.assertIs(engines.engines['engine1'], engine1)
+        self.assertEqual(engine1.paging, False)
+        self.assertEqual(loaded, ['engine1'])
+        self.assertIn('engine1', engines.engine_load_times)
+
+    def test_lazy_engine_validate_token(self):
+        settings['outgoing']['using_tor_proxy'] = False
+        engine_list = [
+            {'engine': 'dummy', 'name': 'engine1', 'shortcut': 'e1', 'categories': 'general', 'disabled': False},
+            {
+                'engine': 'dummy',
+                'name': 'engine2',
+                'shortcut': 'e2',
+                'categories': 'general',
+                'disabled': False,
+                'tokens': ['secret'],
+            },
+        ]
+
+        engines.load_engines(engine_list, lazy=True)
+        preferences = Preferences(['simple'], ['general'], engines.engines, searx.plugins.PluginStorage())
+        self.assertTrue(preferences.validate_token(engines.engines['engine1']))
+        self.assertFalse(preferences.validate_token(engines.engines['engine2']))
+        preferences.parse_dict({'tokens': 'secret'})
+        self.assertTrue(preferences.validate_token(engines.engines['engine2']))
+        for engine in engines.engines.values():
+            self.assertFalse(engines.is_engine_loaded(engine))
+
+    def test_lazy_engine_load_failure(self):
+        settings['outgoing']['using_tor_proxy'] = False
+        engine_data = {'engine': 'does_not_exist', 'name': 'engine1', 'shortcut': 'e1', 'categories': 'general'}
+        engine_list = [{**engine_data, 'disabled': False}]
+
+        engines.load_engines(engine_list, lazy=True)
+        engine1 = engines.engines['engine1']
+        with self.assertLogs('searx.engines', level='ERROR'):
+            self.assertFalse(engines.load_lazy_engine(engine1))
+        self.assertEqual(engines.engines, {})
+        self.assertNotIn('e1', engines.engine_shortcuts)
+        self.assertNotIn(engine1, engines.categories['general'])
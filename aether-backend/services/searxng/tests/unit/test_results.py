@@ -1,9 +1,14 @@
 # SPDX-License-Identifier: AGPL-3.0-or-later
 # pylint: disable=missing-module-docstring,disable=missing-class-docstring,invalid-name
 
+import threading
+from types import SimpleNamespace
+from unittest import mock
 
+import searx.engines
+import searx.metrics
 from searx.result_types import LegacyResult
-from searx.results import ResultContainer
+from searx.results import ResultContainer, merge_two_main_results
 from tests import SearxTestCase
 
 
@@ -58,3 +63,53 @@ class ResultContainerTestCase(SearxTestCase):
         self.assertIn(result, result_list)
         self.assertEqual(result_list[0].title, result.title)
         self.assertEqual(result_list[0].content, result.content)
+
+
+class ResultContainerMergeTestCase(SearxTestCase):
+    """50 engines with 30 results each, merged concurrently."""
+
+    ENGINES = 50
+    RESULTS = 30
+
+    def setUp(self):
+        super().setUp()
+        names = ['bench%d' % i for i in range(self.ENGINES)]
+        for i, name in enumerate(names):
+            category = ['general', 'images', 'news'][i % 3]
+            searx.engines.engines[name] = SimpleNamespace(name=name, categories=[category], weight=1, paging=False)
+            self.addCleanup(searx.engines.engines.pop, name)
+        self.addCleanup(setattr, searx.metrics, 'counter_storage', searx.metrics.counter_storage)
+        self.addCleanup(setattr, searx.metrics, 'histogram_storage', searx.metrics.histogram_storage)
+        searx.metrics.initialize(names)
+
+    def engine_results(self, engine: int):
+        # every URL is returned by 5 engines, in different positions
+        return [
+            {'url': f'https://example.org/{(engine * 6 + pos) % 300}', 'title': f'title {pos}', 'content': 'lorem'}
+            for pos in range(self.RESULTS)
+        ]
+
+    def test_merge_50_engines(self):
+        container = ResultContainer()
+        batches = [('bench%d' % i, self.engine_results(i)) for i in range(self.ENGINES)]
+        barrier = threading.Barrier(self.ENGINES)
+
+        def respond(engine_name, results):
+            barrier.wait()
+            container.extend(engine_name, results)
+
+        threads = [threading.Thread(target=respond, args=batch) for batch in batches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # the staged batches are merged once, when the results are read
+        with mock.patch('searx.results.merge_two_main_results', wraps=merge_two_main_results) as merge:
+            results = container.get_ordered_results()
+        self.assertEqual(merge.call_count, self.ENGINES * self.RESULTS - 300)
+        self.assertEqual(len(results), 300)
+        self.assertEqual(sum(len(r.positions) for r in results), self.ENGINES * self.RESULTS)
+        self.assertTrue(all(len(r.engines) == 5 for r in results))
+        scores = [r.score for r in results if r.category == 'general']
+        self.assertEqual(scores, sorted(scores, reverse=True))
@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# pylint: disable=missing-module-docstring,disable=missing-class-docstring,invalid-name
+
+import threading
+import time
+from types import SimpleNamespace
+from timeit import default_timer
+
+import searx.engines
+import searx.network
+import searx.search
+from searx.search import SearchQuery, EngineRef
+from searx.search.pool import EnginePool, current_task_timed_out, _parse_response
+from searx.search.processors import PROCESSORS
+
+from tests import SearxTestCase
+
+
+class SleepProcessor:
+    """Stand-in for an engine processor: sleeps, then reports a result."""
+
+    def __init__(self, name, delay):
+        self.engine_name = name
+        self.delay = delay
+        self.logger = searx.search.logger
+        self.late = []
+
+    def search(self, query, params, result_container, start_time, timeout_limit):
+        time.sleep(self.delay)
+        if current_task_timed_out():
+            self.late.append(self.engine_name)
+        else:
+            result_container.add_timing(self.engine_name, default_timer() - start_time, None)
+
+
+class TestEnginePool(SearxTestCase):
+
+    def test_threads_are_reused(self):
+        pool = EnginePool(max_workers=4)
+        self.addCleanup(pool.shutdown)
+        threads = set()
+
+        def record():
+            threads.add(threading.get_ident())
+
+        for _ in range(5):
+            deadline = default_timer() + 5
+            tasks = [pool.submit('e%d' % i, record, (), deadline) for i in range(8)]
+            self.assertEqual(pool.wait(tasks, deadline), [])
+
+        self.assertLessEqual(len(threads), 4)
+
+    def test_deadline_flags_running_and_cancels_queued(self):
+        pool = EnginePool(max_workers=1)
+        self.addCleanup(pool.shutdown)
+        flags = []
+
+        def slow():
+            time.sleep(0.3)
+            flags.append(current_task_timed_out())
+
+        deadline = default_timer() + 0.1
+        running = pool.submit('slow', slow, (), deadline)
+        queued = pool.submit('queued', slow, (), deadline)
+        late = pool.wait([running, queued], deadline)
+
+        self.assertEqual([task.engine_name for task in late], ['slow', 'queued'])
+        self.assertTrue(queued.future.cancelled())
+        running.future.result(1)
+        self.assertEqual(flags, [True])
+        self.assertFalse(current_task_timed_out())
+
+    def test_thread_context_reset_between_tasks(self):
+        pool = EnginePool(max_workers=1)
+        self.addCleanup(pool.shutdown)
+        seen = []
+
+        def online():
+            searx.network.set_timeout_for_thread(1.5)
+            searx.network.reset_time_for_thread()
+            searx.network.THREADLOCAL.total_time = 0.7
+
+        def offline():
+            seen.append((searx.network.get_time_for_thread(), getattr(searx.network.THREADLOCAL, 'timeout', None)))
+
+        deadline = default_timer() + 5
+        tasks = [pool.submit('online', online, (), deadline), pool.submit('offline', offline, (), deadline)]
+        self.assertEqual(pool.wait(tasks, deadline), [])
+        self.assertEqual(seen, [(None, None)])
+
+    def test_parse_response_rebuilds_response(self):
+        def response(resp):
+            return [{'url': str(resp.url), 'title': resp.text, 'content': resp.search_params['query']}]
+
+        engine = type('ParseEngine', (), {'response': staticmethod(response)})
+        searx.engines.engines['parse engine'] = engine
+        self.addCleanup(searx.engines.engines.pop, 'parse engine')
+
+        headers = [('content-type', 'text/plain')]
+        results = _parse_response('parse engine', 'GET', 'https://example.org/?q=x', 200, headers, b'body', {'query': 'x'})
+        self.assertEqual(results, [{'url': 'https://example.org/?q=x', 'title': 'body', 'content': 'x'}])
+
+
+class TestSearchMultipleRequests(SearxTestCase):
+
+    def test_timeouts_reported_to_result_container(self):
+        processors = {'fast': SleepProcessor('fast', 0.0), 'slow': SleepProcessor('slow', 0.4)}
+        for name, processor in processors.items():
+            PROCESSORS[name] = processor
+            searx.engines.engines[name] = SimpleNamespace(display_error_messages=True)
+            self.addCleanup(PROCESSORS.pop, name)
+            self.addCleanup(searx.engines.engines.pop, name)
+
+        search_query = SearchQuery('test', [EngineRef('fast', 'general')], 'en-US', 0, 1, None, None)
+        search = searx.search.Search(search_query)
+        search.start_time = default_timer()
+        search.actual_timeout = 0.2
+        with self.app.test_request_context('/search'):
+            search.search_multiple_requests([('fast', 'test', {}), ('slow', 'test', {})])
+
+        self.assertLess(default_timer() - search.start_time, 0.35)
+        unresponsive = {engine.engine: engine.error_type for engine in search.result_container.unresponsive_engines}
+        self.assertEqual(unresponsive, {'slow': 'timeout'})
+        time.sleep(0.3)
+        self.assertEqual(processors['slow'].late, ['slow'])
@@ -0,0 +1,138 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# pylint: disable=missing-module-docstring,disable=missing-class-docstring,invalid-name
+
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+
+import searx.engines
+import searx.metrics
+import searx.search
+from searx.metrics import get_search_cache_stats
+from searx.results import ResultContainer
+from searx.search import SearchQuery, EngineRef
+from searx.search import result_cache
+from searx.search.processors import PROCESSORS
+from searx.search.result_cache import ResultCache
+
+from tests import SearxTestCase
+
+
+class CountingProcessor:
+    """Stand-in for an engine processor: adds one result per search."""
+
+    def __init__(self, name, delay=0.0):
+        self.engine_name = name
+        self.engine = SimpleNamespace(timeout=3.0)
+        self.logger = searx.search.logger
+        self.delay = delay
+        self.calls = 0
+
+    def extend_container_if_suspended(self, result_container):
+        return False
+
+    def get_params(self, search_query, engine_category):
+        return {}
+
+    def search(self, query, params, result_container, start_time, timeout_limit):
+        self.calls += 1
+        time.sleep(self.delay)
+        result_container.extend(self.engine_name, [{'url': 'https://example.org/', 'title': query, 'content': ''}])
+
+
+def search_query(query, category='general', pageno=1):
+    return SearchQuery(query, [EngineRef('counting', category)], 'en-US', 0, pageno, None, None)
+
+
+def build_result_cache(test, **kwargs):
+    tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+    test.addCleanup(tmp_dir.cleanup)
+    cache = ResultCache(db_url=os.path.join(tmp_dir.name, 'cache.db'), **kwargs)
+    test.addCleanup(cache.cache.worker.stop)
+    return cache
+
+
+def register_engine(test):
+    engine = SimpleNamespace(
+        name='counting', categories=['general'], display_error_messages=True, weight=1, timeout=3.0, paging=False
+    )
+    searx.engines.engines['counting'] = engine
+    test.addCleanup(searx.engines.engines.pop, 'counting')
+    searx.metrics.initialize(['counting'])
+
+
+class TestResultCacheKey(SearxTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.cache = build_result_cache(self, ttl=300, category_ttl={'news': 30})
+
+    def test_key_normalises_query(self):
+        self.assertEqual(self.cache.key(search_query('Hello  World')), self.cache.key(search_query(' hello world')))
+        self.assertNotEqual(self.cache.key(search_query('hello')), self.cache.key(search_query('hello', pageno=2)))
+        self.assertNotEqual(self.cache.key(search_query('hello')), self.cache.key(search_query('hello'), ['hostnames']))
+
+    def test_category_ttl(self):
+        self.assertEqual(self.cache.ttl_for(search_query('x')), 300)
+        self.assertEqual(self.cache.ttl_for(search_query('x', 'news')), 30)
+
+    def test_container_round_trip(self):
+        register_engine(self)
+        container = ResultContainer()
+        container.on_result = lambda _: True
+        container.extend('counting', [{'url': 'https://example.org/', 'title': 'T', 'content': ''}])
+        container.add_unresponsive_engine('counting', 'timeout', suspended=True)
+
+        self.assertTrue(ResultCache.cacheable(container))
+        self.cache.cache.set('k', container, 60)
+        restored = self.cache.cache.get('k')
+        restored.close()
+        self.assertEqual([r['title'] for r in restored.get_ordered_results()], ['T'])
+
+        container.add_unresponsive_engine('counting', 'timeout')
+        self.assertFalse(ResultCache.cacheable(container))
+
+
+class TestCachedSearch(SearxTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.processor = CountingProcessor('counting', delay=0.2)
+        PROCESSORS['counting'] = self.processor
+        self.addCleanup(PROCESSORS.pop, 'counting')
+        register_engine(self)
+        self.setattr4test(result_cache, 'RESULT_CACHE', build_result_cache(self))
+
+    def run_search(self, query):
+        search = searx.search.Search(search_query(query))
+        with self.app.test_request_context('/search'):
+            return search.search()
+
+    def test_repeated_search_served_from_cache(self):
+        before = get_search_cache_stats()
+        first = self.run_search('Aether agents')
+        second = self.run_search('aether   AGENTS')
+
+        self.assertEqual(self.processor.calls, 1)
+        self.assertEqual(len(second.main_results_map), 1)
+        self.assertIsNot(first, second)
+        stats = get_search_cache_stats()
+        self.assertEqual(stats['hit'] - before['hit'], 1)
+        self.assertEqual(stats['miss'] - before['miss'], 1)
+
+    def test_concurrent_identical_searches_deduplicated(self):
+        containers = []
+
+        def work():
+            containers.append(self.run_search('same query'))
+
+        threads = [threading.Thread(target=work) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.processor.calls, 1)
+        self.assertEqual([len(c.main_results_map) for c in containers], [1] * 5)
@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: AGPL-3.0-or-later
+# pylint: disable=missing-module-docstring,disable=missing-class-docstring,invalid-name
+
+import time
+from types import SimpleNamespace
+from timeit import default_timer
+
+import searx.engines
+import searx.metrics
+import searx.search
+from searx.metrics import counter, histogram_observe
+from searx.search import SearchQuery, EngineRef, scheduler
+from searx.search.processors import PROCESSORS
+from searx.search.processors.abstract import EngineProcessor, SuspendedStatus
+from searx.search.result_cache import ResultCache
+from searx.search.scheduler import AdaptiveScheduler
+
+from tests import SearxTestCase
+
+
+class DelayProcessor(EngineProcessor):
+    """Engine processor answering each request after the next of ``delays``."""
+
+    def __init__(self, name, delays, count=1):  # pylint: disable=super-init-not-called
+        self.engine = searx.engines.engines[name]
+        self.engine_name = name
+        self.logger = searx.search.logger
+        self.suspended_status = SuspendedStatus()
+        self.delays = list(delays)
+        self.count = count
+        self.calls = 0
+
+    def search(self, query, params, result_container, start_time, timeout_limit):
+        call = self.calls
+        self.calls += 1
+        time.sleep(self.delays[call])
+        results = [
+            {'url': f'https://{self.engine_name}.example.org/{call}/{i}', 'title': query, 'content': ''}
+            for i in range(self.count)
+        ]
+        self.extend_container(result_container, start_time, results)
+
+
+def register_engines(test, **processors):
+    for name, (delays, count, weight) in processors.items():
+        searx.engines.engines[name] = SimpleNamespace(
+            name=name, categories=['general'], display_error_messages=True, weight=weight, timeout=3.0, paging=False
+        )
+        test.addCleanup(searx.engines.engines.pop, name)
+    searx.metrics.initialize(list(processors))
+    for name, (delays, count, weight) in processors.items():
+        PROCESSORS[name] = DelayProcessor(name, delays, count)
+        test.addCleanup(PROCESSORS.pop, name)
+
+
+def observe(engine_name, seconds, count=20):
+    for _ in range(count):
+        histogram_observe(seconds, 'engine', engine_name, 'time', 'total')
+
+
+def run_search(test, engine_names, timeout=1.0):
+    refs = [EngineRef(name, 'general') for name in engine_names]
+    search = searx.search.Search(SearchQuery('test', refs, 'en-US', 0, 1, None, None))
+    search.start_time = default_timer()
+    search.actual_timeout = timeout
+    requests = [(name, 'test', {'n': 1}) for name in engine_names]
+    with test.app.test_request_context('/search'):
+        search.search_multiple_requests(requests)
+    return search, default_timer() - search.start_time
+
+
+class TestSkip(SearxTestCase):
+
+    def test_slow_engines_skipped_and_probed(self):
+        register_engines(self, fast=([], 1, 1), slow=([], 1, 1))
+        observe('fast', 0.2)
+        observe('slow', 2.5)
+        sched = AdaptiveScheduler(probe_interval=3)
+        requests = [('fast', 'q', {}), ('slow', 'q', {})]
+
+        kept = [[name for name, _, _ in sched.skip(requests, 1.0)] for _ in range(3)]
+        self.assertEqual(kept, [['fast'], ['fast'], ['fast', 'slow']])
+        self.assertEqual(counter('engine', 'slow', 'search', 'count', 'skipped'), 2)
+        # within the budget or all engines too slow: keep all
+        self.assertEqual(sched.skip(requests, 3.0), requests)
+        self.assertEqual(sched.skip([('slow', 'q', {})], 1.0), [('slow', 'q', {})])
+
+    def test_too_few_samples(self):
+        register_engines(self, slow=([], 1, 1))
+        observe('slow', 2.5, count=5)
+        self.assertIsNone(AdaptiveScheduler().latency('slow', 95))
+
+
+class TestRun(SearxTestCase):
+
+    def test_hedged_request(self):
+        register_engines(self, important=([0.8, 0.0], 2, 2.0), other=([0.0], 1, 1.0))
+        observe('important', 0.1)
+        self.setattr4test(scheduler, 'SCHEDULER', AdaptiveScheduler(hedge_min_weight=2.0))
+
+        search, elapsed = run_search(self, ['important', 'other'])
+
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual(PROCESSORS['important'].calls, 2)
+        self.assertEqual(counter('engine', 'important', 'search', 'count', 'hedged'), 1)
+        self.assertEqual(counter('engine', 'other', 'search', 'count', 'hedged'), 0)
+        time.sleep(0.9)
+        # only the answer of the hedge is used, the late first request is dropped
+        urls = sorted(result.url for result in search.result_container.get_ordered_results())
+        expected = [f'https://important.example.org/1/{i}' for i in range(2)] + ['https://other.example.org/0/0']
+        self.assertEqual(urls, expected)
+        self.assertEqual(search.result_container.unresponsive_engines, set())
+
+    def test_quorum_returns_early(self):
+        register_engines(self, fast=([0.0], 5, 1.0), light=([0.0], 5, 0.5), slow=([0.8], 5, 1.0))
+        self.setattr4test(scheduler, 'SCHEDULER', AdaptiveScheduler(quorum=5))
+
+        search, elapsed = run_search(self, ['fast', 'light', 'slow'])
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(counter('search', 'scheduler', 'quorum'), 1)
+        time.sleep(0.6)
+        engines = {result.engine for result in search.result_container.get_ordered_results()}
+        self.assertIn('fast', engines)
+        self.assertNotIn('slow', engines)
+        self.assertEqual(search.result_container.unresponsive_engines, set())
+        # the results of the dropped engine are missing, don't cache them
+        self.assertTrue(search.result_container.partial)
+        self.assertFalse(ResultCache.cacheable(search.result_container))
+
+    def test_deadline(self):
+        register_engines(self, fast=([0.0], 1, 1.0), slow=([0.6], 1, 1.0))
+        self.setattr4test(scheduler, 'SCHEDULER', AdaptiveScheduler(quorum=5))
+
+        search, elapsed = run_search(self, ['fast', 'slow'], timeout=0.2)
+
+        self.assertLess(elapsed, 0.4)
+        unresponsive = {engine.engine: engine.error_type for engine in search.result_container.unresponsive_engines}
+        self.assertEqual(unresponsive, {'slow': 'timeout'})
@@ -0,0 +1,201 @@
+"""
+Unit Tests: Bulk Chat Ingestion
+
+Tests for COPY-based bulk message/artifact inserts in ChatRepository and
+the batch storage endpoints.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from api.v1.endpoints.storage import create_artifacts_batch, create_messages_batch
+from api.v1.schemas.chat import ArtifactBatchCreate, MessageBatchCreate
+from data.database.repositories.chat import ChatRepository
+
+
+class FakeCopy:
+    def __init__(self, sink):
+        self.sink = sink
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def write_row(self, row):
+        self.sink.append(row)
+
+
+class FakeCursor:
+    def __init__(self, conn, rows=()):
+        self.conn = conn
+        self.rows = list(rows)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def copy(self, statement):
+        self.conn.copies.append((" ".join(statement.split()), []))
+        return FakeCopy(self.conn.copies[-1][1])
+
+
+class FakeConnection:
+    """Connection counting statements and collecting COPY rows."""
+
+    def __init__(self, chat_exists=True):
+        self.chat_exists = chat_exists
+        self.queries = []
+        self.copies = []
+
+    async def execute(self, query, params=()):
+        self.queries.append((" ".join(query.split()), params))
+        return FakeCursor(self, [{"id": params[-1]}] if self.chat_exists else [])
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+class FakeDatabase:
+    def __init__(self, chat_exists=True):
+        self.conn = FakeConnection(chat_exists)
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield self.conn
+
+
+class TestBulkMessages:
+    """Test bulk message ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_single_check_and_copy_for_whole_batch(self):
+        """Test 1,000 messages cost one chat check and one COPY."""
+        chat_id = uuid4()
+        db = FakeDatabase()
+        messages = [
+            {"role": "user" if i % 2 == 0 else "assistant", "content": f"m{i}"}
+            for i in range(1000)
+        ]
+
+        ids = await ChatRepository(db).create_messages_bulk(chat_id, messages)
+
+        assert len(ids) == 1000
+        assert db.transactions == 1
+        assert len(db.conn.queries) == 1
+        update, params = db.conn.queries[0]
+        assert update.startswith("UPDATE chats SET message_count = message_count + %s")
+        assert params[0] == 1000
+        statement, rows = db.conn.copies[0]
+        assert statement.startswith("COPY messages")
+        assert [row[0] for row in rows] == ids
+        assert params[1] == rows[-1][4]  # last_message_at is the newest timestamp
+
+    @pytest.mark.asyncio
+    async def test_default_timestamps_preserve_order(self):
+        """Test messages without timestamps keep batch order."""
+        db = FakeDatabase()
+        given = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        await ChatRepository(db).create_messages_bulk(uuid4(), [
+            {"role": "user", "content": "a", "timestamp": given},
+            {"role": "assistant", "content": "b"},
+            {"role": "user", "content": "c"},
+        ])
+
+        timestamps = [row[4] for row in db.conn.copies[0][1]]
+        assert timestamps[0] == given
+        assert timestamps[1] < timestamps[2]
+
+    @pytest.mark.asyncio
+    async def test_naive_and_default_timestamps_mixed(self):
+        """Test naive timestamps are taken as UTC next to generated ones."""
+        db = FakeDatabase()
+        naive = datetime(2024, 1, 1, 12, 0)
+
+        await ChatRepository(db).create_messages_bulk(uuid4(), [
+            {"role": "user", "content": "a", "timestamp": naive},
+            {"role": "assistant", "content": "b"},
+        ])
+
+        timestamps = [row[4] for row in db.conn.copies[0][1]]
+        assert timestamps[0] == naive.replace(tzinfo=timezone.utc)
+        assert db.conn.queries[0][1][1] == timestamps[1]
+
+    @pytest.mark.asyncio
+    async def test_unknown_chat_rejected_before_copy(self):
+        """Test a missing chat raises without streaming any rows."""
+        db = FakeDatabase(chat_exists=False)
+
+        with pytest.raises(ValueError):
+            await ChatRepository(db).create_messages_bulk(uuid4(), [{"role": "user", "content": "x"}])
+        assert db.conn.copies == []
+
+
+class TestBulkArtifacts:
+    """Test bulk artifact ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_chat_row_left_to_trigger(self):
+        """Test the batch only checks the chat; the trigger updates it."""
+        db = FakeDatabase()
+
+        await ChatRepository(db).create_artifacts_bulk(uuid4(), [
+            {"type": "code", "content": "print(1)"},
+            {"type": "code", "content": "print(2)"},
+        ])
+
+        assert [query for query, _ in db.conn.queries] == ["SELECT id FROM chats WHERE id = %s"]
+        assert len(db.conn.copies[0][1]) == 2
+
+
+class TestBatchEndpoints:
+    """Test batch endpoint request mapping."""
+
+    @pytest.mark.asyncio
+    async def test_messages_batch_response(self):
+        """Test the endpoint returns inserted ids from the repository."""
+        chat_id = uuid4()
+        repo = ChatRepository(FakeDatabase())
+        batch = MessageBatchCreate(messages=[
+            {"role": "user", "content": "hi"},
+            {"role": "assistant", "content": "hello"},
+        ])
+
+        response = await create_messages_batch(chat_id, batch, {}, repo)
+
+        assert response.inserted == 2
+        assert all(isinstance(i, UUID) for i in response.ids)
+
+    @pytest.mark.asyncio
+    async def test_artifacts_batch_unknown_chat(self):
+        """Test a missing chat maps to 404."""
+        repo = ChatRepository(FakeDatabase(chat_exists=False))
+        batch = ArtifactBatchCreate(artifacts=[{"type": "code", "content": "print(1)"}])
+
+        with pytest.raises(HTTPException) as exc:
+            await create_artifacts_batch(uuid4(), batch, {}, repo)
+        assert exc.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_artifacts_batch_invalid_message_id(self):
+        """Test malformed message ids are rejected before touching the database."""
+        db = FakeDatabase()
+        batch = ArtifactBatchCreate(artifacts=[{"type": "code", "content": "x", "message_id": "nope"}])
+
+        with pytest.raises(HTTPException) as exc:
+            await create_artifacts_batch(uuid4(), batch, {}, ChatRepository(db))
+        assert exc.value.status_code == 400
+        assert db.transactions == 0
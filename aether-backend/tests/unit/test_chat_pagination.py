@@ -0,0 +1,149 @@
+"""
+Unit Tests: Chat Listing
+
+Tests for keyset pagination, cursor encoding and list counter maintenance
+in ChatRepository and the storage endpoints.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from api.v1.endpoints.storage import _decode_chat_cursor, _encode_chat_cursor
+from data.database.repositories.chat import ChatRepository
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    async def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    """Connection recording executed SQL and returning scripted rows."""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.queries = []
+
+    async def execute(self, query, params=()):
+        self.queries.append((" ".join(query.split()), params))
+        return FakeCursor(self.results.pop(0) if self.results else [])
+
+
+class FakeDatabase:
+    def __init__(self, results):
+        self.conn = FakeConnection(results)
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self.conn
+
+    transaction = get_connection
+
+
+def chat_row(minutes: int):
+    ts = datetime(2025, 1, 1, 12, minutes, tzinfo=timezone.utc)
+    return {
+        "id": uuid4(),
+        "title": f"Chat {minutes}",
+        "created_at": ts,
+        "updated_at": ts,
+        "message_count": minutes,
+        "last_message_at": ts,
+    }
+
+
+class TestChatListing:
+    """Test chat list queries."""
+
+    @pytest.mark.asyncio
+    async def test_first_page_has_no_keyset_predicate(self):
+        """Test the first page reads chats only, fetching one extra row."""
+        db = FakeDatabase([[chat_row(3), chat_row(2), chat_row(1)]])
+        chats, has_more = await ChatRepository(db).list_chats_page(limit=2)
+
+        query, params = db.conn.queries[0]
+        assert "messages" not in query
+        assert "WHERE" not in query
+        assert "ORDER BY updated_at DESC, id DESC LIMIT %s" in query
+        assert params == (3,)
+        assert len(chats) == 2
+        assert has_more is True
+
+    @pytest.mark.asyncio
+    async def test_next_page_uses_row_comparison(self):
+        """Test later pages seek past the previous page's last (updated_at, id)."""
+        last = chat_row(5)
+        db = FakeDatabase([[chat_row(4)]])
+        chats, has_more = await ChatRepository(db).list_chats_page(
+            limit=10, after=(last["updated_at"], last["id"])
+        )
+
+        query, params = db.conn.queries[0]
+        assert "WHERE (updated_at, id) < (%s, %s)" in query
+        assert params == (last["updated_at"], last["id"], 11)
+        assert len(chats) == 1
+        assert has_more is False
+
+    def test_cursor_round_trip(self):
+        """Test cursors decode to the encoded keyset position."""
+        row = chat_row(7)
+        cursor = _encode_chat_cursor(row["updated_at"], row["id"])
+
+        assert "=" not in cursor
+        assert _decode_chat_cursor(cursor) == (row["updated_at"], row["id"])
+        with pytest.raises(ValueError):
+            _decode_chat_cursor("not-a-cursor")
+
+
+class TestListCounters:
+    """Test counters are maintained inside message write transactions."""
+
+    @pytest.mark.asyncio
+    async def test_create_message_increments_counter(self):
+        """Test create_message bumps message_count before inserting."""
+        chat_id = uuid4()
+        message = {
+            "id": uuid4(), "chat_id": chat_id, "role": "user", "content": "hi",
+            "timestamp": datetime.now(timezone.utc), "llm_model": None,
+            "llm_provider": None, "tokens_used": None, "correlation_id": None,
+            "created_at": datetime.now(timezone.utc),
+        }
+        db = FakeDatabase([[{"id": chat_id}], [message]])
+
+        await ChatRepository(db).create_message(chat_id, "user", "hi")
+
+        update, params = db.conn.queries[0]
+        assert update.startswith("UPDATE chats SET message_count = message_count + 1")
+        assert params == (chat_id,)
+        assert db.conn.queries[1][0].startswith("INSERT INTO messages")
+
+    @pytest.mark.asyncio
+    async def test_create_message_unknown_chat(self):
+        """Test a missing chat raises before any insert."""
+        db = FakeDatabase([[]])
+
+        with pytest.raises(ValueError):
+            await ChatRepository(db).create_message(uuid4(), "user", "hi")
+        assert len(db.conn.queries) == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_messages_after_decrements_counter(self):
+        """Test branch deletes subtract the deleted rows and refresh last_message_at."""
+        chat_id = uuid4()
+        db = FakeDatabase([[{"id": uuid4()}, {"id": uuid4()}], []])
+
+        deleted = await ChatRepository(db).delete_messages_after(chat_id, uuid4())
+
+        assert deleted == 2
+        update, params = db.conn.queries[1]
+        assert "message_count = GREATEST(message_count - %s, 0)" in update
+        assert params == (2, chat_id, chat_id)
@@ -0,0 +1,131 @@
+"""
+Unit Tests: Document Conversion Cache
+
+Tests for content-addressed caching, LRU eviction and in-flight
+deduplication in DocumentCache.
+"""
+
+import asyncio
+
+import pytest
+
+from core.runtime.document_cache import DocumentCache
+
+
+CONFIG = {"pipeline": "standard", "output_format": "markdown"}
+
+
+class TestDocumentCache:
+    """Test DocumentCache behaviour."""
+
+    def test_key_depends_on_content_and_config(self):
+        """Test keys change with content or pipeline configuration."""
+        key = DocumentCache.make_key(b"pdf-bytes", CONFIG)
+
+        assert key == DocumentCache.make_key(b"pdf-bytes", dict(reversed(list(CONFIG.items()))))
+        assert key != DocumentCache.make_key(b"other-bytes", CONFIG)
+        assert key != DocumentCache.make_key(b"pdf-bytes", {**CONFIG, "output_format": "doctags"})
+
+    @pytest.mark.asyncio
+    async def test_repeat_conversion_served_from_cache(self, tmp_path):
+        """Test the second identical conversion does not call Docling."""
+        cache = DocumentCache(cache_dir=tmp_path)
+        calls = 0
+
+        async def convert():
+            nonlocal calls
+            calls += 1
+            return {"content": "# Title", "format": "markdown"}
+
+        key = cache.make_key(b"pdf", CONFIG)
+        first = await cache.get_or_convert(key, convert)
+        second = await cache.get_or_convert(key, convert)
+
+        assert first == second == {"content": "# Title", "format": "markdown"}
+        assert calls == 1
+        assert cache.get_stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_restart(self, tmp_path):
+        """Test a new cache instance reads entries persisted on disk."""
+        key = DocumentCache.make_key(b"pdf", CONFIG)
+        await DocumentCache(cache_dir=tmp_path).put(key, {"content": "stored"})
+
+        fresh = DocumentCache(cache_dir=tmp_path)
+        assert await fresh.get(key) == {"content": "stored"}
+        assert fresh.get_stats()["disk_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disk_lru_eviction(self, tmp_path):
+        """Test least recently used disk entries are evicted by size."""
+        entry = {"content": "x" * 100}
+        cache = DocumentCache(cache_dir=tmp_path, max_memory_bytes=0, max_disk_bytes=250)
+
+        await cache.put("a", entry)
+        await cache.put("b", entry)
+        assert await cache.get("a") is not None  # touch a
+        await cache.put("c", entry)
+
+        assert (tmp_path / "a.json").exists()
+        assert not (tmp_path / "b.json").exists()
+        assert (tmp_path / "c.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_collapsed(self, tmp_path):
+        """Test concurrent identical conversions share one in-flight call."""
+        cache = DocumentCache(cache_dir=tmp_path)
+        calls = 0
+
+        async def convert():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"content": "shared"}
+
+        key = cache.make_key(b"pdf", CONFIG)
+        results = await asyncio.gather(*(cache.get_or_convert(key, convert) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"content": "shared"} for r in results)
+        assert cache.get_stats()["coalesced"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self, tmp_path):
+        """Test a failed conversion propagates and is retried next time."""
+        cache = DocumentCache(cache_dir=tmp_path)
+        key = cache.make_key(b"pdf", CONFIG)
+
+        async def failing():
+            raise RuntimeError("docling down")
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_convert(key, failing)
+
+        async def working():
+            return {"content": "ok"}
+
+        assert await cache.get_or_convert(key, working) == {"content": "ok"}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_conversion_to_waiter(self, tmp_path):
+        """Test cancelling the converting caller does not cancel its waiters."""
+        cache = DocumentCache(cache_dir=tmp_path)
+        key = cache.make_key(b"pdf", CONFIG)
+        calls = 0
+
+        async def convert():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"content": f"call-{calls}"}
+
+        leader = asyncio.create_task(cache.get_or_convert(key, convert))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_convert(key, convert))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await waiter == {"content": "call-2"}
+        assert calls == 2
@@ -0,0 +1,200 @@
+"""
+Unit Tests: Document Upload Streaming
+
+Tests for disk spooling, streamed multipart upload to Docling and
+progress reporting in DocumentProcessor.
+"""
+
+import base64
+import hashlib
+import tempfile
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from starlette.datastructures import UploadFile
+
+from core.runtime import document as document_module
+from core.runtime.document import (
+    DocumentProcessor,
+    InterpreterUnavailableError,
+    UploadTooLargeError,
+)
+from core.runtime.document_cache import DocumentCache
+
+
+class FakeUpload:
+    """Async-readable upload recording the largest read request."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+        self.max_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        self.max_read = max(self.max_read, size)
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += len(chunk)
+        return chunk
+
+
+class FakeConfigManager:
+    """Config manager yielding an httpx client backed by a mock transport."""
+
+    def __init__(self):
+        self.bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.bodies.append(request.read())
+            return httpx.Response(200, json={"content": "# Converted", "format": "markdown"})
+
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @asynccontextmanager
+    async def client_context(self):
+        yield self.client
+
+
+class FakeTracker:
+    async def start_request(self, *args):
+        pass
+
+    async def end_request(self, *args):
+        pass
+
+
+class FakeInterpreter:
+    def __init__(self):
+        self.messages = []
+
+    def display_message(self, message):
+        self.messages.append(message)
+
+
+@pytest.fixture
+def processor(tmp_path):
+    return DocumentProcessor(
+        FakeConfigManager(),
+        FakeTracker(),
+        cache=DocumentCache(cache_dir=tmp_path / "cache"),
+        spool_dir=tmp_path / "spool",
+    )
+
+
+class TestUploadSpooling:
+    """Test spooling uploads to disk."""
+
+    @pytest.mark.asyncio
+    async def test_stream_read_in_bounded_chunks(self, processor, monkeypatch):
+        """Test uploads are read chunk by chunk and hashed on the way."""
+        monkeypatch.setattr(document_module, "SPOOL_CHUNK_SIZE", 1024)
+        data = bytes(range(256)) * 40
+        upload = FakeUpload(data)
+
+        spooled = await processor._spool_stream(upload)
+        try:
+            assert upload.max_read == 1024
+            assert spooled.path.read_bytes() == data
+            assert spooled.digest.hexdigest() == hashlib.sha256(data).hexdigest()
+        finally:
+            spooled.cleanup()
+        assert not spooled.path.exists()
+
+    @pytest.mark.asyncio
+    async def test_upload_limit_removes_spool_file(self, processor, tmp_path):
+        """Test exceeding max_bytes fails and leaves no spool file behind."""
+        with pytest.raises(UploadTooLargeError):
+            await processor._spool_stream(FakeUpload(b"x" * 100), max_bytes=10)
+        assert list((tmp_path / "spool").iterdir()) == []
+
+    def test_base64_decoded_in_chunks(self, processor, monkeypatch):
+        """Test chunked base64 decoding matches a full decode, even with line breaks."""
+        monkeypatch.setattr(document_module, "SPOOL_CHUNK_SIZE", 7)
+        data = b"chunked base64 decoding must survive misaligned boundaries"
+        encoded = base64.encodebytes(data).decode("ascii")  # wrapped with newlines
+
+        spooled = processor._spool_base64(encoded)
+        try:
+            assert spooled.path.read_bytes() == data
+            assert DocumentCache.key_from_digest(spooled.digest, {}) == DocumentCache.make_key(data, {})
+        finally:
+            spooled.cleanup()
+
+
+class TestStreamingFileChat:
+    """Test the multipart file chat path end to end."""
+
+    @pytest.mark.asyncio
+    async def test_multipart_streams_file_and_reports_progress(self, processor, tmp_path, monkeypatch):
+        """Test the file reaches Docling intact and progress is shown."""
+        monkeypatch.setattr(document_module, "PROGRESS_STEP_BYTES", 1024)
+        data = b"%PDF-" + b"a" * 5000
+        upload = FakeUpload(data)
+        upload.size = len(data)
+        interpreter = FakeInterpreter()
+
+        async def no_llm(*args, **kwargs):
+            return None
+
+        processor._analyze_with_llm = no_llm
+        result = await processor.process_file_chat_multipart(
+            {"name": "doc.pdf", "file_object": upload}, "summarize", "req-1", interpreter
+        )
+
+        assert result["status"] == "ok"
+        body = processor._config_manager.bodies[0]
+        assert data in body
+        progress = [m["content"] for m in interpreter.messages if "MB" in m.get("content", "")]
+        assert any(p.startswith("doc.pdf - Receiving upload") and "(100%)" in p for p in progress)
+        assert any(p.startswith("doc.pdf - Uploading to Docling") and "(100%)" in p for p in progress)
+        assert list((tmp_path / "spool").iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_base64_and_multipart_share_cache(self, processor):
+        """Test both entry points produce the same cache key for the same file."""
+        data = b"identical document"
+
+        first = await processor.process_file(base64.b64encode(data).decode(), "doc.txt")
+        spooled = await processor._spool_stream(FakeUpload(data))
+        try:
+            second = await processor.process_spooled(spooled, "doc.txt")
+        finally:
+            spooled.cleanup()
+
+        assert first["success"] and second["success"]
+        assert len(processor._config_manager.bodies) == 1
+        assert processor._cache.get_stats()["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_starlette_upload_streamed_without_copy(self, processor, tmp_path):
+        """Test an UploadFile is streamed from Starlette's spool, not copied."""
+        data = b"%PDF-" + b"b" * 3000
+        spool = tempfile.SpooledTemporaryFile(max_size=1024)
+        spool.write(data)
+        upload = UploadFile(spool, size=len(data), filename="doc.pdf")
+
+        async def no_llm(*args, **kwargs):
+            return None
+
+        processor._analyze_with_llm = no_llm
+        result = await processor.process_file_chat_multipart(
+            {"name": "doc.pdf", "file_object": upload}, "summarize", "req-1", FakeInterpreter()
+        )
+
+        assert result["status"] == "ok"
+        assert data in processor._config_manager.bodies[0]
+        assert not (tmp_path / "spool").exists() or list((tmp_path / "spool").iterdir()) == []
+        assert not spool.closed
+
+    @pytest.mark.asyncio
+    async def test_client_errors_propagate(self, processor):
+        """Test oversize uploads and a missing interpreter are raised, not wrapped."""
+        with pytest.raises(UploadTooLargeError):
+            await processor.process_file_chat_multipart(
+                {"name": "doc.pdf", "file_object": FakeUpload(b"x" * 100), "max_bytes": 10},
+                "", "req-1", FakeInterpreter(),
+            )
+        with pytest.raises(InterpreterUnavailableError):
+            await processor.process_file_chat_multipart(
+                {"name": "doc.pdf", "file_object": FakeUpload(b"x")}, "", "req-2", None
+            )
@@ -0,0 +1,169 @@
+"""
+Unit Tests: Concurrent Health Checks
+
+Tests for parallel component checks with timeouts, the background system
+metrics sampler, cached health snapshots and the bulk backend health check.
+"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+import monitoring.health as health
+from monitoring.health import HealthChecker, HealthStatus, SystemMetricsSampler
+
+
+class SlowChecker:
+    """Component checker that sleeps before reporting."""
+
+    def __init__(self, delay: float, healthy: bool = True):
+        self.delay = delay
+        self.healthy = healthy
+        self.calls = 0
+
+    async def check_health(self):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return {"healthy": self.healthy, "message": "ok"}
+
+
+def component(report, name):
+    return next(c for c in report["components"] if c["component"] == name)
+
+
+class TestHealthChecker:
+    """Test concurrent checks and snapshot caching."""
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self):
+        """Test total time is bounded by the slowest check, not the sum."""
+        checker = HealthChecker()
+        for i in range(5):
+            checker.register_checker(f"c{i}", SlowChecker(0.1))
+
+        start = time.perf_counter()
+        report = await checker.check_all()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.3
+        assert report["status"] in (HealthStatus.HEALTHY.value, HealthStatus.DEGRADED.value)
+        assert len(report["components"]) == 6
+
+    @pytest.mark.asyncio
+    async def test_slow_check_times_out(self):
+        """Test a hung check is reported unhealthy without delaying the rest."""
+        checker = HealthChecker(check_timeout=0.05)
+        checker.register_checker("fast", SlowChecker(0))
+        checker.register_checker("hung", SlowChecker(10))
+
+        report = await asyncio.wait_for(checker.check_all(), 1)
+
+        assert component(report, "fast")["status"] == HealthStatus.HEALTHY.value
+        assert component(report, "hung")["status"] == HealthStatus.UNHEALTHY.value
+        assert "timed out" in component(report, "hung")["message"]
+        assert report["status"] == HealthStatus.UNHEALTHY.value
+
+    @pytest.mark.asyncio
+    async def test_snapshot_cached_and_shared(self):
+        """Test concurrent snapshot readers share one run within cache_ttl."""
+        checker = HealthChecker(cache_ttl=60)
+        slow = SlowChecker(0.02)
+        checker.register_checker("db", slow)
+
+        await asyncio.gather(*(checker.get_snapshot() for _ in range(10)))
+        await checker.get_snapshot()
+        assert slow.calls == 1
+
+        await checker.get_snapshot(max_age=0)
+        assert slow.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_peek_never_waits(self):
+        """Test peek returns immediately and refreshes in the background."""
+        checker = HealthChecker()
+        slow = SlowChecker(0.05)
+        checker.register_checker("db", slow)
+
+        assert checker.peek_snapshot() is None
+        await asyncio.sleep(0.1)
+
+        snapshot = checker.peek_snapshot()
+        assert snapshot is not None
+        assert slow.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_system_check_reads_sample(self, monkeypatch):
+        """Test the system check uses the sampler instead of blocking psutil."""
+        def blocking_cpu_percent(interval=None):
+            assert interval is None
+            return 97.0
+        monkeypatch.setattr(health.psutil, "cpu_percent", blocking_cpu_percent)
+
+        checker = HealthChecker(sampler=SystemMetricsSampler(interval=60))
+        result = await checker.check_component("system")
+
+        assert result.status == HealthStatus.DEGRADED
+        assert result.details["cpu"]["percent"] == 97.0
+
+
+class TestSystemMetricsSampler:
+    """Test background sampling."""
+
+    @pytest.mark.asyncio
+    async def test_background_sampling(self):
+        """Test the sampler refreshes its snapshot on its interval."""
+        sampler = SystemMetricsSampler(interval=0.01)
+        await sampler.start()
+        await asyncio.sleep(0.05)
+        first = sampler.snapshot()["sampled_at"]
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+
+        assert sampler.snapshot()["sampled_at"] > first
+        assert not sampler.running
+
+
+class TestBackendsHealth:
+    """Test bulk backend health checks."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_check_parallel_with_timeout(self, monkeypatch):
+        """Test backends are probed concurrently and a hung one times out."""
+        from api.v1.endpoints import backends
+
+        async def probe(name):
+            await asyncio.sleep(10 if name == "hung" else 0.1)
+            return {"healthy": True}
+
+        monkeypatch.setattr(backends, "_probe_backend", probe)
+        monkeypatch.setattr(backends, "BACKEND_HEALTH_TIMEOUT", 0.2)
+        monkeypatch.setattr(backends, "_load_integrations_registry", lambda: {
+            "integrations": {"a": {}, "b": {}, "c": {}, "hung": {}}
+        })
+
+        start = time.perf_counter()
+        result = await backends.check_all_backends_health({})
+
+        assert time.perf_counter() - start < 0.5
+        assert result["healthy_backends"] == 3
+        assert result["health_checks"]["hung"]["error"] == "Health check timed out"
+
+    def test_registry_reloaded_only_on_change(self, tmp_path, monkeypatch):
+        """Test the parsed registry is reused until the file changes."""
+        from api.v1.endpoints import backends
+
+        path = tmp_path / "integrations_registry.yaml"
+        path.write_text("integrations:\n  ocr: {}\n")
+        monkeypatch.setattr(backends, "REGISTRY_PATH", path)
+        monkeypatch.setattr(backends, "_registry_cache", None)
+
+        first = backends._load_integrations_registry()
+        assert backends._load_integrations_registry() is first
+
+        path.write_text("integrations:\n  ocr: {}\n  tts: {}\n")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert set(backends._load_integrations_registry()["integrations"]) == {"ocr", "tts"}
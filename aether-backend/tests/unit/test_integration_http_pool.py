@@ -0,0 +1,164 @@
+"""
+Unit Tests: Integration HTTP Pools
+
+Tests for shared keep-alive clients, cached Perplexica model discovery,
+the normalised answer cache and pooled xlwings calls.
+"""
+
+import threading
+
+import httpx
+import pytest
+
+from core.integrations.libraries.xlwings import excel
+from core.integrations.providers.perplexica import search
+from utils import http
+
+
+class FakeService:
+    """MockTransport handler emulating Perplexica, LM Studio and xlwings."""
+
+    def __init__(self, search_status=200):
+        self.search_status = search_status
+        self.paths = []
+
+    def __call__(self, request):
+        self.paths.append(request.url.path)
+        if request.url.path == "/api/models":
+            return httpx.Response(200, json={
+                "chatModelProviders": {"custom_openai": {}},
+                "embeddingModelProviders": {"custom_openai": {}},
+            })
+        if request.url.path == "/v1/models":
+            return httpx.Response(200, json={"data": [{"id": "qwen"}, {"id": "nomic-embedding"}]})
+        if request.url.path == "/api/search":
+            if self.search_status != 200:
+                return httpx.Response(self.search_status, text="model not loaded")
+            query = request.read().decode()
+            return httpx.Response(200, json={"message": f"answer {query[:10]}", "sources": [{"url": "a"}]})
+        return httpx.Response(200, json={"ok": True, "path": request.url.path})
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """Seed the shared sync pools with mock-transport clients."""
+    fake = FakeService()
+    pools = {
+        name: httpx.Client(transport=httpx.MockTransport(fake))
+        for name in ("perplexica", "xlwings")
+    }
+    monkeypatch.setattr(http, "_sync_clients", dict(pools))
+    monkeypatch.setattr(search, "_get_lm_studio_url", lambda: "http://lmstudio/v1")
+    monkeypatch.setattr(search, "_get_cache_ttls", lambda: (300.0, 60.0))
+    search.clear_search_caches()
+    fake.pools = pools
+    yield fake
+    search.clear_search_caches()
+    for client in pools.values():
+        client.close()
+
+
+class TestSyncClientPool:
+    """Test shared client reuse."""
+
+    def test_client_reused_per_name(self, monkeypatch):
+        """Test one client per pool name until closed."""
+        monkeypatch.setattr(http, "_sync_clients", {})
+        first = http.get_sync_http_client("perplexica")
+
+        assert http.get_sync_http_client("perplexica") is first
+        assert http.get_sync_http_client("xlwings") is not first
+
+        http.close_sync_http_clients()
+        assert first.is_closed
+        second = http.get_sync_http_client("perplexica")
+        assert second is not first
+        http.close_sync_http_clients()
+
+
+class TestPerplexicaCaching:
+    """Test model discovery and answer caching."""
+
+    def test_discovery_cached_across_searches(self, service):
+        """Test model discovery runs once for repeated searches."""
+        for i in range(3):
+            result = search.perplexica_search(f"query {i}", base_url="http://perplexica")
+            assert result["model_used"] == "custom_openai/qwen"
+
+        assert service.paths.count("/api/models") == 1
+        assert service.paths.count("/v1/models") == 1
+        assert service.paths.count("/api/search") == 3
+        assert http.get_sync_http_client("perplexica") is service.pools["perplexica"]
+
+    def test_slow_endpoint_does_not_block_other_discoveries(self, service, monkeypatch):
+        """Test discovery is serialized per endpoint, not process-wide."""
+        release = threading.Event()
+        started = threading.Event()
+        match = ({"name": "chat"}, {"name": "embed"})
+
+        def discover(base_url, lm_studio_url):
+            if base_url == "http://slow":
+                started.set()
+                release.wait(5)
+            return match
+
+        monkeypatch.setattr(search, "_discover_models", discover)
+        slow = threading.Thread(target=search.find_best_model_match, args=("http://slow",))
+        slow.start()
+        try:
+            assert started.wait(5)
+            fast = threading.Thread(target=search.find_best_model_match, args=("http://fast",))
+            fast.start()
+            fast.join(1)
+            assert not fast.is_alive()
+        finally:
+            release.set()
+            slow.join()
+
+    def test_answer_cache_normalises_query(self, service):
+        """Test case, whitespace and trailing punctuation share a cache entry."""
+        first = search.perplexica_search("What is  HTTP/2?", base_url="http://perplexica")
+        second = search.perplexica_search("what is http/2", base_url="http://perplexica")
+        other_focus = search.perplexica_search("what is http/2", focus="academicSearch", base_url="http://perplexica")
+
+        assert "cached" not in first
+        assert second["cached"] is True
+        assert second["query"] == "what is http/2"
+        assert second["answer"] == first["answer"]
+        assert "cached" not in other_focus
+        assert service.paths.count("/api/search") == 2
+
+    def test_failed_search_not_cached_and_rediscovers(self, service):
+        """Test errors are not cached and drop the cached model match."""
+        service.search_status = 500
+        failed = search.perplexica_search("q", base_url="http://perplexica")
+        service.search_status = 200
+        result = search.perplexica_search("q", base_url="http://perplexica")
+
+        assert failed["error"] == "Search failed: HTTP 500"
+        assert "cached" not in result
+        assert service.paths.count("/api/models") == 2
+
+    @pytest.mark.asyncio
+    async def test_async_search_shares_caches(self, service):
+        """Test the async variant uses cached discovery and answers."""
+        search.perplexica_search("q", base_url="http://perplexica")
+
+        result = await search.perplexica_search_async("Q?", base_url="http://perplexica")
+
+        assert result["cached"] is True
+        assert service.paths.count("/api/models") == 1
+
+
+class TestXlwingsPool:
+    """Test xlwings operations share the pooled client."""
+
+    def test_calls_use_pooled_client(self, service, monkeypatch):
+        """Test operations go through the shared xlwings client."""
+        monkeypatch.setattr(excel, "_get_xlwings_url", lambda: "http://xlwings")
+
+        assert excel._xlwings_api_call("/health")["path"] == "/health"
+        assert excel._xlwings_api_call("/workbooks/create", "POST", {"a": 1})["ok"] is True
+
+        assert service.paths == ["/health", "/workbooks/create"]
+        assert not service.pools["xlwings"].is_closed
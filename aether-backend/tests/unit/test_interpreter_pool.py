@@ -0,0 +1,209 @@
+"""
+Unit Tests: Interpreter Pool
+
+Tests for interpreter checkout, session affinity, context isolation
+and recycling in InterpreterPool.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from core.runtime.pool import InterpreterPool
+
+
+def make_factory():
+    """Factory producing numbered fake interpreters."""
+    created = []
+
+    async def factory():
+        interp = SimpleNamespace(name=f"oi-{len(created)}", messages=[])
+        created.append(interp)
+        return interp
+
+    return factory, created
+
+
+class TestInterpreterPool:
+    """Test InterpreterPool behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_creates_instances(self):
+        """Test start() warms the configured number of instances."""
+        factory, created = make_factory()
+        pool = InterpreterPool(factory, size=3)
+        await pool.start()
+
+        assert len(created) == 3
+        assert pool.get_stats()["size"] == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions_get_distinct_instances(self):
+        """Test two sessions run concurrently on different instances."""
+        factory, _ = make_factory()
+        pool = InterpreterPool(factory, size=2)
+        await pool.start()
+
+        async with pool.acquire("a") as first:
+            async with pool.acquire("b") as second:
+                assert first is not second
+                assert pool.get_stats()["busy"] == 2
+
+    @pytest.mark.asyncio
+    async def test_session_affinity(self):
+        """Test a session returns to the instance holding its context."""
+        factory, _ = make_factory()
+        pool = InterpreterPool(factory, size=2)
+        await pool.start()
+
+        async with pool.acquire("a") as first:
+            first.messages.append("hello")
+        async with pool.acquire("b"):
+            pass
+        async with pool.acquire("a") as again:
+            assert again is first
+            assert again.messages == ["hello"]
+
+    @pytest.mark.asyncio
+    async def test_context_isolated_when_instance_switches_session(self):
+        """Test messages are stashed and restored across sessions on one instance."""
+        factory, _ = make_factory()
+        pool = InterpreterPool(factory, size=1)
+        await pool.start()
+
+        async with pool.acquire("a") as interp:
+            interp.messages.append("from a")
+        async with pool.acquire("b") as interp:
+            assert interp.messages == []
+            interp.messages.append("from b")
+        async with pool.acquire("a") as interp:
+            assert interp.messages == ["from a"]
+
+    @pytest.mark.asyncio
+    async def test_checkout_waits_for_free_instance(self):
+        """Test a request waits when all instances are busy."""
+        factory, _ = make_factory()
+        pool = InterpreterPool(factory, size=1)
+        await pool.start()
+        order = []
+
+        async def use(session, hold):
+            async with pool.acquire(session):
+                order.append(f"start-{session}")
+                await asyncio.sleep(hold)
+                order.append(f"end-{session}")
+
+        await asyncio.gather(use("a", 0.05), use("b", 0))
+        assert order == ["start-a", "end-a", "start-b", "end-b"]
+
+    @pytest.mark.asyncio
+    async def test_acquire_timeout(self):
+        """Test checkout fails after the acquire timeout."""
+        factory, _ = make_factory()
+        pool = InterpreterPool(factory, size=1, acquire_timeout=0.01)
+        await pool.start()
+
+        async with pool.acquire("a"):
+            with pytest.raises(RuntimeError):
+                async with pool.acquire("b"):
+                    pass
+        assert pool.get_stats()["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_zero_timeout_does_not_wait(self):
+        """Test a checkout with timeout=0 fails at once when it would wait."""
+        factory, _ = make_factory()
+        pool = InterpreterPool(factory, size=1)
+        await pool.start()
+
+        async with pool.acquire("a") as interp:
+            assert pool.get_busy_session_interpreter("a") is interp
+            with pytest.raises(RuntimeError):
+                async with pool.acquire("a", timeout=0):
+                    pass
+        assert pool.get_busy_session_interpreter("a") is None
+
+        async with pool.acquire("a", timeout=0) as again:
+            assert again is interp
+
+    @pytest.mark.asyncio
+    async def test_recycle_after_max_requests(self):
+        """Test an instance is replaced after max_requests and context survives."""
+        factory, created = make_factory()
+        pool = InterpreterPool(factory, size=1, max_requests=2)
+        await pool.start()
+
+        for _ in range(2):
+            async with pool.acquire("a") as interp:
+                interp.messages.append("turn")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        async with pool.acquire("a") as interp:
+            assert interp is created[-1]
+            assert interp.messages == ["turn", "turn"]
+        assert len(created) == 2
+        assert pool.get_stats()["recycled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recycled_and_stopped_instances_are_retired(self):
+        """Test on_retire receives replaced instances and all instances on stop."""
+        factory, created = make_factory()
+        retired = []
+
+        async def on_retire(interp, replacement):
+            retired.append((interp.name, replacement.name if replacement else None))
+
+        pool = InterpreterPool(
+            factory, size=1, max_requests=1, on_retire=on_retire
+        )
+        await pool.start()
+
+        async with pool.acquire("a"):
+            pass
+        await asyncio.gather(*pool._recycle_tasks)
+
+        assert retired == [("oi-0", "oi-1")]
+        assert pool.primary is created[1]
+
+        await pool.stop()
+        assert retired == [("oi-0", "oi-1"), ("oi-1", None)]
+
+    @pytest.mark.asyncio
+    async def test_request_lookup(self):
+        """Test the serving interpreter can be found by request id."""
+        factory, _ = make_factory()
+        pool = InterpreterPool(factory, size=2)
+        await pool.start()
+
+        async with pool.acquire("a", request_id="req-1") as interp:
+            assert pool.get_request_interpreter("req-1") is interp
+        assert pool.get_request_interpreter("req-1") is None
+
+
+class TestRetiredInterpreter:
+    """Test InterpreterManager handling of retired pool instances."""
+
+    @pytest.mark.asyncio
+    async def test_primary_follows_replacement_and_instance_is_closed(self):
+        """Test the primary moves off a retired instance, which is torn down."""
+        from core.runtime.interpreter import InterpreterManager
+
+        terminated = []
+        old = SimpleNamespace(
+            stop_event=asyncio.Event(),
+            computer=SimpleNamespace(terminate=lambda: terminated.append("old")),
+        )
+        new = SimpleNamespace()
+        manager = InterpreterManager()
+        manager._interpreter = old
+
+        manager.replace_interpreter(new, None)
+        assert manager.get_interpreter() is old
+
+        manager.replace_interpreter(old, new)
+        await manager.close_interpreter(old)
+        assert manager.get_interpreter() is new
+        assert old.stop_event.is_set()
+        assert terminated == ["old"]
@@ -0,0 +1,188 @@
+"""
+Unit Tests: MCP Execution Auditing
+
+Tests for the background batched audit writer and its use by
+MCPServerManager.execute_tool.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from core.mcp.audit import ExecutionAuditWriter
+from core.mcp.manager import MCPServerManager
+
+
+class FakeAuditDatabase:
+    """Records batched writes; can block or fail on demand."""
+
+    def __init__(self, failures: int = 0):
+        self.batches = []
+        self.deltas = []
+        self.failures = failures
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.fold_gate = asyncio.Event()
+        self.fold_gate.set()
+
+    async def log_executions(self, executions):
+        await self.gate.wait()
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(executions))
+        return len(executions)
+
+    async def apply_usage_deltas(self, deltas):
+        await self.fold_gate.wait()
+        self.deltas.append(dict(deltas))
+
+
+def execution(server_id, status="success"):
+    return {
+        "server_id": server_id,
+        "tool_name": "echo",
+        "arguments": {},
+        "result": "ok" if status == "success" else None,
+        "status": status,
+        "duration_ms": 1,
+    }
+
+
+class TestExecutionAuditWriter:
+    """Test batching, backpressure and draining."""
+
+    @pytest.mark.asyncio
+    async def test_records_batched_and_counters_folded(self):
+        """Test a burst becomes few multi-row writes and one usage fold per server."""
+        db = FakeAuditDatabase()
+        writer = ExecutionAuditWriter(db, batch_size=100, flush_interval=0.05)
+        await writer.start()
+        server_id = uuid4()
+
+        for i in range(250):
+            await writer.record(execution(server_id, "error" if i % 10 == 0 else "success"))
+        await writer.stop()
+
+        assert sum(len(b) for b in db.batches) == 250
+        assert len(db.batches) == 3
+        totals = {"calls": 0, "errors": 0}
+        for deltas in db.deltas:
+            totals["calls"] += deltas[server_id]["calls"]
+            totals["errors"] += deltas[server_id]["errors"]
+        assert totals == {"calls": 225, "errors": 25}
+
+    @pytest.mark.asyncio
+    async def test_full_queue_applies_backpressure(self):
+        """Test record() waits while the queue is full and resumes once drained."""
+        db = FakeAuditDatabase()
+        db.gate.clear()
+        writer = ExecutionAuditWriter(db, max_queue_size=2, batch_size=1, flush_interval=0)
+        await writer.start()
+        server_id = uuid4()
+
+        await writer.record(execution(server_id))
+        await asyncio.sleep(0.01)  # Taken by the writer, which now blocks
+        for _ in range(2):  # Fill the queue
+            await writer.record(execution(server_id))
+        blocked = asyncio.create_task(writer.record(execution(server_id)))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+        assert writer.get_stats()["backpressure_waits"] == 1
+
+        db.gate.set()
+        await asyncio.wait_for(blocked, 1)
+        await writer.stop()
+        assert sum(len(b) for b in db.batches) == 4
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_without_background_task(self):
+        """Test records queued before start() are still written on stop()."""
+        db = FakeAuditDatabase()
+        writer = ExecutionAuditWriter(db)
+
+        await writer.record(execution(uuid4()))
+        await writer.stop()
+
+        assert len(db.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_fold_in_flight(self):
+        """Test stop() lets a running counter fold finish instead of cancelling it."""
+        db = FakeAuditDatabase()
+        db.fold_gate.clear()
+        writer = ExecutionAuditWriter(db, flush_interval=0, counter_interval=0.05)
+        await writer.start()
+        server_id = uuid4()
+        await asyncio.sleep(0.06)
+
+        await writer.record(execution(server_id))
+        while not db.batches or writer._usage:
+            # Wait until the batch is written and the fold has taken the counters
+            await asyncio.sleep(0)
+        stopping = asyncio.create_task(writer.stop())
+        await asyncio.sleep(0.01)
+        assert not stopping.done()
+
+        db.fold_gate.set()
+        await stopping
+        assert len(db.deltas) == 1
+        assert db.deltas[0][server_id]["calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_without_writer_drops_instead_of_blocking(self):
+        """Test record() never waits when no writer task drains the queue."""
+        db = FakeAuditDatabase()
+        writer = ExecutionAuditWriter(db, max_queue_size=2)
+        server_id = uuid4()
+
+        for _ in range(3):
+            await asyncio.wait_for(writer.record(execution(server_id)), 1)
+        assert writer.get_stats()["dropped"] == 1
+        assert writer.get_stats()["backpressure_waits"] == 0
+
+        await writer.stop()
+        assert sum(len(b) for b in db.batches) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retried_then_dropped(self):
+        """Test transient failures are retried and persistent ones dropped."""
+        db = FakeAuditDatabase(failures=1)
+        writer = ExecutionAuditWriter(db, max_retries=2)
+        await writer.record(execution(uuid4()))
+        await writer.flush()
+        assert len(db.batches) == 1
+
+        db.failures = 2
+        await writer.record(execution(uuid4()))
+        await writer.flush()
+        assert writer.get_stats()["dropped"] == 1
+
+
+class TestManagerAuditing:
+    """Test execute_tool no longer writes audit rows inline."""
+
+    @pytest.mark.asyncio
+    async def test_execute_tool_defers_audit(self):
+        """Test tool results return before any database write happens."""
+        db = FakeAuditDatabase()
+        db.log_execution = AsyncMock()
+        db.increment_usage = AsyncMock()
+        manager = MCPServerManager(db)
+        server_id = uuid4()
+        server = MagicMock()
+        server.apply_tool = AsyncMock(return_value="done")
+        manager._active_servers[server_id] = server
+
+        result = await manager.execute_tool(server_id, "echo", {"x": 1})
+
+        assert result["success"] is True
+        db.log_execution.assert_not_called()
+        db.increment_usage.assert_not_called()
+        assert db.batches == []
+
+        await manager.stop()
+        assert db.batches[0][0]["tool_name"] == "echo"
+        assert db.deltas[0][server_id]["calls"] == 1
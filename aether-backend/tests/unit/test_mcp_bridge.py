@@ -0,0 +1,167 @@
+"""
+Unit Tests: MCP Bridge
+
+Tests for loop-bound synchronous calls from agent threads, async tool
+wrappers, server-name caching and registered tool dispatch.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from core.integrations.providers.mcp.bridge import MCPBridge
+
+SERVER_ID = uuid4()
+
+
+class FakeDB:
+    def __init__(self):
+        self.lookups = 0
+
+    async def get_server_by_name(self, name):
+        self.lookups += 1
+        await asyncio.sleep(0.01)
+        return {"id": str(SERVER_ID)} if name == "weather" else None
+
+
+class FakeManager:
+    def __init__(self, delay=0.05):
+        self.db = FakeDB()
+        self.delay = delay
+        self.loop_threads = set()
+
+    async def list_servers(self):
+        return [{
+            "id": SERVER_ID, "name": "weather", "display_name": "Weather",
+            "server_type": "local", "status": "running", "is_running": True,
+        }]
+
+    async def get_server_tools(self, server_id, refresh=False):
+        return [{"function": {"name": "forecast", "description": "Forecast", "parameters": {}}}]
+
+    async def execute_tool(self, server_id, tool_name, arguments, execution_context=None):
+        import threading
+        self.loop_threads.add(threading.get_ident())
+        await asyncio.sleep(self.delay)
+        if server_id != SERVER_ID:
+            raise RuntimeError("Server is not running")
+        return {"success": True, "result": arguments, "duration_ms": 1}
+
+    async def check_server_health(self, server_id):
+        return {"healthy": True}
+
+
+def make_bridge(manager):
+    computer = SimpleNamespace()
+    return MCPBridge(SimpleNamespace(computer=computer), manager), computer
+
+
+class TestSyncCalls:
+    """Test synchronous calls are dispatched to the owning loop."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_thread_calls_overlap(self):
+        """Test 50 agent threads run tool calls concurrently on the bridge loop."""
+        manager = FakeManager(delay=0.1)
+        bridge, _ = make_bridge(manager)
+        assert bridge.install()
+
+        def agent_call(i):
+            return bridge.execute("weather", "forecast", day=i)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=50) as pool:
+            results = await asyncio.gather(*(
+                asyncio.get_running_loop().run_in_executor(pool, agent_call, i) for i in range(50)
+            ))
+        elapsed = time.perf_counter() - start
+
+        assert all(r["success"] for r in results)
+        assert [r["result"]["day"] for r in results] == list(range(50))
+        assert elapsed < 1.0
+        # Concurrent misses share one lookup; every call ran on the main loop thread
+        assert manager.db.lookups == 1
+        assert len(manager.loop_threads) == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_call_on_loop_thread_refused(self):
+        """Test a sync call from the loop thread fails fast instead of deadlocking."""
+        bridge, _ = make_bridge(FakeManager())
+        bridge.install()
+
+        result = bridge.execute("weather", "forecast")
+
+        assert result["success"] is False
+        assert "async variant" in result["error"]
+
+    def test_unbound_bridge_reports_error(self):
+        """Test calls before install() return an error result."""
+        bridge, _ = make_bridge(FakeManager())
+
+        assert bridge.list_servers() == []
+        assert bridge.execute("weather", "forecast")["success"] is False
+
+
+class TestAsyncCalls:
+    """Test async wrappers and caching."""
+
+    @pytest.mark.asyncio
+    async def test_async_wrappers(self):
+        """Test async variants resolve servers once and report unknown servers."""
+        manager = FakeManager(delay=0)
+        bridge, _ = make_bridge(manager)
+
+        assert (await bridge.aexecute("weather", "forecast", q=1))["result"] == {"q": 1}
+        assert (await bridge.ahealth("weather"))["healthy"] is True
+        assert manager.db.lookups == 1
+
+        missing = await bridge.aexecute("nope", "forecast")
+        assert missing["success"] is False
+        assert "not found" in missing["error"]
+
+    @pytest.mark.asyncio
+    async def test_registered_tools_skip_lookup(self):
+        """Test registration caches tool -> server and executors skip the DB."""
+        manager = FakeManager(delay=0)
+        bridge, computer = make_bridge(manager)
+        bridge.install()
+        await bridge._register_dynamic_tools_async()
+
+        result = await asyncio.to_thread(computer.mcp_weather_forecast, city="Paris")
+
+        assert result == {"success": True, "result": {"city": "Paris"}, "duration_ms": 1}
+        assert manager.db.lookups == 0
+        assert (await computer.mcp_tools.weather_forecast(city="Oslo"))["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_stale_server_id_invalidated(self):
+        """Test a failed execution forgets the cached server ID."""
+        bridge, _ = make_bridge(FakeManager(delay=0))
+        bridge._server_cache["weather"] = uuid4()
+
+        result = await bridge.aexecute("weather", "forecast")
+
+        assert result["success"] is False
+        assert "weather" not in bridge._server_cache
+        assert (await bridge.aexecute("weather", "forecast"))["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_cancelled_lookup_hands_over_to_waiter(self):
+        """Test cancelling the caller looking a server up does not cancel waiters."""
+        manager = FakeManager(delay=0)
+        bridge, _ = make_bridge(manager)
+
+        leader = asyncio.create_task(bridge._get_server_id("weather"))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(bridge._get_server_id("weather"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await waiter == SERVER_ID
+        assert manager.db.lookups == 2
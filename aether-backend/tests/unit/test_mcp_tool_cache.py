@@ -0,0 +1,215 @@
+"""
+Unit Tests: MCP Tool Schema Cache and Call Pipelining
+
+Tests for in-memory tool schemas with change detection, tools/list_changed
+handling and concurrent tool calls on one stdio session.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from core.mcp.manager import MCPServerManager
+from core.mcp.server import LocalMcpServer, TOOLS_LIST_CHANGED
+from data.cache.tiered import TieredCache
+
+
+def mcp_tool(name, description="Tool"):
+    return SimpleNamespace(name=name, description=description, inputSchema={"type": "object"})
+
+
+class FakeSession:
+    """ClientSession stand-in recording list and call traffic."""
+
+    def __init__(self, tools, call_delay=0.0):
+        self.tools = tools
+        self.call_delay = call_delay
+        self.list_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return SimpleNamespace(tools=list(self.tools))
+
+    async def call_tool(self, name, arguments):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.call_delay)
+        self.in_flight -= 1
+        parts = [SimpleNamespace(text=f"{name}:"), SimpleNamespace(text=str(arguments["n"]))]
+        return SimpleNamespace(content=parts)
+
+
+class StubLocalServer(LocalMcpServer):
+    async def init_server(self):
+        raise NotImplementedError
+
+
+def started_server(session, **kwargs):
+    server = StubLocalServer(**kwargs)
+    server._session = session
+    return server
+
+
+class TestToolSchemaCache:
+    """Test per-server schema caching."""
+
+    @pytest.mark.asyncio
+    async def test_schemas_cached_until_refresh(self):
+        """Test list_tools is only called on first use and explicit refresh."""
+        session = FakeSession([mcp_tool("read")])
+        server = started_server(session)
+
+        first = await server.get_tools()
+        assert await server.get_tools() is first
+        assert session.list_calls == 1
+
+        first_hash = server.tools_hash
+        await server.get_tools(refresh=True)
+        assert session.list_calls == 2
+        assert server.tools_hash == first_hash
+
+        session.tools.append(mcp_tool("write"))
+        await server.get_tools(refresh=True)
+        assert server.tools_hash != first_hash
+
+    @pytest.mark.asyncio
+    async def test_list_changed_notification_invalidates(self):
+        """Test tools/list_changed drops the cached schemas and notifies the owner."""
+        session = FakeSession([mcp_tool("read")])
+        server = started_server(session)
+        changed = []
+        server.on_tools_changed = lambda: changed.append(True)
+        await server.get_tools()
+
+        notification = SimpleNamespace(root=SimpleNamespace(method=TOOLS_LIST_CHANGED))
+        await server._handle_message(notification)
+        await server.get_tools()
+
+        assert changed == [True]
+        assert session.list_calls == 2
+
+
+class TestCallPipelining:
+    """Test concurrent call_tool requests on one session."""
+
+    @pytest.mark.asyncio
+    async def test_calls_overlap_up_to_limit(self):
+        """Test parallel calls share the session, capped by max_concurrent_calls."""
+        session = FakeSession([], call_delay=0.05)
+        server = started_server(session, max_concurrent_calls=4)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(server.apply_tool("echo", {"n": i}) for i in range(8)))
+        elapsed = time.perf_counter() - start
+
+        assert results == [f"echo:{i}" for i in range(8)]
+        assert session.max_in_flight == 4
+        assert elapsed < 0.2
+        assert server.in_flight_calls == 0
+
+
+class TestManagerToolSync:
+    """Test the manager only rewrites stored tools when they change."""
+
+    @pytest.mark.asyncio
+    async def test_database_written_on_change_only(self):
+        """Test health checks detect changes by hash and refresh the stores."""
+        db = AsyncMock()
+        cache = TieredCache(name="unit-mcp-tools")
+        manager = MCPServerManager(db, cache=cache)
+        server_id = uuid4()
+        session = FakeSession([mcp_tool("read")])
+        server = started_server(session)
+        manager._active_servers[server_id] = server
+
+        await manager.get_server_tools(server_id)
+        await manager.get_server_tools(server_id, refresh=True)
+        await manager.check_server_health(server_id)
+        assert db.upsert_tools.await_count == 1
+
+        session.tools.append(mcp_tool("write"))
+        health = await manager.check_server_health(server_id)
+
+        assert health["tool_count"] == 2
+        assert db.upsert_tools.await_count == 2
+        cached = await manager.get_server_tools(server_id)
+        assert [t["function"]["name"] for t in cached] == ["read", "write"]
+
+    @pytest.mark.asyncio
+    async def test_notification_triggers_background_refresh(self):
+        """Test a list_changed notification refreshes the shared cache copy."""
+        db = AsyncMock()
+        manager = MCPServerManager(db, cache=TieredCache(name="unit-mcp-notify"))
+        server_id = uuid4()
+        session = FakeSession([mcp_tool("read")])
+        server = started_server(session)
+        manager._active_servers[server_id] = server
+        server.on_tools_changed = lambda: manager._on_tools_changed(server_id)
+        await manager.get_server_tools(server_id)
+
+        session.tools.append(mcp_tool("write"))
+        await server._handle_message(SimpleNamespace(method=TOOLS_LIST_CHANGED))
+        await asyncio.gather(*manager._tool_refreshes.values())
+
+        tools = await manager.get_server_tools(server_id)
+        assert len(tools) == 2
+        assert db.upsert_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_notification_during_refresh_reruns_it(self):
+        """Test a change announced while list_tools runs is picked up afterwards."""
+        db = AsyncMock()
+        manager = MCPServerManager(db, cache=TieredCache(name="unit-mcp-rerun"))
+        server_id = uuid4()
+        session = FakeSession([mcp_tool("read")])
+        server = started_server(session)
+        manager._active_servers[server_id] = server
+        server.on_tools_changed = lambda: manager._on_tools_changed(server_id)
+        await manager.get_server_tools(server_id)
+
+        gate = asyncio.Event()
+        list_tools = session.list_tools
+
+        async def gated_list_tools():
+            result = await list_tools()
+            await gate.wait()
+            return result
+
+        session.list_tools = gated_list_tools
+        await server._handle_message(SimpleNamespace(method=TOOLS_LIST_CHANGED))
+        await asyncio.sleep(0)
+        # Changed after the running refresh got its answer
+        session.tools.append(mcp_tool("write"))
+        await server._handle_message(SimpleNamespace(method=TOOLS_LIST_CHANGED))
+        gate.set()
+        await asyncio.gather(*manager._tool_refreshes.values())
+
+        assert session.list_calls == 3
+        tools = await manager.get_server_tools(server_id)
+        assert [t["function"]["name"] for t in tools] == ["read", "write"]
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_refreshes(self):
+        """Test stop() ends tool refreshes before tearing down the servers."""
+        manager = MCPServerManager(AsyncMock(), cache=TieredCache(name="unit-mcp-stop"))
+        server_id = uuid4()
+        session = FakeSession([mcp_tool("read")])
+
+        async def hanging_list_tools():
+            await asyncio.Event().wait()
+
+        session.list_tools = hanging_list_tools
+        manager._active_servers[server_id] = started_server(session)
+        manager._on_tools_changed(server_id)
+        refresh = manager._tool_refreshes[server_id]
+        await asyncio.sleep(0)
+
+        await manager.stop()
+        assert refresh.cancelled()
+        assert manager._tool_refreshes == {}
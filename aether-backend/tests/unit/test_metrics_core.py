@@ -0,0 +1,150 @@
+"""
+Unit Tests: Metrics Core
+
+Tests for labeled children, bisect bucket lookup, per-thread shards,
+sliding-window summaries, exemplars and Prometheus export.
+"""
+
+import math
+import threading
+
+import pytest
+
+from monitoring.metrics import Counter, Histogram, MetricsRegistry, Summary
+
+
+class TestLabels:
+    """Test child caching and label validation."""
+
+    def test_children_cached_per_label_tuple(self):
+        """Test positional and keyword lookups return the same child."""
+        requests = Counter("requests_total", "", labels=["endpoint", "status"])
+
+        child = requests.labels("/chat", "200")
+        assert requests.labels(endpoint="/chat", status="200") is child
+        assert requests.labels(status="200", endpoint="/chat") is child
+
+        child.inc()
+        requests.inc(2, endpoint="/chat", status="200")
+        assert requests.get(endpoint="/chat", status="200") == 3
+        assert requests.get(endpoint="/chat", status="500") == 0
+
+    def test_label_mismatch_rejected(self):
+        """Test missing, extra and wrongly named labels raise ValueError."""
+        requests = Counter("requests_total", "", labels=["endpoint", "status"])
+
+        with pytest.raises(ValueError):
+            requests.inc(endpoint="/chat")
+        with pytest.raises(ValueError):
+            requests.inc(endpoint="/chat", status="200", method="GET")
+        with pytest.raises(ValueError):
+            requests.inc(endpoint="/chat", code="200")
+        with pytest.raises(ValueError):
+            requests.labels("/chat")
+        with pytest.raises(ValueError):
+            requests.inc(-1, endpoint="/chat", status="200")
+
+
+class TestHistogram:
+    """Test bucket lookup and exemplars."""
+
+    def test_bisect_buckets_are_cumulative_and_inclusive(self):
+        """Test a value equal to a bound lands in that bucket (le semantics)."""
+        latency = Histogram("latency_seconds", "", buckets=[0.1, 0.5, 1.0])
+        for value in (0.05, 0.1, 0.3, 1.0, 4.0):
+            latency.observe(value)
+
+        stats = latency.get_stats()
+        assert stats["buckets"] == {0.1: 2, 0.5: 3, 1.0: 4, float("inf"): 5}
+        assert stats["count"] == 5
+        assert stats["sum"] == pytest.approx(5.45)
+
+    def test_exemplar_kept_per_bucket(self):
+        """Test the latest exemplar is stored against the observed bucket."""
+        latency = Histogram("latency_seconds", "", labels=["tool"], buckets=[0.1, 1.0])
+        latency.observe(0.5, exemplar={"trace_id": "a"}, tool="search")
+        latency.labels("search").observe(0.7, exemplar={"trace_id": "b"})
+
+        exemplars = latency.get_stats(tool="search")["exemplars"]
+        assert list(exemplars) == [1.0]
+        assert exemplars[1.0]["labels"] == {"trace_id": "b"}
+        assert exemplars[1.0]["value"] == 0.7
+
+
+class TestShards:
+    """Test per-thread shards merge at read time."""
+
+    def test_sharded_metrics_correct_across_threads(self):
+        """Test concurrent increments from many threads are not lost."""
+        hits = Counter("hits_total", "", labels=["cache"], sharded=True)
+        sizes = Histogram("sizes", "", buckets=[1.0], sharded=True)
+        child = hits.labels("api")
+
+        def work():
+            for _ in range(10000):
+                child.inc()
+                sizes.observe(0.5)
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert hits.get(cache="api") == 80000
+        assert sizes.get_stats()["buckets"] == {1.0: 80000, float("inf"): 80000}
+
+
+class TestSummary:
+    """Test sliding-window quantiles."""
+
+    def test_quantiles_over_window(self):
+        """Test quantiles come from the most recent window; count and sum cover all."""
+        durations = Summary("durations", "", quantiles=[0.5, 0.99], window_size=100)
+        for value in range(1, 101):
+            durations.observe(1000.0)
+        for value in range(1, 101):
+            durations.observe(float(value))
+
+        stats = durations.get_stats()
+        assert stats["quantiles"] == {0.5: 50.0, 0.99: 99.0}
+        assert stats["count"] == 200
+
+    def test_empty_summary_reports_nan(self):
+        """Test quantiles are NaN before any observation."""
+        stats = Summary("durations", "").get_stats()
+        assert all(math.isnan(v) for v in stats["quantiles"].values())
+
+
+class TestExport:
+    """Test Prometheus text export."""
+
+    def test_export_format(self):
+        """Test series lines, +Inf bucket and label escaping."""
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests", ["path"]).inc(path='/a"b')
+        registry.gauge("connections", "Open connections").set(3)
+        registry.histogram("latency_seconds", "Latency", ["tool"], buckets=[0.5]).observe(0.2, tool="x")
+        registry.summary("durations", "Durations", quantiles=[0.5]).observe(2.0)
+
+        lines = registry.export_prometheus().splitlines()
+
+        assert "# TYPE requests_total counter" in lines
+        assert 'requests_total{path="/a\\"b"} 1.0' in lines
+        assert "connections 3" in lines
+        assert 'latency_seconds_bucket{tool="x",le="0.5"} 1' in lines
+        assert 'latency_seconds_bucket{tool="x",le="+Inf"} 1' in lines
+        assert 'latency_seconds_count{tool="x"} 1' in lines
+        assert 'durations{quantile="0.5"} 2.0' in lines
+        assert "durations_count 1" in lines
+
+    def test_collect_all_includes_every_type(self):
+        """Test histogram collection returns stats (and does not deadlock)."""
+        registry = MetricsRegistry()
+        registry.histogram("latency_seconds", "", buckets=[1.0]).observe(0.5)
+        registry.summary("durations", "").observe(1.0)
+
+        collected = registry.collect_all()
+
+        assert collected["latency_seconds"]["values"][0][1]["count"] == 1
+        assert collected["durations"]["type"] == "summary"
@@ -0,0 +1,181 @@
+"""
+Unit Tests: API Middleware
+
+Tests for the pure-ASGI security headers, rate limiter and error handler
+middlewares, including streaming pass-through.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from api.middleware import (
+    ErrorHandlerConfig,
+    ErrorHandlerMiddleware,
+    RateLimiterMiddleware,
+    SecurityHeadersConfig,
+    SecurityHeadersMiddleware,
+)
+from security.rate_limit import RateLimitExceeded
+
+
+def make_app(stream_gate: asyncio.Event = None) -> Starlette:
+    async def ping(request):
+        return PlainTextResponse("pong", headers={"X-Frame-Options": "ALLOWALL"})
+
+    async def boom(request):
+        raise RuntimeError("secret detail")
+
+    async def stream(request):
+        async def body():
+            yield b"first"
+            if stream_gate is not None:
+                await stream_gate.wait()
+            yield b"second"
+        return StreamingResponse(body())
+
+    async def broken_stream(request):
+        async def body():
+            yield b"partial"
+            raise RuntimeError("mid-stream failure")
+        return StreamingResponse(body())
+
+    return Starlette(routes=[
+        Route("/ping", ping),
+        Route("/boom", boom),
+        Route("/stream", stream),
+        Route("/broken-stream", broken_stream),
+    ])
+
+
+def client_for(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+class FakeLimiter:
+    def __init__(self, allow: bool):
+        self.allow = allow
+
+    async def check_rate_limit(self, client_id, tier):
+        if not self.allow:
+            raise RateLimitExceeded("Rate limit exceeded", retry_after=7)
+
+    async def get_limit_info(self, client_id, tier):
+        return {"limit": 100, "remaining": 99 if self.allow else 0, "reset": 123}
+
+
+class TestSecurityHeaders:
+    """Test header injection."""
+
+    def test_headers_precomputed_as_bytes(self):
+        """Test the config encodes header pairs once for ASGI."""
+        headers = dict(SecurityHeadersConfig(enable_hsts=True).build_raw_headers())
+
+        assert headers[b"x-content-type-options"] == b"nosniff"
+        assert headers[b"strict-transport-security"].startswith(b"max-age=")
+
+    @pytest.mark.asyncio
+    async def test_headers_added_and_override_endpoint(self):
+        """Test every response carries the configured headers."""
+        app = SecurityHeadersMiddleware(make_app(), config=SecurityHeadersConfig(x_frame_options="DENY"))
+
+        async with client_for(app) as client:
+            response = await client.get("/ping")
+
+        assert response.headers.get_list("x-frame-options") == ["DENY"]
+        assert "default-src 'self'" in response.headers["content-security-policy"]
+
+    @pytest.mark.asyncio
+    async def test_streaming_body_not_buffered(self):
+        """Test chunks reach the server while the stream is still open."""
+        gate = asyncio.Event()
+        app = ErrorHandlerMiddleware(
+            RateLimiterMiddleware(SecurityHeadersMiddleware(make_app(gate)), enabled=False)
+        )
+        sent = []
+        first_chunk = asyncio.Event()
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        async def send(message):
+            sent.append(message)
+            if message.get("body") == b"first":
+                first_chunk.set()
+
+        scope = {
+            "type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream",
+            "root_path": "", "query_string": b"", "headers": [], "scheme": "http",
+            "client": ("127.0.0.1", 1), "server": ("test", 80), "http_version": "1.1",
+            "asgi": {"version": "3.0"},
+        }
+        task = asyncio.create_task(app(scope, receive, send))
+        await asyncio.wait_for(first_chunk.wait(), 1)
+        assert not task.done()
+
+        gate.set()
+        await asyncio.wait_for(task, 1)
+        bodies = [m["body"] for m in sent if m["type"] == "http.response.body" and m.get("body")]
+        assert bodies == [b"first", b"second"]
+
+
+class TestRateLimiter:
+    """Test rate limit handling."""
+
+    @pytest.mark.asyncio
+    async def test_allowed_request_gets_limit_headers(self):
+        """Test allowed responses carry X-RateLimit-* headers."""
+        app = RateLimiterMiddleware(make_app(), enabled=True)
+        app._limiter = FakeLimiter(allow=True)
+
+        async with client_for(app) as client:
+            response = await client.get("/ping")
+
+        assert response.status_code == 200
+        assert response.headers["x-ratelimit-remaining"] == "99"
+
+    @pytest.mark.asyncio
+    async def test_limited_request_short_circuits(self):
+        """Test limited requests get 429 with Retry-After without reaching the app."""
+        app = RateLimiterMiddleware(make_app(), enabled=True)
+        app._limiter = FakeLimiter(allow=False)
+
+        async with client_for(app) as client:
+            response = await client.get("/boom")
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "7"
+        assert response.headers["x-ratelimit-limit"] == "100"
+
+
+class TestErrorHandler:
+    """Test error conversion."""
+
+    @pytest.mark.asyncio
+    async def test_unhandled_error_sanitized(self):
+        """Test errors before the response starts become a sanitized JSON 500."""
+        # Registered like app.py does: inside Starlette's ServerErrorMiddleware
+        app = make_app()
+        app.add_middleware(ErrorHandlerMiddleware, config=ErrorHandlerConfig(log_errors=False))
+
+        async with client_for(app) as client:
+            response = await client.get("/boom")
+
+        assert response.status_code == 500
+        error = response.json()["error"]
+        assert error["type"] == "RuntimeError"
+        assert "secret" not in error["message"]
+
+    @pytest.mark.asyncio
+    async def test_error_after_response_start_reraised(self):
+        """Test a mid-stream failure is not turned into a second response."""
+        app = make_app()
+        app.add_middleware(ErrorHandlerMiddleware, config=ErrorHandlerConfig(log_errors=False))
+
+        async with client_for(app) as client:
+            with pytest.raises(RuntimeError):
+                await client.get("/broken-stream")
@@ -0,0 +1,130 @@
+"""
+Unit Tests: Chat Session Store
+
+Tests for per-client conversation sessions, token-budgeted trimming,
+prefix caching and LRU eviction.
+"""
+
+import pytest
+
+from core.runtime.session import ChatSession, SessionStore, estimate_tokens
+
+
+# =============================================================================
+# ChatSession Tests
+# =============================================================================
+
+class TestChatSession:
+    """Test ChatSession history management."""
+
+    def test_append_tracks_tokens(self):
+        """Test token accounting on append."""
+        session = ChatSession("client-1", token_budget=1000)
+        session.append("user", "hello world")
+        session.append("assistant", "hi there")
+
+        assert len(session) == 2
+        assert session.total_tokens == estimate_tokens("hello world") + estimate_tokens("hi there")
+
+    def test_trim_by_token_budget(self):
+        """Test oldest messages are dropped once over budget."""
+        session = ChatSession("client-1", token_budget=50)
+        for i in range(20):
+            session.append("user", f"message number {i} " * 3)
+
+        assert session.total_tokens <= 50
+        assert session.get_messages()[-1]["content"].startswith("message number 19")
+
+    def test_trim_keeps_system_message(self):
+        """Test leading system message survives trimming."""
+        session = ChatSession("client-1", token_budget=40)
+        session.append("system", "be brief")
+        for i in range(10):
+            session.append("user", "x" * 40)
+
+        messages = session.get_messages()
+        assert messages[0] == {"role": "system", "content": "be brief"}
+        assert session.total_tokens <= 40
+
+    def test_images_not_retained(self):
+        """Test image blocks are stripped from stored history."""
+        session = ChatSession("client-1", token_budget=1000)
+        session.append("user", [
+            {"type": "text", "text": "describe this"},
+            {"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}},
+        ])
+
+        assert session.get_messages() == [{"role": "user", "content": "describe this"}]
+
+    def test_prefix_cache_reused_until_mutation(self):
+        """Test prompt prefix is rebuilt only after history changes."""
+        session = ChatSession("client-1", token_budget=1000)
+        session.append("user", "first")
+
+        session.build_messages({"role": "user", "content": "a"})
+        session.build_messages({"role": "user", "content": "b"})
+        assert session.prefix_misses == 1
+        assert session.prefix_hits == 1
+
+        session.append("assistant", "reply")
+        messages = session.build_messages({"role": "user", "content": "c"})
+        assert session.prefix_misses == 2
+        assert [m["content"] for m in messages] == ["first", "reply", "c"]
+
+    def test_build_messages_respects_history_limit(self):
+        """Test per-request history limit tightens trimming."""
+        session = ChatSession("client-1", token_budget=1000)
+        for i in range(10):
+            session.append("user", "y" * 40)
+
+        messages = session.build_messages({"role": "user", "content": "now"}, max_history_tokens=30)
+        assert session.total_tokens <= 30
+        assert messages[-1]["content"] == "now"
+
+
+# =============================================================================
+# SessionStore Tests
+# =============================================================================
+
+class TestSessionStore:
+    """Test SessionStore isolation and eviction."""
+
+    def test_sessions_isolated_per_client(self):
+        """Test clients do not share history."""
+        store = SessionStore()
+        store.get_or_create("a").append("user", "from a")
+        store.get_or_create("b").append("user", "from b")
+
+        assert store.get("a").get_messages() == [{"role": "user", "content": "from a"}]
+        assert store.get("b").get_messages() == [{"role": "user", "content": "from b"}]
+
+    def test_lru_eviction(self):
+        """Test least recently used session is evicted at capacity."""
+        store = SessionStore(max_sessions=2)
+        store.get_or_create("a")
+        store.get_or_create("b")
+        store.get_or_create("a")  # touch a
+        store.get_or_create("c")
+
+        assert "a" in store
+        assert "b" not in store
+        assert store.get_stats()["evictions"] == 1
+
+    def test_idle_eviction(self):
+        """Test idle sessions are evicted."""
+        store = SessionStore(idle_timeout=10)
+        session = store.get_or_create("a")
+        session.last_used -= 60
+
+        assert store.evict_idle() == 1
+        assert len(store) == 0
+
+    def test_reset(self):
+        """Test reset drops only the targeted session."""
+        store = SessionStore()
+        store.get_or_create("a").append("user", "hello")
+        store.get_or_create("b").append("user", "hello")
+
+        assert store.reset("a") == 1
+        assert "a" not in store
+        assert "b" in store
@@ -0,0 +1,129 @@
+"""
+Unit Tests: Startup Orchestrator
+
+Tests for dependency-graph startup: concurrency, failure isolation,
+deferred warm-up, graph validation and startup metrics.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.runtime.startup import StartupOrchestrator, record_time_to_first_request
+from monitoring.metrics import get_registry
+
+
+def sleeper(log, name, delay=0.05, fail=False):
+    async def start():
+        log.append(f"{name}:start")
+        await asyncio.sleep(delay)
+        if fail:
+            raise RuntimeError(f"{name} broke")
+        log.append(f"{name}:done")
+    return start
+
+
+class TestStartupOrchestrator:
+    """Test ordering, concurrency and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_independent_components_start_concurrently(self):
+        """Test startup time tracks the longest chain, not the sum."""
+        log = []
+        startup = StartupOrchestrator("unit-concurrent")
+        for name in ("runtime", "database", "cache"):
+            startup.add(name, sleeper(log, name, delay=0.1))
+        startup.add("mcp", sleeper(log, "mcp", delay=0.1), depends_on=["cache"])
+
+        start = time.perf_counter()
+        report = await startup.run()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35
+        assert log.index("mcp:start") > log.index("cache:done")
+        assert all(c["status"] == "started" for c in report["components"].values())
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_dependents_only(self):
+        """Test a failed component skips dependents while 'after' still runs."""
+        log = []
+        startup = StartupOrchestrator("unit-failure")
+        startup.add("runtime", sleeper(log, "runtime", fail=True))
+        startup.add("websocket_hub", sleeper(log, "websocket_hub"), depends_on=["runtime"])
+        startup.add("database", sleeper(log, "database"))
+        startup.add("health_checks", sleeper(log, "health_checks"), after=["runtime", "database"])
+
+        report = await startup.run()
+        components = report["components"]
+
+        assert components["runtime"]["status"] == "failed"
+        assert components["websocket_hub"]["status"] == "skipped"
+        assert components["database"]["status"] == "started"
+        assert components["health_checks"]["status"] == "started"
+        assert "websocket_hub:start" not in log
+
+    @pytest.mark.asyncio
+    async def test_critical_failure_raises(self):
+        """Test run() raises when a critical component fails or times out."""
+        startup = StartupOrchestrator("unit-critical")
+        startup.add("interpreter_manager", sleeper([], "im", delay=1), critical=True, timeout=0.05)
+
+        with pytest.raises(RuntimeError, match="interpreter_manager"):
+            await startup.run()
+        assert "timed out" in startup.get_report()["components"]["interpreter_manager"]["error"]
+
+    @pytest.mark.asyncio
+    async def test_deferred_components_run_after_startup(self):
+        """Test deferred work does not delay run() and completes in the background."""
+        log = []
+        startup = StartupOrchestrator("unit-deferred")
+        startup.add("runtime", sleeper(log, "runtime", delay=0))
+        startup.add("tools_yaml", sleeper(log, "tools_yaml", delay=0.1), depends_on=["runtime"], deferred=True)
+
+        report = await startup.run()
+        assert report["components"]["tools_yaml"]["status"] == "pending"
+
+        startup.start_deferred()
+        assert startup.get_report()["warmup_complete"] is False
+        await startup.wait_deferred()
+
+        assert startup.get_report()["components"]["tools_yaml"]["status"] == "started"
+        assert startup.get_report()["warmup_complete"] is True
+
+    def test_invalid_graphs_rejected(self):
+        """Test unknown dependencies, cycles and eager-on-deferred edges fail fast."""
+        async def noop():
+            pass
+
+        unknown = StartupOrchestrator()
+        unknown.add("mcp", noop, depends_on=["cache"])
+        with pytest.raises(ValueError, match="unknown"):
+            asyncio.run(unknown.run())
+
+        cycle = StartupOrchestrator()
+        cycle.add("a", noop, depends_on=["b"])
+        cycle.add("b", noop, after=["a"])
+        with pytest.raises(ValueError, match="cycle"):
+            asyncio.run(cycle.run())
+
+        deferred = StartupOrchestrator()
+        deferred.add("warm", noop, deferred=True)
+        deferred.add("eager", noop, depends_on=["warm"])
+        with pytest.raises(ValueError, match="deferred"):
+            asyncio.run(deferred.run())
+
+    @pytest.mark.asyncio
+    async def test_timings_exported_as_metrics(self):
+        """Test per-component and time-to-first-request gauges are set."""
+        startup = StartupOrchestrator("unit-metrics")
+        startup.add("database", sleeper([], "database", delay=0.02))
+        await startup.run()
+
+        registry = get_registry()
+        component_seconds = registry.gauge("aether_startup_component_seconds", "")
+        assert component_seconds.get(orchestrator="unit-metrics", component="database") >= 0.02
+
+        elapsed = record_time_to_first_request(started_at=time.time() - 3)
+        assert 3 <= elapsed < 4
+        assert registry.gauge("aether_startup_time_to_first_request_seconds", "").get() == elapsed
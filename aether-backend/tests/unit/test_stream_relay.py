@@ -0,0 +1,123 @@
+"""
+Unit Tests: WebSocket Stream Relay
+
+Tests for content delta coalescing and event ordering in StreamRelay.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from ws.handlers import StreamRelay
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in that records sent frames."""
+
+    def __init__(self):
+        self.client_state = SimpleNamespace(name="CONNECTED")
+        self.frames = []
+
+    async def send_text(self, text: str) -> None:
+        self.frames.append(json.loads(text))
+
+
+class FakeRuntime:
+    """Runtime stand-in yielding a scripted event stream."""
+
+    def __init__(self, events, delay: float = 0.0):
+        self.events = events
+        self.delay = delay
+
+    async def stream_chat(self, **kwargs):
+        for event in self.events:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield event
+
+
+def _stream(*deltas, extra=None):
+    events = [{"role": "assistant", "type": "message", "start": True}]
+    events += [{"role": "assistant", "type": "message", "content": d} for d in deltas]
+    events += extra or []
+    events.append({"role": "assistant", "type": "message", "end": True})
+    return events
+
+
+def _content_frames(frames):
+    return [f for f in frames if f.get("content") and f.get("type") == "message"]
+
+
+class TestStreamRelayCoalescing:
+    """Test delta coalescing behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_deltas_coalesced_into_one_frame(self):
+        """Test fast deltas are merged into a single batched frame."""
+        ws = FakeWebSocket()
+        relay = StreamRelay(FakeRuntime(_stream("Hel", "lo", " world")), coalesce_window=1.0)
+
+        await relay.relay_stream(ws, "client", "req-1", "front-1", "hi")
+
+        content = _content_frames(ws.frames)
+        assert len(content) == 1
+        assert content[0]["content"] == "Hello world"
+        assert content[0]["batch"] == 3
+        assert content[0]["frontend_id"] == "front-1"
+
+    @pytest.mark.asyncio
+    async def test_coalescing_disabled(self):
+        """Test zero window sends one frame per delta."""
+        ws = FakeWebSocket()
+        relay = StreamRelay(FakeRuntime(_stream("a", "b", "c")), coalesce_window=0)
+
+        await relay.relay_stream(ws, "client", "req-1", None, "hi")
+
+        content = _content_frames(ws.frames)
+        assert [f["content"] for f in content] == ["a", "b", "c"]
+        assert all("batch" not in f for f in content)
+
+    @pytest.mark.asyncio
+    async def test_max_bytes_triggers_flush(self):
+        """Test buffer flushes early once max bytes is reached."""
+        ws = FakeWebSocket()
+        relay = StreamRelay(
+            FakeRuntime(_stream("aaaa", "bbbb", "cc")),
+            coalesce_window=1.0,
+            coalesce_max_bytes=8,
+        )
+
+        await relay.relay_stream(ws, "client", "req-1", None, "hi")
+
+        assert [f["content"] for f in _content_frames(ws.frames)] == ["aaaabbbb", "cc"]
+
+    @pytest.mark.asyncio
+    async def test_code_events_flush_and_keep_order(self):
+        """Test non-delta events flush pending deltas before being sent."""
+        code_event = {"role": "assistant", "type": "code", "format": "python", "content": "print(1)"}
+        ws = FakeWebSocket()
+        relay = StreamRelay(
+            FakeRuntime(_stream("one", "two", extra=[code_event])),
+            coalesce_window=1.0,
+        )
+
+        await relay.relay_stream(ws, "client", "req-1", None, "hi")
+
+        kinds = [(f.get("type"), f.get("content"), f.get("start"), f.get("end")) for f in ws.frames]
+        assert kinds[0][2] is True  # start marker first
+        assert kinds[1] == ("message", "onetwo", None, None)
+        assert kinds[2][0] == "code"
+        assert kinds[3][3] is True  # end marker
+        assert ws.frames[-1]["type"] == "completion"
+
+    @pytest.mark.asyncio
+    async def test_window_flush_for_slow_stream(self):
+        """Test background flusher emits deltas when the stream stalls."""
+        ws = FakeWebSocket()
+        relay = StreamRelay(FakeRuntime(_stream("x", "y"), delay=0.05), coalesce_window=0.01)
+
+        await relay.relay_stream(ws, "client", "req-1", None, "hi")
+
+        assert [f["content"] for f in _content_frames(ws.frames)] == ["x", "y"]
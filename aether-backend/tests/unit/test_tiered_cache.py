@@ -0,0 +1,254 @@
+"""
+Unit Tests: Tiered Cache
+
+Tests for the in-process LRU + Redis read-through cache and its use by
+ChatRepository.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from data.cache.redis import RedisCache
+from data.cache.tiered import TieredCache, cached
+from data.database.repositories.chat import ChatRepository
+from monitoring.metrics import get_registry
+
+
+class FakeRedisClient:
+    """In-memory stand-in for redis.asyncio (string values only)."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value):
+        self.store[key] = value
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        return sum(self.store.pop(key, None) is not None for key in keys)
+
+
+def shared_redis(client: FakeRedisClient) -> RedisCache:
+    redis = RedisCache(namespace="test")
+    redis._client = client
+    redis._connected = True
+    return redis
+
+
+class Loader:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.value
+
+
+class TestTieredCache:
+    """Test tier behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_read_through_and_local_hit(self):
+        """Test a loaded value is served locally and counted in metrics."""
+        cache = TieredCache(name="unit-local")
+        loader = Loader({"n": 1})
+
+        assert await cache.get_or_load("k", loader) == {"n": 1}
+        assert await cache.get_or_load("k", loader) == {"n": 1}
+
+        assert loader.calls == 1
+        hits = get_registry().counter("aether_cache_requests_total", "")
+        assert hits.get(cache="unit-local", tier="local", result="hit") == 1
+
+    @pytest.mark.asyncio
+    async def test_workers_share_redis_tier(self):
+        """Test a second worker reads another worker's value from Redis intact."""
+        client = FakeRedisClient()
+        worker_a = TieredCache(redis=shared_redis(client))
+        worker_b = TieredCache(redis=shared_redis(client))
+        value = {"id": uuid4(), "at": datetime.now(timezone.utc), "tags": ["a"]}
+
+        await worker_a.get_or_load("chat:1", Loader(value))
+        loader_b = Loader(None)
+
+        assert await worker_b.get_or_load("chat:1", loader_b) == value
+        assert loader_b.calls == 0
+        assert worker_b.get_stats()["redis_hits"] == 1
+
+        await worker_b.invalidate("chat:1")
+        assert "test:chat:1" not in client.store
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self):
+        """Test a burst of misses for one key runs the loader once."""
+        cache = TieredCache()
+        loader = Loader([1, 2, 3])
+
+        results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(20)))
+
+        assert loader.calls == 1
+        assert all(r == [1, 2, 3] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_loader_hands_load_to_waiter(self):
+        """Test cancelling the loading caller does not cancel its waiters."""
+        cache = TieredCache()
+        calls = 0
+
+        async def slow_loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return f"load-{calls}"
+
+        leader = asyncio.create_task(cache.get_or_load("k", slow_loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_load("k", slow_loader))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await waiter == "load-2"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_during_load_not_repopulated(self):
+        """Test a load racing a write does not cache the stale value."""
+        cache = TieredCache()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader():
+            started.set()
+            await release.wait()
+            return "stale"
+
+        task = asyncio.create_task(cache.get_or_load("k", slow_loader))
+        await started.wait()
+        await cache.invalidate("k")
+        release.set()
+
+        assert await task == "stale"
+        assert await cache.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_in_other_worker_during_load(self):
+        """Test a load racing another worker's invalidation is dropped from Redis."""
+        client = FakeRedisClient()
+        worker_a = TieredCache(redis=shared_redis(client))
+        worker_b = TieredCache(redis=shared_redis(client))
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_loader():
+            started.set()
+            await release.wait()
+            return "stale"
+
+        task = asyncio.create_task(worker_a.get_or_load("k", slow_loader))
+        await started.wait()
+        await worker_b.invalidate("k")
+        release.set()
+
+        assert await task == "stale"
+        assert "test:k" not in client.store
+        assert await worker_b.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_bound_and_local_ttl(self, monkeypatch):
+        """Test the local tier evicts least recently used and expired entries."""
+        cache = TieredCache(max_entries=2, local_ttl=5)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+
+        import data.cache.tiered as tiered
+        now = tiered.time.monotonic()
+        monkeypatch.setattr(tiered.time, "monotonic", lambda: now + 10)
+        assert await cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator(self):
+        """Test the decorator keys calls by argument."""
+        cache = TieredCache()
+        calls = []
+
+        @cached(lambda base: f"models:{base}", cache=lambda: cache)
+        async def fetch(base):
+            calls.append(base)
+            return [base]
+
+        await fetch("x")
+        await fetch("x")
+        await fetch("y")
+
+        assert calls == ["x", "y"]
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    async def fetchall(self):
+        return self.rows
+
+
+class FakeDatabase:
+    """Database serving one chat row and counting queries."""
+
+    def __init__(self, chat_id):
+        now = datetime.now(timezone.utc)
+        self.row = {"id": chat_id, "title": "Chat", "created_at": now, "updated_at": now}
+        self.queries = 0
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield self
+
+    transaction = get_connection
+
+    async def execute(self, query, params=()):
+        self.queries += 1
+        if query.lstrip().startswith("UPDATE chats"):
+            self.row = dict(self.row, title=params[0])
+        return FakeCursor([self.row])
+
+
+class TestChatRepositoryCaching:
+    """Test repository read-through and write invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_get_chat_cached_until_update(self):
+        """Test repeated reads hit the cache and an update invalidates it."""
+        chat_id = uuid4()
+        db = FakeDatabase(chat_id)
+        repo = ChatRepository(db, cache=TieredCache())
+
+        await repo.get_chat(chat_id)
+        await repo.get_chat(chat_id)
+        assert db.queries == 1
+
+        await repo.update_chat(chat_id, title="Renamed")
+        chat = await repo.get_chat(chat_id)
+
+        assert chat.title == "Renamed"
+        assert db.queries == 3
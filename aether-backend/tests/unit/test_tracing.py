@@ -0,0 +1,170 @@
+"""
+Unit Tests: Tracing
+
+Tests for the bounded span buffer, per-trace index, head and tail sampling
+and the batched OTLP-JSON file exporter.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from monitoring.tracing import (
+    OTLPFileExporter,
+    SpanStatus,
+    TailSamplingPolicy,
+    TraceIdRatioSampler,
+    Tracer,
+    clear_trace_context,
+    trace,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_context():
+    clear_trace_context()
+    yield
+    clear_trace_context()
+
+
+def run_trace(tracer, name="request", children=1, fail=False):
+    """Record one trace (root plus children) and return its trace ID."""
+    clear_trace_context()
+    try:
+        with tracer.start_span(name) as root:
+            for i in range(children):
+                with tracer.start_span(f"{name}.child{i}"):
+                    pass
+            if fail:
+                raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    return root.trace_id
+
+
+class TestSpanBuffer:
+    """Test bounded storage and the trace index."""
+
+    def test_ring_buffer_evicts_oldest(self):
+        """Test memory stays at capacity and evicted spans leave the index."""
+        tracer = Tracer(capacity=10)
+        trace_ids = [run_trace(tracer, children=1) for _ in range(20)]
+
+        assert len(tracer.get_spans()) == 10
+        assert tracer.get_spans(trace_ids[0]) == []
+        assert len(tracer.get_spans(trace_ids[-1])) == 2
+        stats = tracer.get_stats()
+        assert stats["evicted"] == 30
+        assert stats["buffered_traces"] == 5
+
+    def test_get_spans_by_trace(self):
+        """Test lookup returns exactly the spans of one trace in finish order."""
+        tracer = Tracer()
+        first = run_trace(tracer, children=2)
+        run_trace(tracer, children=3)
+
+        spans = tracer.get_spans(first)
+        assert [s.name for s in spans] == ["request.child0", "request.child1", "request"]
+        assert all(s.trace_id == first for s in spans)
+
+    @pytest.mark.asyncio
+    async def test_trace_decorator(self):
+        """Test decorated coroutines are recorded."""
+        tracer = Tracer()
+
+        @trace("work")
+        async def work():
+            await asyncio.sleep(0)
+
+        from monitoring import tracing
+        previous, tracing._global_tracer = tracing._global_tracer, tracer
+        try:
+            await work()
+        finally:
+            tracing._global_tracer = previous
+
+        assert [s.name for s in tracer.get_spans()] == ["work"]
+
+
+class TestSampling:
+    """Test head and tail sampling."""
+
+    def test_head_sampling_whole_traces(self):
+        """Test a ratio sampler keeps or drops entire traces."""
+        tracer = Tracer(sampler=TraceIdRatioSampler(0.25))
+        trace_ids = [run_trace(tracer, children=2) for _ in range(400)]
+
+        kept = [t for t in trace_ids if tracer.get_spans(t)]
+        assert 50 < len(kept) < 150
+        assert all(len(tracer.get_spans(t)) == 3 for t in kept)
+
+    def test_tail_sampling_keeps_errors_and_slow_traces(self):
+        """Test traces dropped at the head survive when they fail or are slow."""
+        tracer = Tracer(
+            sampler=TraceIdRatioSampler(0.0),
+            tail_policy=TailSamplingPolicy(latency_threshold_ms=50),
+        )
+        ok = run_trace(tracer)
+        failed = run_trace(tracer, fail=True)
+
+        clear_trace_context()
+        with tracer.start_span("slow") as slow:
+            slow.start_time -= 1
+
+        assert tracer.get_spans(ok) == []
+        assert len(tracer.get_spans(failed)) == 2
+        assert tracer.get_spans(failed)[-1].status == SpanStatus.ERROR
+        assert len(tracer.get_spans(slow.trace_id)) == 1
+        assert tracer.get_stats()["pending_traces"] == 0
+
+    def test_pending_traces_bounded(self):
+        """Test traces whose root never finishes are decided when the limit is hit."""
+        tracer = Tracer(
+            sampler=TraceIdRatioSampler(0.0),
+            tail_policy=TailSamplingPolicy(max_pending_traces=5),
+        )
+        for _ in range(20):
+            clear_trace_context()
+            root = tracer.start_span("orphan-root")
+            root.__enter__()
+            with tracer.start_span("child"):
+                pass
+
+        assert tracer.get_stats()["pending_traces"] == 5
+
+
+class TestOTLPFileExporter:
+    """Test batched background export."""
+
+    def test_batches_written_as_otlp_json_lines(self, tmp_path):
+        """Test spans are written in batches as OTLP ExportTraceServiceRequests."""
+        path = tmp_path / "traces" / "spans.jsonl"
+        exporter = OTLPFileExporter(path, batch_size=4, flush_interval=60)
+        tracer = Tracer(exporter=exporter)
+        trace_id = run_trace(tracer, children=4, fail=True)
+
+        assert exporter.flush()
+        tracer.shutdown()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert len(lines) == 2
+        spans = [s for line in lines for s in line["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+        assert len(spans) == 5
+        root = spans[-1]
+        assert root["traceId"] == trace_id
+        assert root["parentSpanId"] == ""
+        assert root["status"] == {"code": 2, "message": "boom"}
+        assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+        resource = lines[0]["resourceSpans"][0]["resource"]["attributes"]
+        assert resource == [{"key": "service.name", "value": {"stringValue": "aether-backend"}}]
+        assert exporter.get_stats()["exported"] == 5
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        """Test export never blocks the caller when the writer falls behind."""
+        exporter = OTLPFileExporter(tmp_path / "spans.jsonl", max_queue_size=3)
+        exporter._thread = object()  # Writer not draining
+        tracer = Tracer(exporter=exporter)
+        run_trace(tracer, children=9)
+
+        assert exporter.get_stats()["dropped"] == 7
@@ -0,0 +1,131 @@
+"""
+Unit Tests: Write-Behind Trail State Persistence
+
+Tests for WriteBehindBuffer debouncing and its use by StorageRepository
+trail state saves.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from data.database.repositories.storage import StorageRepository
+from data.database.write_behind import WriteBehindBuffer
+
+
+class Recorder:
+    """Flush target recording writes, optionally failing the first N calls."""
+
+    def __init__(self, failures: int = 0):
+        self.writes = []
+        self.failures = failures
+
+    async def __call__(self, key, value):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("database unavailable")
+        self.writes.append((key, value))
+
+
+class FakeConnection:
+    def __init__(self):
+        self.queries = []
+
+    async def execute(self, query, params=(), prepare=None):
+        self.queries.append((" ".join(query.split()), params, prepare))
+
+        class Cursor:
+            async def fetchone(self):
+                return None
+
+        return Cursor()
+
+
+class FakeDatabase:
+    def __init__(self):
+        self.conn = FakeConnection()
+
+    @asynccontextmanager
+    async def transaction(self):
+        yield self.conn
+
+    get_connection = transaction
+
+
+class TestWriteBehindBuffer:
+    """Test debouncing behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_rapid_saves_coalesce(self):
+        """Test many saves within the interval produce one write of the latest value."""
+        recorder = Recorder()
+        buffer = WriteBehindBuffer(recorder, interval=0.02)
+
+        for i in range(50):
+            buffer.submit("chat-1", {"n": i})
+        buffer.submit("chat-2", {"n": 0})
+        await asyncio.sleep(0.06)
+
+        assert sorted(recorder.writes, key=lambda w: w[0]) == [
+            ("chat-1", {"n": 49}), ("chat-2", {"n": 0})
+        ]
+        assert buffer.get_stats()["coalesced"] == 49
+
+    @pytest.mark.asyncio
+    async def test_failed_write_retried(self):
+        """Test a failing write is retried on the next interval."""
+        recorder = Recorder(failures=1)
+        buffer = WriteBehindBuffer(recorder, interval=0.01)
+
+        buffer.submit("chat-1", {"n": 1})
+        await asyncio.sleep(0.05)
+
+        assert recorder.writes == [("chat-1", {"n": 1})]
+        assert buffer.get_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_close_flushes_pending(self):
+        """Test shutdown writes values still waiting for their interval."""
+        recorder = Recorder()
+        buffer = WriteBehindBuffer(recorder, interval=60)
+
+        buffer.submit("chat-1", {"n": 1})
+        await buffer.close()
+
+        assert recorder.writes == [("chat-1", {"n": 1})]
+        with pytest.raises(RuntimeError):
+            buffer.submit("chat-1", {"n": 2})
+
+
+class TestTrailStatePersistence:
+    """Test StorageRepository trail state paths."""
+
+    @pytest.mark.asyncio
+    async def test_save_is_prepared_upsert_without_ddl(self):
+        """Test direct saves issue a single prepared upsert."""
+        db = FakeDatabase()
+
+        await StorageRepository(db).save_trail_state("chat-1", {"trails": []})
+
+        assert len(db.conn.queries) == 1
+        query, params, prepare = db.conn.queries[0]
+        assert query.startswith("INSERT INTO trail_states")
+        assert "CREATE TABLE" not in query
+        assert params[0] == "chat-1"
+        assert prepare is True
+
+    @pytest.mark.asyncio
+    async def test_buffered_save_read_your_writes_and_delete(self):
+        """Test pending saves are visible to loads and dropped by deletes."""
+        db = FakeDatabase()
+        buffer = WriteBehindBuffer(StorageRepository(db).upsert_trail_state, interval=60)
+        repo = StorageRepository(db, trail_writer=buffer)
+
+        await repo.save_trail_state("chat-1", {"trails": [1]})
+        assert db.conn.queries == []
+        assert await repo.load_trail_state("chat-1") == {"trails": [1]}
+
+        assert await repo.delete_trail_state("chat-1") is True
+        await buffer.close()
+        assert [q[0].split()[0] for q in db.conn.queries] == ["DELETE"]
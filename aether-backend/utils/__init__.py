@@ -26,6 +26,8 @@ from .http import (
     HTTPClientConfig,
     get_http_client,
     close_http_client,
+    get_sync_http_client,
+    close_sync_http_clients,
     get,
     post,
     put,
@@ -77,6 +79,8 @@ __all__ = [
     'HTTPClientConfig',
     'get_http_client',
     'close_http_client',
+    'get_sync_http_client',
+    'close_sync_http_clients',
     'get',
     'post',
     'put',
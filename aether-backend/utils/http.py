@@ -6,12 +6,18 @@ connection pooling, and error handling for reliable external API communication.
 
 @.architecture
 Incoming: core/integrations/*, api/v1/endpoints/*, External services --- {str url, Dict[str, Any] json body, Dict[str, str] headers, Dict[str, Any] params}
-Processing: request(), _request_with_retry(), get(), post(), stream(), health_check(), close(), _get_or_create_client(), get_http_client() --- {8 jobs: cleanup, connection_pooling, error_handling, health_checking, http_client_management, initialization, request_retry, streaming}
-Outgoing: External services (Perplexica, SearxNG, Docling, LM Studio, MCP), Callers --- {httpx.Response, streaming async generator}
+Processing: request(), _request_with_retry(), get(), post(), stream(), health_check(), close(), _get_or_create_client(), get_http_client(), get_sync_http_client(), close_sync_http_clients() --- {9 jobs: cleanup, connection_pooling, error_handling, health_checking, http_client_management, initialization, request_retry, streaming, sync_client_sharing}
+Outgoing: External services (Perplexica, SearxNG, Docling, LM Studio, MCP, XLWings), Callers --- {httpx.Response, streaming async generator, shared httpx.Client}
+
+Synchronous integration functions (run on agent worker threads) cannot
+await the async client; get_sync_http_client() gives them a named, shared
+keep-alive httpx.Client instead of a fresh client (and TCP/TLS handshake)
+per call.
 """
 
 import asyncio
 import logging
+import threading
 from typing import Any, Dict, Optional, Union
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
@@ -67,6 +73,23 @@ class HTTPClientConfig:
         except ImportError:
             # During initialization, just use defaults
             return cls()
+    
+    def timeout(self) -> httpx.Timeout:
+        """Build the httpx timeout for this configuration."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+    
+    def limits(self) -> httpx.Limits:
+        """Build the httpx connection pool limits for this configuration."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
 
 
 # =============================================================================
@@ -100,22 +123,9 @@ class HTTPClient:
         """Get or create HTTP client with proper configuration."""
         async with self._client_lock:
             if self._client is None or self._client.is_closed:
-                timeout = httpx.Timeout(
-                    connect=self.config.connect_timeout,
-                    read=self.config.read_timeout,
-                    write=self.config.write_timeout,
-                    pool=self.config.pool_timeout,
-                )
-                
-                limits = httpx.Limits(
-                    max_connections=self.config.max_connections,
-                    max_keepalive_connections=self.config.max_keepalive_connections,
-                    keepalive_expiry=self.config.keepalive_expiry,
-                )
-                
                 self._client = httpx.AsyncClient(
-                    timeout=timeout,
-                    limits=limits,
+                    timeout=self.config.timeout(),
+                    limits=self.config.limits(),
                     max_redirects=self.config.max_redirects,
                     follow_redirects=True,
                 )
@@ -377,6 +387,60 @@ async def close_http_client() -> None:
         _global_http_client = None
 
 
+# =============================================================================
+# Shared Sync Clients
+# =============================================================================
+
+_sync_clients: Dict[str, httpx.Client] = {}
+_sync_clients_lock = threading.Lock()
+
+
+def get_sync_http_client(
+    name: str = "default",
+    config: Optional[HTTPClientConfig] = None
+) -> httpx.Client:
+    """
+    Get a shared keep-alive httpx.Client for synchronous callers.
+    
+    One client (and connection pool) is kept per name and reused across
+    calls and threads; httpx.Client is safe to share between threads.
+    Callers pass per-request timeouts with ``timeout=`` rather than
+    creating their own client. Redirects are not followed (httpx default).
+    
+    Args:
+        name: Pool name (e.g. "perplexica", "xlwings")
+        config: Configuration used when the client is first created
+        
+    Returns:
+        Shared httpx.Client instance
+    """
+    client = _sync_clients.get(name)
+    if client is not None and not client.is_closed:
+        return client
+    
+    with _sync_clients_lock:
+        client = _sync_clients.get(name)
+        if client is None or client.is_closed:
+            config = config or HTTPClientConfig.from_settings()
+            client = httpx.Client(
+                timeout=config.timeout(),
+                limits=config.limits(),
+                max_redirects=config.max_redirects,
+            )
+            _sync_clients[name] = client
+            logger.debug(f"Created shared sync HTTP client: {name}")
+        return client
+
+
+def close_sync_http_clients() -> None:
+    """Close all shared sync HTTP clients."""
+    with _sync_clients_lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+    for client in clients:
+        client.close()
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
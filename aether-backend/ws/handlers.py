@@ -10,7 +10,7 @@ Outgoing: ws/hub.py, Frontend (WebSocket), core/runtime/engine.py --- {validated
 
 Features:
 - Message parsing and routing
-- Stream relay with cancellation
+- Stream relay with cancellation and delta coalescing
 - Generation control (stop/cancel)
 - Audio stream handling
 - Error handling and recovery
@@ -19,7 +19,7 @@ Features:
 import asyncio
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from fastapi import WebSocket
@@ -35,33 +35,147 @@ from ws.protocols import (
     AudioControlMessage,
     ContextResetMessage,
     WS_SEND_TIMEOUT,
+    WS_COALESCE_WINDOW,
+    WS_COALESCE_MAX_BYTES,
 )
 
 logger = get_logger(__name__)
 
 
+class _DeltaCoalescer:
+    """Buffers assistant content deltas of a single stream between flushes."""
+    
+    __slots__ = ("parts", "size", "first_at", "error")
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self.size = 0
+        self.first_at = 0.0
+        self.error: Optional[Exception] = None
+    
+    def add(self, content: str, now: float) -> None:
+        if not self.parts:
+            self.first_at = now
+        self.parts.append(content)
+        self.size += len(content)
+    
+    def drain(self) -> Tuple[str, int]:
+        count = len(self.parts)
+        content = "".join(self.parts)
+        self.parts = []
+        self.size = 0
+        return content, count
+
+
 class StreamRelay:
     """
     Handles streaming chat responses from runtime to WebSocket clients.
     
     Features:
     - Non-blocking async stream relay
+    - Content delta coalescing (one frame per flush window)
     - Cancellation support
     - Error handling and recovery
     - Automatic end marker emission
     - Client disconnection detection
+    
+    Coalescing:
+    - Content deltas are buffered for up to ``coalesce_window`` seconds or
+      ``coalesce_max_bytes`` characters and sent as one frame
+    - Start/end markers and non-delta events (code, console, ...) flush the
+      buffer first and are sent immediately, preserving ordering
+    - A window of 0 disables coalescing (one frame per delta)
     """
     
-    def __init__(self, runtime: Any):
+    def __init__(
+        self,
+        runtime: Any,
+        coalesce_window: float = WS_COALESCE_WINDOW,
+        coalesce_max_bytes: int = WS_COALESCE_MAX_BYTES,
+    ):
         """
         Initialize stream relay.
         
         Args:
             runtime: RuntimeEngine instance for chat streaming
+            coalesce_window: Max seconds a delta is buffered (0 disables)
+            coalesce_max_bytes: Buffered size that triggers an early flush
         """
         self.runtime = runtime
+        self.coalesce_window = coalesce_window
+        self.coalesce_max_bytes = coalesce_max_bytes
         self._logger = logging.getLogger(f"{__name__}.StreamRelay")
     
+    async def _send(self, ws: WebSocket, payload: Dict[str, Any], lock: asyncio.Lock) -> None:
+        """Send one JSON frame with timeout, serialised against the flusher."""
+        async with lock:
+            await asyncio.wait_for(
+                ws.send_text(json.dumps(payload)),
+                timeout=WS_SEND_TIMEOUT
+            )
+    
+    async def _flush_deltas(
+        self,
+        ws: WebSocket,
+        coalescer: _DeltaCoalescer,
+        lock: asyncio.Lock,
+        request_id: str,
+        frontend_id: Optional[str],
+    ) -> None:
+        """Send buffered content deltas as a single frame."""
+        if not coalescer.parts:
+            return
+        
+        content, count = coalescer.drain()
+        await self._send(ws, self._delta_frame(content, count, request_id, frontend_id), lock)
+    
+    @staticmethod
+    def _delta_frame(
+        content: str,
+        count: int,
+        request_id: str,
+        frontend_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Build a content delta frame (DeltaBatchMessage when count > 1)."""
+        delta = {
+            "role": MessageRole.ASSISTANT,
+            "type": MessageType.MESSAGE,
+            "content": content,
+            "id": request_id,
+        }
+        if count > 1:
+            delta["batch"] = count
+        # Echo frontend_id back in every chunk
+        if frontend_id:
+            delta["frontend_id"] = frontend_id
+        return delta
+    
+    async def _flush_periodically(
+        self,
+        ws: WebSocket,
+        coalescer: _DeltaCoalescer,
+        lock: asyncio.Lock,
+        request_id: str,
+        frontend_id: Optional[str],
+    ) -> None:
+        """Flush deltas that have waited a full window (one timer per window, not per delta)."""
+        loop = asyncio.get_running_loop()
+        window = self.coalesce_window
+        
+        while True:
+            delay = window
+            if coalescer.parts:
+                delay = max(0.0, coalescer.first_at + window - loop.time())
+            await asyncio.sleep(delay)
+            
+            if coalescer.parts and loop.time() - coalescer.first_at >= window:
+                try:
+                    await self._flush_deltas(ws, coalescer, lock, request_id, frontend_id)
+                except Exception as e:
+                    # Surface to the relay loop, which stops the stream
+                    coalescer.error = e
+                    return
+    
     async def relay_stream(
         self,
         ws: WebSocket,
@@ -85,6 +199,16 @@ class StreamRelay:
         sent_end = False
         sent_start = False  # Track start marker to prevent duplicates
         
+        send_lock = asyncio.Lock()
+        coalescer: Optional[_DeltaCoalescer] = None
+        flusher: Optional[asyncio.Task] = None
+        if self.coalesce_window > 0:
+            coalescer = _DeltaCoalescer()
+            flusher = asyncio.create_task(
+                self._flush_periodically(ws, coalescer, send_lock, request_id, frontend_id)
+            )
+        loop = asyncio.get_running_loop()
+        
         try:
             self._logger.debug(f"Starting stream relay for request {request_id} (frontend_id={frontend_id})")
             
@@ -100,10 +224,50 @@ class StreamRelay:
                     self._logger.debug(f"Client disconnected during stream {request_id}")
                     break
                 
+                # Background flush failed - treat like a failed send
+                if coalescer and coalescer.error:
+                    self._logger.debug(f"Failed to send content delta: {coalescer.error}")
+                    break
+                
                 # Process event
                 if not isinstance(event, dict):
                     continue
                 
+                # Buffer content deltas (assistant messages only)
+                if (
+                    event.get("role") == MessageRole.ASSISTANT
+                    and event.get("type") == MessageType.MESSAGE
+                    and event.get("content")
+                    and not event.get("start")
+                    and not event.get("end")  # Don't forward content on end marker
+                ):
+                    try:
+                        if coalescer is None:
+                            await self._send(
+                                ws,
+                                self._delta_frame(event["content"], 1, request_id, frontend_id),
+                                send_lock,
+                            )
+                        else:
+                            coalescer.add(event["content"], loop.time())
+                            if (
+                                coalescer.size >= self.coalesce_max_bytes
+                                or loop.time() - coalescer.first_at >= self.coalesce_window
+                            ):
+                                await self._flush_deltas(ws, coalescer, send_lock, request_id, frontend_id)
+                    except Exception as e:
+                        self._logger.debug(f"Failed to send content delta: {e}")
+                        break
+                    continue
+                
+                # Every other event flushes pending deltas first to keep ordering
+                if coalescer is not None:
+                    try:
+                        await self._flush_deltas(ws, coalescer, send_lock, request_id, frontend_id)
+                    except Exception as e:
+                        self._logger.debug(f"Failed to send content delta: {e}")
+                        break
+                
                 # Track end marker
                 if event.get("end"):
                     sent_end = True
@@ -123,10 +287,7 @@ class StreamRelay:
                         
                         self._logger.info(f"🚀 EXIT POINT: Sending start marker - backend_id={request_id}, frontend_id={frontend_id}")
                         
-                        await asyncio.wait_for(
-                            ws.send_text(json.dumps(start_event)),
-                            timeout=WS_SEND_TIMEOUT
-                        )
+                        await self._send(ws, start_event, send_lock)
                         sent_start = True  # Mark as sent to prevent duplicates
                     except Exception as e:
                         self._logger.debug(f"Failed to send start marker: {e}")
@@ -137,33 +298,6 @@ class StreamRelay:
                     self._logger.debug(f"Skipping duplicate start marker for {request_id}")
                     continue
                 
-                # Forward content deltas (assistant messages only)
-                if (
-                    event.get("role") == MessageRole.ASSISTANT
-                    and event.get("type") == MessageType.MESSAGE
-                    and event.get("content")
-                    and not event.get("end")  # Don't forward content on end marker
-                ):
-                    try:
-                        delta = {
-                            "role": MessageRole.ASSISTANT,
-                            "type": MessageType.MESSAGE,
-                            "content": event["content"],
-                            "id": request_id,
-                        }
-                        # Echo frontend_id back in every chunk
-                        if frontend_id:
-                            delta["frontend_id"] = frontend_id
-                        
-                        await asyncio.wait_for(
-                            ws.send_text(json.dumps(delta)),
-                            timeout=WS_SEND_TIMEOUT
-                        )
-                    except Exception as e:
-                        self._logger.debug(f"Failed to send content delta: {e}")
-                        break
-                    continue
-                
                 # Forward other events as-is (code, console, system, etc.)
                 # Add frontend_id to artifacts too
                 try:
@@ -171,13 +305,17 @@ class StreamRelay:
                     if frontend_id and event_copy.get("role") in ("assistant", "computer"):
                         event_copy["frontend_id"] = frontend_id
                     
-                    await asyncio.wait_for(
-                        ws.send_text(json.dumps(event_copy)),
-                        timeout=WS_SEND_TIMEOUT
-                    )
+                    await self._send(ws, event_copy, send_lock)
                 except Exception as e:
                     self._logger.debug(f"Failed to send event: {e}")
                     break
+            
+            # Flush whatever is still buffered once the stream completes
+            if coalescer is not None and not coalescer.error:
+                try:
+                    await self._flush_deltas(ws, coalescer, send_lock, request_id, frontend_id)
+                except Exception as e:
+                    self._logger.debug(f"Failed to send content delta: {e}")
         
         except asyncio.CancelledError:
             self._logger.info(f"Stream relay cancelled for {request_id}")
@@ -209,6 +347,9 @@ class StreamRelay:
                 pass
         
         finally:
+            if flusher is not None:
+                flusher.cancel()
+            
             # Send end marker if not already sent
             if not sent_end:
                 try:
@@ -334,7 +475,7 @@ class MessageHandler:
         
         # Handle raw LMC pass-through (advanced clients)
         if isinstance(payload, dict) and any(k in payload for k in ("start", "end", "auth")):
-            await self._handle_lmc_passthrough(payload)
+            await self._handle_lmc_passthrough(ws, client_id, payload)
             return
         
         # Unknown message - send diagnostic
@@ -550,6 +691,8 @@ class MessageHandler:
     
     async def _handle_lmc_passthrough(
         self,
+        ws: WebSocket,
+        client_id: str,
         payload: Dict[str, Any],
     ) -> None:
         """
@@ -557,16 +700,20 @@ class MessageHandler:
         
         Note: This is a low-level feature for advanced Open Interpreter clients
         that send raw LMC (Language Model Communication) protocol messages.
+        The message goes to the interpreter serving the client, never to an
+        instance serving another client. If none is free the client gets an
+        error instead of waiting.
         """
         try:
-            # Use public method if available instead of accessing private attributes
-            if hasattr(self.runtime, 'send_raw_input'):
-                await self.runtime.send_raw_input(payload)
-            elif hasattr(self.runtime, '_interpreter_manager'):
-                # Fallback: use manager's public interface
-                interpreter = self.runtime._interpreter_manager.get_interpreter()
-                if interpreter:
-                    await interpreter.input(payload)
+            await self.runtime.send_raw_input(payload, client_id=client_id)
         except Exception as e:
             self._logger.debug(f"LMC passthrough failed: {e}")
+            try:
+                await ws.send_text(json.dumps({
+                    "role": MessageRole.SERVER,
+                    "type": MessageType.ERROR,
+                    "message": f"LMC passthrough failed: {str(e)}",
+                }))
+            except Exception:
+                pass
 
@@ -7,11 +7,11 @@ Based on OpenInterpreter's LMC (Language Model Communication) format with extens
 @.architecture
 Incoming: ws/handlers.py, ws/hub.py --- {raw JSON payloads from WebSocket messages}
 Processing: validate_message(), Pydantic model validation, content sanitization --- {4 jobs: data_validation, message_parsing, sanitization, schema_validation}
-Outgoing: ws/handlers.py --- {Pydantic message models: ClientMessage, AssistantMessage, SystemMessage, StopMessage, HeartbeatMessage, AudioControlMessage}
+Outgoing: ws/handlers.py --- {Pydantic message models: ClientMessage, AssistantMessage, DeltaBatchMessage, SystemMessage, StopMessage, HeartbeatMessage, AudioControlMessage}
 
 Message Types:
 - User messages: Text/image inputs from frontend
-- Assistant messages: Streaming responses from LLM
+- Assistant messages: Streaming responses from LLM (optionally coalesced)
 - System messages: Server status and control
 - Control messages: Stop/cancel/heartbeat
 
@@ -129,6 +129,23 @@ class AssistantMessage(BaseMessage):
     end: Optional[bool] = None
 
 
+class DeltaBatchMessage(AssistantMessage):
+    """
+    Coalesced assistant content deltas.
+    
+    Several LLM deltas buffered within the coalescing window are sent as a
+    single frame. The frame is wire-compatible with a plain content delta
+    (same role/type, concatenated content), so existing clients simply append
+    it; ``batch`` carries the number of deltas merged into the frame.
+    
+    Example:
+        {"role": "assistant", "type": "message", "content": "Hello world",
+         "batch": 3, "id": "uuid"}
+    """
+    content: str
+    batch: int = Field(ge=1)
+
+
 class SystemMessage(BaseMessage):
     """
     System/server status messages.
@@ -261,3 +278,7 @@ WS_BROADCAST_TIMEOUT = 5.0  # Timeout for broadcasting
 HEARTBEAT_INTERVAL = 30.0  # Heartbeat interval in seconds
 CONNECTION_TIMEOUT = 300.0  # Connection timeout in seconds
 
+# Delta coalescing (0 window disables batching)
+WS_COALESCE_WINDOW = 0.02  # Max seconds a content delta waits before flush
+WS_COALESCE_MAX_BYTES = 4096  # Flush early once buffered content reaches this size
+